@@ -0,0 +1,582 @@
+"""
+Estatísticas agregadas das vagas, atualizadas a cada vaga coletada e mescláveis entre execuções
+
+Para cada grupo (tipo, área, cidade, nível de ensino e área + cidade) são mantidos:
+contagem, soma e esboço de quantis do salário mensal (mediana, p90...), horas semanais
+médias e os horários, áreas e empresas mais frequentes (top-k aproximado). Cada vaga
+entra uma vez só (pelo código), então atualizar o painel custa O(vagas novas) em vez
+de reler todo o histórico. Arquivos de execuções ou de trabalhadores em paralelo
+são mesclados com 'mesclar'.
+
+Uso:
+    python agregados.py ingerir 'vagas_ciee_*.jsonl'          # só os arquivos novos
+    python agregados.py resumo --dimensao area --limite 15
+    python agregados.py resumo --dimensao area,cidade --json
+    python agregados.py mesclar agregados_ciee.json trabalhador_*.json
+"""
+
+import argparse
+import base64
+import glob
+import hashlib
+import heapq
+import json
+import math
+import os
+import sys
+import threading
+from array import array
+
+from modelo import Vaga
+from paginacao import chave_vaga
+
+
+# Versão do formato do arquivo (arquivos de outra versão são ignorados)
+VERSAO_AGREGADOS = 2
+
+# Erro relativo máximo dos quantis do esboço (1%: R$ 1.500 sai entre 1.485 e 1.515)
+ERRO_QUANTIS = 0.01
+
+# Itens acompanhados por contador top-k (os k mais frequentes são exatos quando
+# as contagens fora do top ficam abaixo de N / capacidade)
+CAPACIDADE_TOPK = 64
+
+# Grupos mantidos: cada um é uma tupla de dimensões da vaga
+DIMENSOES = (('tipo',), ('area',), ('cidade',), ('nivel_ensino',), ('area', 'cidade'))
+
+# Quantis do salário exibidos no resumo
+QUANTIS_RESUMO = (0.25, 0.5, 0.75, 0.9)
+
+
+class EsbocoQuantis:
+    """
+    Esboço de quantis com erro relativo garantido (baldes logarítmicos, como o DDSketch)
+
+    Cada valor cai no balde ceil(log_gamma(valor)); a mescla de dois esboços é a soma
+    dos baldes, então o resultado é o mesmo que teria um esboço com todos os valores.
+    Salários de R$ 100 a R$ 20.000 ocupam no máximo ~270 baldes.
+    """
+
+    __slots__ = ('erro', 'gamma', '_log_gamma', 'baldes', 'zeros', 'quantidade', 'soma', 'minimo', 'maximo')
+
+    def __init__(self, erro=ERRO_QUANTIS):
+        self.erro = erro
+        self.gamma = (1 + erro) / (1 - erro)
+        self._log_gamma = math.log(self.gamma)
+        self.baldes = {}
+        self.zeros = 0
+        self.quantidade = 0
+        self.soma = 0.0
+        self.minimo = None
+        self.maximo = None
+
+    def adicionar(self, valor, vezes=1):
+        if valor <= 0:
+            self.zeros += vezes
+        else:
+            balde = math.ceil(math.log(valor) / self._log_gamma)
+            self.baldes[balde] = self.baldes.get(balde, 0) + vezes
+        self.quantidade += vezes
+        self.soma += valor * vezes
+        self.minimo = valor if self.minimo is None else min(self.minimo, valor)
+        self.maximo = valor if self.maximo is None else max(self.maximo, valor)
+
+    def mesclar(self, outro):
+        """
+        Soma os valores de outro esboço (com o mesmo erro) a este
+
+        Raises:
+            ValueError: Se os esboços têm erros relativos diferentes
+        """
+        if outro.erro != self.erro:
+            raise ValueError(f"Esboços com erros diferentes: {self.erro} x {outro.erro}")
+        for balde, vezes in outro.baldes.items():
+            self.baldes[balde] = self.baldes.get(balde, 0) + vezes
+        self.zeros += outro.zeros
+        self.quantidade += outro.quantidade
+        self.soma += outro.soma
+        for limite in (outro.minimo, outro.maximo):
+            if limite is not None:
+                self.minimo = limite if self.minimo is None else min(self.minimo, limite)
+                self.maximo = limite if self.maximo is None else max(self.maximo, limite)
+
+    def quantil(self, q):
+        """
+        Args:
+            q (float): Entre 0 e 1 (0.5 = mediana)
+
+        Returns:
+            float: Valor do quantil (erro relativo <= erro), ou None se o esboço está vazio
+        """
+        if not self.quantidade:
+            return None
+        posicao = q * (self.quantidade - 1)
+        acumulado = self.zeros
+        if posicao < acumulado:
+            return 0.0
+        for balde in sorted(self.baldes):
+            acumulado += self.baldes[balde]
+            if posicao < acumulado:
+                # Ponto do balde com o mesmo erro relativo para as duas bordas
+                valor = 2 * self.gamma ** balde / (self.gamma + 1)
+                return min(max(valor, self.minimo), self.maximo)
+        return self.maximo
+
+    def media(self):
+        return self.soma / self.quantidade if self.quantidade else None
+
+    def estado(self):
+        # Baldes como pares: as chaves de um objeto JSON seriam strings
+        return {'erro': self.erro, 'baldes': sorted(self.baldes.items()), 'zeros': self.zeros,
+                'quantidade': self.quantidade, 'soma': self.soma, 'minimo': self.minimo, 'maximo': self.maximo}
+
+    @classmethod
+    def de_estado(cls, estado):
+        esboco = cls(float(estado['erro']))
+        esboco.baldes = {int(balde): int(vezes) for balde, vezes in estado['baldes']}
+        for campo in ('zeros', 'quantidade', 'soma', 'minimo', 'maximo'):
+            setattr(esboco, campo, estado[campo])
+        return esboco
+
+
+class TopK:
+    """
+    Itens mais frequentes com memória fixa (Space-Saving)
+
+    Quando a tabela está cheia, um item novo substitui o menos frequente e herda a
+    contagem dele (contagens podem ser superestimadas, nunca subestimadas). A mescla
+    soma as tabelas e mantém as `capacidade` maiores contagens.
+    """
+
+    __slots__ = ('capacidade', 'contagens')
+
+    def __init__(self, capacidade=CAPACIDADE_TOPK):
+        self.capacidade = capacidade
+        self.contagens = {}
+
+    def adicionar(self, item, vezes=1):
+        if item in self.contagens or len(self.contagens) < self.capacidade:
+            self.contagens[item] = self.contagens.get(item, 0) + vezes
+            return
+        menor = min(self.contagens, key=self.contagens.get)
+        self.contagens[item] = self.contagens.pop(menor) + vezes
+
+    def mesclar(self, outro):
+        for item, vezes in outro.contagens.items():
+            self.contagens[item] = self.contagens.get(item, 0) + vezes
+        if len(self.contagens) > self.capacidade:
+            self.contagens = dict(heapq.nlargest(self.capacidade, self.contagens.items(), key=lambda par: par[1]))
+
+    def mais_frequentes(self, k=5):
+        """
+        Returns:
+            list: Até k pares (item, contagem), do mais frequente ao menos
+        """
+        return heapq.nlargest(k, self.contagens.items(), key=lambda par: (par[1], par[0]))
+
+    def estado(self):
+        return {'capacidade': self.capacidade, 'contagens': self.contagens}
+
+    @classmethod
+    def de_estado(cls, estado):
+        topk = cls(int(estado['capacidade']))
+        topk.contagens = {str(item): int(vezes) for item, vezes in estado['contagens'].items()}
+        return topk
+
+
+class AgregadoGrupo:
+    """Estatísticas de um grupo de vagas (ex: área 'INFORMÁTICA')"""
+
+    __slots__ = ('vagas', 'salarios', 'sem_salario', 'horas_soma', 'horas_quantidade',
+                 'horarios', 'areas', 'empresas')
+
+    def __init__(self, erro=ERRO_QUANTIS, capacidade=CAPACIDADE_TOPK):
+        self.vagas = 0
+        self.salarios = EsbocoQuantis(erro)
+        self.sem_salario = 0
+        self.horas_soma = 0.0
+        self.horas_quantidade = 0
+        self.horarios = TopK(capacidade)
+        self.areas = TopK(capacidade)
+        self.empresas = TopK(capacidade)
+
+    def adicionar(self, vaga, empresa):
+        self.vagas += 1
+        # Só salários mensais (ou sem período) entram nos quantis; '/hora' etc. distorceriam a mediana
+        if vaga.salario_valor is not None and vaga.salario_periodo in ('mes', None):
+            self.salarios.adicionar(vaga.salario_valor)
+        else:
+            self.sem_salario += 1
+        if vaga.horas_semanais is not None:
+            self.horas_soma += vaga.horas_semanais
+            self.horas_quantidade += 1
+        if vaga.inicio is not None:
+            self.horarios.adicionar(f"{vaga.inicio:%H:%M}-{vaga.fim:%H:%M}")
+        if vaga.area:
+            self.areas.adicionar(vaga.area)
+        if empresa:
+            self.empresas.adicionar(empresa)
+
+    def mesclar(self, outro):
+        self.vagas += outro.vagas
+        self.salarios.mesclar(outro.salarios)
+        self.sem_salario += outro.sem_salario
+        self.horas_soma += outro.horas_soma
+        self.horas_quantidade += outro.horas_quantidade
+        self.horarios.mesclar(outro.horarios)
+        self.areas.mesclar(outro.areas)
+        self.empresas.mesclar(outro.empresas)
+
+    def resumo(self, k=3):
+        """
+        Returns:
+            dict: Vagas, quantis e média do salário, horas semanais médias e top-k
+        """
+        dados = {'vagas': self.vagas, 'com_salario': self.salarios.quantidade}
+        for q in QUANTIS_RESUMO:
+            dados[f"salario_p{round(q * 100)}"] = self.salarios.quantil(q)
+        dados['salario_medio'] = self.salarios.media()
+        dados['horas_semanais'] = self.horas_soma / self.horas_quantidade if self.horas_quantidade else None
+        dados['horarios'] = self.horarios.mais_frequentes(k)
+        dados['areas'] = self.areas.mais_frequentes(k)
+        dados['empresas'] = self.empresas.mais_frequentes(k)
+        return dados
+
+    def estado(self):
+        return {'vagas': self.vagas, 'salarios': self.salarios.estado(), 'sem_salario': self.sem_salario,
+                'horas_soma': self.horas_soma, 'horas_quantidade': self.horas_quantidade,
+                'horarios': self.horarios.estado(), 'areas': self.areas.estado(), 'empresas': self.empresas.estado()}
+
+    @classmethod
+    def de_estado(cls, estado):
+        grupo = cls.__new__(cls)
+        grupo.vagas = estado['vagas']
+        grupo.salarios = EsbocoQuantis.de_estado(estado['salarios'])
+        grupo.sem_salario = estado['sem_salario']
+        grupo.horas_soma = estado['horas_soma']
+        grupo.horas_quantidade = estado['horas_quantidade']
+        for campo in ('horarios', 'areas', 'empresas'):
+            setattr(grupo, campo, TopK.de_estado(estado[campo]))
+        return grupo
+
+
+def empresa_da_vaga(vaga):
+    """
+    Empresa da vaga: o campo 'empresa' da página de detalhe ou o início do título do card
+
+    Args:
+        vaga (Vaga): Vaga tipada
+
+    Returns:
+        str: Ex: 'Empresa 12' de 'Empresa 12 - Comércio varejista' (None se não há título)
+    """
+    empresa = vaga.get('empresa')
+    if empresa and empresa != 'N/A':
+        return empresa
+    if not vaga.descricao or vaga.descricao == 'N/A':
+        return None
+    return vaga.descricao.split(' - ', 1)[0].strip()
+
+
+def _digest(chave):
+    """Chave da vaga em 8 bytes (o conjunto de vistas fica ~4x menor que com as strings)"""
+    return int.from_bytes(hashlib.blake2b(chave.encode('utf-8'), digest_size=8).digest(), 'big')
+
+
+def _codificar_vistas(vistas):
+    """Digests das vagas vistas em base64 (8 bytes little-endian cada), para o JSON"""
+    dados = array('Q', sorted(vistas))
+    if sys.byteorder != 'little':
+        dados.byteswap()
+    return base64.b64encode(dados.tobytes()).decode('ascii')
+
+
+def _decodificar_vistas(texto):
+    dados = array('Q')
+    dados.frombytes(base64.b64decode(texto))
+    if sys.byteorder != 'little':
+        dados.byteswap()
+    return set(dados)
+
+
+class AgregadosVagas:
+    """
+    Estatísticas por grupo, atualizadas vaga a vaga e mescláveis
+
+    Uso:
+        agregados = AgregadosVagas.carregar('agregados_ciee.json') or AgregadosVagas()
+        for vaga in agregados.acompanhar(scraper.iterar(filtros), filtros):
+            ...
+        agregados.resumo('area', limite=10)
+        agregados.salvar('agregados_ciee.json')
+    """
+
+    def __init__(self, erro=ERRO_QUANTIS, capacidade=CAPACIDADE_TOPK):
+        self.erro = erro
+        self.capacidade = capacidade
+        self.grupos = {}
+        self.vistas = set()
+        self.fontes = {}
+
+    def __len__(self):
+        return len(self.vistas)
+
+    def _grupo(self, chave):
+        grupo = self.grupos.get(chave)
+        if grupo is None:
+            grupo = self.grupos[chave] = AgregadoGrupo(self.erro, self.capacidade)
+        return grupo
+
+    def adicionar(self, vaga, filtros=None):
+        """
+        Soma uma vaga aos grupos dela (vagas já vistas, pelo código, são ignoradas)
+
+        Args:
+            vaga: Dict extraído ou Vaga
+            filtros (dict): Filtros da busca (dão o nível de ensino, que não está no card)
+
+        Returns:
+            bool: True se a vaga era nova
+        """
+        chave = chave_vaga(vaga)
+        if chave is not None:
+            digest = _digest(chave)
+            if digest in self.vistas:
+                return False
+            self.vistas.add(digest)
+        if not isinstance(vaga, Vaga):
+            vaga = Vaga.de_dict(vaga)
+
+        valores = {
+            'tipo': vaga.categoria.value,
+            'area': vaga.area if vaga.area and vaga.area != 'N/A' else None,
+            'cidade': f"{vaga.cidade} - {vaga.uf}" if vaga.uf else vaga.cidade,
+            'nivel_ensino': (filtros or {}).get('nivel_ensino'),
+        }
+        empresa = empresa_da_vaga(vaga)
+        self._grupo(()).adicionar(vaga, empresa)
+        for dimensoes in DIMENSOES:
+            chave_grupo = tuple((dimensao, valores[dimensao]) for dimensao in dimensoes)
+            if all(valor for _, valor in chave_grupo):
+                self._grupo(chave_grupo).adicionar(vaga, empresa)
+        return True
+
+    def acompanhar(self, vagas, filtros=None):
+        """
+        Repassa as vagas, somando cada uma aos agregados no caminho
+
+        Args:
+            vagas: Iterável de vagas (ex: scraper.iterar(filtros))
+            filtros (dict): Filtros da busca
+
+        Yields:
+            As mesmas vagas
+        """
+        for vaga in vagas:
+            self.adicionar(vaga, filtros)
+            yield vaga
+
+    def mesclar(self, outro):
+        """
+        Soma os agregados de outra execução ou trabalhador a estes
+
+        Se todas as vagas do outro já estão aqui (ex: o mesmo arquivo mesclado de novo), nada
+        é somado. Numa sobreposição parcial, as vagas presentes nos dois (mesmo código) são
+        contadas duas vezes nos grupos, pois os esboços não guardam as vagas; distribua as
+        combinações entre os trabalhadores sem sobreposição.
+
+        Args:
+            outro (AgregadosVagas): Agregados com o mesmo erro de quantis
+
+        Returns:
+            int: Vagas que estavam nos dois
+        """
+        repetidas = len(self.vistas & outro.vistas)
+        if outro.vistas and repetidas == len(outro.vistas):
+            return repetidas
+        for chave, grupo in outro.grupos.items():
+            self._grupo(chave).mesclar(grupo)
+        self.vistas |= outro.vistas
+        self.fontes.update(outro.fontes)
+        return repetidas
+
+    def grupo(self, **valores):
+        """
+        Args:
+            **valores: Dimensões do grupo (ex: area='INFORMÁTICA', cidade='Brasília - DF'); nenhuma = total
+
+        Returns:
+            AgregadoGrupo: Grupo, ou None se não há vagas nele
+        """
+        dimensoes = next((d for d in DIMENSOES if set(d) == set(valores)), ()) if valores else ()
+        return self.grupos.get(tuple((dimensao, valores[dimensao]) for dimensao in dimensoes))
+
+    def resumo(self, dimensao='area', limite=None, k=3):
+        """
+        Resumo dos grupos de uma dimensão, do que tem mais vagas ao que tem menos
+
+        Args:
+            dimensao (str): 'tipo', 'area', 'cidade', 'nivel_ensino' ou 'area,cidade'
+            limite (int): Número máximo de grupos
+            k (int): Itens em cada top-k
+
+        Returns:
+            list: Dicts com os valores do grupo e AgregadoGrupo.resumo()
+        """
+        dimensoes = tuple(dimensao.split(','))
+        if dimensoes not in DIMENSOES:
+            raise ValueError(f"Dimensão desconhecida: {dimensao!r} (use {', '.join(','.join(d) for d in DIMENSOES)})")
+        grupos = [(chave, grupo) for chave, grupo in self.grupos.items()
+                  if tuple(nome for nome, _ in chave) == dimensoes]
+        grupos.sort(key=lambda item: (-item[1].vagas, item[0]))
+        return [{**dict(chave), **grupo.resumo(k)} for chave, grupo in grupos[:limite]]
+
+    def ingerir_arquivos(self, padroes):
+        """
+        Soma as vagas dos arquivos de saída ainda não lidos (ou alterados desde a última leitura)
+
+        Args:
+            padroes (list): Padrões glob (ex: ['vagas_ciee_*.jsonl'])
+
+        Returns:
+            dict: Arquivo -> vagas novas
+        """
+        from consulta import ler_arquivo_vagas
+
+        lidos = {}
+        for caminho in sorted({c for padrao in padroes for c in glob.glob(padrao)}):
+            info = os.stat(caminho)
+            assinatura = (info.st_size, info.st_mtime_ns)
+            if self.fontes.get(caminho) == assinatura:
+                continue
+            lidos[caminho] = sum(self.adicionar(vaga) for vaga in ler_arquivo_vagas(caminho))
+            self.fontes[caminho] = assinatura
+        return lidos
+
+    def salvar(self, caminho):
+        """
+        Grava os agregados em JSON (escrita atômica)
+
+        JSON e não pickle: 'mesclar' lê arquivos de trabalhadores em outras máquinas, e
+        carregar um pickle de terceiros executa código arbitrário.
+
+        Args:
+            caminho (str): Arquivo dos agregados
+        """
+        estado = {
+            'versao': VERSAO_AGREGADOS,
+            'erro': self.erro,
+            'capacidade': self.capacidade,
+            # Chaves dos grupos (tuplas de pares dimensão/valor) como listas
+            'grupos': [[[list(par) for par in chave], grupo.estado()] for chave, grupo in self.grupos.items()],
+            'vistas': _codificar_vistas(self.vistas),
+            'fontes': {arquivo: list(assinatura) for arquivo, assinatura in self.fontes.items()},
+        }
+        # Nome único: coletas paralelas (lote, trabalhadores) salvam o mesmo arquivo
+        temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(estado, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temporario, caminho)
+
+    @classmethod
+    def carregar(cls, caminho):
+        """
+        Lê agregados salvos
+
+        Args:
+            caminho (str): Arquivo dos agregados
+
+        Returns:
+            AgregadosVagas: Agregados salvos, ou None se ausentes, ilegíveis ou de outra versão
+        """
+        try:
+            with open(caminho, encoding='utf-8') as f:
+                estado = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(estado, dict) or estado.get('versao') != VERSAO_AGREGADOS:
+            return None
+        try:
+            agregados = cls(float(estado['erro']), int(estado['capacidade']))
+            agregados.grupos = {tuple(tuple(par) for par in chave): AgregadoGrupo.de_estado(grupo)
+                                for chave, grupo in estado['grupos']}
+            agregados.vistas = _decodificar_vistas(estado['vistas'])
+            agregados.fontes = {arquivo: tuple(assinatura) for arquivo, assinatura in estado['fontes'].items()}
+        except (KeyError, TypeError, ValueError, AttributeError):
+            return None
+        return agregados
+
+
+def _formatar_valor(valor):
+    return f"{valor:,.0f}".replace(',', '.') if valor is not None else '-'
+
+
+def imprimir_resumo(linhas, dimensao):
+    """Tabela do resumo: vagas, quartis e p90 do salário, horas semanais e horário mais comum"""
+    dimensoes = dimensao.split(',')
+    print(f"\n{' / '.join(dimensoes):<40}{'vagas':>7}{'p25':>8}{'mediana':>9}{'p75':>8}{'p90':>8}"
+          f"{'h/sem':>7}  horário mais comum")
+    for linha in linhas:
+        nome = ' / '.join(str(linha[d]) for d in dimensoes)
+        horario = linha['horarios'][0][0] if linha['horarios'] else '-'
+        horas = f"{linha['horas_semanais']:.0f}" if linha['horas_semanais'] is not None else '-'
+        print(f"{nome[:39]:<40}{linha['vagas']:>7}{_formatar_valor(linha['salario_p25']):>8}"
+              f"{_formatar_valor(linha['salario_p50']):>9}{_formatar_valor(linha['salario_p75']):>8}"
+              f"{_formatar_valor(linha['salario_p90']):>8}{horas:>7}  {horario}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--arquivo', default='agregados_ciee.json', help='arquivo dos agregados')
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    ingerir = subparsers.add_parser('ingerir', help='soma as vagas dos arquivos de saída ainda não lidos')
+    ingerir.add_argument('padroes', nargs='*', default=['vagas_ciee_*.jsonl', 'vagas_ciee_*.json', 'vagas_ciee_*.csv'])
+
+    resumo = subparsers.add_parser('resumo', help='tabela por grupo')
+    resumo.add_argument('--dimensao', default='area', choices=[','.join(d) for d in DIMENSOES])
+    resumo.add_argument('--limite', type=int, default=20)
+    resumo.add_argument('--json', action='store_true', help='imprime os grupos em JSONL')
+
+    mesclar = subparsers.add_parser('mesclar', help='soma agregados de outras execuções ou trabalhadores')
+    mesclar.add_argument('entradas', nargs='+', help='arquivos de agregados')
+    args = parser.parse_args(argv)
+
+    agregados = AgregadosVagas.carregar(args.arquivo) or AgregadosVagas()
+
+    if args.comando == 'ingerir':
+        lidos = agregados.ingerir_arquivos(args.padroes)
+        for caminho, quantidade in lidos.items():
+            print(f"📥 {caminho}: {quantidade} vagas novas")
+        agregados.salvar(args.arquivo)
+        print(f"📊 {len(agregados)} vagas nos agregados ({args.arquivo})")
+
+    elif args.comando == 'mesclar':
+        for entrada in args.entradas:
+            outro = AgregadosVagas.carregar(entrada)
+            if outro is None:
+                print(f"⚠️ {entrada}: ignorado (ausente ou de outra versão)")
+                continue
+            repetidas = agregados.mesclar(outro)
+            if outro and repetidas == len(outro):
+                print(f"⏭️ {entrada}: todas as {len(outro)} vagas já estavam nos agregados")
+            else:
+                print(f"🔀 {entrada}: {len(outro)} vagas" + (f" ({repetidas} já presentes)" if repetidas else ''))
+        agregados.salvar(args.arquivo)
+        print(f"📊 {len(agregados)} vagas nos agregados ({args.arquivo})")
+
+    else:
+        linhas = agregados.resumo(args.dimensao, limite=args.limite)
+        if args.json:
+            for linha in linhas:
+                print(json.dumps(linha, ensure_ascii=False))
+            return
+        total = agregados.grupo()
+        mediana = total.salarios.quantil(0.5) if total is not None else None
+        print(f"📊 {len(agregados)} vagas"
+              + (f", mediana do salário R$ {_formatar_valor(mediana)}" if mediana is not None else ''))
+        imprimir_resumo(linhas, args.dimensao)
+
+
+if __name__ == "__main__":
+    main()
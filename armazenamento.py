@@ -0,0 +1,283 @@
+"""Armazenamento persistente das vagas em SQLite, com histórico e diferenças entre execuções"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime
+
+from paginacao import chave_vaga
+
+
+# Vagas gravadas por transação em registrar_execucao (o lock fica livre entre os lotes)
+LOTE_REGISTRO = 50
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS vagas (
+    codigo TEXT PRIMARY KEY,
+    dados TEXT NOT NULL,
+    hash TEXT NOT NULL,
+    primeira_vez TEXT NOT NULL,
+    ultima_vez TEXT NOT NULL,
+    alterada_em TEXT,
+    removida_em TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_vagas_ultima_vez ON vagas (ultima_vez);
+
+-- Em quais buscas (escopo = filtros) cada vaga apareceu, para detectar remoções por busca
+CREATE TABLE IF NOT EXISTS vistas (
+    escopo TEXT NOT NULL,
+    codigo TEXT NOT NULL,
+    execucao INTEGER NOT NULL,
+    PRIMARY KEY (escopo, codigo)
+);
+CREATE INDEX IF NOT EXISTS idx_vistas_codigo ON vistas (codigo);
+
+CREATE TABLE IF NOT EXISTS execucoes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    escopo TEXT NOT NULL,
+    data TEXT NOT NULL,
+    completa INTEGER NOT NULL,
+    total INTEGER NOT NULL DEFAULT 0,
+    novas INTEGER NOT NULL DEFAULT 0,
+    alteradas INTEGER NOT NULL DEFAULT 0,
+    removidas INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+def hash_vaga(vaga):
+    """
+    Calcula o hash do conteúdo da vaga (detecta alterações entre execuções)
+
+    Args:
+        vaga (dict): Dados da vaga
+
+    Returns:
+        str: Hash SHA-1 do JSON canônico
+    """
+    canonico = json.dumps(vaga, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(canonico.encode('utf-8')).hexdigest()
+
+
+def escopo_filtros(filtros):
+    """
+    Converte os filtros em uma chave estável de escopo
+
+    Args:
+        filtros (dict): Filtros da busca (ou None para o escopo global)
+
+    Returns:
+        str: JSON canônico dos filtros
+    """
+    return json.dumps(filtros or {}, ensure_ascii=False, sort_keys=True)
+
+
+class ArmazemVagas:
+    """
+    Guarda cada vaga uma única vez (chave: código), com datas de primeira e última vez vista
+
+    Uso:
+        armazem = ArmazemVagas('vagas_ciee.db')
+        diff = armazem.registrar_execucao(vagas, filtros)
+        diff['novas'], diff['alteradas'], diff['removidas']
+    """
+
+    def __init__(self, caminho='vagas_ciee.db'):
+        """
+        Args:
+            caminho (str): Arquivo do banco SQLite (':memory:' para testes)
+        """
+        self.caminho = caminho
+        self.conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self.conexao.row_factory = sqlite3.Row
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.executescript(ESQUEMA)
+        self._lock = threading.Lock()
+        # Códigos inseridos pelas execuções em andamento: ainda contam como novos para pagina_conhecida
+        self._novas_em_andamento = set()
+
+    def codigos_conhecidos(self, codigos):
+        """
+        Filtra os códigos que já estavam no armazém (e não foram removidos)
+
+        As vagas novas da execução em andamento não contam: a coleta incremental
+        só para numa página que não trouxe nada de novo em relação às execuções anteriores.
+
+        Args:
+            codigos (iterable): Códigos a verificar
+
+        Returns:
+            set: Códigos já conhecidos
+        """
+        codigos = list(codigos)
+        conhecidos = set()
+        with self._lock:
+            for inicio in range(0, len(codigos), 500):
+                parte = codigos[inicio:inicio + 500]
+                marcadores = ','.join('?' * len(parte))
+                linhas = self.conexao.execute(
+                    f"SELECT codigo FROM vagas WHERE removida_em IS NULL AND codigo IN ({marcadores})", parte
+                )
+                conhecidos.update(linha['codigo'] for linha in linhas)
+            conhecidos -= self._novas_em_andamento
+        return conhecidos
+
+    def pagina_conhecida(self, vagas):
+        """
+        Indica se todas as vagas da página já estão no armazém
+
+        Usado como critério de parada da coleta incremental (parar_quando).
+
+        Args:
+            vagas (list): Vagas de uma página
+
+        Returns:
+            bool: True se a página não tem nenhuma vaga nova
+        """
+        codigos = {chave_vaga(vaga) for vaga in vagas}
+        return bool(codigos) and self.codigos_conhecidos(codigos) == codigos
+
+    def registrar_execucao(self, vagas, filtros=None, completa=True):
+        """
+        Faz upsert das vagas e calcula o que mudou desde a última execução com os mesmos filtros
+
+        O gerador é consumido sem segurar o lock: as vagas são gravadas em lotes de
+        LOTE_REGISTRO, cada um numa transação curta. Assim o critério de parada da coleta
+        incremental (pagina_conhecida) consulta o armazém enquanto as páginas chegam.
+
+        Args:
+            vagas (iterable): Vagas extraídas nesta execução (pode ser um gerador)
+            filtros (dict): Filtros usados (escopo para detectar remoções)
+            completa (bool ou callable): False quando a coleta parou cedo (modo incremental);
+                nesse caso nenhuma vaga é considerada removida. Com um gerador, passe uma
+                função avaliada depois de consumi-lo
+
+        Returns:
+            dict: 'novas' e 'alteradas' (listas de vagas), 'removidas' (lista de códigos)
+                e 'inalteradas' (quantidade)
+        """
+        agora = datetime.now().isoformat(timespec='seconds')
+        escopo = escopo_filtros(filtros)
+        resultado = {'novas': [], 'alteradas': [], 'removidas': [], 'inalteradas': 0}
+
+        with self._lock, self.conexao:
+            execucao = self.conexao.execute(
+                "INSERT INTO execucoes (escopo, data, completa) VALUES (?, ?, 0)", (escopo, agora)
+            ).lastrowid
+
+        vistos = set()
+        lote = []
+        interrompida = True
+        try:
+            try:
+                for vaga in vagas:
+                    codigo = chave_vaga(vaga)
+                    if not codigo or codigo in vistos:
+                        continue
+                    vistos.add(codigo)
+                    lote.append((codigo, vaga))
+                    if len(lote) >= LOTE_REGISTRO:
+                        lote, pendente = [], lote
+                        self._gravar_lote(pendente, escopo, execucao, agora, resultado)
+            finally:
+                # Também numa interrupção: as vagas do lote já estão na saída e no checkpoint
+                self._gravar_lote(lote, escopo, execucao, agora, resultado)
+            interrompida = False
+        finally:
+            with self._lock:
+                self._novas_em_andamento.difference_update(chave_vaga(vaga) for vaga in resultado['novas'])
+            if interrompida:
+                self._encerrar_execucao(execucao, False, len(vistos), resultado)
+
+        if callable(completa):
+            completa = completa()
+        with self._lock, self.conexao:
+            if completa:
+                resultado['removidas'] = [
+                    linha['codigo'] for linha in self.conexao.execute(
+                        "SELECT codigo FROM vistas WHERE escopo = ? AND execucao < ?", (escopo, execucao)
+                    )
+                ]
+                self.conexao.execute("DELETE FROM vistas WHERE escopo = ? AND execucao < ?", (escopo, execucao))
+                # Só marca como removida a vaga que não aparece em nenhuma outra busca
+                self.conexao.executemany(
+                    "UPDATE vagas SET removida_em = ? WHERE codigo = ? "
+                    "AND NOT EXISTS (SELECT 1 FROM vistas WHERE vistas.codigo = vagas.codigo)",
+                    [(agora, codigo) for codigo in resultado['removidas']],
+                )
+        self._encerrar_execucao(execucao, completa, len(vistos), resultado)
+
+        print(f"\n🗄️ {len(resultado['novas'])} novas, {len(resultado['alteradas'])} alteradas, "
+              f"{len(resultado['removidas'])} removidas, {resultado['inalteradas']} inalteradas")
+        return resultado
+
+    def _encerrar_execucao(self, execucao, completa, total, resultado):
+        """Grava os totais da execução (também quando ela foi interrompida, com completa=False)"""
+        with self._lock, self.conexao:
+            self.conexao.execute(
+                "UPDATE execucoes SET completa = ?, total = ?, novas = ?, alteradas = ?, removidas = ? WHERE id = ?",
+                (int(bool(completa)), total, len(resultado['novas']), len(resultado['alteradas']),
+                 len(resultado['removidas']), execucao),
+            )
+
+    def _gravar_lote(self, lote, escopo, execucao, agora, resultado):
+        """
+        Grava um lote de vagas numa transação curta, acumulando as diferenças em resultado
+
+        Args:
+            lote (list): Pares (código, vaga) ainda não vistos nesta execução
+            escopo (str): Escopo dos filtros (escopo_filtros)
+            execucao (int): ID da execução em andamento
+            agora (str): Data da execução (ISO)
+            resultado (dict): Acumulador de registrar_execucao
+        """
+        if not lote:
+            return
+        with self._lock, self.conexao:
+            for codigo, vaga in lote:
+                dados = json.dumps(vaga, ensure_ascii=False)
+                hash_atual = hash_vaga(vaga)
+
+                linha = self.conexao.execute(
+                    "SELECT hash, removida_em FROM vagas WHERE codigo = ?", (codigo,)
+                ).fetchone()
+                if linha is None or linha['removida_em'] is not None:
+                    resultado['novas'].append(vaga)
+                    self._novas_em_andamento.add(codigo)
+                    self.conexao.execute(
+                        "INSERT INTO vagas (codigo, dados, hash, primeira_vez, ultima_vez) VALUES (?, ?, ?, ?, ?) "
+                        "ON CONFLICT(codigo) DO UPDATE SET dados = excluded.dados, hash = excluded.hash, "
+                        "ultima_vez = excluded.ultima_vez, removida_em = NULL",
+                        (codigo, dados, hash_atual, agora, agora),
+                    )
+                elif linha['hash'] != hash_atual:
+                    resultado['alteradas'].append(vaga)
+                    self.conexao.execute(
+                        "UPDATE vagas SET dados = ?, hash = ?, ultima_vez = ?, alterada_em = ? WHERE codigo = ?",
+                        (dados, hash_atual, agora, agora, codigo),
+                    )
+                else:
+                    resultado['inalteradas'] += 1
+                    self.conexao.execute("UPDATE vagas SET ultima_vez = ? WHERE codigo = ?", (agora, codigo))
+
+                self.conexao.execute(
+                    "INSERT INTO vistas (escopo, codigo, execucao) VALUES (?, ?, ?) "
+                    "ON CONFLICT(escopo, codigo) DO UPDATE SET execucao = excluded.execucao",
+                    (escopo, codigo, execucao),
+                )
+
+    def vagas_ativas(self):
+        """
+        Returns:
+            list: Todas as vagas não removidas, das mais recentes para as mais antigas
+        """
+        with self._lock:
+            linhas = self.conexao.execute(
+                "SELECT dados FROM vagas WHERE removida_em IS NULL ORDER BY primeira_vez DESC, codigo"
+            ).fetchall()
+        return [json.loads(linha['dados']) for linha in linhas]
+
+    def fechar(self):
+        """Fecha a conexão com o banco"""
+        self.conexao.close()
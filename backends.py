@@ -0,0 +1,281 @@
+"""Interface comum dos backends de busca de vagas e backend HTTP (sem navegador)"""
+
+import json
+
+import urllib3
+
+from catalogo import CatalogoFiltros
+from controle import ErroHTTP
+from modelo import ColecaoVagas
+from paginacao import RelatorioPaginacao, iterar_paginas, iterar_vagas_paginas
+from parser_html import extrair_pagina_html, extrair_pagina_json
+from portal import PARAMETRO_PAGINA, URL_VAGAS, ids_filtros
+
+
+class BackendVagas:
+    """
+    Interface de um backend de busca de vagas
+
+    Implementações: CIEEScraper (Selenium, em main.py) e BackendHTTP.
+    Todas retornam a mesma lista de dicionários de vaga.
+    """
+
+    nome = None
+
+    def abrir(self):
+        """Prepara o backend (navegador, sessão HTTP...)"""
+
+    def iterar(self, filtros, todas_paginas=False, concorrencia=4, parar_quando=None, pular_paginas=(),
+               ao_extrair_pagina=None):
+        """
+        Executa uma busca com os filtros informados, gerando as vagas conforme são extraídas
+
+        Args:
+            filtros (dict): Ex: {'tipo_vaga': 'ESTÁGIO', 'cidade': 'BRASÍLIA - DF'}
+            todas_paginas (bool): Se True, coleta todas as páginas de resultados
+            concorrencia (int): Máximo de páginas buscadas ao mesmo tempo
+            parar_quando (callable): Recebe as vagas de uma página; se retornar True, as
+                páginas seguintes não são coletadas (ex: ArmazemVagas.pagina_conhecida)
+            pular_paginas (set): Números de páginas já coletadas, que não são entregues
+                (retomada de checkpoint.CheckpointColeta)
+            ao_extrair_pagina (callable): Recebe (número, vagas) de cada página, antes das vagas
+
+        Yields:
+            dict: Dados de cada vaga
+        """
+        raise NotImplementedError
+
+    def buscar(self, filtros, todas_paginas=False, concorrencia=4, parar_quando=None):
+        """
+        Executa uma busca com os filtros informados (ver iterar)
+
+        Returns:
+            list: Lista de dicionários com os dados das vagas
+        """
+        return list(self.iterar(filtros, todas_paginas=todas_paginas, concorrencia=concorrencia,
+                                parar_quando=parar_quando))
+
+    def buscar_colecao(self, filtros, todas_paginas=False, concorrencia=4, parar_quando=None):
+        """
+        Executa a busca guardando as vagas numa ColecaoVagas (ver iterar)
+
+        Salário, horário e localização são interpretados uma vez por valor distinto,
+        conforme as vagas são extraídas.
+
+        Returns:
+            ColecaoVagas: Vagas em colunas
+        """
+        return ColecaoVagas.de_dicts(self.iterar(filtros, todas_paginas=todas_paginas, concorrencia=concorrencia,
+                                                 parar_quando=parar_quando))
+
+    def fechar(self):
+        """Libera os recursos do backend"""
+
+    def __enter__(self):
+        self.abrir()
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+class BackendHTTP(BackendVagas):
+    """Envia a requisição de busca do portal direto por HTTP, sem abrir o navegador"""
+
+    nome = 'http'
+
+    def __init__(self, url_busca=None, conexoes=10, timeout=15, retries=2, catalogo=None,
+                 caminho_catalogo='catalogo_filtros.json', controle=None, gravador=None):
+        """
+        Inicializa o backend
+
+        Args:
+            url_busca (str): URL que recebe os filtros como parâmetros de query
+            conexoes (int): Tamanho do pool de conexões keep-alive por host
+            timeout (float): Timeout de cada requisição, em segundos
+            retries (int): Novas tentativas em erros de conexão
+            catalogo (CatalogoFiltros): Catálogo das opções dos filtros (padrão: o coletado pelo
+                backend Selenium em caminho_catalogo, mesmo expirado, ou os mapas de portal.py)
+            caminho_catalogo (str): Arquivo do catálogo salvo
+            controle (ControleAdaptativo): Se informado, cada requisição passa pelo limite de
+                taxa e pela concorrência adaptativa, e as páginas usam até controle.maximo threads
+            gravador (ArquivoGravacoes): Se informado, cada resposta da busca é gravada
+                para reprocessamento offline (ver gravacao.py)
+        """
+        self.url_busca = url_busca or URL_VAGAS
+        self.controle = controle
+        self.gravador = gravador
+        self.conexoes = max(conexoes, controle.maximo) if controle is not None else conexoes
+        self.timeout = timeout
+        self.retries = retries
+        if catalogo is None and caminho_catalogo:
+            catalogo = CatalogoFiltros.carregar(caminho_catalogo, ttl=None)
+        self.catalogo = catalogo or CatalogoFiltros.padrao()
+        self.http = None
+        self.relatorio_paginacao = None
+
+    def abrir(self):
+        """Cria o pool de conexões HTTP"""
+        if self.http is None:
+            self.http = urllib3.PoolManager(
+                maxsize=self.conexoes,
+                block=True,
+                timeout=urllib3.Timeout(total=self.timeout),
+                retries=urllib3.Retry(self.retries, backoff_factor=0.2),
+                headers={'User-Agent': 'Mozilla/5.0 (ciee-vagas)', 'Accept': 'application/json, text/html'},
+            )
+
+    def parametros_busca(self, filtros, pagina=None):
+        """
+        Monta os parâmetros de query da busca
+
+        Args:
+            filtros (dict): Filtros legíveis
+            pagina (int): Número da página (opcional)
+
+        Returns:
+            dict: Parâmetros com os IDs do formulário
+        """
+        parametros = ids_filtros(filtros, self.catalogo)
+        if pagina is not None:
+            parametros[PARAMETRO_PAGINA] = str(pagina)
+        return parametros
+
+    def requisitar(self, filtros, pagina=None):
+        """
+        Executa a requisição de busca
+
+        Args:
+            filtros (dict): Filtros legíveis
+            pagina (int): Número da página (opcional)
+
+        Returns:
+            urllib3.BaseHTTPResponse: Resposta da busca
+        """
+        self.abrir()
+        if self.controle is not None:
+            resposta = self.controle.executar(self._requisitar, filtros, pagina)
+        else:
+            resposta = self._requisitar(filtros, pagina)
+        # Fora do controle (o tempo de gravação não conta como latência) e sem derrubar a busca
+        if self.gravador is not None:
+            try:
+                tipo = 'json' if 'json' in resposta.headers.get('Content-Type', '') else 'html'
+                self.gravador.gravar(resposta.data, filtros, pagina or 1, tipo, self.url_busca)
+            except Exception as e:
+                print(f"  ⚠️ Não foi possível gravar a página {pagina or 1}: {e}")
+        return resposta
+
+    def _requisitar(self, filtros, pagina):
+        resposta = self.http.request('GET', self.url_busca, fields=self.parametros_busca(filtros, pagina))
+        if resposta.status >= 400:
+            raise ErroHTTP(resposta.status, self.url_busca)
+        return resposta
+
+    def extrair_resposta(self, resposta):
+        """
+        Converte a resposta (JSON ou HTML) na lista de vagas e no total de páginas
+
+        Args:
+            resposta: Resposta retornada por requisitar
+
+        Returns:
+            tuple: (lista de dicionários com os dados das vagas, total de páginas)
+        """
+        tipo = resposta.headers.get('Content-Type', '')
+        corpo = resposta.data.decode('utf-8', errors='replace')
+        if 'json' in tipo:
+            return extrair_pagina_json(json.loads(corpo), self.url_busca)
+        return extrair_pagina_html(corpo, self.url_busca)
+
+    def buscar_pagina(self, filtros, pagina):
+        """
+        Busca uma página de resultados (seguro para uso em várias threads)
+
+        Args:
+            filtros (dict): Filtros legíveis
+            pagina (int): Número da página
+
+        Returns:
+            list: Vagas da página
+        """
+        return self.extrair_resposta(self.requisitar(filtros, pagina))[0]
+
+    def iterar(self, filtros, todas_paginas=False, concorrencia=4, parar_quando=None, pular_paginas=(),
+               ao_extrair_pagina=None):
+        """
+        Busca as vagas com os filtros informados, gerando cada página assim que chega
+
+        Args:
+            filtros (dict): Filtros legíveis
+            todas_paginas (bool): Se True, busca as demais páginas em requisições concorrentes
+            concorrencia (int): Máximo de requisições simultâneas
+            parar_quando (callable): Critério de parada da coleta incremental (ver BackendVagas.iterar)
+            pular_paginas (set): Páginas já coletadas (a primeira é buscada para saber o total)
+            ao_extrair_pagina (callable): Recebe (número, vagas) de cada página
+
+        Yields:
+            dict: Dados de cada vaga
+        """
+        self.relatorio_paginacao = None
+        relatorio = RelatorioPaginacao()
+        vagas, total_paginas = self.extrair_resposta(self.requisitar(filtros))
+        print(f"✅ {len(vagas)} vagas encontradas via HTTP em {relatorio.segundos:.2f}s")
+
+        if not todas_paginas:
+            if 1 not in pular_paginas:
+                if ao_extrair_pagina is not None:
+                    ao_extrair_pagina(1, vagas)
+                yield from vagas
+            return
+
+        erros = {}
+        relatorio.paginas_puladas = sum(1 for numero in pular_paginas if numero <= total_paginas)
+        if relatorio.paginas_puladas:
+            print(f"  ⏭️ {relatorio.paginas_puladas} páginas já coletadas na execução anterior")
+        self.relatorio_paginacao = relatorio
+        yield from iterar_vagas_paginas(
+            self._iterar_paginas(filtros, vagas, total_paginas, concorrencia, parar_quando, erros, pular_paginas),
+            relatorio, ao_extrair_pagina,
+        )
+        relatorio.encerrar(erros, total_paginas)
+        relatorio.imprimir()
+
+    def _iterar_paginas(self, filtros, primeira, total_paginas, concorrencia, parar_quando, erros,
+                        pular_paginas=()):
+        """Gera (número, vagas) da primeira página já buscada e das seguintes, exceto as de pular_paginas"""
+        if 1 not in pular_paginas:
+            yield 1, primeira
+            if parar_quando is not None and parar_quando(primeira):
+                print("  ⏹️ Página 1 só tem vagas conhecidas, parando a coleta")
+                return
+        yield from iterar_paginas(
+            lambda numero: self.buscar_pagina(filtros, numero),
+            [numero for numero in range(2, total_paginas + 1) if numero not in pular_paginas],
+            self.controle.maximo if self.controle is not None else concorrencia, parar_quando, erros,
+        )
+
+    def fechar(self):
+        """Fecha o pool de conexões"""
+        if self.http is not None:
+            self.http.clear()
+            self.http = None
+
+
+def criar_backend(nome, **kwargs):
+    """
+    Cria um backend pelo nome
+
+    Args:
+        nome (str): 'selenium' ou 'http'
+        **kwargs: Repassados ao construtor do backend
+
+    Returns:
+        BackendVagas: Backend ainda não aberto
+    """
+    if nome == 'http':
+        return BackendHTTP(**kwargs)
+    if nome == 'selenium':
+        from main import CIEEScraper
+        return CIEEScraper(**kwargs)
+    raise ValueError(f"Backend desconhecido: {nome!r} (use 'selenium' ou 'http')")
@@ -0,0 +1,169 @@
+"""
+Atualização do painel após cada execução: recálculo sobre todo o histórico x agregados incrementais
+
+Simula --execucoes arquivos vagas_ciee_*.jsonl, cada um com --vagas vagas das quais
+uma fração --novas é nova (o resto repete execuções anteriores), e salários variados.
+Depois de cada execução, o painel (quantis do salário por área e cidade, contagem
+por tipo, top empresas) é atualizado de dois jeitos:
+  - recálculo: relê todos os arquivos, deduplica e calcula os quantis exatos;
+  - incremental: carrega agregados_ciee.json, ingere só o arquivo novo e salva.
+No fim, compara os quantis do esboço com os exatos e mede a mescla de N trabalhadores.
+
+Uso:
+    python -m benchmarks.bench_agregados --execucoes 30 --vagas 2000 --novas 0.2
+"""
+
+import argparse
+import json
+import os
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from collections import Counter, defaultdict
+
+from agregados import AgregadosVagas, empresa_da_vaga
+from consulta import ler_arquivo_vagas
+from fixture_ciee import AREAS, CIDADES, HORARIOS, TIPOS
+from modelo import Vaga
+from paginacao import chave_vaga
+
+
+def gerar_execucoes(pasta, execucoes, vagas, novas):
+    """
+    Grava os arquivos das execuções simuladas
+
+    Returns:
+        list: Caminhos dos arquivos, na ordem das execuções
+    """
+    caminhos = []
+    proximo = 0
+    for execucao in range(execucoes):
+        # Parte das vagas repete as das últimas execuções (continuam abertas no portal)
+        quantidade_novas = vagas if execucao == 0 else int(vagas * novas)
+        repetidas = range(max(0, proximo - (vagas - quantidade_novas)), proximo)
+        codigos = list(repetidas) + list(range(proximo, proximo + quantidade_novas))
+        proximo += quantidade_novas
+        caminho = os.path.join(pasta, f"vagas_ciee_{execucao:04d}.jsonl")
+        with open(caminho, 'w', encoding='utf-8') as f:
+            for i in codigos:
+                estado = random.Random(i)
+                salario = round(estado.lognormvariate(7.2, 0.35), 2)
+                f.write(json.dumps({
+                    'codigo': str(5860000 + i),
+                    'tipo': TIPOS[i % len(TIPOS)],
+                    # Poucas empresas concentram muitas vagas (cauda longa)
+                    'descricao': f"Empresa {min(499, int(estado.paretovariate(1.1)) - 1)} - Comércio varejista",
+                    'area': AREAS[i % len(AREAS)],
+                    'localizacao': CIDADES[(i // len(AREAS)) % len(CIDADES)],
+                    'horario': HORARIOS[estado.randrange(len(HORARIOS))],
+                    'salario': f"R$ {salario:,.2f} / Mês".replace(',', 'X').replace('.', ',').replace('X', '.'),
+                }, ensure_ascii=False) + '\n')
+        caminhos.append(caminho)
+    return caminhos
+
+
+def quantil_exato(valores, q):
+    return valores[int(q * (len(valores) - 1))]
+
+
+def recalcular(caminhos):
+    """
+    Painel calculado do zero: lê tudo, deduplica e calcula os quantis exatos
+
+    Returns:
+        dict: Mediana e p90 por (área, cidade), contagem por tipo e top empresas
+    """
+    vistas = {}
+    for caminho in caminhos:
+        for dados in ler_arquivo_vagas(caminho):
+            vistas.setdefault(chave_vaga(dados), dados)
+    salarios = defaultdict(list)
+    tipos = Counter()
+    empresas = Counter()
+    for dados in vistas.values():
+        vaga = Vaga.de_dict(dados)
+        tipos[vaga.categoria.value] += 1
+        empresas[empresa_da_vaga(vaga)] += 1
+        if vaga.salario_valor is not None:
+            salarios[(vaga.area, f"{vaga.cidade} - {vaga.uf}")].append(vaga.salario_valor)
+    painel = {}
+    for grupo, valores in salarios.items():
+        valores.sort()
+        painel[grupo] = (quantil_exato(valores, 0.5), quantil_exato(valores, 0.9))
+    return {'vagas': len(vistas), 'salarios': painel, 'tipos': tipos, 'empresas': empresas.most_common(10)}
+
+
+def atualizar_incremental(caminho_agregados, caminho_novo):
+    """Carrega os agregados, ingere só o arquivo novo e salva"""
+    agregados = AgregadosVagas.carregar(caminho_agregados) or AgregadosVagas()
+    agregados.ingerir_arquivos([caminho_novo])
+    agregados.resumo('area,cidade')
+    agregados.salvar(caminho_agregados)
+    return agregados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--execucoes', type=int, default=30)
+    parser.add_argument('--vagas', type=int, default=2000, help='vagas por execução')
+    parser.add_argument('--novas', type=float, default=0.2, help='fração de vagas novas por execução')
+    parser.add_argument('--trabalhadores', type=int, default=4, help='arquivos mesclados no fim')
+    args = parser.parse_args()
+
+    pasta = tempfile.mkdtemp(prefix='agregados_')
+    try:
+        caminhos = gerar_execucoes(pasta, args.execucoes, args.vagas, args.novas)
+        caminho_agregados = os.path.join(pasta, 'agregados_ciee.json')
+
+        print("\n" + "=" * 62)
+        print(f"{'execução':<10}{'histórico':>11}{'recálculo (ms)':>17}{'incremental (ms)':>19}")
+        marcos = {1, args.execucoes} | {round(args.execucoes * f) for f in (0.25, 0.5, 0.75)}
+        for execucao in range(1, args.execucoes + 1):
+            inicio = time.perf_counter()
+            agregados = atualizar_incremental(caminho_agregados, caminhos[execucao - 1])
+            ms_incremental = (time.perf_counter() - inicio) * 1000
+            if execucao not in marcos:
+                continue
+            inicio = time.perf_counter()
+            exato = recalcular(caminhos[:execucao])
+            ms_recalculo = (time.perf_counter() - inicio) * 1000
+            print(f"{execucao:<10}{exato['vagas']:>11}{ms_recalculo:>17.1f}{ms_incremental:>19.1f}")
+        print("=" * 62)
+
+        erros = []
+        for (area, cidade), (mediana, p90) in exato['salarios'].items():
+            grupo = agregados.grupo(area=area, cidade=cidade)
+            erros.append(abs(grupo.salarios.quantil(0.5) - mediana) / mediana)
+            erros.append(abs(grupo.salarios.quantil(0.9) - p90) / p90)
+        contagens_ok = all(agregados.grupo(tipo=tipo).vagas == n for tipo, n in exato['tipos'].items())
+        topo = [empresa for empresa, _ in agregados.grupo().empresas.mais_frequentes(10)]
+        print(f"📊 {len(agregados)} vagas ({'✓' if len(agregados) == exato['vagas'] else '✗'}), "
+              f"contagens por tipo {'✓' if contagens_ok else '✗'}, "
+              f"top-10 empresas {len(set(topo) & {e for e, _ in exato['empresas']})}/10 iguais")
+        print(f"   erro relativo dos quantis: mediano {statistics.median(erros):.2%}, máximo {max(erros):.2%}")
+        print(f"   arquivo: {os.path.getsize(caminho_agregados) / 1024:.0f} KB "
+              f"(histórico: {sum(os.path.getsize(c) for c in caminhos) / 1024:.0f} KB)")
+
+        # Trabalhadores com combinações disjuntas (uma parte das áreas cada), mesclados num só
+        partes = [AgregadosVagas() for _ in range(args.trabalhadores)]
+        for caminho in caminhos:
+            for dados in ler_arquivo_vagas(caminho):
+                partes[AREAS.index(dados['area']) % args.trabalhadores].adicionar(dados)
+        inicio = time.perf_counter()
+        mesclado = AgregadosVagas()
+        for parte in partes:
+            mesclado.mesclar(parte)
+        ms_mescla = (time.perf_counter() - inicio) * 1000
+        igual = all(mesclado.grupos[chave].vagas == grupo.vagas
+                    and mesclado.grupos[chave].salarios.baldes == grupo.salarios.baldes
+                    for chave, grupo in agregados.grupos.items())
+        print(f"🔀 mescla de {args.trabalhadores} trabalhadores: {ms_mescla:.1f} ms, {len(mesclado)} vagas, "
+              f"contagens e baldes dos quantis {'idênticos' if igual else 'diferentes'} aos de um único agregador")
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compara a latência por busca dos backends HTTP e Selenium contra o site sintético local
+
+Uso:
+    python -m benchmarks.bench_backends --vagas 100 --buscas 20
+    python -m benchmarks.bench_backends --selenium
+"""
+
+import argparse
+import statistics
+import time
+
+from backends import BackendHTTP
+from fixture_ciee import ServidorFixture, rotas_padrao
+
+
+FILTROS = {
+    'tipo_vaga': 'ESTÁGIO',
+    'nivel_ensino': 'Superior',
+    'area_profissional': 'INFORMÁTICA',
+    'cidade': 'BRASÍLIA - DF'
+}
+
+
+def medir(backend, buscas):
+    """
+    Executa várias buscas no mesmo backend e mede cada uma
+
+    Args:
+        backend (BackendVagas): Backend a medir
+        buscas (int): Quantidade de buscas
+
+    Returns:
+        dict: Segundos de abertura, latências por busca e vagas da última busca
+    """
+    inicio = time.perf_counter()
+    backend.abrir()
+    abertura = time.perf_counter() - inicio
+
+    latencias = []
+    vagas = []
+    try:
+        for _ in range(buscas):
+            inicio = time.perf_counter()
+            vagas = backend.buscar(FILTROS)
+            latencias.append(time.perf_counter() - inicio)
+    finally:
+        backend.fechar()
+
+    return {'abertura': abertura, 'latencias': latencias, 'vagas': len(vagas)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vagas', type=int, default=100, help='vagas retornadas por busca')
+    parser.add_argument('--buscas', type=int, default=20, help='buscas por backend')
+    parser.add_argument('--selenium', action='store_true', help='mede também o backend Selenium')
+    args = parser.parse_args()
+
+    resultados = {}
+    with ServidorFixture(rotas_padrao(args.vagas)) as servidor:
+        resultados['http (html)'] = medir(BackendHTTP(url_busca=servidor.url('/busca')), args.buscas)
+        resultados['http (json)'] = medir(BackendHTTP(url_busca=servidor.url('/api/busca')), args.buscas)
+
+        if args.selenium:
+            from main import CIEEScraper
+            scraper = CIEEScraper(headless=True, url_base=servidor.url('/portal'))
+            resultados['selenium'] = medir(scraper, min(args.buscas, 3))
+
+    print("\n" + "=" * 60)
+    print(f"{'backend':<14}{'vagas':>7}{'abertura (s)':>14}{'mediana (s)':>13}{'máx (s)':>10}")
+    for nome, r in resultados.items():
+        print(f"{nome:<14}{r['vagas']:>7}{r['abertura']:>14.3f}"
+              f"{statistics.median(r['latencias']):>13.3f}{max(r['latencias']):>10.3f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Lista carregada sob demanda no scroll: retrato único x colheita com MutationObserver
+
+A página fixture mostra --lote cards após aplicar os filtros e carrega mais --lote a
+cada vez que a lista é rolada até o fim, com --atraso ms de latência. O retrato único
+vê só o primeiro lote; a colheita rola até a quantidade estabilizar.
+
+Uso:
+    python -m benchmarks.bench_colheita --cards 200 --lote 20 --atraso 300
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from fixture_ciee import salvar_pagina_portal
+from main import CIEEScraper
+
+
+FILTROS = {
+    'tipo_vaga': 'ESTÁGIO',
+    'nivel_ensino': 'Superior',
+    'area_profissional': 'INFORMÁTICA',
+    'cidade': 'BRASÍLIA - DF'
+}
+
+
+def executar(url, colheita, quieto):
+    """
+    Executa acessar_site + aplicar_filtros + buscar_vagas
+
+    Returns:
+        dict: Vagas encontradas, segundos da busca e segundos da colheita
+    """
+    scraper = CIEEScraper(headless=True, url_base=url, colheita=colheita, quieto_colheita=quieto,
+                          caminho_seletores=None, caminho_catalogo=None)
+    try:
+        scraper.inicializar_driver()
+        scraper.acessar_site()
+        scraper.aplicar_filtros(FILTROS)
+        inicio = time.perf_counter()
+        vagas = scraper.buscar_vagas()
+        passos = scraper.esperas.relatorio()['passos']
+        return {
+            'vagas': len(vagas),
+            'segundos': time.perf_counter() - inicio,
+            'colheita': passos.get('colheita', {}).get('segundos', 0.0),
+        }
+    finally:
+        scraper.fechar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cards', type=int, default=200, help='cards no total')
+    parser.add_argument('--lote', type=int, default=20, help='cards por carregamento no scroll')
+    parser.add_argument('--atraso', type=int, default=300, help='latência de cada lote (ms)')
+    parser.add_argument('--quieto', type=float, default=0.5, help='silêncio que encerra a colheita (s)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = salvar_pagina_portal(os.path.join(pasta, 'portal.html'), args.cards, lote_rolagem=args.lote,
+                                       atraso_rolagem=args.atraso)
+        url = Path(caminho).as_uri()
+        resultados = {
+            'retrato': executar(url, False, args.quieto),
+            'colheita': executar(url, True, args.quieto),
+        }
+
+    lotes = -(-args.cards // args.lote)
+    print("\n" + "=" * 56)
+    print(f"{'modo':<12}{'vagas':>8}{'busca (s)':>12}{'colheita (s)':>14}")
+    for modo, r in resultados.items():
+        print(f"{modo:<12}{r['vagas']:>8}{r['segundos']:>12.2f}{r['colheita']:>14.2f}")
+    print("=" * 56)
+    print(f"Piso do conteúdo: {lotes - 1} lotes x {args.atraso} ms = {(lotes - 1) * args.atraso / 1000:.2f}s "
+          f"(+ {args.quieto:.2f}s de silêncio)")
+
+
+if __name__ == "__main__":
+    main()
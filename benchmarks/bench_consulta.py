@@ -0,0 +1,76 @@
+"""
+Consultas no índice local (consulta.IndiceVagas) x varredura linear das vagas
+
+Uso:
+    python -m benchmarks.bench_consulta --vagas 100000
+"""
+
+import argparse
+import time
+
+from benchmarks.bench_modelo import gerar_dicts
+from catalogo import normalizar
+from consulta import TURNOS, IndiceVagas
+from modelo import Vaga, TipoVaga
+
+# Nome, filtros do índice, ordenação e predicado equivalente para a varredura linear
+CONSULTAS = [
+    ('texto + UF', {'texto': 'comercio', 'uf': 'DF'}, None,
+     lambda v: 'COMERCIO' in normalizar(v.descricao).split() and v.uf == 'DF'),
+    ('tipo + salário', {'tipo': 'aprendiz', 'salario_min': 1200}, None,
+     lambda v: v.categoria is TipoVaga.APRENDIZ and v.salario_valor is not None and v.salario_valor >= 1200),
+    ('turno tarde', {'turno': 'tarde'}, None,
+     lambda v: v.inicio is not None and TURNOS['tarde'][0] <= v.inicio.hour * 60 + v.inicio.minute <= TURNOS['tarde'][1]),
+    ('top-10 salário', {}, '-salario', lambda v: True),
+]
+
+
+def varrer(vagas, predicado, ordenar, limite):
+    encontradas = [v for v in vagas if predicado(v)]
+    if ordenar:
+        encontradas.sort(key=lambda v: (v.salario_valor is None, -(v.salario_valor or 0)))
+    return encontradas[:limite]
+
+
+def cronometrar(funcao, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        resultado = funcao()
+    return resultado, (time.perf_counter() - inicio) / repeticoes * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vagas', type=int, default=100000)
+    parser.add_argument('--limite', type=int, default=10)
+    parser.add_argument('--repeticoes', type=int, default=20)
+    args = parser.parse_args()
+
+    dicts = gerar_dicts(args.vagas)
+    inicio = time.perf_counter()
+    indice = IndiceVagas()
+    metade = args.vagas // 2
+    indice.ingerir(dicts[:metade])
+    indice.ingerir(dicts[metade:])
+    segundos_indice = time.perf_counter() - inicio
+    vagas = [Vaga.de_dict(d) for d in dicts]
+    print(f"\nÍndice de {len(indice)} vagas montado em {segundos_indice:.2f} s (duas ingestões)")
+
+    print("\n" + "=" * 66)
+    print(f"{'consulta':<18}{'vagas':>10}{'índice (ms)':>13}{'linear (ms)':>13}{'ganho':>9}{'ok':>3}")
+    for nome, filtros, ordenar, predicado in CONSULTAS:
+        total = indice.contar(**filtros)
+        resultado, ms_indice = cronometrar(
+            lambda: indice.buscar(ordenar=ordenar, limite=args.limite, **filtros), args.repeticoes)
+        esperado, ms_linear = cronometrar(lambda: varrer(vagas, predicado, ordenar, args.limite), args.repeticoes)
+        if ordenar:
+            ok = [v.salario_valor for v in resultado] == [v.salario_valor for v in esperado]
+        else:
+            ok = total == len([v for v in vagas if predicado(v)])
+        print(f"{nome:<18}{total:>10}{ms_indice:>13.2f}{ms_linear:>13.2f}"
+              f"{ms_linear / max(ms_indice, 1e-9):>8.0f}x{'✓' if ok else '✗':>3}")
+    print("=" * 66)
+
+
+if __name__ == "__main__":
+    main()
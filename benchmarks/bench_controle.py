@@ -0,0 +1,75 @@
+"""
+Concorrência fixa x controle adaptativo (AIMD) contra um servidor local de capacidade limitada
+
+O servidor sintético responde normalmente até --capacidade requisições simultâneas,
+fica mais lento acima disso, responde 503 acima do dobro e, com --falhas, devolve
+500 aleatórios. Cada execução coleta todas as páginas pelo backend HTTP.
+
+Uso:
+    python -m benchmarks.bench_controle --paginas 200 --capacidade 8 --latencia 0.05
+    python -m benchmarks.bench_controle --falhas 0.02 --taxa 100
+"""
+
+import argparse
+import time
+
+from backends import BackendHTTP
+from controle import ControleAdaptativo
+from fixture_ciee import ServidorFixture, rotas_padrao, simular_sobrecarga
+
+
+def coletar(url_busca, concorrencia=4, controle=None):
+    """
+    Coleta todas as páginas de uma busca
+
+    Returns:
+        dict: páginas ok, páginas com erro, vagas e segundos
+    """
+    inicio = time.perf_counter()
+    with BackendHTTP(url_busca=url_busca, conexoes=concorrencia, caminho_catalogo=None, retries=0,
+                     controle=controle) as backend:
+        vagas = backend.buscar({}, todas_paginas=True, concorrencia=concorrencia)
+        relatorio = backend.relatorio_paginacao
+    return {
+        'paginas': relatorio.paginas_coletadas,
+        'erros': len(relatorio.erros),
+        'vagas': len(vagas),
+        'segundos': time.perf_counter() - inicio,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--paginas', type=int, default=200)
+    parser.add_argument('--capacidade', type=int, default=8, help='requisições simultâneas sem degradar')
+    parser.add_argument('--latencia', type=float, default=0.05, help='latência de cada página (s)')
+    parser.add_argument('--falhas', type=float, default=0.0, help='probabilidade de HTTP 500 aleatório')
+    parser.add_argument('--taxa', type=float, default=None, help='limite de requisições/s do controle')
+    parser.add_argument('--fixas', type=int, nargs='+', default=[2, 8, 32], help='concorrências fixas comparadas')
+    parser.add_argument('--maximo', type=int, default=64, help='concorrência máxima do controle')
+    args = parser.parse_args()
+
+    rotas = simular_sobrecarga(rotas_padrao(args.paginas * 10, por_pagina=10, latencia_busca=args.latencia),
+                               capacidade=args.capacidade, taxa_falhas=args.falhas)
+    linhas = []
+    with ServidorFixture(rotas) as servidor:
+        url = servidor.url('/busca')
+        for concorrencia in args.fixas:
+            linhas.append((f"fixa {concorrencia}", coletar(url, concorrencia=concorrencia)))
+        controle = ControleAdaptativo('bench', inicial=2, maximo=args.maximo, taxa=args.taxa)
+        linhas.append(("adaptativa", coletar(url, controle=controle)))
+
+    print("\n" + "=" * 64)
+    print(f"{'concorrência':<14}{'páginas ok':>12}{'erros':>8}{'vagas':>9}{'segundos':>10}{'págs/s':>10}")
+    for nome, r in linhas:
+        print(f"{nome:<14}{r['paginas']:>12}{r['erros']:>8}{r['vagas']:>9}{r['segundos']:>10.2f}"
+              f"{r['paginas'] / max(r['segundos'], 1e-9):>10.1f}")
+    print("=" * 64)
+    relatorio = controle.relatorio()
+    print(f"Controle: limite final {relatorio['limite']} (maior {relatorio['maior_limite']}), "
+          f"{relatorio['reducoes']} reduções, {relatorio['falhas']} falhas, "
+          f"latência base {relatorio['latencia_base'] * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
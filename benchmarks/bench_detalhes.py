@@ -0,0 +1,62 @@
+"""
+Mede o enriquecimento com as páginas de detalhe: sequencial x concorrente x cache
+
+Uso:
+    python -m benchmarks.bench_detalhes --vagas 500 --latencia 0.05 --concorrencia 1 16 32
+"""
+
+import argparse
+
+from backends import BackendHTTP
+from detalhes import CacheDetalhes, EnriquecedorDetalhes
+from fixture_ciee import ServidorFixture, rotas_padrao
+
+
+def enriquecer(vagas, concorrencia, cache=None):
+    """
+    Enriquece cópias das vagas e retorna as estatísticas
+
+    Args:
+        vagas (list): Vagas coletadas (não são alteradas)
+        concorrencia (int): Páginas de detalhe simultâneas
+        cache (CacheDetalhes): Cache opcional
+
+    Returns:
+        dict: Estatísticas do EnriquecedorDetalhes
+    """
+    with EnriquecedorDetalhes(concorrencia=concorrencia, cache=cache) as enriquecedor:
+        enriquecedor.enriquecer([dict(vaga) for vaga in vagas])
+        return enriquecedor.estatisticas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vagas', type=int, default=500)
+    parser.add_argument('--latencia', type=float, default=0.05, help='atraso de cada página de detalhe (s)')
+    parser.add_argument('--concorrencia', type=int, nargs='+', default=[1, 16, 32])
+    args = parser.parse_args()
+
+    linhas = []
+    rotas = rotas_padrao(args.vagas, por_pagina=100, latencia_detalhe=args.latencia)
+    with ServidorFixture(rotas) as servidor:
+        with BackendHTTP(url_busca=servidor.url('/busca'), caminho_catalogo=None) as backend:
+            vagas = backend.buscar({}, todas_paginas=True)
+
+        for concorrencia in args.concorrencia:
+            linhas.append((f"concorrência {concorrencia}", enriquecer(vagas, concorrencia)))
+
+        cache = CacheDetalhes(':memory:')
+        enriquecer(vagas, max(args.concorrencia), cache)
+        linhas.append(("cache (2ª execução)", enriquecer(vagas, max(args.concorrencia), cache)))
+        cache.fechar()
+
+    print("\n" + "=" * 62)
+    print(f"{'execução':<22}{'http':>7}{'cache':>7}{'erros':>7}{'segundos':>10}{'vagas/s':>9}")
+    for nome, e in linhas:
+        print(f"{nome:<22}{e['http']:>7}{e['cache']:>7}{e['erros']:>7}{e['segundos']:>10.2f}"
+              f"{len(vagas) / max(e['segundos'], 1e-9):>9.0f}")
+    print("=" * 62)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Vazão do modo distribuído por número de trabalhadores (processos), com a fila servida por HTTP
+
+Cada trabalhador é um processo com o backend HTTP contra o servidor local, como um nó
+remoto falaria com o coordenador. Com --abandonar, uma tarefa é alugada por um trabalhador
+que nunca reporta: ela é reentregue quando o aluguel (--duracao) expira.
+
+Uso:
+    python -m benchmarks.bench_distribuido --combinacoes 40 --trabalhadores 1 2 4 --latencia 0.1
+    python -m benchmarks.bench_distribuido --abandonar --duracao 2
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import threading
+import time
+
+from distribuido import FilaHTTP, FilaSQLite, executar_trabalhador, imprimir_status, servir_fila
+from fixture_ciee import ServidorFixture, rotas_padrao
+
+
+def _trabalhador(url_fila, url_busca, duracao):
+    executar_trabalhador(FilaHTTP(url_fila), backend='http', duracao=duracao, intervalo=0.2, ate_esvaziar=True,
+                         kwargs_backend={'url_busca': url_busca, 'caminho_catalogo': None})
+
+
+def rodada(trabalhadores, combinacoes, url_busca, duracao, abandonar):
+    """
+    Publica as combinações e espera os trabalhadores esvaziarem a fila
+
+    Returns:
+        dict: Status final da rodada (FilaSQLite.status)
+    """
+    with tempfile.TemporaryDirectory() as pasta:
+        fila = FilaSQLite(os.path.join(pasta, 'fila.db'))
+        servidor = servir_fila(fila, '127.0.0.1', 0)
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        url_fila = f"http://127.0.0.1:{servidor.server_address[1]}"
+        rodada_id = fila.publicar([{'cidade': f"CIDADE {i}"} for i in range(combinacoes)], todas_paginas=True)
+
+        contexto = multiprocessing.get_context('spawn')
+        if abandonar:
+            # Como um trabalhador que morreu logo depois de alugar
+            fila.alugar('abandonado', duracao)
+        processos = [contexto.Process(target=_trabalhador, args=(url_fila, url_busca, duracao))
+                     for _ in range(trabalhadores)]
+        for processo in processos:
+            processo.start()
+        # Trabalhadores que esvaziaram a fila antes do aluguel abandonado expirar saem; espera a reentrega
+        while fila.status(rodada_id)['pendentes']:
+            if not any(processo.is_alive() for processo in processos):
+                processos = [contexto.Process(target=_trabalhador, args=(url_fila, url_busca, duracao))]
+                processos[0].start()
+            time.sleep(0.1)
+        for processo in processos:
+            processo.join()
+        status = fila.status(rodada_id)
+        servidor.shutdown()
+        servidor.server_close()
+        fila.fechar()
+    return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--combinacoes', type=int, default=40)
+    parser.add_argument('--trabalhadores', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--paginas', type=int, default=3, help='páginas por combinação')
+    parser.add_argument('--latencia', type=float, default=0.1, help='latência de cada página (s)')
+    parser.add_argument('--duracao', type=float, default=2.0, help='prazo do aluguel (s)')
+    parser.add_argument('--abandonar', action='store_true', help='um trabalhador morre com uma tarefa alugada')
+    args = parser.parse_args()
+
+    linhas = []
+    with ServidorFixture(rotas_padrao(args.paginas * 10, por_pagina=10, latencia_busca=args.latencia)) as servidor:
+        for trabalhadores in args.trabalhadores:
+            status = rodada(trabalhadores, args.combinacoes, servidor.url('/busca'), args.duracao, args.abandonar)
+            imprimir_status(status)
+            linhas.append((trabalhadores, status))
+
+    print("\n" + "=" * 72)
+    print(f"{'trabalhadores':<15}{'concluídas':>12}{'reentregas':>12}{'segundos':>10}{'tarefas/min':>13}"
+          f"{'vagas/s':>10}")
+    for trabalhadores, status in linhas:
+        print(f"{trabalhadores:<15}{status['estados'].get('concluida', 0):>12}{status['reentregas']:>12}"
+              f"{status['segundos']:>10.2f}{status['tarefas_por_minuto']:>13.0f}{status['vagas_por_segundo']:>10.0f}")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
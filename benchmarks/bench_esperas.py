@@ -0,0 +1,78 @@
+"""
+Mede o tempo de uma execução filtrada com pausas fixas x esperas por eventos
+
+Uso:
+    python -m benchmarks.bench_esperas --cards 100
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from fixture_ciee import salvar_pagina_portal
+from main import CIEEScraper
+
+
+FILTROS = {
+    'tipo_vaga': 'ESTÁGIO',
+    'nivel_ensino': 'Superior',
+    'area_profissional': 'INFORMÁTICA',
+    'cidade': 'BRASÍLIA - DF'
+}
+
+
+def executar(url, modo):
+    """
+    Executa acessar_site + aplicar_filtros + buscar_vagas no modo de espera indicado
+
+    Args:
+        url (str): URL da página fixture
+        modo (str): 'sleep' ou 'evento'
+
+    Returns:
+        dict: Segundos totais, vagas encontradas e relatório das esperas
+    """
+    scraper = CIEEScraper(headless=True, url_base=url, modo_espera=modo)
+    try:
+        scraper.inicializar_driver()
+        inicio = time.perf_counter()
+        scraper.acessar_site()
+        scraper.aplicar_filtros(FILTROS)
+        vagas = scraper.buscar_vagas()
+        return {
+            'segundos': time.perf_counter() - inicio,
+            'vagas': len(vagas),
+            'esperas': scraper.esperas.relatorio(),
+        }
+    finally:
+        scraper.fechar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cards', type=int, default=100, help='cards exibidos após aplicar os filtros')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = salvar_pagina_portal(os.path.join(pasta, 'portal.html'), args.cards)
+        url = Path(caminho).as_uri()
+        resultados = {modo: executar(url, modo) for modo in ('sleep', 'evento')}
+
+    print("\n" + "=" * 50)
+    print(f"{'modo':<10}{'vagas':>8}{'total (s)':>12}{'esperas (s)':>14}")
+    for modo, r in resultados.items():
+        print(f"{modo:<10}{r['vagas']:>8}{r['segundos']:>12.2f}{r['esperas']['total_segundos']:>14.2f}")
+    print("=" * 50)
+
+    print("\nEsperas por passo (modo evento):")
+    for passo, dados in resultados['evento']['esperas']['passos'].items():
+        print(f"  {passo:<12} {dados['vezes']:>3}x  {dados['segundos']:>6.2f}s  (pausas fixas: {dados['legado']:.2f}s)")
+
+    economizado = resultados['sleep']['segundos'] - resultados['evento']['segundos']
+    print(f"\n⏱️ Tempo economizado: {economizado:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compara a extração card a card com a extração em lote numa página local
+
+Uso:
+    python -m benchmarks.bench_extracao --cards 300
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from fixture_ciee import salvar_pagina_vagas
+from main import CIEEScraper
+
+
+def medir_extracao(scraper, modo):
+    """
+    Executa buscar_vagas no modo indicado e mede comandos e tempo
+
+    Args:
+        scraper (CIEEScraper): Scraper com a página fixture já carregada
+        modo (str): 'individual' ou 'lote'
+
+    Returns:
+        dict: Vagas extraídas, comandos WebDriver e segundos gastos
+    """
+    scraper.zerar_contador_comandos()
+    inicio = time.perf_counter()
+    vagas = scraper.buscar_vagas(modo_extracao=modo)
+    return {
+        'vagas': len(vagas),
+        'comandos': scraper.total_comandos_webdriver(),
+        'segundos': time.perf_counter() - inicio,
+        'resultado': vagas,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--cards', type=int, default=300, help='quantidade de cards na página fixture')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = salvar_pagina_vagas(os.path.join(pasta, 'vagas.html'), args.cards)
+        scraper = CIEEScraper(headless=True, url_base=Path(caminho).as_uri())
+
+        try:
+            scraper.inicializar_driver()
+            scraper.acessar_site()
+
+            individual = medir_extracao(scraper, 'individual')
+            lote = medir_extracao(scraper, 'lote')
+        finally:
+            scraper.fechar()
+
+    print("\n" + "=" * 50)
+    print(f"{'modo':<12}{'vagas':>8}{'comandos':>12}{'segundos':>12}")
+    for nome, r in (('individual', individual), ('lote', lote)):
+        print(f"{nome:<12}{r['vagas']:>8}{r['comandos']:>12}{r['segundos']:>12.2f}")
+    print("=" * 50)
+    print(f"Resultados idênticos: {individual['resultado'] == lote['resultado']}")
+
+
+if __name__ == "__main__":
+    main()
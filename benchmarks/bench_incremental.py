@@ -0,0 +1,108 @@
+"""
+Coleta incremental ponta a ponta (coleta.executar_coleta) contra o site sintético local
+
+Roda a coleta completa com o backend HTTP, gravando o histórico SQLite, o arquivo
+JSONL e o checkpoint, nesta ordem:
+  1. 'incremental' com o histórico vazio: todas as vagas são novas, coleta tudo;
+  2. 'incremental' de novo: a primeira página só tem vagas conhecidas, para nela;
+  3. 'todas' para comparar: coleta todas as páginas de novo.
+Cada execução roda numa thread com --timeout; se passar do limite (ex: o armazém
+travado esperando o próprio lock), o benchmark falha em vez de ficar preso.
+
+Uso:
+    python -m benchmarks.bench_incremental --vagas 2000 --por-pagina 20
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+
+import backends
+from coleta import executar_coleta
+from fixture_ciee import ServidorFixture, rotas_padrao
+from metricas import desativar
+
+
+FILTROS = {'tipo_vaga': 'ESTÁGIO', 'cidade': 'SÃO PAULO - SP'}
+
+
+def executar(pasta, modo, timeout):
+    """
+    Executa uma coleta numa thread, sem a saída no terminal
+
+    Returns:
+        tuple: (vagas gravadas ou None, segundos), ou None se passou do timeout
+    """
+    resultado = {}
+
+    def coletar():
+        inicio = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            resultado['vagas'] = executar_coleta(
+                FILTROS, backend='http', modo=modo,
+                arquivo_saida=os.path.join(pasta, f"vagas_{modo}_{time.monotonic_ns()}.jsonl"),
+                caminho_checkpoint=os.path.join(pasta, 'checkpoint.json'),
+                caminho_db=os.path.join(pasta, 'vagas.db'),
+                arquivo_agregados=None, arquivo_metricas=None,
+            )
+        resultado['segundos'] = time.perf_counter() - inicio
+
+    thread = threading.Thread(target=coletar, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    if thread.is_alive():
+        return None
+    return resultado['vagas'], resultado['segundos']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vagas', type=int, default=2000, help='total de vagas no site sintético')
+    parser.add_argument('--por-pagina', type=int, default=20, help='vagas por página')
+    parser.add_argument('--latencia', type=float, default=0.02, help='atraso de cada página, em segundos')
+    parser.add_argument('--timeout', type=float, default=60.0, help='limite de cada execução, em segundos')
+    args = parser.parse_args()
+    desativar()
+
+    pasta = tempfile.mkdtemp(prefix='incremental_')
+    rotas = rotas_padrao(args.vagas, por_pagina=args.por_pagina, latencia_busca=args.latencia)
+    linhas = []
+    try:
+        with ServidorFixture(rotas) as servidor:
+            backends.URL_VAGAS = servidor.url('/busca')
+            for rotulo, modo in [('incremental (vazio)', 'incremental'), ('incremental (repetida)', 'incremental'),
+                                 ('todas', 'todas')]:
+                medido = executar(pasta, modo, args.timeout)
+                if medido is None:
+                    print(f"❌ '{rotulo}' passou de {args.timeout:.0f}s (coleta travada)")
+                    sys.exit(1)
+                linhas.append((rotulo, *medido))
+
+        with sqlite3.connect(os.path.join(pasta, 'vagas.db')) as conexao:
+            execucoes = conexao.execute("SELECT total, novas, completa FROM execucoes ORDER BY id").fetchall()
+    finally:
+        shutil.rmtree(pasta, ignore_errors=True)
+
+    print("\n" + "=" * 72)
+    print(f"{'execução':<24}{'vagas':>8}{'novas':>8}{'completa':>10}{'segundos':>10}{'vagas/s':>12}")
+    for (rotulo, vagas, segundos), (total, novas, completa) in zip(linhas, execucoes):
+        print(f"{rotulo:<24}{vagas or 0:>8}{novas:>8}{'sim' if completa else 'não':>10}{segundos:>10.2f}"
+              f"{(vagas or 0) / segundos:>12.0f}")
+    print("=" * 72)
+    primeira, repetida = linhas[0][1] or 0, linhas[1][1] or 0
+    ok = primeira == args.vagas and repetida == min(args.vagas, args.por_pagina)
+    print(f"{'✅' if ok else '❌'} a execução repetida parou na primeira página ({repetida} vagas); "
+          f"a primeira coletou {primeira}/{args.vagas}")
+    if not ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Tempo de início da linha de comando: importações e comandos que não abrem navegador
+
+Mede, em processos novos:
+  - o tempo acumulado de importação de cada módulo (python -X importtime);
+  - a mediana do tempo de parede de cada comando (--help, catálogo, consulta, gravações)
+    pelo cli.py e, para comparação, do main.py --help (que importa o Selenium);
+  - se o comando importou o Selenium.
+
+Com --executavel, também cronometra os mesmos comandos em executáveis congelados
+(ex: dist/ciee-vagas/ciee-vagas do cli.spec contra dist/main do main.spec).
+
+Uso:
+    python -m benchmarks.bench_inicio --repeticoes 10
+    python -m benchmarks.bench_inicio --executavel dist/ciee-vagas/ciee-vagas dist/main
+"""
+
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODULOS = ['cli', 'consulta', 'gravacao', 'catalogo', 'coleta', 'backends', 'distribuido', 'main']
+
+COMANDOS = [
+    ('cli.py --help', ['cli.py', '--help']),
+    ('cli.py catalogo', ['cli.py', 'catalogo']),
+    ('cli.py consulta --help', ['cli.py', 'consulta', '--help']),
+    ('cli.py gravacoes --help', ['cli.py', 'gravacoes', '--help']),
+    ('cli.py buscar --help', ['cli.py', 'buscar', '--help']),
+    ('main.py --help', ['main.py', '--help']),
+]
+
+# Roda o script como __main__ e informa se o Selenium foi importado
+SONDA = """
+import runpy, sys
+sys.argv = sys.argv[1:]
+try:
+    runpy.run_path(sys.argv[0], run_name='__main__')
+except SystemExit:
+    pass
+sys.stderr.write('\\nSELENIUM=%d\\n' % ('selenium' in sys.modules))
+"""
+
+
+def tempo_importacao(modulo):
+    """
+    Tempo acumulado de importação de um módulo (inclui as dependências)
+
+    Returns:
+        float: Milissegundos, ou None se a importação falhou
+    """
+    processo = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {modulo}'],
+                              cwd=RAIZ, capture_output=True, text=True)
+    if processo.returncode != 0:
+        return None
+    for linha in reversed(processo.stderr.splitlines()):
+        # import time: self [us] | cumulative | imported package
+        encontrado = re.match(r'import time:\s+\d+ \|\s+(\d+) \|\s+(\S+)$', linha)
+        if encontrado and encontrado.group(2) == modulo:
+            return int(encontrado.group(1)) / 1000
+    return None
+
+
+def cronometrar(comando, repeticoes):
+    """
+    Mediana do tempo de parede de um comando
+
+    Returns:
+        tuple: (milissegundos, saída de erro da última execução)
+    """
+    tempos = []
+    erro = ''
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        processo = subprocess.run(comando, cwd=RAIZ, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+        erro = processo.stderr
+    return statistics.median(tempos), erro
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--executavel', nargs='*', default=[], help='executáveis congelados para cronometrar')
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print(f"{'módulo':<20}{'importação (ms)':>20}")
+    for modulo in MODULOS:
+        milissegundos = tempo_importacao(modulo)
+        print(f"{modulo:<20}{'falhou' if milissegundos is None else f'{milissegundos:.1f}':>20}")
+
+    print("\n" + "=" * 60)
+    print(f"{'comando':<28}{'mediana (ms)':>14}{'selenium':>12}")
+    for nome, comando in COMANDOS:
+        milissegundos, erro = cronometrar([sys.executable, '-c', SONDA] + comando, args.repeticoes)
+        selenium = re.search(r'SELENIUM=(\d)', erro)
+        importado = '?' if selenium is None else ('sim' if selenium.group(1) == '1' else 'não')
+        print(f"{nome:<28}{milissegundos:>14.1f}{importado:>12}")
+
+    for executavel in args.executavel:
+        print("\n" + "=" * 60)
+        print(f"📦 {executavel}")
+        for argumentos in (['--help'], ['catalogo'], ['consulta', '--help']):
+            milissegundos, _ = cronometrar([os.path.abspath(executavel)] + argumentos, args.repeticoes)
+            print(f"   {' '.join(argumentos):<25}{milissegundos:>14.1f} ms")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Mede a escalabilidade do lote (combinações/s) com diferentes números de workers
+
+Cada busca no portal real é dominada pela espera (rede, renderização), não pela CPU;
+--latencia simula essa espera em cada página de resultados. Sem ela, a busca HTTP
+contra o site local vira só parsing e o ganho fica limitado pelo número de CPUs
+(o servidor sintético roda neste mesmo processo).
+
+Uso:
+    python -m benchmarks.bench_lote --combinacoes 16 --workers 1 2 4
+    python -m benchmarks.bench_lote --backend http --combinacoes 64 --workers 1 2 4 8 --latencia 0.2
+"""
+
+import argparse
+import os
+
+from fixture_ciee import COMBOS, ServidorFixture, rotas_padrao
+from lote import executar_lote
+
+
+def especificacao(quantidade):
+    """
+    Monta combinações área x cidade do site sintético até a quantidade pedida
+
+    Args:
+        quantidade (int): Número de combinações
+
+    Returns:
+        list: Lista de filtros
+    """
+    opcoes = {id_input: [texto for _, texto in itens] for id_input, _, itens in COMBOS}
+    combinacoes = [
+        {'tipo_vaga': 'ESTÁGIO', 'area_profissional': area, 'cidade': cidade}
+        for area in opcoes['AreaProfissional'] for cidade in opcoes['CidadeVaga']
+    ]
+    return (combinacoes * (quantidade // len(combinacoes) + 1))[:quantidade]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--combinacoes', type=int, default=16, help='combinações de filtros no lote')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4], help='números de workers a medir')
+    parser.add_argument('--backend', choices=['selenium', 'http'], default='selenium')
+    parser.add_argument('--vagas', type=int, default=50, help='vagas por busca no site sintético')
+    parser.add_argument('--latencia', type=float, default=0.2, help='espera de cada busca no portal, em segundos')
+    args = parser.parse_args()
+
+    linhas = []
+    with ServidorFixture(rotas_padrao(args.vagas, latencia_busca=args.latencia)) as servidor:
+        if args.backend == 'selenium':
+            kwargs_backend = {'headless': True, 'url_base': servidor.url('/portal')}
+        else:
+            kwargs_backend = {'url_busca': servidor.url('/busca')}
+
+        for workers in args.workers:
+            resultado = executar_lote(especificacao(args.combinacoes), workers=workers,
+                                      backend=args.backend, kwargs_backend=kwargs_backend)
+            linhas.append((workers, resultado))
+
+    base = linhas[0][1]['segundos'] * linhas[0][0]
+    print("\n" + "=" * 64)
+    print(f"{'workers':<9}{'combinações':>13}{'falhas':>8}{'segundos':>10}{'comb./s':>10}{'eficiência':>13}")
+    for workers, r in linhas:
+        total = len(r['combinacoes'])
+        eficiencia = base / (r['segundos'] * workers) if r['segundos'] else 0.0
+        print(f"{workers:<9}{total:>13}{len(r['falhas']):>8}{r['segundos']:>10.2f}"
+              f"{total / r['segundos']:>10.2f}{eficiencia:>12.0%}")
+    print("=" * 64)
+    print(f"{os.cpu_count()} CPUs; latência por busca: {args.latencia:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Memória e tempo de montagem de muitas vagas: dicts x Vaga (slots) x ColecaoVagas (colunar)
+
+Uso:
+    python -m benchmarks.bench_modelo --vagas 100000
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from fixture_ciee import AREAS, CIDADES, HORARIOS, SALARIOS, TIPOS
+from modelo import ColecaoVagas, Vaga
+
+
+def _copia(texto):
+    # Cada vaga extraída traz strings próprias (não compartilhadas), como na extração real
+    return (texto + ' ')[:-1]
+
+
+def gerar_dicts(quantidade):
+    """
+    Gera vagas no formato extraído dos cards
+
+    Args:
+        quantidade (int): Número de vagas
+
+    Returns:
+        list: Dicts de vaga
+    """
+    return [{
+        'codigo': str(5860000 + i),
+        'tipo': _copia(TIPOS[i % len(TIPOS)]),
+        'descricao': f"Empresa {i} - Comércio varejista",
+        'area': _copia(AREAS[i % len(AREAS)]),
+        'localizacao': _copia(CIDADES[i % len(CIDADES)]),
+        'horario': _copia(HORARIOS[i % len(HORARIOS)]),
+        'salario': _copia(SALARIOS[i % len(SALARIOS)]),
+        'link': f"https://www.ciee.org.br/portal/estudantes/ofertas/vaga?codigoVaga={5860000 + i}",
+    } for i in range(quantidade)]
+
+
+def medir(nome, montar):
+    """
+    Mede a memória retida e o tempo de montagem de uma representação
+
+    Args:
+        nome (str): Nome da representação
+        montar (callable): Retorna a estrutura montada
+
+    Returns:
+        dict: nome, kb e segundos
+    """
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    estrutura = montar()
+    segundos = time.perf_counter() - inicio
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del estrutura
+    return {'nome': nome, 'kb': atual // 1024, 'segundos': segundos}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vagas', type=int, default=100000)
+    args = parser.parse_args()
+
+    linhas = [
+        medir('dicts', lambda: gerar_dicts(args.vagas)),
+        medir('Vaga (slots)', lambda: [Vaga.de_dict(d) for d in gerar_dicts(args.vagas)]),
+        medir('ColecaoVagas', lambda: ColecaoVagas.de_dicts(gerar_dicts(args.vagas))),
+    ]
+
+    dicts = gerar_dicts(args.vagas)
+    colecao = ColecaoVagas.de_dicts(dicts)
+    print(f"\nIda e volta sem perdas: {colecao.como_dicts() == dicts}")
+
+    inicio = time.perf_counter()
+    media = colecao.media('salario_valor')
+    segundos_media = time.perf_counter() - inicio
+    print(f"Média do salário ({args.vagas} vagas, colunar): R$ {media:.2f} em {segundos_media * 1000:.1f} ms")
+
+    base = linhas[0]['kb']
+    print("\n" + "=" * 54)
+    print(f"{'representação':<16}{'memória (KB)':>14}{'vs dicts':>10}{'montagem (s)':>14}")
+    for linha in linhas:
+        print(f"{linha['nome']:<16}{linha['kb']:>14}{linha['kb'] / max(base, 1):>10.0%}{linha['segundos']:>14.2f}")
+    print("=" * 54)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Mede a vazão (páginas/s) da coleta paginada com diferentes níveis de concorrência
+
+Uso:
+    python -m benchmarks.bench_paginacao --vagas 2000 --por-pagina 20 --concorrencia 1 4 8
+    python -m benchmarks.bench_paginacao --selenium --concorrencia 1 4
+"""
+
+import argparse
+
+from backends import BackendHTTP
+from fixture_ciee import ServidorFixture, rotas_padrao
+
+
+FILTROS = {'tipo_vaga': 'ESTÁGIO', 'cidade': 'SÃO PAULO - SP'}
+
+
+def coletar(backend, concorrencia):
+    """
+    Coleta todas as páginas com o backend e retorna o relatório da paginação
+
+    Args:
+        backend (BackendVagas): Backend a medir
+        concorrencia (int): Máximo de páginas simultâneas
+
+    Returns:
+        dict: Relatório da coleta (RelatorioPaginacao.como_dict)
+    """
+    with backend:
+        backend.buscar(FILTROS, todas_paginas=True, concorrencia=concorrencia)
+        return backend.relatorio_paginacao.como_dict()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--vagas', type=int, default=2000, help='total de vagas no site sintético')
+    parser.add_argument('--por-pagina', type=int, default=20, help='vagas por página')
+    parser.add_argument('--concorrencia', type=int, nargs='+', default=[1, 4, 8], help='níveis de concorrência')
+    parser.add_argument('--selenium', action='store_true', help='mede o backend Selenium (abas) em vez do HTTP')
+    args = parser.parse_args()
+
+    linhas = []
+    with ServidorFixture(rotas_padrao(args.vagas, por_pagina=args.por_pagina, sobreposicao=1)) as servidor:
+        for concorrencia in args.concorrencia:
+            if args.selenium:
+                from main import CIEEScraper
+                backend = CIEEScraper(headless=True, url_base=servidor.url('/portal'))
+            else:
+                backend = BackendHTTP(url_busca=servidor.url('/busca'), conexoes=max(args.concorrencia))
+            linhas.append((concorrencia, coletar(backend, concorrencia)))
+
+    print("\n" + "=" * 60)
+    print(f"{'concorrência':<14}{'páginas':>9}{'vagas':>8}{'segundos':>11}{'páginas/s':>12}")
+    for concorrencia, r in linhas:
+        print(f"{concorrencia:<14}{r['paginas_coletadas']:>9}{r['vagas']:>8}"
+              f"{r['segundos']:>11.2f}{r['paginas_por_segundo']:>12.1f}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
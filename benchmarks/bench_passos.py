@@ -0,0 +1,148 @@
+"""
+Falhas nos filtros: repetir a sessão inteira x repetir só o passo (passos.ExecutorPassos)
+
+Simulação com relógio virtual (não abre navegador). Cada tentativa de um passo falha
+com probabilidade --falhas; uma fração --falhas-pagina dessas falhas quebra a página
+(só passa depois de recarregar), o resto é transitória (combo que não abriu).
+
+  - sessão: cada espera encadeada do passo que falhou esgota os 10 s do WebDriverWait,
+    a busca segue com a página sem o filtro e a sessão inteira (~30 s) é repetida
+    até sair limpa;
+  - passos: a tentativa que falhou esgota o orçamento do passo, roda a recuperação da
+    vez (reabrir o combo, recarregar e refazer os filtros, reciclar o navegador) e só
+    o passo é repetido; depois das tentativas a combinação falha de forma explícita.
+
+Uso:
+    python -m benchmarks.bench_passos --sessoes 2000 --falhas 0.02 0.05 0.1 0.2
+"""
+
+import argparse
+import contextlib
+import io
+import random
+
+from metricas import desativar
+from passos import ExecutorPassos, FalhaPasso
+
+# Custos simulados (segundos)
+ABRIR_NAVEGADOR = 4.0
+CARREGAR_PAGINA = 4.0
+PASSO_OK = 1.0
+APLICAR_OK = 3.0
+EXTRAIR = 15.0
+ESPERAS_ENCADEADAS = 3
+TIMEOUT_WAIT = 10.0
+REABRIR = 0.2
+
+PASSOS = ['selecionar_tipo_vaga', 'selecionar_nivel_ensino', 'selecionar_area_profissional', 'selecionar_cidade',
+          'aplicar_botao']
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+    def avancar(self, segundos):
+        self.agora += segundos
+
+
+def sessao_antiga(aleatorio, falhas):
+    """
+    Returns:
+        float: Segundos até uma sessão sair com todos os filtros aplicados
+    """
+    total = 0.0
+    while True:
+        total += ABRIR_NAVEGADOR + CARREGAR_PAGINA + EXTRAIR
+        limpa = True
+        for passo in PASSOS:
+            custo = APLICAR_OK if passo == 'aplicar_botao' else PASSO_OK
+            if aleatorio.random() < falhas:
+                custo = ESPERAS_ENCADEADAS * TIMEOUT_WAIT
+                limpa = False
+            total += custo
+        if limpa:
+            return total
+
+
+def sessao_passos(aleatorio, falhas, falhas_pagina):
+    """
+    Returns:
+        tuple: (segundos, True se os filtros foram aplicados, relatório do executor)
+    """
+    relogio = Relogio()
+    estado = {'pagina_quebrada': False, 'feitos': 0}
+
+    def recarregar():
+        relogio.avancar(CARREGAR_PAGINA + PASSO_OK * estado['feitos'])
+        estado['pagina_quebrada'] = False
+
+    def reciclar():
+        relogio.avancar(ABRIR_NAVEGADOR)
+        recarregar()
+
+    executor = ExecutorPassos({'reabrir': lambda: relogio.avancar(REABRIR), 'recarregar': recarregar,
+                               'reciclar': reciclar}, relogio=relogio, dormir=relogio.avancar)
+
+    def tentar(passo):
+        def acao():
+            if estado['pagina_quebrada'] or aleatorio.random() < falhas:
+                if not estado['pagina_quebrada']:
+                    estado['pagina_quebrada'] = aleatorio.random() < falhas_pagina
+                relogio.avancar(executor.restante())
+                raise TimeoutError(passo)
+            relogio.avancar(APLICAR_OK if passo == 'aplicar_botao' else PASSO_OK)
+            return True
+        return acao
+
+    relogio.avancar(ABRIR_NAVEGADOR + CARREGAR_PAGINA)
+    try:
+        for passo in PASSOS:
+            executor.executar(passo, tentar(passo))
+            estado['feitos'] += 1
+    except FalhaPasso:
+        return relogio(), False, executor.relatorio()
+    relogio.avancar(EXTRAIR)
+    return relogio(), True, executor.relatorio()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessoes', type=int, default=2000)
+    parser.add_argument('--falhas', type=float, nargs='+', default=[0.02, 0.05, 0.1, 0.2],
+                        help='probabilidade de falha de cada tentativa de passo')
+    parser.add_argument('--falhas-pagina', type=float, default=0.3, help='fração das falhas que exige recarregar')
+    parser.add_argument('--semente', type=int, default=1)
+    args = parser.parse_args()
+    desativar()
+
+    print("\n" + "=" * 78)
+    print(f"{'falhas':<8}{'sessão (s)':>12}{'passos (s)':>12}{'ganho':>8}{'falharam':>10}"
+          f"{'tentativas extras':>19}{'recargas':>10}")
+    for falhas in args.falhas:
+        aleatorio = random.Random(args.semente)
+        antiga = sum(sessao_antiga(aleatorio, falhas) for _ in range(args.sessoes)) / args.sessoes
+
+        aleatorio = random.Random(args.semente)
+        segundos = falharam = extras = recargas = 0
+        for _ in range(args.sessoes):
+            # Sem os avisos de cada tentativa
+            with contextlib.redirect_stdout(io.StringIO()):
+                tempo, ok, relatorio = sessao_passos(aleatorio, falhas, args.falhas_pagina)
+            segundos += tempo
+            falharam += not ok
+            extras += sum(dados['tentativas_extras'] for dados in relatorio.values())
+            recargas += sum(dados['recuperacoes'].get('recarregar', 0) for dados in relatorio.values())
+        novo = segundos / args.sessoes
+        print(f"{falhas:<8.2f}{antiga:>12.1f}{novo:>12.1f}{antiga / novo:>7.1f}x{falharam / args.sessoes:>10.2%}"
+              f"{extras / args.sessoes:>19.2f}{recargas / args.sessoes:>10.2f}")
+    print("=" * 78)
+    print("'falharam': sessões em que um passo esgotou as tentativas (a combinação falha em vez de "
+          "coletar a página sem filtro)")
+
+
+if __name__ == "__main__":
+    main()
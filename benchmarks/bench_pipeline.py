@@ -0,0 +1,88 @@
+"""
+Compara várias buscas em sequência (buscar, processar, gravar) com o pipeline assíncrono
+
+O processamento é o enriquecimento com as páginas de detalhe; a latência das
+páginas de resultados e de detalhe simula o portal.
+
+Uso:
+    python -m benchmarks.bench_pipeline --buscas 8 --latencia-busca 0.2 --latencia-detalhe 0.02
+    python -m benchmarks.bench_pipeline --backend selenium --buscas 4 --workers 2
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from backends import criar_backend
+from benchmarks.bench_lote import especificacao
+from detalhes import EnriquecedorDetalhes
+from fixture_ciee import ServidorFixture, rotas_padrao
+from orquestrador import PipelineBuscas, imprimir_estagios
+from paginacao import chave_vaga
+from saidas import criar_saida
+
+
+def sequencial(combinacoes, backend, kwargs_backend, processar, arquivo, **opcoes_busca):
+    """
+    Uma busca de cada vez, como o main(): busca, processa e grava (sem repetir vagas) antes da próxima
+
+    Returns:
+        dict: Vagas gravadas e segundos
+    """
+    inicio = time.perf_counter()
+    vistas = set()
+    with criar_backend(backend, **kwargs_backend) as instancia, criar_saida('jsonl', arquivo) as saida:
+        for filtros in combinacoes:
+            for vaga in processar(instancia.buscar(filtros, **opcoes_busca)):
+                if chave_vaga(vaga) not in vistas:
+                    vistas.add(chave_vaga(vaga))
+                    saida.escrever(vaga)
+    return {'vagas': saida.quantidade, 'segundos': time.perf_counter() - inicio}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--buscas', type=int, default=8, help='combinações de filtros')
+    parser.add_argument('--vagas', type=int, default=300, help='vagas por busca no site sintético')
+    parser.add_argument('--por-pagina', type=int, default=100)
+    parser.add_argument('--backend', choices=['selenium', 'http'], default='http')
+    parser.add_argument('--workers', type=int, default=1, help='navegadores/sessões do pipeline')
+    parser.add_argument('--latencia-busca', type=float, default=0.2, help='atraso de cada página de resultados (s)')
+    parser.add_argument('--latencia-detalhe', type=float, default=0.02, help='atraso de cada página de detalhe (s)')
+    parser.add_argument('--concorrencia-detalhes', type=int, default=8)
+    args = parser.parse_args()
+
+    combinacoes = especificacao(args.buscas)
+    rotas = rotas_padrao(args.vagas, por_pagina=args.por_pagina, latencia_busca=args.latencia_busca,
+                         latencia_detalhe=args.latencia_detalhe)
+    pasta = tempfile.mkdtemp(prefix='bench_pipeline_')
+
+    with ServidorFixture(rotas) as servidor:
+        if args.backend == 'selenium':
+            kwargs_backend = {'headless': True, 'url_base': servidor.url('/portal'), 'caminho_catalogo': None}
+        else:
+            kwargs_backend = {'url_busca': servidor.url('/busca'), 'caminho_catalogo': None}
+        opcoes_busca = {'todas_paginas': True}
+
+        with EnriquecedorDetalhes(concorrencia=args.concorrencia_detalhes) as enriquecedor:
+            base = sequencial(combinacoes, args.backend, kwargs_backend, enriquecedor.enriquecer,
+                              os.path.join(pasta, 'sequencial.jsonl'), **opcoes_busca)
+
+        with EnriquecedorDetalhes(concorrencia=args.concorrencia_detalhes) as enriquecedor:
+            pipeline = PipelineBuscas(args.backend, kwargs_backend, workers=args.workers,
+                                      processar=enriquecedor.enriquecer, **opcoes_busca)
+            with criar_saida('jsonl', os.path.join(pasta, 'pipeline.jsonl')) as saida:
+                relatorio = pipeline.executar_sync(combinacoes, saida)
+
+    imprimir_estagios(relatorio)
+    print("\n" + "=" * 50)
+    print(f"{'execução':<14}{'vagas':>10}{'segundos':>12}{'ganho':>10}")
+    print(f"{'sequencial':<14}{base['vagas']:>10}{base['segundos']:>12.2f}{'':>10}")
+    print(f"{'pipeline':<14}{relatorio['quantidade']:>10}{relatorio['segundos']:>12.2f}"
+          f"{base['segundos'] / max(relatorio['segundos'], 1e-9):>9.2f}x")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
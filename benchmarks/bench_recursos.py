@@ -0,0 +1,79 @@
+"""
+Compara bytes transferidos e tempo até os filtros ficarem prontos com e sem bloqueio de recursos
+
+Roda contra o portal sintético servido localmente, com imagens, fonte, CSS, vídeo e
+um rastreador (cada resposta com latência, como numa CDN).
+
+Uso:
+    python -m benchmarks.bench_recursos --imagens 20
+"""
+
+import argparse
+import time
+
+from selenium.webdriver.common.by import By
+
+from fixture_ciee import ServidorFixture, rotas_padrao
+from main import CIEEScraper
+
+
+def executar(servidor, politica):
+    """
+    Abre o portal na política indicada e mede até o primeiro combo de filtro ficar clicável
+
+    Args:
+        servidor (ServidorFixture): Servidor já iniciado
+        politica (str): 'completa', 'leve' ou 'minima'
+
+    Returns:
+        dict: Segundos até os filtros ficarem prontos, bytes medidos no navegador e no servidor
+    """
+    scraper = CIEEScraper(headless=True, url_base=servidor.url('/portal'), politica_recursos=politica)
+    try:
+        scraper.inicializar_driver()
+        bytes_antes = servidor.bytes_enviados
+        inicio = time.perf_counter()
+        scraper.acessar_site()
+        scraper.esperas.aguardar_opcao_clicavel(By.ID, 'TipoVaga')
+        segundos = time.perf_counter() - inicio
+        transferencia = scraper.bytes_transferidos()
+        # Recursos assíncronos (vídeo, rastreador) continuam chegando depois dos filtros prontos
+        time.sleep(1)
+        return {
+            'segundos': segundos,
+            'bytes_navegador': transferencia['bytes'],
+            'recursos': transferencia['recursos'],
+            'bytes_servidor': servidor.bytes_enviados - bytes_antes,
+        }
+    finally:
+        scraper.fechar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--imagens', type=int, default=20, help='imagens pesadas no portal')
+    parser.add_argument('--cards', type=int, default=50)
+    parser.add_argument('--politicas', nargs='+', default=['completa', 'leve', 'minima'])
+    args = parser.parse_args()
+
+    with ServidorFixture(rotas_padrao(args.cards, recursos=args.imagens)) as servidor:
+        resultados = {politica: executar(servidor, politica) for politica in args.politicas}
+
+    print("\n" + "=" * 66)
+    print(f"{'política':<10}{'filtros (s)':>13}{'recursos':>10}{'KB navegador':>15}{'KB servidor':>14}")
+    for politica, r in resultados.items():
+        print(f"{politica:<10}{r['segundos']:>13.2f}{r['recursos']:>10}"
+              f"{r['bytes_navegador'] / 1024:>15.0f}{r['bytes_servidor'] / 1024:>14.0f}")
+    print("=" * 66)
+
+    if 'completa' in resultados:
+        base = resultados['completa']
+        for politica, r in resultados.items():
+            if politica == 'completa':
+                continue
+            print(f"\n{politica}: {base['segundos'] / max(r['segundos'], 1e-9):.1f}x mais rápido, "
+                  f"{(base['bytes_servidor'] - r['bytes_servidor']) / 1024:.0f} KB a menos")
+
+
+if __name__ == "__main__":
+    main()
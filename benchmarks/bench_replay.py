@@ -0,0 +1,82 @@
+"""
+Reprocessamento offline de um mês de gravações sintéticas, com 1 e com N processos
+
+Grava --dias capturas de --combinacoes combinações de filtros com --paginas páginas
+cada (HTML do fixture). A cada dia uma fração --rotatividade das vagas muda; as
+páginas sem mudança viram o mesmo objeto no arquivo endereçado por conteúdo.
+
+Uso:
+    python -m benchmarks.bench_replay --dias 30 --combinacoes 10 --paginas 5
+    python -m benchmarks.bench_replay --processos 1 2 4 8 --pasta /tmp/gravacoes_bench
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+import time
+
+from fixture_ciee import gerar_pagina_vagas
+from gravacao import ArquivoGravacoes, reprocessar
+from parser_html import lxml
+
+
+def gravar_mes(pasta, dias, combinacoes, paginas, por_pagina, rotatividade):
+    """
+    Grava as capturas sintéticas
+
+    Returns:
+        float: Segundos gastos gravando
+    """
+    arquivo = ArquivoGravacoes(pasta)
+    inicio = time.perf_counter()
+    for dia in range(dias):
+        data = f"2026-09-{dia + 1:02d}T08:00:00"
+        for combinacao in range(combinacoes):
+            filtros = {'cidade': f"CIDADE {combinacao}"}
+            base = combinacao * 100_000
+            for pagina in range(1, paginas + 1):
+                # Só as primeiras páginas recebem vagas novas a cada dia
+                deslocamento = dia * int(por_pagina * rotatividade) if pagina <= max(1, paginas // 3) else 0
+                html = gerar_pagina_vagas(por_pagina, inicio=base + (pagina - 1) * por_pagina + deslocamento,
+                                          pagina=pagina, total_paginas=paginas)
+                arquivo.gravar(html, filtros, pagina, 'html', f"http://fixture/busca?pagina={pagina}",
+                               capturado_em=data)
+    return time.perf_counter() - inicio
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dias', type=int, default=30)
+    parser.add_argument('--combinacoes', type=int, default=10)
+    parser.add_argument('--paginas', type=int, default=5)
+    parser.add_argument('--por-pagina', type=int, default=50)
+    parser.add_argument('--rotatividade', type=float, default=0.2, help='fração das vagas novas por dia')
+    parser.add_argument('--processos', type=int, nargs='+', default=[1, os.cpu_count() or 1])
+    parser.add_argument('--pasta', default=None, help='pasta das gravações (padrão: temporária, apagada no fim)')
+    args = parser.parse_args()
+
+    pasta = args.pasta or tempfile.mkdtemp(prefix='gravacoes_')
+    try:
+        segundos_gravacao = gravar_mes(pasta, args.dias, args.combinacoes, args.paginas, args.por_pagina,
+                                       args.rotatividade)
+        dados = ArquivoGravacoes(pasta).estatisticas()
+        print(f"📦 {dados['registros']} páginas gravadas em {segundos_gravacao:.2f}s: {dados['objetos']} objetos, "
+              f"{dados['bytes_registrados'] / 1e6:.1f} MB → {dados['bytes_comprimidos'] / 1e6:.2f} MB em disco")
+        print(f"   parser: {'lxml' if lxml is not None else 'html.parser (stdlib)'}")
+
+        print("\n" + "=" * 60)
+        print(f"{'processos':<12}{'segundos':>10}{'páginas/s':>12}{'objetos/s':>12}{'vagas':>10}")
+        for processos in args.processos:
+            resultado = reprocessar(pasta, processos=processos)
+            print(f"{processos:<12}{resultado['segundos']:>10.2f}"
+                  f"{resultado['registros'] / resultado['segundos']:>12.0f}"
+                  f"{resultado['objetos'] / resultado['segundos']:>12.0f}{len(resultado['vagas']):>10}")
+        print("=" * 60)
+    finally:
+        if args.pasta is None:
+            shutil.rmtree(pasta, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
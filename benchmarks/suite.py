@@ -0,0 +1,362 @@
+"""
+Suíte de benchmark ponta a ponta contra o site sintético local (fixture_ciee.py)
+
+Executa o CIEEScraper completo (abrir navegador, acessar, filtrar, extrair todas as
+páginas, salvar) e mede por fase: tempo, comandos WebDriver e pico de memória (Python,
+numa execução extra com tracemalloc, e RSS do navegador). O resultado vai para um JSON
+em benchmarks/resultados/, para comparar commits.
+
+Uso:
+    python -m benchmarks.suite --cards 10 1000 10000 --paginas 1 5
+    python -m benchmarks.suite --backend http --cards 10000 --paginas 50
+    python -m benchmarks.suite --comparar benchmarks/resultados/antes.json benchmarks/resultados/depois.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+from fixture_ciee import ServidorFixture, rotas_padrao
+
+
+FILTROS = {
+    'tipo_vaga': 'ESTÁGIO',
+    'nivel_ensino': 'Superior',
+    'area_profissional': 'INFORMÁTICA',
+    'cidade': 'BRASÍLIA - DF'
+}
+
+PASTA_RESULTADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resultados')
+
+
+def _rss_kb():
+    """Pico de memória residente (KB) deste processo"""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # No macOS o valor vem em bytes
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+
+def rss_arvore_kb(pid):
+    """
+    Memória residente (KB) de um processo e de todos os descendentes (ex: chromedriver + Chrome)
+
+    Lê /proc, então só funciona no Linux.
+
+    Args:
+        pid (int): Processo raiz
+
+    Returns:
+        int: Soma do VmRSS da árvore, ou None fora do Linux
+    """
+    if not os.path.isdir('/proc'):
+        return None
+    total = 0
+    pendentes = [pid]
+    while pendentes:
+        atual = pendentes.pop()
+        try:
+            with open(f'/proc/{atual}/status') as f:
+                for linha in f:
+                    if linha.startswith('VmRSS:'):
+                        total += int(linha.split()[1])
+            with open(f'/proc/{atual}/task/{atual}/children') as f:
+                pendentes.extend(int(filho) for filho in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return total
+
+
+class Medidor:
+    """Mede cada fase de uma execução: segundos, comandos WebDriver e memória"""
+
+    def __init__(self, contar_comandos=None, pid_navegador=None):
+        """
+        Args:
+            contar_comandos (callable): Retorna o total de comandos WebDriver até agora
+            pid_navegador (callable): Retorna o PID do driver (raiz da árvore do navegador), ou None
+        """
+        self.contar_comandos = contar_comandos
+        self.pid_navegador = pid_navegador
+        self.fases = {}
+
+    @contextmanager
+    def fase(self, nome):
+        comandos_antes = self.contar_comandos() if self.contar_comandos else 0
+        rastreando = tracemalloc.is_tracing()
+        if rastreando:
+            tracemalloc.reset_peak()
+        inicio = time.perf_counter()
+        try:
+            yield
+        finally:
+            segundos = time.perf_counter() - inicio
+            comandos = (self.contar_comandos() if self.contar_comandos else 0) - comandos_antes
+            pid = self.pid_navegador() if self.pid_navegador else None
+            self.fases[nome] = {
+                'segundos': segundos,
+                'comandos': comandos,
+                'rss_navegador_kb': (rss_arvore_kb(pid) if pid else None) or 0,
+            }
+            if rastreando:
+                self.fases[nome]['pico_python_kb'] = tracemalloc.get_traced_memory()[1] // 1024
+
+
+def executar_selenium(servidor, paginas, pasta):
+    """
+    Executa o fluxo completo do CIEEScraper contra o servidor
+
+    Returns:
+        tuple: (Medidor com as fases, quantidade de vagas)
+    """
+    from main import CIEEScraper
+
+    scraper = CIEEScraper(headless=True, url_base=servidor.url('/portal'), caminho_catalogo=None)
+    medidor = Medidor(
+        lambda: scraper.total_comandos_webdriver() if scraper.driver else 0,
+        lambda: scraper.driver.service.process.pid if scraper.driver and scraper.driver.service.process else None,
+    )
+    try:
+        with medidor.fase('inicializar'):
+            scraper.inicializar_driver()
+        with medidor.fase('acessar'):
+            scraper.acessar_site()
+        with medidor.fase('filtros'):
+            scraper.aplicar_filtros(FILTROS)
+        with medidor.fase('extracao'):
+            vagas = scraper.buscar_vagas(todas_paginas=paginas > 1)
+        with medidor.fase('saida'):
+            scraper.salvar_resultados(vagas, 'jsonl', os.path.join(pasta, 'vagas.jsonl'))
+    finally:
+        with medidor.fase('fechar'):
+            scraper.fechar()
+    return medidor, len(vagas)
+
+
+def executar_http(servidor, paginas, pasta):
+    """
+    Executa a busca pelo backend HTTP contra o servidor (não precisa de navegador)
+
+    Returns:
+        tuple: (Medidor com as fases, quantidade de vagas)
+    """
+    from backends import BackendHTTP
+    from saidas import criar_saida
+
+    backend = BackendHTTP(url_busca=servidor.url('/busca'), caminho_catalogo=None)
+    medidor = Medidor()
+    with medidor.fase('inicializar'):
+        backend.abrir()
+    with medidor.fase('extracao'):
+        vagas = backend.buscar(FILTROS, todas_paginas=paginas > 1)
+    with medidor.fase('saida'):
+        with criar_saida('jsonl', os.path.join(pasta, 'vagas.jsonl')) as saida:
+            for vaga in vagas:
+                saida.escrever(vaga)
+    with medidor.fase('fechar'):
+        backend.fechar()
+    return medidor, len(vagas)
+
+
+EXECUTORES = {'selenium': executar_selenium, 'http': executar_http}
+
+
+def medir_cenario(backend, cards, paginas, repeticoes=3, atraso_busca=600):
+    """
+    Mede um cenário (backend, cards, páginas) várias vezes e resume pela mediana
+
+    As repetições medem tempo sem tracemalloc (que deixa o Python várias vezes mais
+    lento); uma execução extra, rastreada, mede o pico de memória Python de cada fase.
+
+    Args:
+        backend (str): 'selenium' ou 'http'
+        cards (int): Total de vagas no site sintético
+        paginas (int): Número de páginas de resultados
+        repeticoes (int): Execuções do cenário
+        atraso_busca (int): Atraso (ms) do botão Aplicar no portal sintético
+
+    Returns:
+        dict: Configuração, vagas, mediana por fase e todas as execuções
+    """
+    por_pagina = max(1, -(-cards // paginas))
+    execucoes = []
+    rotas = rotas_padrao(cards, por_pagina=por_pagina, atraso_busca=atraso_busca)
+    with ServidorFixture(rotas) as servidor, tempfile.TemporaryDirectory() as pasta:
+        for _ in range(repeticoes):
+            medidor, vagas = EXECUTORES[backend](servidor, paginas, pasta)
+            execucoes.append({'vagas': vagas, 'fases': medidor.fases})
+
+        tracemalloc.start()
+        try:
+            rastreado, _ = EXECUTORES[backend](servidor, paginas, pasta)
+        finally:
+            tracemalloc.stop()
+
+    fases = {}
+    for nome in execucoes[0]['fases']:
+        valores = [e['fases'][nome] for e in execucoes if nome in e['fases']]
+        fases[nome] = {
+            'segundos': statistics.median(v['segundos'] for v in valores),
+            'comandos': statistics.median_low(v['comandos'] for v in valores),
+            'rss_navegador_kb': max(v['rss_navegador_kb'] for v in valores),
+            'pico_python_kb': rastreado.fases.get(nome, {}).get('pico_python_kb', 0),
+        }
+    total = {
+        'segundos': sum(f['segundos'] for f in fases.values()),
+        'comandos': sum(f['comandos'] for f in fases.values()),
+    }
+    return {
+        'backend': backend,
+        'cards': cards,
+        'paginas': paginas,
+        'vagas': execucoes[-1]['vagas'],
+        'fases': fases,
+        'total': total,
+        'execucoes': execucoes,
+    }
+
+
+def commit_atual():
+    """Hash curto do commit atual (ou None fora de um repositório git)"""
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def executar_suite(backend, cards, paginas, repeticoes=3, atraso_busca=600):
+    """
+    Executa todos os cenários (cada combinação de cards x páginas)
+
+    Returns:
+        dict: Metadados do ambiente e os cenários medidos
+    """
+    cenarios = []
+    for quantidade in cards:
+        for numero_paginas in paginas:
+            print(f"\n🏁 {backend}: {quantidade} cards em {numero_paginas} página(s)")
+            cenarios.append(medir_cenario(backend, quantidade, numero_paginas, repeticoes, atraso_busca))
+
+    return {
+        'commit': commit_atual(),
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'ambiente': {
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'cpus': os.cpu_count(),
+        },
+        'repeticoes': repeticoes,
+        'rss_pico_kb': _rss_kb(),
+        'cenarios': cenarios,
+    }
+
+
+def salvar_resultado(resultado, caminho=None):
+    """
+    Grava o resultado da suíte em JSON
+
+    Args:
+        resultado (dict): Retorno de executar_suite
+        caminho (str): Arquivo de saída (padrão: resultados/<data>_<commit>.json)
+
+    Returns:
+        str: Caminho gravado
+    """
+    if caminho is None:
+        os.makedirs(PASTA_RESULTADOS, exist_ok=True)
+        nome = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{resultado['commit'] or 'sem-commit'}.json"
+        caminho = os.path.join(PASTA_RESULTADOS, nome)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump(resultado, f, ensure_ascii=False, indent=2)
+    return caminho
+
+
+def comparar(base, atual, limite=0.10):
+    """
+    Compara duas execuções da suíte, cenário a cenário e fase a fase
+
+    Args:
+        base (dict): Resultado de referência
+        atual (dict): Resultado novo
+        limite (float): Aumento relativo de tempo considerado regressão (0.10 = 10%)
+
+    Returns:
+        list: Regressões encontradas (textos)
+    """
+    chave = lambda c: (c['backend'], c['cards'], c['paginas'])
+    anteriores = {chave(c): c for c in base['cenarios']}
+    regressoes = []
+
+    print(f"\n{'cenário':<28}{'fase':<13}{'antes (s)':>11}{'depois (s)':>12}{'Δ':>8}{'comandos':>14}")
+    for cenario in atual['cenarios']:
+        anterior = anteriores.get(chave(cenario))
+        if anterior is None:
+            continue
+        nome = f"{cenario['backend']} {cenario['cards']}c/{cenario['paginas']}p"
+        for fase, dados in list(cenario['fases'].items()) + [('TOTAL', cenario['total'])]:
+            antes = anterior['total'] if fase == 'TOTAL' else anterior['fases'].get(fase)
+            if antes is None:
+                continue
+            variacao = (dados['segundos'] - antes['segundos']) / antes['segundos'] if antes['segundos'] else 0.0
+            comandos = f"{antes['comandos']}→{dados['comandos']}"
+            print(f"{nome:<28}{fase:<13}{antes['segundos']:>11.3f}{dados['segundos']:>12.3f}"
+                  f"{variacao:>+8.0%}{comandos:>14}")
+            if variacao > limite:
+                regressoes.append(f"{nome} {fase}: {variacao:+.0%}")
+    return regressoes
+
+
+def imprimir_resumo(resultado):
+    print("\n" + "=" * 88)
+    print(f"{'cenário':<24}{'vagas':>7}{'total (s)':>11}{'comandos':>10}{'pico py (KB)':>14}{'navegador (KB)':>16}")
+    for cenario in resultado['cenarios']:
+        pico = max(f['pico_python_kb'] for f in cenario['fases'].values())
+        navegador = max(f['rss_navegador_kb'] for f in cenario['fases'].values())
+        nome = f"{cenario['backend']} {cenario['cards']}c/{cenario['paginas']}p"
+        print(f"{nome:<24}{cenario['vagas']:>7}{cenario['total']['segundos']:>11.2f}"
+              f"{cenario['total']['comandos']:>10}{pico:>14}{navegador:>16}")
+    print("=" * 88)
+    print(f"RSS pico do processo Python: {resultado['rss_pico_kb']} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--backend', choices=sorted(EXECUTORES), default='selenium')
+    parser.add_argument('--cards', type=int, nargs='+', default=[10, 100, 1000], help='total de vagas (10 a 10000)')
+    parser.add_argument('--paginas', type=int, nargs='+', default=[1], help='páginas de resultados')
+    parser.add_argument('--repeticoes', type=int, default=3)
+    parser.add_argument('--atraso-busca', type=int, default=600, help='atraso (ms) do botão Aplicar')
+    parser.add_argument('--saida', default=None, help='arquivo JSON do resultado')
+    parser.add_argument('--comparar', nargs=2, metavar=('BASE', 'ATUAL'), help='compara dois JSONs e sai')
+    parser.add_argument('--limite', type=float, default=0.10, help='aumento de tempo tratado como regressão')
+    args = parser.parse_args()
+
+    if args.comparar:
+        with open(args.comparar[0], encoding='utf-8') as f:
+            base = json.load(f)
+        with open(args.comparar[1], encoding='utf-8') as f:
+            atual = json.load(f)
+        regressoes = comparar(base, atual, args.limite)
+        if regressoes:
+            print("\n⚠️ Regressões:\n  " + "\n  ".join(regressoes))
+            sys.exit(1)
+        print("\n✅ Sem regressões")
+        return
+
+    resultado = executar_suite(args.backend, args.cards, args.paginas, args.repeticoes, args.atraso_busca)
+    imprimir_resumo(resultado)
+    print(f"\n💾 Resultado salvo em: {salvar_resultado(resultado, args.saida)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+"""Catálogo das opções dos filtros do portal: coleta única, cache em disco com TTL e busca por nome"""
+
+import difflib
+import json
+import os
+import re
+import threading
+import time
+import unicodedata
+
+from portal import CAMPOS_FILTROS, LISTAS_FILTROS
+
+
+# Validade padrão do catálogo salvo em disco
+TTL_PADRAO = 7 * 24 * 3600
+
+# Coleta (id, texto) de todas as opções dos combos em uma única chamada
+# (arguments[0] = {filtro: [id do input, id da lista]}). As opções ficam no DOM
+# mesmo com a lista fechada; quando a lista não tem ID conhecido, usa a do combo do input.
+SCRIPT_COLETAR_OPCOES = """
+const combos = arguments[0];
+const resultado = {};
+for (const filtro in combos) {
+    const input = document.getElementById(combos[filtro][0]);
+    let lista = document.getElementById(combos[filtro][1]);
+    if (!lista && input) {
+        let raiz = input.parentElement;
+        while (raiz && !raiz.querySelector('li[id]')) { raiz = raiz.parentElement; }
+        lista = raiz;
+    }
+    resultado[filtro] = lista ? Array.from(lista.querySelectorAll('li[id]')).map(function (li) {
+        return [li.id, (li.textContent || '').trim()];
+    }).filter(function (opcao) { return opcao[1]; }) : [];
+}
+return resultado;
+"""
+
+
+def normalizar(texto):
+    """
+    Normaliza um nome para busca: sem acentos, maiúsculo, só letras/números separados por espaço
+
+    Args:
+        texto (str): Ex: 'Brasília - DF'
+
+    Returns:
+        str: Ex: 'BRASILIA DF'
+    """
+    sem_acento = unicodedata.normalize('NFKD', texto).encode('ascii', 'ignore').decode('ascii')
+    return ' '.join(re.findall(r'[A-Z0-9]+', sem_acento.upper()))
+
+
+class CatalogoFiltros:
+    """
+    Opções de cada filtro (ID -> texto) com índice normalizado para busca O(1)
+
+    Uso:
+        catalogo = CatalogoFiltros.carregar('catalogo_filtros.json') or CatalogoFiltros.padrao()
+        catalogo.resolver('cidade', 'brasilia df')  # '5300108'
+    """
+
+    def __init__(self, opcoes=None, apelidos=None, gerado_em=None):
+        """
+        Args:
+            opcoes (dict): Filtro -> {ID da opção: texto exibido}
+            apelidos (dict): Filtro -> {nome alternativo: ID} (ex: 'TI' -> '18')
+            gerado_em (float): Timestamp da coleta
+        """
+        self.opcoes = {filtro: dict(opcoes_filtro) for filtro, opcoes_filtro in (opcoes or {}).items()}
+        self.apelidos = {filtro: dict(apelidos_filtro) for filtro, apelidos_filtro in (apelidos or {}).items()}
+        self.gerado_em = gerado_em or time.time()
+        self._indexar()
+
+    def _indexar(self):
+        """Monta o índice nome normalizado -> ID de cada filtro"""
+        self.indices = {}
+        for filtro in set(self.opcoes) | set(self.apelidos):
+            indice = {}
+            for nome, id_opcao in self.apelidos.get(filtro, {}).items():
+                indice[normalizar(nome)] = id_opcao
+            # Os textos coletados do portal têm precedência sobre os apelidos
+            for id_opcao, texto in self.opcoes.get(filtro, {}).items():
+                indice[normalizar(texto)] = id_opcao
+            self.indices[filtro] = indice
+
+    @classmethod
+    def padrao(cls):
+        """
+        Catálogo mínimo montado a partir dos mapas de portal.py (usado antes da primeira coleta)
+
+        Returns:
+            CatalogoFiltros: Catálogo só com apelidos
+        """
+        return cls(apelidos={filtro: mapa for filtro, (_, mapa) in CAMPOS_FILTROS.items()}, gerado_em=0)
+
+    @classmethod
+    def coletar(cls, driver):
+        """
+        Coleta as opções de todos os combos da página atual
+
+        Os mapas de portal.py são mantidos como apelidos (ex: 'TI', 'MÉDIO').
+
+        Args:
+            driver: WebDriver com a página de vagas carregada
+
+        Returns:
+            CatalogoFiltros: Catálogo coletado
+        """
+        combos = {filtro: [CAMPOS_FILTROS[filtro][0], lista] for filtro, lista in LISTAS_FILTROS.items()}
+        coletado = driver.execute_script(SCRIPT_COLETAR_OPCOES, combos)
+        opcoes = {filtro: {id_opcao: texto for id_opcao, texto in pares} for filtro, pares in coletado.items()}
+        apelidos = {filtro: mapa for filtro, (_, mapa) in CAMPOS_FILTROS.items()}
+        return cls(opcoes, apelidos)
+
+    @classmethod
+    def carregar(cls, caminho, ttl=TTL_PADRAO):
+        """
+        Lê o catálogo salvo, se existir e ainda estiver válido
+
+        Args:
+            caminho (str): Arquivo JSON do catálogo
+            ttl (float): Idade máxima em segundos (None: não expira)
+
+        Returns:
+            CatalogoFiltros: Catálogo salvo, ou None se ausente, inválido ou expirado
+        """
+        try:
+            with open(caminho, encoding='utf-8') as f:
+                dados = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if ttl is not None and time.time() - dados.get('gerado_em', 0) > ttl:
+            return None
+        return cls(dados.get('opcoes'), dados.get('apelidos'), dados.get('gerado_em'))
+
+    def salvar(self, caminho):
+        """
+        Grava o catálogo em JSON (escrita atômica)
+
+        Args:
+            caminho (str): Arquivo JSON do catálogo
+        """
+        # Nome único: vários navegadores (lote, pipeline, daemon) podem coletar o catálogo ao mesmo tempo
+        temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump({'gerado_em': self.gerado_em, 'opcoes': self.opcoes, 'apelidos': self.apelidos},
+                      f, ensure_ascii=False, indent=2)
+        os.replace(temporario, caminho)
+
+    def completo(self):
+        """
+        Returns:
+            bool: True se há opções coletadas para todos os filtros
+        """
+        return all(self.opcoes.get(filtro) for filtro in LISTAS_FILTROS)
+
+    def resolver(self, filtro, valor, aproximado=True):
+        """
+        Converte um nome legível no ID da opção
+
+        Ordem: ID exato, nome normalizado (sem acentos/maiúsculas/pontuação), nome
+        que começa com o valor (o mais curto, ex: 'Brasília' -> 'BRASÍLIA - DF') e,
+        por fim, o nome mais parecido (difflib).
+
+        Args:
+            filtro (str): 'tipo_vaga', 'nivel_ensino', 'area_profissional' ou 'cidade'
+            valor (str): Ex: 'informatica', 'Sao Paulo SP'
+            aproximado (bool): Se False, só aceita ID ou nome exato
+
+        Returns:
+            str: ID da opção, ou None se não encontrada
+        """
+        if valor in self.opcoes.get(filtro, {}):
+            return valor
+        indice = self.indices.get(filtro, {})
+        chave = normalizar(valor)
+        if chave in indice:
+            return indice[chave]
+        if not aproximado or not chave:
+            return None
+
+        prefixos = [nome for nome in indice if nome.startswith(chave + ' ')]
+        if prefixos:
+            return indice[min(prefixos, key=len)]
+        parecidos = difflib.get_close_matches(chave, indice, n=1, cutoff=0.8)
+        return indice[parecidos[0]] if parecidos else None
+
+    def texto(self, filtro, id_opcao):
+        """
+        Returns:
+            str: Texto exibido da opção (ou None se não foi coletada)
+        """
+        return self.opcoes.get(filtro, {}).get(id_opcao)
+
+    def sugestoes(self, filtro, valor, quantidade=5):
+        """
+        Nomes mais parecidos com o valor, para mensagens de erro
+
+        Returns:
+            list: Até `quantidade` nomes normalizados
+        """
+        return difflib.get_close_matches(normalizar(valor), self.indices.get(filtro, {}), n=quantidade, cutoff=0.5)
+
+
+def obter_catalogo(driver, caminho='catalogo_filtros.json', ttl=TTL_PADRAO):
+    """
+    Retorna o catálogo salvo, ou coleta da página atual e salva quando ausente/expirado
+
+    Args:
+        driver: WebDriver com a página de vagas carregada
+        caminho (str): Arquivo JSON do catálogo (None: não usa disco)
+        ttl (float): Validade do arquivo, em segundos
+
+    Returns:
+        CatalogoFiltros: Catálogo pronto para resolver()
+    """
+    if caminho:
+        catalogo = CatalogoFiltros.carregar(caminho, ttl)
+        if catalogo is not None:
+            return catalogo
+
+    catalogo = CatalogoFiltros.coletar(driver)
+    total = sum(len(opcoes) for opcoes in catalogo.opcoes.values())
+    print(f"📇 Catálogo de filtros coletado: {total} opções")
+    if not catalogo.completo():
+        # Página sem os combos (ex: erro de carregamento): não salva um catálogo incompleto
+        print("  ⚠️ Catálogo incompleto, usando os mapas padrão para os filtros sem opções")
+        return catalogo
+    if caminho:
+        catalogo.salvar(caminho)
+    return catalogo
@@ -0,0 +1,278 @@
+"""Checkpoint de coletas longas: combinações e páginas concluídas e vagas já gravadas, para retomar após um crash"""
+
+import json
+import os
+import threading
+from datetime import datetime
+
+from armazenamento import escopo_filtros
+from paginacao import chave_vaga
+
+
+# Versão do formato do arquivo de checkpoint (checkpoints de outra versão são ignorados)
+VERSAO_CHECKPOINT = 1
+
+
+class CheckpointColeta:
+    """
+    Estado de uma coleta gravado em disco depois de cada página
+
+    Uma página só conta como concluída quando todas as suas vagas já estão no arquivo
+    de saída (JSONL, com flush por linha). As vagas gravadas não vão para o checkpoint:
+    na retomada são relidas do próprio arquivo de saída, então cada gravação do
+    checkpoint é um JSON pequeno (combinações e números de página) trocado com os.replace.
+
+    Uso:
+        checkpoint = CheckpointColeta('checkpoint_ciee.json')
+        if not (retomar and checkpoint.retomar()):
+            checkpoint.iniciar('vagas.jsonl')
+        with criar_saida('jsonl', checkpoint.arquivo_saida) as saida:
+            vagas = backend.iterar(filtros, todas_paginas=True, **checkpoint.opcoes_busca(filtros))
+            for vaga in checkpoint.gravar(vagas, saida):
+                ...
+        checkpoint.encerrar_combinacao(filtros, completa=backend.relatorio_paginacao.completa)
+    """
+
+    def __init__(self, caminho='checkpoint_ciee.json'):
+        """
+        Args:
+            caminho (str): Arquivo JSON do checkpoint
+        """
+        self.caminho = caminho
+        self.estado = None
+        self.gravadas = set()
+        # (escopo, página) -> chaves ainda não gravadas; chave -> páginas que esperam por ela
+        self._pendentes = {}
+        self._esperando = {}
+        self._lock = threading.Lock()
+
+    @property
+    def arquivo_saida(self):
+        return self.estado['arquivo_saida'] if self.estado else None
+
+    def iniciar(self, arquivo_saida):
+        """
+        Começa um checkpoint novo (descarta o anterior)
+
+        Args:
+            arquivo_saida (str): Arquivo JSONL onde as vagas são gravadas
+        """
+        self.estado = {'versao': VERSAO_CHECKPOINT, 'arquivo_saida': arquivo_saida, 'combinacoes': {}}
+        self.gravadas = set()
+        self._pendentes.clear()
+        self._esperando.clear()
+        self.salvar()
+
+    def retomar(self):
+        """
+        Carrega o checkpoint e as chaves das vagas já gravadas no arquivo de saída
+
+        Uma última linha incompleta (crash no meio da escrita) é removida do arquivo.
+
+        Returns:
+            bool: True se havia um checkpoint válido para retomar
+        """
+        try:
+            with open(self.caminho, encoding='utf-8') as f:
+                estado = json.load(f)
+        except (OSError, ValueError):
+            return False
+        if not isinstance(estado, dict) or estado.get('versao') != VERSAO_CHECKPOINT:
+            return False
+        self.estado = estado
+        self.gravadas = set(self._ler_gravadas(estado['arquivo_saida']))
+        self._pendentes.clear()
+        self._esperando.clear()
+        concluidas = sum(1 for combinacao in estado['combinacoes'].values() if combinacao['concluida'])
+        paginas = sum(len(combinacao['paginas']) for combinacao in estado['combinacoes'].values())
+        print(f"♻️ Retomando checkpoint: {concluidas} combinações e {paginas} páginas concluídas, "
+              f"{len(self.gravadas)} vagas já gravadas em {estado['arquivo_saida']}")
+        return True
+
+    def vagas_gravadas(self):
+        """
+        Gera as vagas já gravadas no arquivo de saída (depois de retomar)
+
+        Yields:
+            dict: Cada vaga, na ordem do arquivo
+        """
+        try:
+            with open(self.arquivo_saida, encoding='utf-8') as f:
+                for linha in f:
+                    if linha.strip():
+                        yield json.loads(linha)
+        except FileNotFoundError:
+            return
+
+    @staticmethod
+    def _ler_gravadas(arquivo):
+        """Gera as chaves das vagas do JSONL, cortando uma linha final sem '\\n'"""
+        try:
+            with open(arquivo, 'rb+') as f:
+                conteudo = f.read()
+                fim = conteudo.rfind(b'\n') + 1
+                if fim < len(conteudo):
+                    f.truncate(fim)
+        except FileNotFoundError:
+            return
+        for linha in conteudo[:fim].splitlines():
+            if linha.strip():
+                yield chave_vaga(json.loads(linha))
+
+    def _combinacao(self, filtros):
+        escopo = escopo_filtros(filtros)
+        combinacoes = self.estado['combinacoes']
+        if escopo not in combinacoes:
+            combinacoes[escopo] = {'filtros': filtros, 'paginas': [], 'concluida': False}
+        return escopo, combinacoes[escopo]
+
+    def concluida(self, filtros):
+        """
+        Returns:
+            bool: True se a combinação de filtros já foi coletada por completo
+        """
+        if not self.estado:
+            return False
+        return self.estado['combinacoes'].get(escopo_filtros(filtros), {}).get('concluida', False)
+
+    def paginas_concluidas(self, filtros):
+        """
+        Returns:
+            set: Números das páginas da combinação cujas vagas já estão gravadas
+        """
+        if not self.estado:
+            return set()
+        return set(self.estado['combinacoes'].get(escopo_filtros(filtros), {}).get('paginas', []))
+
+    def pagina_coletada(self, filtros, numero):
+        """
+        Returns:
+            bool: True se a página já foi gravada ou está a caminho da saída (pipeline)
+        """
+        with self._lock:
+            escopo = escopo_filtros(filtros)
+            return numero in self.paginas_concluidas(filtros) or (escopo, numero) in self._pendentes
+
+    def opcoes_busca(self, filtros):
+        """
+        Argumentos de backend.iterar para retomar a combinação
+
+        Returns:
+            dict: 'pular_paginas' e 'ao_extrair_pagina'
+        """
+        return {
+            'pular_paginas': self.paginas_concluidas(filtros),
+            'ao_extrair_pagina': lambda numero, vagas: self.pagina_extraida(filtros, numero, vagas),
+        }
+
+    def pagina_extraida(self, filtros, numero, vagas):
+        """
+        Registra as vagas de uma página antes de serem gravadas
+
+        A página é marcada como concluída (e o checkpoint salvo) quando a última
+        delas for gravada; se todas já estavam gravadas, na hora.
+
+        Args:
+            filtros (dict): Combinação de filtros
+            numero (int): Número da página
+            vagas (list): Vagas da página
+        """
+        with self._lock:
+            escopo, _ = self._combinacao(filtros)
+            faltando = {chave_vaga(vaga) for vaga in vagas} - self.gravadas
+            if not faltando:
+                self._concluir_pagina(escopo, numero)
+                return
+            self._pendentes[(escopo, numero)] = faltando
+            for chave in faltando:
+                self._esperando.setdefault(chave, []).append((escopo, numero))
+
+    def _concluir_pagina(self, escopo, numero):
+        combinacao = self.estado['combinacoes'][escopo]
+        if numero not in combinacao['paginas']:
+            combinacao['paginas'].append(numero)
+        self._salvar()
+
+    def registrar_gravada(self, vaga):
+        """
+        Marca a vaga como gravada, concluindo as páginas que só esperavam por ela
+
+        Args:
+            vaga (dict): Vaga já escrita na saída
+        """
+        chave = chave_vaga(vaga)
+        with self._lock:
+            self.gravadas.add(chave)
+            for pagina in self._esperando.pop(chave, ()):
+                faltando = self._pendentes.get(pagina)
+                if faltando is None:
+                    continue
+                faltando.discard(chave)
+                if not faltando:
+                    del self._pendentes[pagina]
+                    self._concluir_pagina(*pagina)
+                    self._verificar_conclusao(pagina[0])
+
+    def gravar(self, vagas, *saidas):
+        """
+        Como saidas.gravar_em, pulando as vagas já gravadas e atualizando o checkpoint
+
+        Args:
+            vagas (iterable): Vagas (geralmente um gerador)
+            *saidas (SaidaVagas): Destinos
+
+        Yields:
+            dict: Cada vaga nova, depois de gravada
+        """
+        for vaga in vagas:
+            if chave_vaga(vaga) in self.gravadas:
+                # Vaga repetida ou gravada antes do crash: só libera a página que a espera
+                self.registrar_gravada(vaga)
+                continue
+            for saida in saidas:
+                saida.escrever(vaga)
+            self.registrar_gravada(vaga)
+            yield vaga
+
+    def encerrar_combinacao(self, filtros, completa=True):
+        """
+        Marca a combinação como concluída, se a coleta dela terminou sem interrupção
+
+        Com páginas ainda a caminho da saída (pipeline), a conclusão fica para quando
+        a última delas for gravada.
+
+        Args:
+            filtros (dict): Combinação de filtros
+            completa (bool): False se a paginação parou no meio (erros, crash)
+        """
+        with self._lock:
+            escopo, combinacao = self._combinacao(filtros)
+            if completa:
+                combinacao['navegada'] = True
+                self._verificar_conclusao(escopo)
+
+    def _verificar_conclusao(self, escopo):
+        combinacao = self.estado['combinacoes'][escopo]
+        if combinacao.get('navegada') and not combinacao['concluida'] \
+                and not any(pagina[0] == escopo for pagina in self._pendentes):
+            combinacao['concluida'] = True
+            self._salvar()
+
+    def salvar(self):
+        """Grava o checkpoint em JSON (escrita atômica)"""
+        with self._lock:
+            self._salvar()
+
+    def _salvar(self):
+        self.estado['atualizado_em'] = datetime.now().isoformat(timespec='seconds')
+        temporario = f"{self.caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(self.estado, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(temporario, self.caminho)
+
+    def remover(self):
+        """Apaga o checkpoint (coleta terminada)"""
+        try:
+            os.remove(self.caminho)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,171 @@
+"""
+Linha de comando do CIEE Vagas (ponto de entrada do executável)
+
+Cada comando importa só o que usa: o Selenium é carregado apenas por 'buscar' com o
+backend selenium e por 'daemon'. '--help', o catálogo, as consultas locais e o
+reprocessamento das gravações abrem sem ele.
+
+Uso:
+    python cli.py buscar --tipo-vaga ESTÁGIO --nivel-ensino Superior --area INFORMÁTICA \\
+        --cidade 'BRASÍLIA - DF' --formato csv --modo incremental
+    python cli.py buscar --backend http --cidade 'SÃO PAULO - SP' --saida vagas_sp.jsonl
+    python cli.py catalogo cidade --busca brasilia
+    python cli.py consulta --texto python --uf DF
+    python cli.py agregados resumo --dimensao area,cidade
+    python cli.py gravacoes reprocessar gravacoes_ciee --processos 8
+    python cli.py distribuido trabalhador --fila http://coordenador:8766
+    python cli.py daemon --workers 2
+"""
+
+import argparse
+import importlib
+import sys
+
+
+# Comandos repassados ao main(argv) de outro módulo: nome -> (módulo, ajuda)
+COMANDOS_MODULOS = {
+    'consulta': ('consulta', 'consultas locais sobre as vagas já coletadas'),
+    'gravacoes': ('gravacao', 'resumo e reprocessamento offline das respostas gravadas'),
+    'distribuido': ('distribuido', 'coordenador e trabalhadores do modo distribuído'),
+    'daemon': ('daemon', 'navegadores abertos atendendo buscas por HTTP local'),
+    'agregados': ('agregados', 'estatísticas por área, cidade e tipo (salário, horários, empresas)'),
+}
+
+# Opção da linha de comando -> filtro da busca
+OPCOES_FILTROS = {
+    'tipo_vaga': 'tipo_vaga',
+    'nivel_ensino': 'nivel_ensino',
+    'area': 'area_profissional',
+    'cidade': 'cidade',
+}
+
+
+def comando_buscar(args):
+    """Executa uma coleta com os filtros da linha de comando"""
+    from coleta import executar_coleta
+    from metricas import desativar
+
+    if args.sem_metricas:
+        desativar()
+    filtros = {filtro: getattr(args, opcao) for opcao, filtro in OPCOES_FILTROS.items()
+               if getattr(args, opcao)}
+    quantidade = executar_coleta(
+        filtros,
+        backend=args.backend,
+        formato_saida=args.formato,
+        arquivo_saida=args.saida,
+        modo=args.modo,
+        enriquecer_detalhes=args.detalhes,
+        colheita=args.colheita,
+        headless=not args.visivel,
+        politica_recursos=args.recursos,
+        retomar=args.resume,
+        caminho_checkpoint=args.checkpoint,
+        pasta_gravacoes=args.gravar,
+        caminho_db=args.db,
+        arquivo_agregados=None if args.sem_agregados else args.agregados,
+        arquivo_metricas=None if args.sem_metricas else args.metricas,
+        log_json=args.log_json,
+    )
+    return 1 if quantidade is None else 0
+
+
+def comando_catalogo(args):
+    """Lista as opções dos filtros do catálogo salvo (ou dos mapas de portal.py), sem navegador"""
+    from catalogo import CatalogoFiltros
+    from portal import CAMPOS_FILTROS
+
+    catalogo = CatalogoFiltros.carregar(args.arquivo, ttl=None)
+    if catalogo is None:
+        print(f"⚠️ Catálogo {args.arquivo} não encontrado; usando os nomes conhecidos de portal.py")
+        catalogo = CatalogoFiltros.padrao()
+
+    for filtro in [args.filtro] if args.filtro else list(CAMPOS_FILTROS):
+        if args.busca:
+            id_opcao = catalogo.resolver(filtro, args.busca)
+            if id_opcao is None:
+                sugestoes = catalogo.sugestoes(filtro, args.busca)
+                print(f"❌ {filtro}: {args.busca!r} não encontrado"
+                      + (f" (parecidos: {', '.join(sugestoes)})" if sugestoes else ''))
+            else:
+                print(f"✅ {filtro}: {args.busca!r} -> {id_opcao} {catalogo.texto(filtro, id_opcao) or ''}".rstrip())
+            continue
+        # Sem catálogo coletado, lista os apelidos de portal.py
+        opcoes = catalogo.opcoes.get(filtro) or {
+            id_opcao: nome for nome, id_opcao in catalogo.apelidos.get(filtro, {}).items()}
+        print(f"\n🗂️ {filtro} ({len(opcoes)} opções)")
+        for id_opcao, texto in sorted(opcoes.items(), key=lambda item: item[1]):
+            print(f"   {id_opcao:<10} {texto}")
+    return 0
+
+
+def criar_parser():
+    """
+    Monta o parser da linha de comando
+
+    Returns:
+        argparse.ArgumentParser: Parser com os subcomandos
+    """
+    parser = argparse.ArgumentParser(prog='ciee-vagas', description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='comando', required=True, metavar='COMANDO')
+
+    buscar = subparsers.add_parser('buscar', help='coleta as vagas de uma combinação de filtros')
+    filtros = buscar.add_argument_group('filtros')
+    filtros.add_argument('--tipo-vaga', help="ex: ESTÁGIO, APRENDIZ")
+    filtros.add_argument('--nivel-ensino', help="ex: Superior, Técnico, Médio")
+    filtros.add_argument('--area', help="área profissional, ex: INFORMÁTICA")
+    filtros.add_argument('--cidade', help="ex: 'BRASÍLIA - DF'")
+    buscar.add_argument('--modo', default='todas', choices=['pagina', 'todas', 'incremental'],
+                        help="'pagina': só a primeira; 'incremental': para na primeira página sem vagas novas")
+    buscar.add_argument('--formato', default='jsonl', choices=['jsonl', 'csv', 'json', 'parquet'])
+    buscar.add_argument('--saida', default=None, help='arquivo de saída (padrão: vagas_ciee_<data>.<formato>)')
+    buscar.add_argument('--backend', default='selenium', choices=['selenium', 'http'])
+    buscar.add_argument('--detalhes', action='store_true', help='busca a página de detalhe de cada vaga')
+    buscar.add_argument('--colheita', action='store_true', help='rola a lista até a quantidade de cards estabilizar')
+    buscar.add_argument('--visivel', action='store_true', help='abre o Chrome com janela')
+    buscar.add_argument('--recursos', default='leve', choices=['completa', 'leve', 'minima'])
+    buscar.add_argument('--resume', action='store_true', help='retoma a coleta interrompida (saída JSONL)')
+    buscar.add_argument('--checkpoint', default='checkpoint_ciee.json')
+    buscar.add_argument('--gravar', metavar='PASTA', default=None, help='grava as respostas brutas')
+    buscar.add_argument('--db', default='vagas_ciee.db', help='histórico SQLite das vagas')
+    buscar.add_argument('--agregados', default='agregados_ciee.json', help='estatísticas por grupo')
+    buscar.add_argument('--sem-agregados', action='store_true')
+    buscar.add_argument('--metricas', default='metricas_ciee.prom', help='snapshot Prometheus')
+    buscar.add_argument('--log-json', default=None, metavar='ARQUIVO')
+    buscar.add_argument('--sem-metricas', action='store_true', help='desliga cronômetros e contadores')
+    buscar.set_defaults(funcao=comando_buscar)
+
+    catalogo = subparsers.add_parser('catalogo', help='opções dos filtros (sem navegador)')
+    catalogo.add_argument('filtro', nargs='?', choices=list(OPCOES_FILTROS.values()))
+    catalogo.add_argument('--busca', help='resolve um nome (ex: brasilia) no ID da opção')
+    catalogo.add_argument('--arquivo', default='catalogo_filtros.json')
+    catalogo.set_defaults(funcao=comando_catalogo)
+
+    for nome, (_, ajuda) in COMANDOS_MODULOS.items():
+        subparsers.add_parser(nome, help=f"{ajuda} ('{nome} --help' para as opções)", add_help=False)
+    return parser
+
+
+def main(argv=None):
+    """
+    Ponto de entrada: repassa os comandos de outros módulos sem passar pelo parser
+
+    Returns:
+        int: Código de saída
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] in COMANDOS_MODULOS:
+        modulo = importlib.import_module(COMANDOS_MODULOS[argv[0]][0])
+        return modulo.main(argv[1:]) or 0
+
+    args = criar_parser().parse_args(argv)
+    return args.funcao(args)
+
+
+if __name__ == "__main__":
+    # Os pools de processos (lote, reprocessamento) relançam o executável congelado
+    import multiprocessing
+
+    multiprocessing.freeze_support()
+    sys.exit(main())
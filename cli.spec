@@ -0,0 +1,49 @@
+# -*- mode: python ; coding: utf-8 -*-
+# Perfil de início rápido: pasta (onedir) em vez de arquivo único, sem UPX e com
+# bytecode pré-compilado. O executável não descompacta nada a cada execução.
+#   pyinstaller cli.spec  ->  dist/ciee-vagas/ciee-vagas[.exe]
+
+
+a = Analysis(
+    ['cli.py'],
+    pathex=[],
+    binaries=[],
+    datas=[],
+    # Importados só dentro das funções dos comandos (ver cli.py e backends.criar_backend)
+    hiddenimports=['main', 'coleta', 'consulta', 'gravacao', 'distribuido', 'daemon', 'catalogo'],
+    hookspath=[],
+    hooksconfig={},
+    runtime_hooks=[],
+    excludes=['tkinter', 'unittest', 'pydoc', 'doctest', 'test', 'lib2to3', 'IPython', 'matplotlib'],
+    noarchive=False,
+    # 1 remove os asserts; 2 também apagaria as docstrings usadas como descrição no --help
+    optimize=1,
+)
+pyz = PYZ(a.pure)
+
+exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='ciee-vagas',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip=False,
+    upx=False,
+    console=True,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='ciee-vagas',
+)
@@ -0,0 +1,213 @@
+"""Coleta completa de uma combinação de filtros: backend, saída, histórico, checkpoint e relatório final"""
+
+import itertools
+
+from agregados import AgregadosVagas
+from armazenamento import ArmazemVagas
+from backends import criar_backend
+from checkpoint import CheckpointColeta
+from controle import ControleAdaptativo
+from detalhes import CacheDetalhes, EnriquecedorDetalhes
+from gravacao import ArquivoGravacoes
+from metricas import configurar_logs, metricas
+from portal import CAMPOS_DETALHE, CAMPOS_VAGA
+from saidas import criar_saida, gravar_em, nome_arquivo_saida
+
+
+# Modos de paginação aceitos por executar_coleta
+MODOS_COLETA = ('pagina', 'todas', 'incremental')
+
+
+def criar_backend_coleta(backend='selenium', headless=False, politica_recursos='leve', colheita=False,
+                         gravador=None):
+    """
+    Cria o backend da coleta (o Selenium só é importado pelo backend 'selenium')
+
+    Args:
+        backend (str): 'selenium' ou 'http'
+        headless (bool): Navegador sem janela (Selenium)
+        politica_recursos (str): 'completa', 'leve' ou 'minima' (Selenium)
+        colheita (bool): Colhe os cards rolando a lista (Selenium)
+        gravador (ArquivoGravacoes): Grava as respostas brutas (ver gravacao.py)
+
+    Returns:
+        BackendVagas: Backend ainda não aberto
+    """
+    if backend == 'selenium':
+        # Abas abertas por lote ajustadas pela latência e pelos timeouts das páginas (AIMD), até 8
+        return criar_backend('selenium', headless=headless, politica_recursos=politica_recursos, colheita=colheita,
+                             gravador=gravador, controle=ControleAdaptativo('selenium', inicial=2, maximo=8))
+    return criar_backend(backend, gravador=gravador, controle=ControleAdaptativo(backend))
+
+
+def imprimir_passos(relatorio):
+    """Lista os passos dos filtros que precisaram de novas tentativas ou falharam (ver passos.py)"""
+    instaveis = {passo: dados for passo, dados in relatorio.items() if dados['tentativas_extras'] or dados['falhas']}
+    if not instaveis:
+        return
+    print("\n🔁 Passos instáveis:")
+    for passo, dados in instaveis.items():
+        recuperacoes = ', '.join(f"{nome} {vezes}x" for nome, vezes in dados['recuperacoes'].items())
+        print(f"   {passo}: {dados['execucoes']} execuções, {dados['tentativas_extras']} tentativas extras, "
+              f"{dados['falhas']} falhas" + (f" ({recuperacoes})" if recuperacoes else ''))
+
+
+def executar_coleta(filtros, backend='selenium', formato_saida='jsonl', arquivo_saida=None, modo='todas',
+                    enriquecer_detalhes=False, colheita=False, headless=False, politica_recursos='leve',
+                    retomar=False, caminho_checkpoint='checkpoint_ciee.json', pasta_gravacoes=None,
+                    caminho_db='vagas_ciee.db', arquivo_agregados='agregados_ciee.json',
+                    arquivo_metricas='metricas_ciee.prom', log_json=None):
+    """
+    Coleta as vagas de uma combinação de filtros, gravando cada uma assim que é extraída
+
+    Args:
+        filtros (dict): Ex: {'tipo_vaga': 'ESTÁGIO', 'cidade': 'BRASÍLIA - DF'}
+        backend (str): 'selenium' ou 'http'
+        formato_saida (str): 'jsonl' (sobrevive a falhas no meio da coleta), 'csv', 'json' ou 'parquet'
+        arquivo_saida (str): Arquivo de saída (padrão: vagas_ciee_YYYYMMDD_HHMMSS.<ext>)
+        modo (str): 'pagina' (só a primeira), 'todas' ou 'incremental' (para na primeira
+            página sem vagas novas)
+        enriquecer_detalhes (bool): Busca a página de detalhe de cada vaga em paralelo
+        colheita (bool): Rola a lista colhendo os cards até a quantidade estabilizar (Selenium)
+        headless (bool): Navegador sem janela (Selenium)
+        politica_recursos (str): 'leve' não baixa imagens, mídia, fontes nem rastreadores (Selenium)
+        retomar (bool): Continua a coleta interrompida a partir do checkpoint
+        caminho_checkpoint (str): Checkpoint gravado a cada página (só com saída JSONL)
+        pasta_gravacoes (str): Se informada, grava as respostas brutas para reprocessamento
+        caminho_db (str): Histórico SQLite das vagas
+        arquivo_agregados (str): Estatísticas por grupo atualizadas com as vagas novas (None: desligado)
+        arquivo_metricas (str): Snapshot Prometheus das fases e contadores (None: não grava)
+        log_json (str): Eventos JSON, uma linha por evento (None: desligado)
+
+    Returns:
+        int: Vagas gravadas (None se a coleta falhou)
+    """
+    if modo not in MODOS_COLETA:
+        raise ValueError(f"Modo desconhecido: {modo!r} (use {', '.join(MODOS_COLETA)})")
+    todas_paginas = modo != 'pagina'
+    incremental = modo == 'incremental'
+    checkpoint = CheckpointColeta(caminho_checkpoint) if formato_saida == 'jsonl' else None
+
+    retomando = False
+    if retomar:
+        if checkpoint is None:
+            print("⚠️ --resume requer saída JSONL; iniciando uma coleta nova")
+        elif checkpoint.retomar():
+            retomando = True
+            arquivo_saida = checkpoint.arquivo_saida
+            if checkpoint.concluida(filtros):
+                print("✅ A coleta do checkpoint já estava concluída")
+                checkpoint.remover()
+                return 0
+        else:
+            print(f"⚠️ Nenhum checkpoint em {caminho_checkpoint}; iniciando uma coleta nova")
+    if checkpoint is not None and not retomando:
+        arquivo_saida = arquivo_saida or nome_arquivo_saida(formato_saida)
+        checkpoint.iniciar(arquivo_saida)
+
+    gravador = ArquivoGravacoes(pasta_gravacoes) if pasta_gravacoes else None
+    scraper = criar_backend_coleta(backend, headless=headless, politica_recursos=politica_recursos,
+                                   colheita=colheita, gravador=gravador)
+    armazem = ArmazemVagas(caminho_db)
+    cache_detalhes = CacheDetalhes(caminho_db) if enriquecer_detalhes else None
+    agregados = (AgregadosVagas.carregar(arquivo_agregados) or AgregadosVagas()) if arquivo_agregados else None
+    enriquecedor = None
+    primeiras = []
+    quantidade = None
+
+    def amostrar(vagas):
+        for vaga in vagas:
+            if len(primeiras) < 3:
+                primeiras.append(vaga)
+            yield vaga
+
+    if log_json:
+        configurar_logs(log_json)
+
+    try:
+        scraper.abrir()
+
+        # Cada vaga vai para o arquivo e para o armazém assim que é extraída
+        campos = CAMPOS_VAGA + CAMPOS_DETALHE if enriquecer_detalhes else CAMPOS_VAGA
+        with criar_saida(formato_saida, arquivo_saida, campos=campos) as saida:
+            vagas = scraper.iterar(
+                filtros,
+                todas_paginas=todas_paginas,
+                parar_quando=armazem.pagina_conhecida if incremental else None,
+                **(checkpoint.opcoes_busca(filtros) if checkpoint else {}),
+            )
+            if enriquecer_detalhes:
+                # Páginas que exigem JavaScript são abertas numa aba do próprio scraper
+                enriquecedor = EnriquecedorDetalhes(cache=cache_detalhes, navegador=getattr(scraper, 'driver', None))
+                vagas = enriquecedor.iterar(vagas)
+            if agregados is not None:
+                vagas = agregados.acompanhar(vagas, filtros)
+            vagas = amostrar(checkpoint.gravar(vagas, saida) if checkpoint else gravar_em(vagas, saida))
+            if retomando:
+                # Vagas gravadas antes da interrupção podem não ter chegado ao armazém (o checkpoint
+                # as pula daqui em diante); o upsert é idempotente
+                vagas = itertools.chain(checkpoint.vagas_gravadas(), vagas)
+            # Remoções só são detectadas quando todas as páginas foram coletadas nesta execução
+            armazem.registrar_execucao(
+                vagas, filtros,
+                completa=lambda: bool(not retomando and scraper.relatorio_paginacao
+                                      and scraper.relatorio_paginacao.completa),
+            )
+
+        if checkpoint is not None:
+            # No modo incremental a parada antecipada é esperada; só erros deixam a coleta incompleta
+            relatorio = scraper.relatorio_paginacao
+            if not todas_paginas:
+                completa = 1 in checkpoint.paginas_concluidas(filtros)
+            elif incremental:
+                completa = bool(relatorio and relatorio.fim is not None and not relatorio.erros)
+            else:
+                completa = bool(relatorio and relatorio.completa)
+            checkpoint.encerrar_combinacao(filtros, completa=completa)
+            if checkpoint.concluida(filtros):
+                checkpoint.remover()
+            else:
+                print("\n♻️ Coleta incompleta; continue com --resume")
+
+        quantidade = saida.quantidade
+        print("\n" + "=" * 50)
+        print(f"TOTAL: {saida.quantidade} vagas encontradas!")
+        print("=" * 50)
+        print(f"\n💾 Resultados salvos em: {saida.arquivo}")
+        if gravador is not None:
+            print(f"📦 {gravador.gravadas} respostas gravadas em {gravador.pasta} "
+                  f"({gravador.objetos_novos} objetos novos)")
+
+        if primeiras:
+            print("\n📋 Primeiras vagas:")
+            for i, vaga in enumerate(primeiras, 1):
+                print(f"\n  {i}. {vaga['tipo']} - {vaga['descricao']}")
+                print(f"     📍 {vaga['localizacao']}")
+                print(f"     💰 {vaga['salario']}")
+
+        if getattr(scraper, 'esperas', None) is not None:
+            esperas = scraper.esperas.relatorio()
+            print(f"\n⏱️ Tempo em esperas: {esperas['total_segundos']:.1f}s "
+                  f"(pausas fixas: {esperas['legado_segundos']:.1f}s)")
+
+        if metricas.ativo and arquivo_metricas:
+            metricas.salvar_prometheus(arquivo_metricas)
+            print(f"📈 Métricas salvas em: {arquivo_metricas}")
+
+    except Exception as e:
+        print(f"\n❌ Erro durante execução: {e}")
+
+    finally:
+        if getattr(scraper, 'passos', None) is not None:
+            imprimir_passos(scraper.passos.relatorio())
+        if agregados is not None:
+            # Também depois de uma falha: as vagas já gravadas não são somadas de novo ao retomar
+            agregados.salvar(arquivo_agregados)
+        if enriquecedor is not None:
+            enriquecedor.fechar()
+        if cache_detalhes is not None:
+            cache_detalhes.fechar()
+        scraper.fechar()
+        armazem.fechar()
+
+    return quantidade
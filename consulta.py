@@ -0,0 +1,499 @@
+"""
+Consultas locais sobre as vagas já coletadas, com índices em memória construídos incrementalmente
+
+Índices: texto (invertido, sobre descrição e área), hash (cidade, UF, tipo) e
+ordenados (salário, início, fim e horas semanais). O índice é salvo em disco e,
+a cada atualização, só os arquivos novos ou alterados são lidos.
+
+Uso:
+    python consulta.py --ingerir 'vagas_ciee_*.jsonl' --texto informatica --uf DF \\
+        --tipo estagio --salario-min 1500 --turno tarde --ordenar=-salario --limite 10
+"""
+
+import argparse
+import csv
+import glob
+import heapq
+import json
+import math
+import os
+import pickle
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+from catalogo import normalizar
+from modelo import ColecaoVagas, TipoVaga, analisar_horario, analisar_localizacao, analisar_salario, analisar_tipo
+from paginacao import chave_vaga
+
+
+# Faixas de início (em minutos) de cada turno
+TURNOS = {
+    'manha': (5 * 60, 12 * 60 - 1),
+    'tarde': (12 * 60, 18 * 60 - 1),
+    'noite': (18 * 60, 24 * 60 - 1),
+}
+
+# Campos aceitos em ordenar (prefixo '-' para decrescente)
+ORDENACOES = ('salario', 'inicio', 'fim', 'horas_semanais')
+
+# Versão do formato do arquivo do índice (índices de outra versão são reconstruídos)
+VERSAO_INDICE = 1
+
+# Arquivos lidos por atualizar() quando nenhum padrão é informado
+PADROES_ARQUIVOS = ['vagas_ciee_*.jsonl', 'vagas_ciee_*.json', 'vagas_ciee_*.csv']
+
+
+def _minutos(horario):
+    return horario.hour * 60 + horario.minute if horario is not None else -1
+
+
+def ler_arquivo_vagas(caminho):
+    """
+    Lê as vagas de um arquivo de saída do scraper
+
+    Args:
+        caminho (str): Arquivo .jsonl, .json ou .csv
+
+    Yields:
+        dict: Cada vaga
+    """
+    with open(caminho, encoding='utf-8', newline='') as f:
+        if caminho.endswith('.jsonl'):
+            for linha in f:
+                if linha.strip():
+                    yield json.loads(linha)
+        elif caminho.endswith('.csv'):
+            yield from csv.DictReader(f)
+        else:
+            dados = json.load(f)
+            yield from (dados.get('vagas', []) if isinstance(dados, dict) else dados)
+
+
+class _IndiceOrdenado:
+    """Valores ordenados com a linha de cada um; inserções acumulam e são ordenadas na próxima consulta"""
+
+    __slots__ = ('valores', 'linhas', 'pendentes')
+
+    def __init__(self):
+        self.valores = []
+        self.linhas = []
+        self.pendentes = []
+
+    def adicionar(self, valor, linha):
+        if valor is not None:
+            self.pendentes.append((valor, linha))
+
+    def _consolidar(self):
+        if self.pendentes:
+            pares = sorted(list(zip(self.valores, self.linhas)) + self.pendentes)
+            self.valores = [valor for valor, _ in pares]
+            self.linhas = [linha for _, linha in pares]
+            self.pendentes = []
+
+    def intervalo(self, minimo=None, maximo=None):
+        """
+        Returns:
+            list: Linhas com minimo <= valor <= maximo
+        """
+        self._consolidar()
+        inicio = bisect_left(self.valores, minimo) if minimo is not None else 0
+        fim = bisect_right(self.valores, maximo) if maximo is not None else len(self.valores)
+        return self.linhas[inicio:fim]
+
+
+class IndiceVagas:
+    """
+    Vagas acumuladas de várias execuções com índices para filtrar, ordenar e pegar o top-k
+
+    A mesma vaga (código) ingerida de novo substitui a anterior.
+
+    Uso:
+        indice = IndiceVagas.carregar('indice_vagas.pkl') or IndiceVagas()
+        indice.atualizar()                        # lê só os arquivos novos
+        indice.buscar(texto='informatica', uf='DF', salario_min=1500, turno='tarde',
+                      ordenar='-salario', limite=10)
+        indice.salvar('indice_vagas.pkl')
+    """
+
+    def __init__(self):
+        self.colecao = ColecaoVagas()
+        self.linha_por_chave = {}
+        self.substituidas = set()
+        self.ativas = set()
+        self.fontes = {}
+        self.texto = {}
+        self._palavras = None
+        self.hash = {'cidade': {}, 'uf': {}, 'tipo': {}}
+        self.ordenados = {campo: _IndiceOrdenado() for campo in ORDENACOES}
+        self.colunas = {
+            'salario': array('d'),
+            'inicio': array('h'),
+            'fim': array('h'),
+            'horas_semanais': array('d'),
+        }
+
+    def __len__(self):
+        return len(self.linha_por_chave)
+
+    def ingerir(self, vagas):
+        """
+        Acrescenta vagas aos índices
+
+        Args:
+            vagas (iterable): Dicts de vaga (ou Vaga)
+
+        Returns:
+            int: Quantidade de vagas ingeridas
+        """
+        quantidade = 0
+        for vaga in vagas:
+            chave = chave_vaga(vaga)
+            if not chave or chave == 'N/A':
+                continue
+            linha = len(self.colecao)
+            self.colecao.adicionar(vaga)
+            anterior = self.linha_por_chave.get(chave)
+            if anterior is not None:
+                self.substituidas.add(anterior)
+                self.ativas.discard(anterior)
+            self.ativas.add(linha)
+            self.linha_por_chave[chave] = linha
+            self._indexar(vaga, linha)
+            quantidade += 1
+        return quantidade
+
+    def _indexar(self, vaga, linha):
+        palavras = set(normalizar(f"{vaga.get('descricao') or ''} {vaga.get('area') or ''}").split())
+        for palavra in palavras:
+            if palavra not in self.texto:
+                self.texto[palavra] = set()
+                self._palavras = None
+            self.texto[palavra].add(linha)
+
+        cidade, uf = analisar_localizacao(vaga.get('localizacao'))
+        if cidade:
+            self.hash['cidade'].setdefault(normalizar(cidade), set()).add(linha)
+        if uf:
+            self.hash['uf'].setdefault(uf, set()).add(linha)
+        self.hash['tipo'].setdefault(analisar_tipo(vaga.get('tipo')).value, set()).add(linha)
+
+        salario, _ = analisar_salario(vaga.get('salario'))
+        inicio, fim, horas_semanais = analisar_horario(vaga.get('horario'))
+        valores = {
+            'salario': salario,
+            'inicio': _minutos(inicio) if inicio is not None else None,
+            'fim': _minutos(fim) if fim is not None else None,
+            'horas_semanais': horas_semanais,
+        }
+        for campo, valor in valores.items():
+            self.ordenados[campo].adicionar(valor, linha)
+            vazio = math.nan if self.colunas[campo].typecode == 'd' else -1
+            self.colunas[campo].append(vazio if valor is None else valor)
+
+    def ingerir_arquivo(self, caminho):
+        """
+        Ingere um arquivo de saída, se ele for novo ou tiver mudado desde a última ingestão
+
+        Args:
+            caminho (str): Arquivo .jsonl, .json ou .csv
+
+        Returns:
+            int: Vagas ingeridas (0 se o arquivo já estava no índice)
+        """
+        estado = os.stat(caminho)
+        assinatura = (estado.st_mtime_ns, estado.st_size)
+        chave = os.path.abspath(caminho)
+        if self.fontes.get(chave) == assinatura:
+            return 0
+        quantidade = self.ingerir(ler_arquivo_vagas(caminho))
+        self.fontes[chave] = assinatura
+        return quantidade
+
+    def ingerir_armazem(self, armazem):
+        """
+        Ingere as vagas ativas do histórico SQLite
+
+        Args:
+            armazem (ArmazemVagas): Armazém aberto
+
+        Returns:
+            int: Vagas ingeridas
+        """
+        return self.ingerir(armazem.vagas_ativas())
+
+    def atualizar(self, padroes=None):
+        """
+        Ingere os arquivos novos ou alterados que casam com os padrões
+
+        Args:
+            padroes (list): Padrões glob (padrão: PADROES_ARQUIVOS no diretório atual)
+
+        Returns:
+            dict: Arquivo -> vagas ingeridas (só os arquivos lidos)
+        """
+        lidos = {}
+        for padrao in padroes or PADROES_ARQUIVOS:
+            for caminho in sorted(glob.glob(padrao)):
+                quantidade = self.ingerir_arquivo(caminho)
+                if quantidade:
+                    lidos[caminho] = quantidade
+        return lidos
+
+    def _candidatas(self, texto=None, cidade=None, uf=None, tipo=None, salario_min=None, salario_max=None,
+                    inicio_min=None, inicio_max=None, fim_min=None, fim_max=None, turno=None,
+                    horas_min=None, horas_max=None):
+        exatos = []
+        if texto:
+            # 'info*' busca por prefixo; as demais palavras precisam aparecer inteiras
+            for termo in texto.split():
+                for palavra in normalizar(termo).split():
+                    if termo.endswith('*'):
+                        exatos.append(self._prefixo(palavra))
+                    else:
+                        exatos.append(self.texto.get(palavra, set()))
+        if cidade:
+            exatos.append(self.hash['cidade'].get(normalizar(analisar_localizacao(cidade)[0]), set()))
+        if uf:
+            exatos.append(self.hash['uf'].get(uf.upper(), set()))
+        if tipo:
+            exatos.append(self.hash['tipo'].get(self._tipo(tipo), set()))
+
+        faixas = []
+        if salario_min is not None or salario_max is not None:
+            faixas.append(('salario', salario_min, salario_max))
+        if turno:
+            inicio_min, inicio_max = TURNOS[turno]
+        if inicio_min is not None or inicio_max is not None:
+            faixas.append(('inicio', self._em_minutos(inicio_min), self._em_minutos(inicio_max)))
+        if fim_min is not None or fim_max is not None:
+            faixas.append(('fim', self._em_minutos(fim_min), self._em_minutos(fim_max)))
+        if horas_min is not None or horas_max is not None:
+            faixas.append(('horas_semanais', horas_min, horas_max))
+
+        candidatas = None
+        for conjunto in sorted(exatos, key=len):
+            candidatas = set(conjunto) if candidatas is None else candidatas & conjunto
+            if not candidatas:
+                return set()
+        for campo, minimo, maximo in faixas:
+            if candidatas is not None and len(candidatas) < 1000:
+                # Poucas candidatas: confere direto na coluna em vez de materializar a faixa
+                coluna = self.colunas[campo]
+                candidatas = {linha for linha in candidatas
+                              if (minimo is None or coluna[linha] >= minimo)
+                              and (maximo is None or coluna[linha] <= maximo)
+                              and not (coluna[linha] != coluna[linha] or coluna[linha] == -1)}
+            else:
+                faixa = self.ordenados[campo].intervalo(minimo, maximo)
+                candidatas = set(faixa) if candidatas is None else candidatas.intersection(faixa)
+            if not candidatas:
+                return set()
+
+        if candidatas is None:
+            return self.ativas
+        return candidatas - self.substituidas if self.substituidas else candidatas
+
+    def _prefixo(self, prefixo):
+        if self._palavras is None:
+            self._palavras = sorted(self.texto)
+        linhas = set()
+        for posicao in range(bisect_left(self._palavras, prefixo), len(self._palavras)):
+            palavra = self._palavras[posicao]
+            if not palavra.startswith(prefixo):
+                break
+            linhas |= self.texto[palavra]
+        return linhas
+
+    @staticmethod
+    def _tipo(tipo):
+        try:
+            return TipoVaga(tipo.lower()).value
+        except ValueError:
+            return analisar_tipo(tipo).value
+
+    @staticmethod
+    def _em_minutos(valor):
+        """Aceita minutos (int) ou 'HH:MM'"""
+        if valor is None or isinstance(valor, int):
+            return valor
+        horas, _, minutos = str(valor).partition(':')
+        return int(horas) * 60 + int(minutos or 0)
+
+    def buscar(self, ordenar=None, limite=None, **filtros):
+        """
+        Filtra, ordena e limita as vagas
+
+        Args:
+            ordenar (str): Um de ORDENACOES, com '-' na frente para decrescente (ex: '-salario');
+                vagas sem o valor vão para o fim
+            limite (int): Top-k (None: todas)
+            **filtros: texto, cidade, uf, tipo, salario_min, salario_max, inicio_min, inicio_max,
+                fim_min, fim_max ('HH:MM' ou minutos), turno ('manha', 'tarde', 'noite'),
+                horas_min, horas_max
+
+        Returns:
+            list: Vagas (modelo.Vaga) encontradas
+        """
+        candidatas = self._candidatas(**filtros)
+        if ordenar:
+            decrescente = ordenar.startswith('-')
+            coluna = self.colunas[ordenar.lstrip('-')]
+
+            def chave(linha):
+                valor = coluna[linha]
+                ausente = valor != valor or valor == -1
+                return (ausente, -valor if decrescente else valor, linha)
+
+            if limite and len(candidatas) > 8 * limite:
+                linhas = self._primeiras_ordenadas(ordenar.lstrip('-'), decrescente, candidatas, limite, chave)
+            else:
+                linhas = heapq.nsmallest(limite, candidatas, key=chave) if limite else sorted(candidatas, key=chave)
+        else:
+            linhas = sorted(candidatas)[:limite] if limite else sorted(candidatas)
+        return [self.colecao[linha] for linha in linhas]
+
+    def _primeiras_ordenadas(self, campo, decrescente, candidatas, limite, chave):
+        """Top-k de muitas candidatas: percorre o índice ordenado em vez de ordenar as candidatas"""
+        indice = self.ordenados[campo]
+        indice._consolidar()
+        valores, linhas_indice = indice.valores, indice.linhas
+        linhas = []
+        # Percorre blocos de valor igual (do maior para o menor se decrescente); dentro do bloco
+        # as linhas já estão em ordem crescente, o mesmo desempate de chave()
+        inicio, fim = (len(valores), len(valores)) if decrescente else (0, 0)
+        while len(linhas) < limite:
+            if decrescente:
+                if inicio == 0:
+                    break
+                fim = inicio
+                inicio = bisect_left(valores, valores[fim - 1], 0, fim)
+            else:
+                if fim == len(valores):
+                    break
+                inicio = fim
+                fim = bisect_right(valores, valores[inicio], inicio)
+            for posicao in range(inicio, fim):
+                if linhas_indice[posicao] in candidatas:
+                    linhas.append(linhas_indice[posicao])
+                    if len(linhas) == limite:
+                        return linhas
+        # Faltaram vagas com valor: completa com as que não têm (ficam no fim)
+        sem_valor = heapq.nsmallest(limite - len(linhas), set(candidatas).difference(linhas), key=chave)
+        return linhas + sem_valor
+
+    def contar(self, **filtros):
+        """
+        Returns:
+            int: Quantidade de vagas que atendem aos filtros (ver buscar)
+        """
+        return len(self._candidatas(**filtros))
+
+    def salvar(self, caminho):
+        """
+        Grava o índice (escrita atômica)
+
+        Só estruturas builtin e a ColecaoVagas vão para o arquivo, então o índice salvo pela
+        linha de comando (__main__) também é lido pela API.
+
+        Args:
+            caminho (str): Arquivo do índice
+        """
+        estado = dict(vars(self))
+        for indice in self.ordenados.values():
+            indice._consolidar()
+        estado['ordenados'] = {campo: (indice.valores, indice.linhas) for campo, indice in self.ordenados.items()}
+        estado['_palavras'] = None
+        temporario = f"{caminho}.tmp"
+        with open(temporario, 'wb') as f:
+            pickle.dump({'versao': VERSAO_INDICE, 'estado': estado}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporario, caminho)
+
+    @classmethod
+    def carregar(cls, caminho):
+        """
+        Lê um índice salvo
+
+        Args:
+            caminho (str): Arquivo do índice
+
+        Returns:
+            IndiceVagas: Índice salvo, ou None se ausente, ilegível ou de outra versão
+        """
+        try:
+            with open(caminho, 'rb') as f:
+                dados = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+        if not isinstance(dados, dict) or dados.get('versao') != VERSAO_INDICE:
+            return None
+        estado = dados['estado']
+        ordenados = {}
+        for campo, (valores, linhas) in estado['ordenados'].items():
+            ordenados[campo] = _IndiceOrdenado()
+            ordenados[campo].valores, ordenados[campo].linhas = valores, linhas
+        estado['ordenados'] = ordenados
+        indice = cls.__new__(cls)
+        indice.__dict__.update(estado)
+        return indice
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--indice', default='indice_vagas.pkl', help='arquivo do índice')
+    parser.add_argument('--ingerir', nargs='*', default=None, metavar='PADRAO',
+                        help='arquivos a ingerir antes da consulta (padrão: vagas_ciee_*.jsonl/.json/.csv)')
+    parser.add_argument('--db', default=None, help='também ingere as vagas ativas deste histórico SQLite')
+    parser.add_argument('--texto')
+    parser.add_argument('--cidade')
+    parser.add_argument('--uf')
+    parser.add_argument('--tipo', help="ex: estagio, aprendiz, 'ESTÁGIO'")
+    parser.add_argument('--salario-min', type=float)
+    parser.add_argument('--salario-max', type=float)
+    parser.add_argument('--inicio-min', help='HH:MM')
+    parser.add_argument('--inicio-max', help='HH:MM')
+    parser.add_argument('--fim-max', help='HH:MM')
+    parser.add_argument('--turno', choices=list(TURNOS))
+    parser.add_argument('--ordenar', help=f"um de {', '.join(ORDENACOES)}; decrescente com '-' (ex: --ordenar=-salario)")
+    parser.add_argument('--limite', type=int, default=20)
+    parser.add_argument('--json', action='store_true', help='imprime as vagas em JSONL')
+    args = parser.parse_args(argv)
+
+    indice = IndiceVagas.carregar(args.indice) or IndiceVagas()
+    lidos = indice.atualizar(args.ingerir or None)
+    if args.db:
+        from armazenamento import ArmazemVagas
+
+        armazem = ArmazemVagas(args.db)
+        lidos[args.db] = indice.ingerir_armazem(armazem)
+        armazem.fechar()
+    if lidos:
+        for caminho, quantidade in lidos.items():
+            print(f"📥 {caminho}: {quantidade} vagas")
+        indice.salvar(args.indice)
+
+    filtros = {campo: valor for campo, valor in {
+        'texto': args.texto, 'cidade': args.cidade, 'uf': args.uf, 'tipo': args.tipo,
+        'salario_min': args.salario_min, 'salario_max': args.salario_max,
+        'inicio_min': args.inicio_min, 'inicio_max': args.inicio_max, 'fim_max': args.fim_max,
+        'turno': args.turno,
+    }.items() if valor is not None}
+
+    inicio = time.perf_counter()
+    total = indice.contar(**filtros)
+    vagas = indice.buscar(ordenar=args.ordenar, limite=args.limite, **filtros)
+    milissegundos = (time.perf_counter() - inicio) * 1000
+
+    if args.json:
+        for vaga in vagas:
+            print(json.dumps(vaga.como_dict(), ensure_ascii=False))
+        return
+
+    print(f"\n🔎 {total} de {len(indice)} vagas em {milissegundos:.1f} ms (mostrando {len(vagas)})\n")
+    for vaga in vagas:
+        print(f"  {vaga.codigo:<9} {vaga.tipo:<10} {vaga.salario:<20} {vaga.horario:<16} "
+              f"{vaga.localizacao:<22} {vaga.descricao}")
+
+
+if __name__ == "__main__":
+    main()
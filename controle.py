@@ -0,0 +1,263 @@
+"""Controle de carga das buscas paralelas: limite de taxa (token bucket) e concorrência adaptativa (AIMD)"""
+
+import statistics
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import urllib3
+
+from metricas import metricas
+
+
+# Segundos considerados na taxa observada (requisições concluídas por segundo)
+JANELA_TAXA = 5.0
+
+
+class ErroHTTP(urllib3.exceptions.HTTPError):
+    """Resposta com status de erro (>= 400), com o status disponível para o controle"""
+
+    def __init__(self, status, url):
+        super().__init__(f"HTTP {status} em {url}")
+        self.status = status
+        self.url = url
+
+
+def sinal_de_sobrecarga(erro):
+    """
+    Diz se o erro indica servidor sobrecarregado (e não um erro da própria requisição)
+
+    Args:
+        erro (Exception): Erro de uma requisição ou carregamento de página
+
+    Returns:
+        bool: True para timeouts, conexões recusadas/derrubadas, HTTP 429 e 5xx
+    """
+    if isinstance(erro, ErroHTTP):
+        return erro.status == 429 or erro.status >= 500
+    if isinstance(erro, (TimeoutError, urllib3.exceptions.TimeoutError, urllib3.exceptions.ProtocolError,
+                         urllib3.exceptions.NewConnectionError, urllib3.exceptions.MaxRetryError)):
+        return True
+    # TimeoutException do Selenium, sem importar o Selenium aqui
+    return any(classe.__name__ == 'TimeoutException' for classe in type(erro).__mro__)
+
+
+class BaldeTokens:
+    """
+    Limite de taxa: até rajada requisições de uma vez e, depois disso, taxa por segundo
+
+    Seguro para várias threads; quem não encontra token dorme (fora do lock) até o próximo.
+    """
+
+    def __init__(self, taxa, rajada=None):
+        """
+        Args:
+            taxa (float): Requisições por segundo
+            rajada (int): Tokens acumulados no máximo (padrão: max(1, taxa))
+        """
+        self.taxa = float(taxa)
+        self.rajada = float(rajada or max(1.0, self.taxa))
+        self.tokens = self.rajada
+        self.atualizado = time.monotonic()
+        self._lock = threading.Lock()
+
+    def adquirir(self):
+        """
+        Retira um token, esperando se necessário
+
+        Returns:
+            float: Segundos esperados
+        """
+        esperado = 0.0
+        while True:
+            with self._lock:
+                agora = time.monotonic()
+                self.tokens = min(self.rajada, self.tokens + (agora - self.atualizado) * self.taxa)
+                self.atualizado = agora
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return esperado
+                espera = (1 - self.tokens) / self.taxa
+            time.sleep(espera)
+            esperado += espera
+
+
+class ControleAdaptativo:
+    """
+    Concorrência AIMD com limite de taxa, para envolver cada requisição ou carregamento de página
+
+    - aumento aditivo: cada sucesso com latência saudável soma 1/limite (um slot a mais
+      por "rodada" de limite requisições)
+    - redução multiplicativa: timeout, conexão recusada, HTTP 429/5xx multiplicam o limite
+      por reducao; latência mediana acima de tolerancia_latencia x a menor latência vista
+      multiplica por reducao_latencia
+    - só uma redução por rodada: falhas de requisições iniciadas antes da última redução
+      (que já refletiam o limite antigo) não reduzem de novo
+
+    O limite atual, as requisições em andamento e a taxa observada vão para as métricas
+    (`ciee_controle_limite`, `ciee_controle_em_andamento`, `ciee_controle_taxa`).
+
+    Uso:
+        controle = ControleAdaptativo('http', maximo=32, taxa=20)
+        resposta = controle.executar(http.request, 'GET', url)
+        with controle.permissao():
+            driver.get(url)
+    """
+
+    def __init__(self, nome='http', inicial=4, minimo=1, maximo=32, taxa=None, rajada=None, reducao=0.5,
+                 reducao_latencia=0.8, tolerancia_latencia=2.0, janela=20):
+        """
+        Args:
+            nome (str): Rótulo 'controle' nas métricas
+            inicial (int): Concorrência inicial
+            minimo (int): Menor concorrência
+            maximo (int): Maior concorrência (e tamanho dos pools que usam o controle)
+            taxa (float): Requisições por segundo no máximo (None: sem limite de taxa)
+            rajada (int): Requisições de uma vez antes do limite de taxa valer
+            reducao (float): Fator do limite após uma falha de sobrecarga
+            reducao_latencia (float): Fator do limite quando a latência sobe demais
+            tolerancia_latencia (float): Latência mediana aceita, em múltiplos da menor vista
+            janela (int): Latências recentes consideradas na mediana
+        """
+        self.nome = nome
+        self.minimo = max(1, minimo)
+        self.maximo = max(self.minimo, maximo)
+        self.limite = float(min(max(inicial, self.minimo), self.maximo))
+        self.reducao = reducao
+        self.reducao_latencia = reducao_latencia
+        self.tolerancia_latencia = tolerancia_latencia
+        self.janela = janela
+        self.balde = BaldeTokens(taxa, rajada) if taxa else None
+        self.em_andamento = 0
+        self.latencias = deque(maxlen=janela)
+        self.historico = deque(maxlen=janela * 10)
+        self.concluidas = deque()
+        self.estatisticas = {'sucessos': 0, 'falhas': 0, 'reducoes': 0, 'maior_limite': int(self.limite)}
+        self._ultima_reducao = 0.0
+        self._cond = threading.Condition()
+
+    @property
+    def limite_atual(self):
+        """Requisições simultâneas permitidas agora"""
+        return int(self.limite)
+
+    def adquirir(self):
+        """
+        Espera um slot livre e um token do limite de taxa
+
+        Returns:
+            float: Instante de início (time.monotonic), a repassar para liberar
+        """
+        with self._cond:
+            while self.em_andamento >= int(self.limite):
+                self._cond.wait()
+            self.em_andamento += 1
+        if self.balde is not None:
+            self.balde.adquirir()
+        self._publicar()
+        return time.monotonic()
+
+    def liberar(self, inicio, erro=None):
+        """
+        Devolve o slot e ajusta o limite pelo resultado
+
+        Args:
+            inicio (float): Retorno de adquirir
+            erro (Exception): Erro da requisição (None: sucesso)
+        """
+        agora = time.monotonic()
+        with self._cond:
+            self.em_andamento -= 1
+            self.concluidas.append(agora)
+            if erro is None:
+                self._sucesso(agora - inicio, inicio)
+            else:
+                self._falha(erro, inicio)
+            self._cond.notify_all()
+        self._publicar()
+
+    def executar(self, funcao, *args, **kwargs):
+        """
+        Chama funcao(*args, **kwargs) dentro de um slot do controle
+
+        Returns:
+            O retorno de funcao (exceções são registradas e propagadas)
+        """
+        inicio = self.adquirir()
+        try:
+            resultado = funcao(*args, **kwargs)
+        except Exception as e:
+            self.liberar(inicio, e)
+            raise
+        self.liberar(inicio)
+        return resultado
+
+    @contextmanager
+    def permissao(self):
+        """Context manager equivalente a executar, para blocos (ex: carregar uma aba)"""
+        inicio = self.adquirir()
+        try:
+            yield
+        except Exception as e:
+            self.liberar(inicio, e)
+            raise
+        self.liberar(inicio)
+
+    def _sucesso(self, latencia, inicio):
+        self.estatisticas['sucessos'] += 1
+        self.latencias.append(latencia)
+        self.historico.append(latencia)
+        base = min(self.historico)
+        if len(self.latencias) >= self.janela // 2 and \
+                statistics.median(self.latencias) > base * self.tolerancia_latencia:
+            self._reduzir(inicio, self.reducao_latencia, 'latencia')
+            return
+        self.limite = min(self.maximo, self.limite + 1 / self.limite)
+        self.estatisticas['maior_limite'] = max(self.estatisticas['maior_limite'], int(self.limite))
+
+    def _falha(self, erro, inicio):
+        self.estatisticas['falhas'] += 1
+        metricas.incrementar('controle_falhas', controle=self.nome)
+        if sinal_de_sobrecarga(erro):
+            self._reduzir(inicio, self.reducao, 'erro')
+
+    def _reduzir(self, inicio, fator, motivo):
+        if inicio < self._ultima_reducao:
+            return
+        self.limite = max(self.minimo, self.limite * fator)
+        self._ultima_reducao = time.monotonic()
+        # As latências da janela foram medidas com o limite antigo
+        self.latencias.clear()
+        self.estatisticas['reducoes'] += 1
+        metricas.incrementar('controle_reducoes', controle=self.nome, motivo=motivo)
+
+    def taxa_observada(self):
+        """
+        Returns:
+            float: Requisições concluídas por segundo nos últimos JANELA_TAXA segundos
+        """
+        limite = time.monotonic() - JANELA_TAXA
+        with self._cond:
+            while self.concluidas and self.concluidas[0] < limite:
+                self.concluidas.popleft()
+            return len(self.concluidas) / JANELA_TAXA
+
+    def _publicar(self):
+        if not metricas.ativo:
+            return
+        metricas.definir('controle_limite', int(self.limite), controle=self.nome)
+        metricas.definir('controle_em_andamento', self.em_andamento, controle=self.nome)
+        metricas.definir('controle_taxa', round(self.taxa_observada(), 3), controle=self.nome)
+
+    def relatorio(self):
+        """
+        Returns:
+            dict: Limite atual, em andamento, taxa observada, latências (base e mediana) e contagens
+        """
+        with self._cond:
+            mediana = statistics.median(self.latencias) if self.latencias else None
+            base = min(self.historico) if self.historico else None
+            dados = dict(self.estatisticas, limite=int(self.limite), em_andamento=self.em_andamento)
+        dados.update(taxa=self.taxa_observada(), latencia_base=base, latencia_mediana=mediana)
+        return dados
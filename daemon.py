@@ -0,0 +1,302 @@
+"""
+Modo daemon: mantém um pool de navegadores já abertos no portal e atende buscas por HTTP local
+
+Uso:
+    python daemon.py --workers 2 --porta 8765
+
+    curl -X POST http://127.0.0.1:8765/vagas \\
+         -d '{"filtros": {"tipo_vaga": "ESTÁGIO", "cidade": "BRASÍLIA - DF"}}'
+
+    curl http://127.0.0.1:8765/metrics   # snapshot no formato Prometheus
+"""
+
+import argparse
+import json
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import urllib3
+
+from main import CIEEScraper
+from metricas import configurar_logs, desativar, metricas
+
+
+class ScraperDoPool:
+    """Scraper do pool com contagem de usos"""
+
+    def __init__(self, scraper):
+        self.scraper = scraper
+        self.usos = 0
+        self.criado_em = time.time()
+
+
+class PoolDrivers:
+    """
+    Pool de CIEEScraper pré-inicializados e já na página de vagas
+
+    Depois de cada busca o scraper volta ao pool com os filtros resetados
+    (recarga da página, sem relançar o Chrome). Scrapers que não respondem ao
+    health check ou que atingiram max_usos são fechados e recriados, limitando
+    o crescimento de memória do Chrome.
+    """
+
+    def __init__(self, tamanho=2, max_usos=50, **kwargs_scraper):
+        """
+        Args:
+            tamanho (int): Número de navegadores mantidos abertos
+            max_usos (int): Buscas por navegador antes de reciclá-lo
+            **kwargs_scraper: Repassados ao construtor de CIEEScraper
+        """
+        self.tamanho = tamanho
+        self.max_usos = max_usos
+        self.kwargs_scraper = dict({'headless': True}, **kwargs_scraper)
+        self.livres = queue.Queue()
+        self.estatisticas = {'buscas': 0, 'erros': 0, 'reciclados': 0, 'falhas_saude': 0}
+        self._lock = threading.Lock()
+        self.fechado = False
+
+    def _criar(self):
+        scraper = CIEEScraper(**self.kwargs_scraper)
+        scraper.abrir()
+        return ScraperDoPool(scraper)
+
+    def iniciar(self):
+        """Abre todos os navegadores do pool em paralelo"""
+        print(f"🚀 Iniciando pool com {self.tamanho} navegadores...")
+        with ThreadPoolExecutor(max_workers=self.tamanho) as executor:
+            for item in executor.map(lambda _: self._criar(), range(self.tamanho)):
+                self.livres.put(item)
+        print("✅ Pool pronto!")
+        return self
+
+    def _reciclar(self, item, motivo):
+        with self._lock:
+            self.estatisticas['reciclados'] += 1
+        print(f"♻️ Reciclando navegador ({motivo}, {item.usos} usos)")
+        try:
+            item.scraper.fechar()
+        except Exception:
+            pass
+        return self._criar()
+
+    def _devolver(self, item):
+        """Prepara o scraper para a próxima busca e devolve ao pool"""
+        try:
+            if item.usos >= self.max_usos:
+                item = self._reciclar(item, 'limite de usos')
+            elif not item.scraper.saudavel():
+                with self._lock:
+                    self.estatisticas['falhas_saude'] += 1
+                item = self._reciclar(item, 'health check')
+            else:
+                item.scraper.resetar_filtros()
+        except Exception as e:
+            print(f"  ⚠️ Erro ao preparar navegador: {e}")
+            try:
+                item = self._reciclar(item, 'erro no reset')
+            except Exception as erro_criacao:
+                print(f"  ❌ Não foi possível recriar o navegador: {erro_criacao}")
+                self._agendar_reposicao()
+                return
+        self.livres.put(item)
+
+    def _agendar_reposicao(self, atraso=5):
+        """Recria um navegador em segundo plano, tentando de novo até conseguir (o pool não encolhe)"""
+        def repor():
+            if self.fechado:
+                return
+            try:
+                self.livres.put(self._criar())
+            except Exception as e:
+                print(f"  ❌ Não foi possível recriar o navegador: {e} (nova tentativa em {atraso}s)")
+                self._agendar_reposicao(atraso)
+
+        timer = threading.Timer(atraso, repor)
+        timer.daemon = True
+        timer.start()
+
+    def buscar(self, filtros, timeout=60, **opcoes_busca):
+        """
+        Executa uma busca num navegador livre do pool
+
+        Args:
+            filtros (dict): Filtros legíveis
+            timeout (float): Tempo máximo esperando um navegador livre
+            **opcoes_busca: Repassados a CIEEScraper.buscar (ex: todas_paginas=True)
+
+        Returns:
+            list: Lista de dicionários com os dados das vagas
+        """
+        item = self.livres.get(timeout=timeout)
+        try:
+            # Dentro do try: se o Chrome não relançar, o finally ainda devolve a vaga do pool
+            if not item.scraper.saudavel():
+                with self._lock:
+                    self.estatisticas['falhas_saude'] += 1
+                item = self._reciclar(item, 'health check')
+            item.usos += 1
+            vagas = item.scraper.buscar(filtros, **opcoes_busca)
+            with self._lock:
+                self.estatisticas['buscas'] += 1
+            return vagas
+        except Exception:
+            with self._lock:
+                self.estatisticas['erros'] += 1
+            raise
+        finally:
+            # O reset roda fora do caminho da resposta
+            threading.Thread(target=self._devolver, args=(item,), daemon=True).start()
+
+    def status(self):
+        """
+        Returns:
+            dict: Tamanho do pool, navegadores livres e estatísticas
+        """
+        with self._lock:
+            return dict(self.estatisticas, tamanho=self.tamanho, livres=self.livres.qsize())
+
+    def fechar(self):
+        """Fecha todos os navegadores livres"""
+        self.fechado = True
+        while True:
+            try:
+                item = self.livres.get_nowait()
+            except queue.Empty:
+                break
+            item.scraper.fechar()
+
+
+def criar_servidor(pool, host='127.0.0.1', porta=8765):
+    """
+    Cria o servidor HTTP local do daemon
+
+    Rotas:
+        POST /vagas  {"filtros": {...}, "todas_paginas": false} -> {"vagas": [...], "segundos": 1.2}
+        GET  /saude  -> status do pool
+        GET  /metrics -> cronômetros e contadores no formato de texto do Prometheus
+
+    Args:
+        pool (PoolDrivers): Pool já iniciado
+        host (str): Interface de escuta (apenas local por padrão)
+        porta (int): Porta
+
+    Returns:
+        ThreadingHTTPServer: Servidor pronto para serve_forever()
+    """
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _responder(self, status, dados, tipo='application/json; charset=utf-8'):
+            if not isinstance(dados, str):
+                dados = json.dumps(dados, ensure_ascii=False)
+            corpo = dados.encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', tipo)
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def do_GET(self):
+            if self.path == '/saude':
+                self._responder(200, pool.status())
+            elif self.path == '/metrics':
+                self._responder(200, metricas.texto_prometheus(), tipo='text/plain; version=0.0.4; charset=utf-8')
+            else:
+                self._responder(404, {'erro': 'rota não encontrada'})
+
+        def do_POST(self):
+            if self.path != '/vagas':
+                self._responder(404, {'erro': 'rota não encontrada'})
+                return
+            try:
+                tamanho = int(self.headers.get('Content-Length', 0))
+                pedido = json.loads(self.rfile.read(tamanho) or b'{}')
+                filtros = pedido.get('filtros', {})
+                opcoes = {k: pedido[k] for k in ('todas_paginas', 'concorrencia') if k in pedido}
+            except (ValueError, AttributeError) as e:
+                self._responder(400, {'erro': f"pedido inválido: {e}"})
+                return
+
+            inicio = time.perf_counter()
+            try:
+                vagas = pool.buscar(filtros, **opcoes)
+            except queue.Empty:
+                self._responder(503, {'erro': 'nenhum navegador livre'})
+                return
+            except Exception as e:
+                self._responder(500, {'erro': str(e)})
+                return
+            self._responder(200, {'vagas': vagas, 'segundos': time.perf_counter() - inicio})
+
+        def log_message(self, formato, *args):
+            print(f"  🌐 {self.address_string()} {formato % args}")
+
+    servidor = ThreadingHTTPServer((host, porta), Handler)
+    servidor.daemon_threads = True
+    return servidor
+
+
+def consultar(filtros, url='http://127.0.0.1:8765', timeout=120, **opcoes_busca):
+    """
+    Envia uma busca para um daemon em execução
+
+    Args:
+        filtros (dict): Filtros legíveis
+        url (str): Endereço do daemon
+        timeout (float): Timeout da requisição, em segundos
+        **opcoes_busca: Ex: todas_paginas=True
+
+    Returns:
+        list: Lista de dicionários com os dados das vagas
+    """
+    corpo = json.dumps(dict(opcoes_busca, filtros=filtros)).encode('utf-8')
+    resposta = urllib3.request('POST', f"{url}/vagas", body=corpo, timeout=timeout,
+                               headers={'Content-Type': 'application/json'})
+    dados = json.loads(resposta.data)
+    if resposta.status != 200:
+        raise RuntimeError(f"Daemon respondeu {resposta.status}: {dados.get('erro')}")
+    return dados['vagas']
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--workers', type=int, default=2, help='navegadores mantidos abertos')
+    parser.add_argument('--max-usos', type=int, default=50, help='buscas por navegador antes de reciclar')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8765)
+    parser.add_argument('--url-base', default=None, help='URL da página de vagas (padrão: portal do CIEE)')
+    parser.add_argument('--visivel', action='store_true', help='abre o Chrome com janela')
+    parser.add_argument('--recursos', default='leve', choices=['completa', 'leve', 'minima'],
+                        help='política de recursos do navegador (leve: sem imagens, mídia, fontes e rastreadores)')
+    parser.add_argument('--log-json', default=None, metavar='ARQUIVO',
+                        help='grava os eventos estruturados (uma linha JSON por evento)')
+    parser.add_argument('--sem-metricas', action='store_true', help='desliga cronômetros e contadores')
+    args = parser.parse_args(argv)
+
+    if args.sem_metricas:
+        desativar()
+    elif args.log_json:
+        configurar_logs(args.log_json)
+
+    pool = PoolDrivers(args.workers, max_usos=args.max_usos, headless=not args.visivel, url_base=args.url_base,
+                       politica_recursos=args.recursos)
+    pool.iniciar()
+    servidor = criar_servidor(pool, args.host, args.porta)
+    print(f"🌐 Daemon ouvindo em http://{args.host}:{args.porta}")
+
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.server_close()
+        pool.fechar()
+        print("\n🔒 Daemon encerrado.")
+
+
+if __name__ == "__main__":
+    main()
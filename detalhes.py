@@ -0,0 +1,288 @@
+"""Enriquecimento das vagas com a página de detalhe: busca concorrente, cache por código e fallback no navegador"""
+
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import urllib3
+
+from armazenamento import hash_vaga
+from controle import ErroHTTP
+from paginacao import chave_vaga
+from parser_html import extrair_detalhes_html
+from portal import CAMPOS_VAGA
+
+
+ESQUEMA_DETALHES = """
+CREATE TABLE IF NOT EXISTS detalhes (
+    codigo TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    dados TEXT NOT NULL,
+    buscado_em TEXT NOT NULL
+);
+"""
+
+
+def hash_card(vaga):
+    """
+    Hash só dos campos do card (os campos de detalhe não entram)
+
+    Args:
+        vaga (dict): Dados da vaga
+
+    Returns:
+        str: Hash que muda quando o card da vaga muda
+    """
+    return hash_vaga({campo: vaga.get(campo) for campo in CAMPOS_VAGA})
+
+
+class CacheDetalhes:
+    """
+    Detalhes já buscados, por código da vaga, em SQLite
+
+    Um detalhe só é reaproveitado enquanto o card da vaga não mudar (mesmo hash).
+    """
+
+    def __init__(self, caminho='vagas_ciee.db'):
+        """
+        Args:
+            caminho (str): Arquivo do banco SQLite (pode ser o mesmo do ArmazemVagas)
+        """
+        self.conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self.conexao.row_factory = sqlite3.Row
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.executescript(ESQUEMA_DETALHES)
+        self._lock = threading.Lock()
+
+    def obter(self, chaves):
+        """
+        Busca os detalhes em cache
+
+        Args:
+            chaves (dict): Código -> hash do card
+
+        Returns:
+            dict: Código -> detalhes, só para os códigos com o mesmo hash
+        """
+        codigos = list(chaves)
+        encontrados = {}
+        with self._lock:
+            for inicio in range(0, len(codigos), 500):
+                parte = codigos[inicio:inicio + 500]
+                marcadores = ','.join('?' * len(parte))
+                linhas = self.conexao.execute(
+                    f"SELECT codigo, hash, dados FROM detalhes WHERE codigo IN ({marcadores})", parte
+                )
+                for linha in linhas:
+                    if linha['hash'] == chaves[linha['codigo']]:
+                        encontrados[linha['codigo']] = json.loads(linha['dados'])
+        return encontrados
+
+    def salvar(self, itens):
+        """
+        Grava detalhes buscados
+
+        Args:
+            itens (list): Tuplas (código, hash do card, detalhes)
+        """
+        agora = datetime.now().isoformat(timespec='seconds')
+        with self._lock, self.conexao:
+            self.conexao.executemany(
+                "INSERT INTO detalhes (codigo, hash, dados, buscado_em) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(codigo) DO UPDATE SET hash = excluded.hash, dados = excluded.dados, "
+                "buscado_em = excluded.buscado_em",
+                [(codigo, hash_atual, json.dumps(detalhes, ensure_ascii=False), agora)
+                 for codigo, hash_atual, detalhes in itens],
+            )
+
+    def fechar(self):
+        """Fecha a conexão com o banco"""
+        self.conexao.close()
+
+
+class EnriquecedorDetalhes:
+    """
+    Busca as páginas de detalhe das vagas em paralelo e acrescenta os campos de CAMPOS_DETALHE
+
+    As páginas vêm por HTTP, num pool de conexões keep-alive. Páginas que não
+    trazem nenhum campo sem JavaScript são abertas no navegador (se houver um).
+
+    Uso:
+        with EnriquecedorDetalhes(cache=CacheDetalhes('vagas_ciee.db')) as enriquecedor:
+            vagas = enriquecedor.enriquecer(vagas)
+    """
+
+    def __init__(self, concorrencia=16, timeout=15, retries=2, cache=None, navegador=None, controle=None):
+        """
+        Args:
+            concorrencia (int): Páginas buscadas ao mesmo tempo (e tamanho do pool de conexões)
+            timeout (float): Timeout de cada requisição, em segundos
+            retries (int): Novas tentativas em erros de conexão
+            cache (CacheDetalhes): Cache por código (None: sem cache)
+            navegador: WebDriver usado para páginas que exigem JavaScript (None: sem fallback)
+            controle (ControleAdaptativo): Se informado, limita a taxa e ajusta a concorrência
+                (até controle.maximo) conforme a latência e os erros das páginas de detalhe
+        """
+        self.controle = controle
+        self.concorrencia = max(1, controle.maximo if controle is not None else concorrencia)
+        self.timeout = timeout
+        self.retries = retries
+        self.cache = cache
+        self.navegador = navegador
+        self.http = None
+        self.estatisticas = {'cache': 0, 'http': 0, 'navegador': 0, 'sem_detalhes': 0, 'erros': 0, 'segundos': 0.0}
+
+    def abrir(self):
+        """Cria o pool de conexões HTTP"""
+        if self.http is None:
+            self.http = urllib3.PoolManager(
+                maxsize=self.concorrencia,
+                block=True,
+                timeout=urllib3.Timeout(total=self.timeout),
+                retries=urllib3.Retry(self.retries, backoff_factor=0.2),
+                headers={'User-Agent': 'Mozilla/5.0 (ciee-vagas)', 'Accept': 'text/html'},
+            )
+
+    def buscar_detalhes(self, link):
+        """
+        Busca e extrai uma página de detalhe por HTTP (seguro para uso em várias threads)
+
+        Args:
+            link (str): URL da página de detalhe
+
+        Returns:
+            dict: Campos encontrados (vazio se a página depende de JavaScript)
+        """
+        if self.controle is not None:
+            resposta = self.controle.executar(self._requisitar, link)
+        else:
+            resposta = self._requisitar(link)
+        return extrair_detalhes_html(resposta.data.decode('utf-8', errors='replace'))
+
+    def _requisitar(self, link):
+        resposta = self.http.request('GET', link)
+        if resposta.status >= 400:
+            raise ErroHTTP(resposta.status, link)
+        return resposta
+
+    def buscar_detalhes_navegador(self, link):
+        """
+        Abre a página de detalhe numa aba nova do navegador e extrai os campos do DOM renderizado
+
+        A aba original (ex: a lista de resultados ainda sendo paginada) não é alterada.
+
+        Args:
+            link (str): URL da página de detalhe
+
+        Returns:
+            dict: Campos encontrados
+        """
+        janela_original = self.navegador.current_window_handle
+        self.navegador.switch_to.new_window('tab')
+        try:
+            self.navegador.get(link)
+            return extrair_detalhes_html(self.navegador.page_source)
+        finally:
+            self.navegador.close()
+            self.navegador.switch_to.window(janela_original)
+
+    def _buscar_seguro(self, link):
+        try:
+            return self.buscar_detalhes(link)
+        except Exception as e:
+            print(f"  ❌ Erro no detalhe {link}: {e}")
+            return None
+
+    def enriquecer(self, vagas):
+        """
+        Acrescenta os campos de detalhe às vagas (altera os próprios dicts)
+
+        Args:
+            vagas (list): Vagas com 'link'
+
+        Returns:
+            list: As mesmas vagas, com os campos de CAMPOS_DETALHE encontrados
+        """
+        self.abrir()
+        inicio = time.perf_counter()
+        com_link = [vaga for vaga in vagas if vaga.get('link') and vaga['link'] != 'N/A']
+        chaves = {chave_vaga(vaga): hash_card(vaga) for vaga in com_link}
+        em_cache = self.cache.obter(chaves) if self.cache is not None else {}
+
+        pendentes = []
+        for vaga in com_link:
+            detalhes = em_cache.get(chave_vaga(vaga))
+            if detalhes is not None:
+                vaga.update(detalhes)
+                self.estatisticas['cache'] += 1
+            else:
+                pendentes.append(vaga)
+
+        with ThreadPoolExecutor(max_workers=self.concorrencia) as executor:
+            resultados = list(executor.map(self._buscar_seguro, [vaga['link'] for vaga in pendentes]))
+
+        novos = []
+        for vaga, detalhes in zip(pendentes, resultados):
+            if detalhes is None:
+                self.estatisticas['erros'] += 1
+                continue
+            if detalhes:
+                self.estatisticas['http'] += 1
+            elif self.navegador is not None:
+                try:
+                    detalhes = self.buscar_detalhes_navegador(vaga['link'])
+                    self.estatisticas['navegador'] += 1
+                except Exception as e:
+                    print(f"  ❌ Erro no detalhe {vaga['link']} (navegador): {e}")
+                    self.estatisticas['erros'] += 1
+                    continue
+            if not detalhes:
+                self.estatisticas['sem_detalhes'] += 1
+                continue
+            vaga.update(detalhes)
+            novos.append((chave_vaga(vaga), chaves[chave_vaga(vaga)], detalhes))
+
+        if self.cache is not None and novos:
+            self.cache.salvar(novos)
+
+        segundos = time.perf_counter() - inicio
+        self.estatisticas['segundos'] += segundos
+        print(f"🔎 Detalhes: {len(pendentes)} buscados, {len(com_link) - len(pendentes)} do cache "
+              f"em {segundos:.2f}s")
+        return vagas
+
+    def iterar(self, vagas, tamanho_lote=200):
+        """
+        Enriquece um fluxo de vagas em lotes, sem montar a lista inteira
+
+        Args:
+            vagas (iterable): Vagas (ex: gerador de iterar_vagas)
+            tamanho_lote (int): Vagas enriquecidas por vez
+
+        Yields:
+            dict: Vaga com os campos de detalhe
+        """
+        lote = []
+        for vaga in vagas:
+            lote.append(vaga)
+            if len(lote) >= tamanho_lote:
+                yield from self.enriquecer(lote)
+                lote = []
+        if lote:
+            yield from self.enriquecer(lote)
+
+    def fechar(self):
+        """Fecha o pool de conexões"""
+        if self.http is not None:
+            self.http.clear()
+            self.http = None
+
+    def __enter__(self):
+        self.abrir()
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
@@ -0,0 +1,691 @@
+"""
+Modo distribuído: um coordenador divide as combinações de filtros numa fila durável e
+trabalhadores em qualquer número de máquinas as executam
+
+A fila é um arquivo SQLite (FilaSQLite). Trabalhadores na mesma máquina podem abrir o
+arquivo direto; os de outras máquinas falam com o coordenador por HTTP (FilaHTTP), que
+expõe a mesma fila. Cada tarefa é alugada por um prazo renovado enquanto a busca roda;
+se o trabalhador morrer, o aluguel expira e a tarefa é entregue a outro. As vagas são
+mescladas no coordenador, sem repetir códigos.
+
+Uso:
+    # coordenador: publica a matriz, serve a fila e grava o resultado quando todas terminarem
+    python distribuido.py coordenador --combinacoes combinacoes.json --porta 8766 \\
+        --saida vagas.jsonl --todas-paginas
+
+    # em cada máquina: N navegadores consumindo a fila
+    python distribuido.py trabalhador --fila http://coordenador:8766 --drivers 2
+
+    python distribuido.py status --fila http://coordenador:8766
+"""
+
+import argparse
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import urllib3
+
+from armazenamento import escopo_filtros
+from backends import criar_backend
+from lote import expandir_combinacoes
+from metricas import metricas
+from paginacao import chave_vaga
+from saidas import criar_saida, formato_do_arquivo
+
+
+ESQUEMA_FILA = """
+CREATE TABLE IF NOT EXISTS rodadas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    criada_em REAL NOT NULL,
+    opcoes TEXT NOT NULL,
+    encerrada_em REAL
+);
+
+CREATE TABLE IF NOT EXISTS tarefas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    rodada INTEGER NOT NULL,
+    escopo TEXT NOT NULL,
+    filtros TEXT NOT NULL,
+    estado TEXT NOT NULL DEFAULT 'pendente',
+    tentativas INTEGER NOT NULL DEFAULT 0,
+    trabalhador TEXT,
+    token TEXT,
+    expira_em REAL,
+    iniciada_em REAL,
+    concluida_em REAL,
+    segundos REAL,
+    vagas INTEGER,
+    erro TEXT,
+    UNIQUE (rodada, escopo)
+);
+CREATE INDEX IF NOT EXISTS idx_tarefas_estado ON tarefas (estado, expira_em);
+
+-- Vagas reportadas, uma por código em cada rodada (a primeira tarefa que a reportou fica)
+CREATE TABLE IF NOT EXISTS resultados (
+    rodada INTEGER NOT NULL,
+    codigo TEXT NOT NULL,
+    tarefa INTEGER NOT NULL,
+    posicao INTEGER NOT NULL,
+    dados TEXT NOT NULL,
+    PRIMARY KEY (rodada, codigo)
+);
+"""
+
+# Prazo padrão do aluguel de uma tarefa (s); o trabalhador renova a cada terço dele
+DURACAO_ALUGUEL = 300
+
+# Entregas de uma tarefa antes de ela ser dada como falha
+MAX_TENTATIVAS = 3
+
+# Porta padrão do coordenador
+PORTA_PADRAO = 8766
+
+# Chamadas da FilaHTTP que não são repetidas automaticamente: se só a resposta se perdeu,
+# o coordenador já entregou a tarefa (alugar) ou gravou as vagas (concluir). O aluguel
+# expira e a tarefa volta à fila; as demais chamadas podem ser repetidas sem efeito
+METODOS_SEM_REPETICAO = {'alugar', 'concluir'}
+
+
+class FilaSQLite:
+    """
+    Fila de tarefas durável num arquivo SQLite
+
+    Estados de uma tarefa: pendente -> alugada -> concluida (ou de volta a pendente
+    após uma falha ou aluguel expirado, até max_tentativas; depois, falhou).
+
+    Um relatório de uma tarefa cujo aluguel expirou ainda é aceito se ela não foi
+    concluída por outro trabalhador: as vagas são as mesmas e a deduplicação por
+    código garante que nada é repetido.
+
+    Vários processos podem abrir o mesmo arquivo; o aluguel usa BEGIN IMMEDIATE, então
+    duas entregas da mesma tarefa nunca acontecem ao mesmo tempo.
+    """
+
+    def __init__(self, caminho='fila_ciee.db', max_tentativas=MAX_TENTATIVAS):
+        """
+        Args:
+            caminho (str): Arquivo do banco SQLite
+            max_tentativas (int): Entregas de uma tarefa antes de ela ser dada como falha
+        """
+        self.caminho = caminho
+        self.max_tentativas = max_tentativas
+        self.conexao = sqlite3.connect(caminho, timeout=30, isolation_level=None, check_same_thread=False)
+        self.conexao.row_factory = sqlite3.Row
+        self.conexao.execute("PRAGMA journal_mode=WAL")
+        self.conexao.executescript(ESQUEMA_FILA)
+        self._lock = threading.Lock()
+
+    def _transacao(self, funcao, *args):
+        """Executa funcao(cursor, *args) numa transação BEGIN IMMEDIATE"""
+        with self._lock:
+            cursor = self.conexao.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                resultado = funcao(cursor, *args)
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
+            return resultado
+
+    def publicar(self, combinacoes, **opcoes_busca):
+        """
+        Cria uma rodada com uma tarefa por combinação (combinações repetidas viram uma só)
+
+        Args:
+            combinacoes (list): Dicts de filtros
+            **opcoes_busca: Repassados a backend.buscar pelos trabalhadores (ex: todas_paginas=True)
+
+        Returns:
+            int: ID da rodada
+        """
+        def publicar(cursor):
+            cursor.execute("INSERT INTO rodadas (criada_em, opcoes) VALUES (?, ?)",
+                           (time.time(), json.dumps(opcoes_busca)))
+            rodada = cursor.lastrowid
+            cursor.executemany(
+                "INSERT OR IGNORE INTO tarefas (rodada, escopo, filtros) VALUES (?, ?, ?)",
+                [(rodada, escopo_filtros(filtros), json.dumps(filtros, ensure_ascii=False))
+                 for filtros in combinacoes],
+            )
+            return rodada
+
+        return self._transacao(publicar)
+
+    def _expirar_esgotadas(self, cursor, agora):
+        """Dá como falha as tarefas com aluguel expirado que já usaram todas as tentativas"""
+        cursor.execute(
+            "UPDATE tarefas SET estado = 'falhou', erro = 'aluguel expirado', token = NULL "
+            "WHERE estado = 'alugada' AND expira_em < ? AND tentativas >= ?",
+            (agora, self.max_tentativas),
+        )
+
+    def alugar(self, trabalhador, duracao=DURACAO_ALUGUEL):
+        """
+        Entrega a próxima tarefa pendente (ou com aluguel expirado) de uma rodada aberta
+
+        Args:
+            trabalhador (str): Nome do trabalhador
+            duracao (float): Prazo do aluguel, em segundos
+
+        Returns:
+            dict: 'id', 'rodada', 'filtros', 'opcoes', 'token', 'tentativa' e 'reentrega'
+                (aluguel anterior expirado), ou None se não há tarefa
+        """
+        def alugar(cursor):
+            agora = time.time()
+            self._expirar_esgotadas(cursor, agora)
+            linha = cursor.execute(
+                "SELECT t.id, t.rodada, t.filtros, t.tentativas, t.estado, r.opcoes FROM tarefas t "
+                "JOIN rodadas r ON r.id = t.rodada "
+                "WHERE r.encerrada_em IS NULL "
+                "AND (t.estado = 'pendente' OR (t.estado = 'alugada' AND t.expira_em < ?)) "
+                "ORDER BY t.id LIMIT 1",
+                (agora,),
+            ).fetchone()
+            if linha is None:
+                return None
+            token = uuid.uuid4().hex
+            cursor.execute(
+                "UPDATE tarefas SET estado = 'alugada', trabalhador = ?, token = ?, expira_em = ?, "
+                "tentativas = tentativas + 1, iniciada_em = COALESCE(iniciada_em, ?) WHERE id = ?",
+                (trabalhador, token, agora + duracao, agora, linha['id']),
+            )
+            return {
+                'id': linha['id'],
+                'rodada': linha['rodada'],
+                'filtros': json.loads(linha['filtros']),
+                'opcoes': json.loads(linha['opcoes']),
+                'token': token,
+                'tentativa': linha['tentativas'] + 1,
+                'reentrega': linha['estado'] == 'alugada',
+            }
+
+        tarefa = self._transacao(alugar)
+        if tarefa is not None and tarefa['reentrega']:
+            metricas.incrementar('fila_reentregas')
+        return tarefa
+
+    def renovar(self, tarefa_id, token, duracao=DURACAO_ALUGUEL):
+        """
+        Estende o aluguel de uma tarefa em andamento
+
+        Returns:
+            bool: False se o aluguel já foi perdido (expirou e foi entregue a outro)
+        """
+        with self._lock:
+            cursor = self.conexao.execute(
+                "UPDATE tarefas SET expira_em = ? WHERE id = ? AND token = ? AND estado = 'alugada'",
+                (time.time() + duracao, tarefa_id, token),
+            )
+            return cursor.rowcount == 1
+
+    def concluir(self, tarefa_id, token, trabalhador, vagas, segundos):
+        """
+        Registra as vagas de uma tarefa terminada
+
+        Args:
+            tarefa_id (int): ID da tarefa
+            token (str): Token do aluguel (um aluguel expirado ainda é aceito, ver a classe)
+            trabalhador (str): Nome do trabalhador
+            vagas (list): Vagas encontradas
+            segundos (float): Duração da busca
+
+        Returns:
+            bool: False se a tarefa já tinha sido concluída (relatório descartado)
+        """
+        def concluir(cursor):
+            linha = cursor.execute("SELECT rodada, estado FROM tarefas WHERE id = ?", (tarefa_id,)).fetchone()
+            if linha is None or linha['estado'] == 'concluida':
+                return False
+            cursor.executemany(
+                "INSERT OR IGNORE INTO resultados (rodada, codigo, tarefa, posicao, dados) VALUES (?, ?, ?, ?, ?)",
+                [(linha['rodada'], chave_vaga(vaga), tarefa_id, posicao, json.dumps(vaga, ensure_ascii=False))
+                 for posicao, vaga in enumerate(vagas)],
+            )
+            cursor.execute(
+                "UPDATE tarefas SET estado = 'concluida', trabalhador = ?, token = NULL, concluida_em = ?, "
+                "segundos = ?, vagas = ?, erro = NULL WHERE id = ?",
+                (trabalhador, time.time(), segundos, len(vagas), tarefa_id),
+            )
+            return True
+
+        return self._transacao(concluir)
+
+    def falhar(self, tarefa_id, token, erro):
+        """
+        Devolve a tarefa à fila (ou a dá como falha depois de max_tentativas)
+
+        Returns:
+            bool: False se o aluguel já tinha sido perdido
+        """
+        with self._lock:
+            cursor = self.conexao.execute(
+                "UPDATE tarefas SET estado = CASE WHEN tentativas >= ? THEN 'falhou' ELSE 'pendente' END, "
+                "token = NULL, erro = ? WHERE id = ? AND token = ? AND estado = 'alugada'",
+                (self.max_tentativas, str(erro), tarefa_id, token),
+            )
+            return cursor.rowcount == 1
+
+    def encerrar(self, rodada):
+        """Fecha a rodada: tarefas restantes deixam de ser entregues"""
+        with self._lock:
+            self.conexao.execute("UPDATE rodadas SET encerrada_em = ? WHERE id = ?", (time.time(), rodada))
+
+    def ultima_rodada(self):
+        """
+        Returns:
+            int: ID da rodada mais recente (None se não houver)
+        """
+        with self._lock:
+            return self.conexao.execute("SELECT MAX(id) FROM rodadas").fetchone()[0]
+
+    def status(self, rodada=None):
+        """
+        Progresso e vazão da rodada
+
+        Args:
+            rodada (int): ID da rodada (padrão: a mais recente)
+
+        Returns:
+            dict: Tarefas por estado, reentregas, vagas únicas, vazão (tarefas/min e vagas/s
+                desde a primeira entrega) e totais por trabalhador
+        """
+        rodada = rodada or self.ultima_rodada()
+        if rodada is None:
+            return {'rodada': None}
+        # Sem isso, uma tarefa esgotada cujo trabalhador morreu contaria como pendente até
+        # alguém tentar alugar, e o coordenador esperaria para sempre
+        self._transacao(self._expirar_esgotadas, time.time())
+        with self._lock:
+            estados = dict(self.conexao.execute(
+                "SELECT estado, COUNT(*) FROM tarefas WHERE rodada = ? GROUP BY estado", (rodada,)))
+            linha = self.conexao.execute(
+                "SELECT MIN(iniciada_em), MAX(concluida_em), SUM(MAX(tentativas - 1, 0)), SUM(vagas) "
+                "FROM tarefas WHERE rodada = ?", (rodada,)).fetchone()
+            unicas = self.conexao.execute("SELECT COUNT(*) FROM resultados WHERE rodada = ?", (rodada,)).fetchone()[0]
+            trabalhadores = {
+                nome: {'tarefas': tarefas, 'segundos': segundos or 0.0, 'vagas': vagas or 0}
+                for nome, tarefas, segundos, vagas in self.conexao.execute(
+                    "SELECT trabalhador, COUNT(*), SUM(segundos), SUM(vagas) FROM tarefas "
+                    "WHERE rodada = ? AND estado = 'concluida' GROUP BY trabalhador", (rodada,))
+            }
+            encerrada = self.conexao.execute("SELECT encerrada_em FROM rodadas WHERE id = ?",
+                                             (rodada,)).fetchone()[0]
+
+        inicio, fim, reentregas, vagas = linha
+        pendentes = estados.get('pendente', 0) + estados.get('alugada', 0)
+        duracao = ((fim if not pendentes and fim else time.time()) - inicio) if inicio else 0.0
+        concluidas = estados.get('concluida', 0)
+        return {
+            'rodada': rodada,
+            'tarefas': sum(estados.values()),
+            'estados': estados,
+            'pendentes': pendentes,
+            'encerrada': encerrada is not None,
+            'reentregas': reentregas or 0,
+            'vagas': vagas or 0,
+            'vagas_unicas': unicas,
+            'segundos': duracao,
+            'tarefas_por_minuto': concluidas * 60 / duracao if duracao else 0.0,
+            'vagas_por_segundo': (vagas or 0) / duracao if duracao else 0.0,
+            'trabalhadores': trabalhadores,
+        }
+
+    def vagas(self, rodada):
+        """
+        Returns:
+            list: Vagas únicas da rodada, na ordem das tarefas e das posições
+        """
+        with self._lock:
+            return [json.loads(dados) for (dados,) in self.conexao.execute(
+                "SELECT dados FROM resultados WHERE rodada = ? ORDER BY tarefa, posicao", (rodada,))]
+
+    def fechar(self):
+        """Fecha a conexão"""
+        self.conexao.close()
+
+
+class FilaHTTP:
+    """
+    Cliente da fila servida pelo coordenador (servir_fila), com a mesma interface de
+    FilaSQLite para os trabalhadores: alugar, renovar, concluir, falhar e status
+    """
+
+    def __init__(self, url, timeout=60):
+        """
+        Args:
+            url (str): Endereço do coordenador (ex: http://10.0.0.5:8766)
+            timeout (float): Timeout de cada chamada, em segundos
+        """
+        self.url = url.rstrip('/')
+        self.http = urllib3.PoolManager(timeout=urllib3.Timeout(total=timeout),
+                                        retries=urllib3.Retry(3, backoff_factor=0.5, allowed_methods=None))
+
+    def _chamar(self, metodo, **argumentos):
+        corpo = json.dumps(argumentos, ensure_ascii=False).encode('utf-8')
+        opcoes = {'retries': False} if metodo in METODOS_SEM_REPETICAO else {}
+        resposta = self.http.request('POST', f"{self.url}/{metodo}", body=corpo,
+                                     headers={'Content-Type': 'application/json'}, **opcoes)
+        dados = json.loads(resposta.data)
+        if resposta.status != 200:
+            raise RuntimeError(f"Coordenador respondeu {resposta.status}: {dados.get('erro')}")
+        return dados['resultado']
+
+    def alugar(self, trabalhador, duracao=DURACAO_ALUGUEL):
+        return self._chamar('alugar', trabalhador=trabalhador, duracao=duracao)
+
+    def renovar(self, tarefa_id, token, duracao=DURACAO_ALUGUEL):
+        return self._chamar('renovar', tarefa_id=tarefa_id, token=token, duracao=duracao)
+
+    def concluir(self, tarefa_id, token, trabalhador, vagas, segundos):
+        return self._chamar('concluir', tarefa_id=tarefa_id, token=token, trabalhador=trabalhador,
+                            vagas=vagas, segundos=segundos)
+
+    def falhar(self, tarefa_id, token, erro):
+        return self._chamar('falhar', tarefa_id=tarefa_id, token=token, erro=erro)
+
+    def status(self, rodada=None):
+        return self._chamar('status', rodada=rodada)
+
+    def fechar(self):
+        self.http.clear()
+
+
+def abrir_fila(endereco):
+    """
+    Abre a fila pelo endereço
+
+    Args:
+        endereco (str): 'http://host:porta' (coordenador) ou caminho do arquivo SQLite
+
+    Returns:
+        FilaHTTP ou FilaSQLite
+    """
+    if endereco.startswith(('http://', 'https://')):
+        return FilaHTTP(endereco)
+    return FilaSQLite(endereco)
+
+
+def servir_fila(fila, host='0.0.0.0', porta=PORTA_PADRAO):
+    """
+    Cria o servidor HTTP que expõe a fila aos trabalhadores de outras máquinas
+
+    Rotas (POST, corpo JSON com os argumentos do método de FilaSQLite):
+        /alugar, /renovar, /concluir, /falhar, /status -> {"resultado": ...}
+
+    Args:
+        fila (FilaSQLite): Fila local
+        host (str): Interface de escuta
+        porta (int): Porta
+
+    Returns:
+        ThreadingHTTPServer: Servidor pronto para serve_forever()
+    """
+    metodos = {
+        'alugar': fila.alugar,
+        'renovar': fila.renovar,
+        'concluir': fila.concluir,
+        'falhar': fila.falhar,
+        'status': fila.status,
+    }
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def _responder(self, status, dados):
+            corpo = json.dumps(dados, ensure_ascii=False).encode('utf-8')
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(corpo)))
+            self.end_headers()
+            self.wfile.write(corpo)
+
+        def do_POST(self):
+            metodo = metodos.get(self.path.strip('/'))
+            if metodo is None:
+                self._responder(404, {'erro': 'rota não encontrada'})
+                return
+            try:
+                tamanho = int(self.headers.get('Content-Length', 0))
+                argumentos = json.loads(self.rfile.read(tamanho) or b'{}')
+                self._responder(200, {'resultado': metodo(**argumentos)})
+            except (ValueError, TypeError) as e:
+                self._responder(400, {'erro': f"pedido inválido: {e}"})
+            except Exception as e:
+                self._responder(500, {'erro': str(e)})
+
+        def log_message(self, formato, *args):
+            pass
+
+    servidor = ThreadingHTTPServer((host, porta), Handler)
+    servidor.daemon_threads = True
+    return servidor
+
+
+def executar_trabalhador(fila, nome=None, backend='selenium', kwargs_backend=None, duracao=DURACAO_ALUGUEL,
+                         intervalo=2.0, ate_esvaziar=False, parar=None):
+    """
+    Consome tarefas da fila até ser interrompido (ou até a fila esvaziar)
+
+    Um backend é aberto uma vez e reaproveitado entre as tarefas; depois de um erro
+    ele é recriado, como no lote. Enquanto a busca roda, o aluguel é renovado a cada
+    terço do prazo.
+
+    Args:
+        fila: FilaSQLite ou FilaHTTP
+        nome (str): Nome do trabalhador (padrão: host-pid-thread)
+        backend (str): 'selenium' ou 'http'
+        kwargs_backend (dict): Repassados ao construtor do backend
+        duracao (float): Prazo do aluguel, em segundos
+        intervalo (float): Espera entre consultas à fila quando não há tarefa
+        ate_esvaziar (bool): Se True, termina quando não houver tarefa disponível
+        parar (threading.Event): Se informado, termina quando for sinalizado
+
+    Returns:
+        dict: Tarefas concluídas, falhas, relatórios descartados e segundos em buscas
+    """
+    nome = nome or f"{socket.gethostname()}-{os.getpid()}-{threading.get_ident()}"
+    estatisticas = {'concluidas': 0, 'falhas': 0, 'descartadas': 0, 'segundos': 0.0}
+    instancia = None
+    parar = parar or threading.Event()
+
+    try:
+        while not parar.is_set():
+            try:
+                tarefa = fila.alugar(nome, duracao)
+            except urllib3.exceptions.HTTPError as e:
+                print(f"  ⚠️ [{nome}] coordenador indisponível: {e}")
+                parar.wait(intervalo)
+                continue
+            if tarefa is None:
+                if ate_esvaziar:
+                    break
+                parar.wait(intervalo)
+                continue
+
+            renovando = threading.Event()
+
+            def renovar(tarefa=tarefa):
+                while not renovando.wait(duracao / 3):
+                    if not fila.renovar(tarefa['id'], tarefa['token'], duracao):
+                        print(f"  ⚠️ [{nome}] aluguel da tarefa {tarefa['id']} perdido")
+                        return
+
+            threading.Thread(target=renovar, daemon=True).start()
+            inicio = time.perf_counter()
+            try:
+                if instancia is None:
+                    instancia = criar_backend(backend, **(kwargs_backend or {}))
+                    instancia.abrir()
+                vagas = instancia.buscar(tarefa['filtros'], **tarefa['opcoes'])
+            except Exception as e:
+                renovando.set()
+                estatisticas['falhas'] += 1
+                metricas.incrementar('fila_tarefas', resultado='erro')
+                print(f"  ❌ [{nome}] tarefa {tarefa['id']} {tarefa['filtros']}: {e}")
+                fila.falhar(tarefa['id'], tarefa['token'], f"{type(e).__name__}: {e}")
+                if instancia is not None:
+                    try:
+                        instancia.fechar()
+                    except Exception:
+                        pass
+                    instancia = None
+                continue
+            renovando.set()
+
+            segundos = time.perf_counter() - inicio
+            estatisticas['segundos'] += segundos
+            try:
+                aceito = fila.concluir(tarefa['id'], tarefa['token'], nome, vagas, segundos)
+            except urllib3.exceptions.HTTPError as e:
+                # A tarefa volta à fila quando o aluguel expirar (ou já foi gravada, se só a resposta se perdeu)
+                print(f"  ⚠️ [{nome}] relatório da tarefa {tarefa['id']} não confirmado: {e}")
+                aceito = False
+            if aceito:
+                estatisticas['concluidas'] += 1
+                metricas.incrementar('fila_tarefas', resultado='concluida')
+                print(f"  ✅ [{nome}] tarefa {tarefa['id']} {tarefa['filtros']}: {len(vagas)} vagas "
+                      f"em {segundos:.1f}s")
+            else:
+                estatisticas['descartadas'] += 1
+                metricas.incrementar('fila_tarefas', resultado='descartada')
+    finally:
+        if instancia is not None:
+            instancia.fechar()
+    return estatisticas
+
+
+def imprimir_status(status):
+    """Imprime o progresso e a vazão de uma rodada (retorno de FilaSQLite.status)"""
+    if status.get('rodada') is None:
+        print("Nenhuma rodada publicada")
+        return
+    estados = status['estados']
+    print(f"📊 Rodada {status['rodada']}: {estados.get('concluida', 0)}/{status['tarefas']} concluídas, "
+          f"{estados.get('alugada', 0)} em andamento, {estados.get('pendente', 0)} pendentes, "
+          f"{estados.get('falhou', 0)} falhas, {status['reentregas']} reentregas")
+    print(f"   {status['vagas_unicas']} vagas únicas ({status['vagas']} reportadas) em {status['segundos']:.0f}s: "
+          f"{status['tarefas_por_minuto']:.1f} tarefas/min, {status['vagas_por_segundo']:.1f} vagas/s")
+    for nome, dados in sorted(status['trabalhadores'].items()):
+        print(f"   {nome:<36} {dados['tarefas']:>5} tarefas {dados['vagas']:>7} vagas "
+              f"{dados['segundos']:>8.0f}s em buscas")
+
+
+def coordenar(fila, especificacao, arquivo_saida=None, intervalo=5.0, **opcoes_busca):
+    """
+    Publica a matriz de filtros e espera os trabalhadores terminarem
+
+    Args:
+        fila (FilaSQLite): Fila local
+        especificacao: Lista de filtros ou dict cartesiano (ver lote.expandir_combinacoes)
+        arquivo_saida (str): Se informado, grava as vagas mescladas (formato pela extensão)
+        intervalo (float): Segundos entre as impressões do progresso
+        **opcoes_busca: Repassados a backend.buscar (ex: todas_paginas=True)
+
+    Returns:
+        dict: 'rodada', 'vagas' (únicas) e 'status' (ver FilaSQLite.status)
+    """
+    combinacoes = expandir_combinacoes(especificacao)
+    rodada = fila.publicar(combinacoes, **opcoes_busca)
+    print(f"\n📤 Rodada {rodada}: {len(combinacoes)} combinações publicadas em {fila.caminho}")
+
+    try:
+        while True:
+            status = fila.status(rodada)
+            if not status['pendentes']:
+                break
+            imprimir_status(status)
+            time.sleep(intervalo)
+    finally:
+        fila.encerrar(rodada)
+
+    vagas = fila.vagas(rodada)
+    imprimir_status(status)
+    if arquivo_saida:
+        with criar_saida(formato_do_arquivo(arquivo_saida), arquivo_saida) as saida:
+            for vaga in vagas:
+                saida.escrever(vaga)
+        print(f"💾 Resultados salvos em: {arquivo_saida}")
+    return {'rodada': rodada, 'vagas': vagas, 'status': status}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    coordenador = subparsers.add_parser('coordenador', help='publica as combinações e mescla os resultados')
+    coordenador.add_argument('--fila', default='fila_ciee.db', help='arquivo SQLite da fila')
+    coordenador.add_argument('--combinacoes', required=True,
+                             help='JSON com a lista de filtros ou o dict cartesiano (filtro -> valores)')
+    coordenador.add_argument('--porta', type=int, default=None,
+                             help=f'serve a fila por HTTP nesta porta (ex: {PORTA_PADRAO})')
+    coordenador.add_argument('--host', default='0.0.0.0')
+    coordenador.add_argument('--saida', default=None, help='arquivo das vagas mescladas')
+    coordenador.add_argument('--todas-paginas', action='store_true')
+    coordenador.add_argument('--max-tentativas', type=int, default=MAX_TENTATIVAS)
+
+    trabalhador = subparsers.add_parser('trabalhador', help='executa tarefas da fila')
+    trabalhador.add_argument('--fila', default='fila_ciee.db', help='arquivo SQLite ou http://coordenador:porta')
+    trabalhador.add_argument('--drivers', type=int, default=1, help='navegadores (threads) nesta máquina')
+    trabalhador.add_argument('--backend', default='selenium', choices=['selenium', 'http'])
+    trabalhador.add_argument('--duracao', type=float, default=DURACAO_ALUGUEL, help='prazo do aluguel (s)')
+    trabalhador.add_argument('--ate-esvaziar', action='store_true', help='termina quando a fila esvaziar')
+
+    status = subparsers.add_parser('status', help='progresso e vazão da rodada mais recente')
+    status.add_argument('--fila', default='fila_ciee.db')
+    args = parser.parse_args(argv)
+
+    if args.comando == 'status':
+        fila = abrir_fila(args.fila)
+        imprimir_status(fila.status())
+        fila.fechar()
+        return
+
+    if args.comando == 'trabalhador':
+        fila = abrir_fila(args.fila)
+        parar = threading.Event()
+        threads = [threading.Thread(target=executar_trabalhador, args=(fila,),
+                                    kwargs={'backend': args.backend, 'duracao': args.duracao,
+                                            'ate_esvaziar': args.ate_esvaziar, 'parar': parar})
+                   for _ in range(max(1, args.drivers))]
+        print(f"👷 {len(threads)} trabalhadores consumindo {args.fila}")
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(1)
+        except KeyboardInterrupt:
+            print("\n⏹️ Encerrando depois das tarefas em andamento...")
+            parar.set()
+            for thread in threads:
+                thread.join()
+        fila.fechar()
+        return
+
+    with open(args.combinacoes, encoding='utf-8') as f:
+        especificacao = json.load(f)
+    fila = FilaSQLite(args.fila, max_tentativas=args.max_tentativas)
+    servidor = None
+    if args.porta is not None:
+        servidor = servir_fila(fila, args.host, args.porta)
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        print(f"🌐 Fila servida em http://{args.host}:{args.porta}")
+    try:
+        coordenar(fila, especificacao, arquivo_saida=args.saida, todas_paginas=args.todas_paginas)
+    finally:
+        if servidor is not None:
+            servidor.shutdown()
+            servidor.server_close()
+        fila.fechar()
+
+
+if __name__ == "__main__":
+    main()
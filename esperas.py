@@ -0,0 +1,392 @@
+"""Esperas por eventos da página (WebDriverWait) no lugar dos time.sleep fixos"""
+
+import time
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from metricas import metricas
+from seletores import JS_CARDS_DO_CANDIDATO, SCRIPT_COLHER_CARDS, SELETOR_GENERICO
+
+
+# Timeout máximo (s) de cada passo quando esperando por eventos
+TIMEOUTS_PADRAO = {
+    'pagina': 15,
+    'dropdown': 5,
+    'opcao': 5,
+    'selecao': 3,
+    'digitacao': 5,
+    'pos_filtros': 5,
+    'resultados': 15,
+    'busca': 10,
+    'rede': 10,
+    'colheita': 10,
+}
+
+# Pausas fixas usadas antes das esperas por eventos (modo 'sleep' e fallback)
+SLEEPS_LEGADOS = {
+    'pagina': 5,
+    'dropdown': 1,
+    'opcao': 0.5,
+    'selecao': 1,
+    'digitacao': 2,
+    'pos_filtros': 2,
+    'resultados': 4,
+    'busca': 3,
+    'rede': 1,
+    'colheita': 3,
+}
+
+# Instala contadores de requisições fetch/XHR pendentes na página
+SCRIPT_MONITOR_REDE = """
+if (!window.__cieeRede) {
+    window.__cieeRede = {pendentes: 0, ultimaAtividade: Date.now()};
+    const rede = window.__cieeRede;
+    const inicio = function () { rede.pendentes++; rede.ultimaAtividade = Date.now(); };
+    const fim = function () { rede.pendentes = Math.max(0, rede.pendentes - 1); rede.ultimaAtividade = Date.now(); };
+    if (window.fetch) {
+        const fetchOriginal = window.fetch;
+        window.fetch = function () {
+            inicio();
+            return fetchOriginal.apply(this, arguments).finally(fim);
+        };
+    }
+    const sendOriginal = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        inicio();
+        this.addEventListener('loadend', fim);
+        return sendOriginal.apply(this, arguments);
+    };
+}
+"""
+
+# Estado da rede: requisições pendentes e ms desde a última atividade (fetch/XHR ou recurso carregado)
+SCRIPT_ESTADO_REDE = """
+const rede = window.__cieeRede || {pendentes: 0, ultimaAtividade: 0};
+const recursos = performance.getEntriesByType('resource');
+let ultimoRecurso = 0;
+for (const r of recursos) { ultimoRecurso = Math.max(ultimoRecurso, r.responseEnd); }
+const ultimo = Math.max(rede.ultimaAtividade, performance.timeOrigin + ultimoRecurso);
+return [rede.pendentes, Date.now() - ultimo, document.readyState];
+"""
+
+# Estado da lista de resultados: [assinatura, carregando]. A assinatura (seletor do primeiro
+# candidato com cards, quantidade, primeiro e último card, texto da paginação) detecta que a
+# lista foi re-renderizada; carregando indica um spinner visível
+# (arguments: seletores dos cards em ordem de preferência, SELETOR_GENERICO, seletores da
+# paginação, seletores dos indicadores de carregamento; os dois últimos podem ser null)
+SCRIPT_ESTADO_RESULTADOS = JS_CARDS_DO_CANDIDATO + """
+const candidatos = arguments[0], generico = arguments[1], paginacao = arguments[2], carregando = arguments[3];
+let seletor = '', cards = [];
+for (const candidato of candidatos) {
+    const encontrados = cardsDoCandidato(candidato, generico);
+    if (encontrados.length) { seletor = candidato; cards = encontrados; break; }
+}
+const texto = function (card) { return card ? (card.getAttribute('href') || card.textContent) : ''; };
+function buscar(seletor) {
+    if (!seletor) { return []; }
+    try { return Array.from(document.querySelectorAll(seletor)); } catch (e) { return []; }
+}
+const paginas = buscar(paginacao).map(function (e) { return e.textContent.trim(); }).join(' ');
+const ocupada = buscar(carregando).some(function (e) { return e.getClientRects().length > 0; });
+const assinatura = [seletor, cards.length, texto(cards[0]), texto(cards[cards.length - 1]), paginas].join('|');
+return [assinatura, ocupada];
+"""
+
+
+class GerenciadorEsperas:
+    """Centraliza as esperas do scraper, com timeout por passo e fallback para as pausas fixas"""
+
+    def __init__(self, driver, timeouts=None, modo='evento', intervalo=0.05, carregamento='normal'):
+        """
+        Inicializa o gerenciador
+
+        Args:
+            driver: WebDriver em uso
+            timeouts (dict): Sobrescreve os timeouts de TIMEOUTS_PADRAO por passo
+            modo (str): 'evento' espera por condições da página; 'sleep' usa as pausas fixas antigas
+            intervalo (float): Intervalo de polling das condições, em segundos
+            carregamento (str): Estratégia de carregamento do driver; com 'eager' a página
+                é considerada pronta no DOMContentLoaded (readyState 'interactive')
+        """
+        self.driver = driver
+        self.timeouts = dict(TIMEOUTS_PADRAO, **(timeouts or {}))
+        self.modo = modo
+        self.intervalo = intervalo
+        self.estados_prontos = ('interactive', 'complete') if carregamento == 'eager' else ('complete',)
+        self.registros = []
+        # Passo do último timeout (None se a última espera terminou a tempo)
+        self.ultimo_timeout = None
+        # Instante (time.perf_counter) em que acaba o orçamento do passo em andamento (ver passos.py);
+        # nenhuma espera passa dele
+        self.prazo = None
+
+    def _timeout(self, passo):
+        """Timeout do passo, limitado ao que resta do orçamento do passo em andamento"""
+        if self.prazo is None:
+            return self.timeouts[passo]
+        return max(self.intervalo, min(self.timeouts[passo], self.prazo - time.perf_counter()))
+
+    def _wait(self, passo, timeout=None):
+        """Cria um WebDriverWait com o timeout do passo"""
+        return WebDriverWait(self.driver, timeout or self._timeout(passo), poll_frequency=self.intervalo)
+
+    def _registrar(self, passo, inicio, ok):
+        segundos = time.perf_counter() - inicio
+        self.registros.append({
+            'passo': passo,
+            'segundos': segundos,
+            'legado': SLEEPS_LEGADOS[passo],
+            'ok': ok,
+        })
+        metricas.observar('espera', segundos, passo=passo)
+
+    def aguardar(self, passo, condicao):
+        """
+        Espera uma condição do passo ficar verdadeira
+
+        No modo 'sleep', ou se a condição não puder ser avaliada (erro de JS, driver
+        sem suporte), dorme a pausa fixa antiga do passo.
+
+        Args:
+            passo (str): Nome do passo (chave de TIMEOUTS_PADRAO)
+            condicao (callable): Recebe o driver e retorna um valor verdadeiro quando pronto
+
+        Returns:
+            O valor retornado pela condição, ou None se ela não ficou pronta
+        """
+        inicio = time.perf_counter()
+        self.ultimo_timeout = None
+
+        if self.modo == 'sleep':
+            time.sleep(SLEEPS_LEGADOS[passo])
+            self._registrar(passo, inicio, True)
+            return None
+
+        limite = self._timeout(passo)
+        try:
+            resultado = self._wait(passo, limite).until(condicao)
+            self._registrar(passo, inicio, True)
+            return resultado
+        except TimeoutException:
+            print(f"  ⚠️ Timeout aguardando '{passo}' ({limite:.1f}s)")
+            metricas.incrementar('timeouts', fase='espera', passo=passo)
+            metricas.evento('timeout', fase='espera', passo=passo, limite=limite)
+            self.ultimo_timeout = passo
+            self._registrar(passo, inicio, False)
+            return None
+        except WebDriverException as e:
+            print(f"  ⚠️ Espera por '{passo}' indisponível, usando pausa fixa: {e.msg}")
+            metricas.incrementar('fallbacks', tipo='pausa_fixa', passo=passo)
+            time.sleep(SLEEPS_LEGADOS[passo])
+            self._registrar(passo, inicio, False)
+            return None
+
+    def instalar_monitor_rede(self):
+        """Instala o monitor de fetch/XHR na página atual e nas próximas navegações"""
+        try:
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': SCRIPT_MONITOR_REDE})
+        except (AttributeError, WebDriverException):
+            pass
+
+        try:
+            self.driver.execute_script(SCRIPT_MONITOR_REDE)
+        except WebDriverException:
+            pass
+
+    def aguardar_pagina_carregada(self):
+        """
+        Espera o documento terminar de carregar e a rede ficar ociosa
+
+        Returns:
+            bool: False se o documento não ficou pronto dentro do timeout
+        """
+        pronto = self.aguardar(
+            'pagina', lambda d: d.execute_script("return document.readyState") in self.estados_prontos
+        )
+        carregou = self.ultimo_timeout is None
+        self.instalar_monitor_rede()
+        if pronto:
+            self.aguardar_rede_ociosa()
+        return carregou
+
+    def aguardar_rede_ociosa(self, quieto=0.3, passo='rede'):
+        """
+        Espera não haver requisições pendentes por um período de silêncio
+
+        Args:
+            quieto (float): Segundos sem atividade de rede para considerar ociosa
+            passo (str): Nome do passo usado no timeout e no relatório
+        """
+        def ociosa(driver):
+            pendentes, ms_sem_atividade, estado = driver.execute_script(SCRIPT_ESTADO_REDE)
+            return estado in self.estados_prontos and pendentes == 0 and ms_sem_atividade >= quieto * 1000
+
+        return self.aguardar(passo, ociosa)
+
+    def aguardar_colheita(self, candidatos, generico, quieto=0.5):
+        """
+        Colhe os cards rolando a página até a quantidade estabilizar (ver SCRIPT_COLHER_CARDS)
+
+        Tudo roda numa única chamada execute_async_script, limitada pelo timeout do
+        passo 'colheita'. No modo 'sleep', ou se o script falhar, dorme a pausa fixa
+        e retorna None (o chamador tira um retrato único da lista).
+
+        Args:
+            candidatos (list): Seletores dos cards em ordem de preferência
+            generico (str): Candidato especial seletores.SELETOR_GENERICO
+            quieto (float): Segundos no fim da página sem cards novos para encerrar
+
+        Returns:
+            dict: 'seletor', 'cards' (WebElements na ordem em que apareceram), 'rolagens'
+                e 'completa' (False se o timeout encerrou a colheita), ou None
+        """
+        inicio = time.perf_counter()
+        self.ultimo_timeout = None
+
+        if self.modo == 'sleep':
+            time.sleep(SLEEPS_LEGADOS['colheita'])
+            self._registrar('colheita', inicio, True)
+            return None
+
+        limite = self._timeout('colheita')
+        try:
+            colheita = self.driver.execute_async_script(
+                SCRIPT_COLHER_CARDS, candidatos, generico, int(quieto * 1000), int(limite * 1000)
+            )
+        except WebDriverException as e:
+            print(f"  ⚠️ Colheita dos cards indisponível, usando pausa fixa: {e.msg}")
+            metricas.incrementar('fallbacks', tipo='pausa_fixa', passo='colheita')
+            time.sleep(SLEEPS_LEGADOS['colheita'])
+            self._registrar('colheita', inicio, False)
+            return None
+
+        if not colheita['completa']:
+            print(f"  ⚠️ Timeout aguardando 'colheita' ({limite}s): {len(colheita['cards'])} cards até aqui")
+            metricas.incrementar('timeouts', fase='espera', passo='colheita')
+            self.ultimo_timeout = 'colheita'
+        self._registrar('colheita', inicio, colheita['completa'])
+        return colheita
+
+    def aguardar_lista_dropdown(self, by, valor):
+        """
+        Espera a lista de opções do combo ser renderizada (visível)
+
+        Args:
+            by: Estratégia de localização (By.ID, By.XPATH, ...)
+            valor (str): Localizador da lista ou de uma opção dela
+
+        Returns:
+            WebElement visível, ou None
+        """
+        return self.aguardar('dropdown', EC.visibility_of_element_located((by, valor)))
+
+    def aguardar_opcao_clicavel(self, by, valor):
+        """
+        Espera uma opção ficar clicável
+
+        Returns:
+            WebElement clicável, ou None
+        """
+        return self.aguardar('opcao', EC.element_to_be_clickable((by, valor)))
+
+    def aguardar_selecao(self, elemento, valor_anterior):
+        """
+        Espera o valor do campo mudar após clicar numa opção
+
+        Args:
+            elemento: WebElement do campo do filtro
+            valor_anterior (str): Valor do campo antes do clique
+        """
+        return self.aguardar('selecao', lambda d: elemento.get_attribute('value') != valor_anterior)
+
+    def aguardar_opcoes_filtradas(self, by, valor):
+        """Espera a lista de opções reagir ao texto digitado no combo"""
+        return self.aguardar('digitacao', EC.visibility_of_element_located((by, valor)))
+
+    def assinatura_resultados(self, seletores, paginacao=None):
+        """
+        Retorna uma assinatura da lista de resultados atual
+
+        Args:
+            seletores (list): Seletores dos cards em ordem de preferência (ex: a ordem
+                aprendida de CacheSeletores.ordenar('cards', ...)); aceita SELETOR_GENERICO
+            paginacao (str): Seletores da paginação, cujo texto entra na assinatura
+
+        Returns:
+            str: Seletor que encontrou os cards, quantidade, primeiro e último card e paginação
+        """
+        try:
+            return self.driver.execute_script(
+                SCRIPT_ESTADO_RESULTADOS, list(seletores), SELETOR_GENERICO, paginacao, None
+            )[0]
+        except WebDriverException:
+            return None
+
+    def aguardar_resultados_alterados(self, assinatura_anterior, seletores, paginacao=None, carregando=None,
+                                      estavel=1.0):
+        """
+        Espera a lista de resultados ser re-renderizada (ou se mostrar estável) e a rede ficar ociosa
+
+        Uma lista igual à anterior não é falha: os filtros podem não mudar os resultados.
+        Ela conta como estável depois de estavel segundos sem indicador de carregamento
+        visível e sem atividade de rede.
+
+        Args:
+            assinatura_anterior (str): Valor de assinatura_resultados antes de aplicar os filtros
+            seletores (list): Os mesmos seletores usados em assinatura_resultados
+            paginacao (str): Os mesmos seletores da paginação usados em assinatura_resultados
+            carregando (str): Seletores dos indicadores de carregamento (spinner)
+            estavel (float): Segundos de silêncio para aceitar a lista inalterada
+
+        Returns:
+            str: 'alterada', 'estavel', ou None se a lista continuou carregando até o timeout
+        """
+        seletores = list(seletores)
+        inicio = time.perf_counter()
+
+        def pronta(driver):
+            assinatura, ocupada = driver.execute_script(
+                SCRIPT_ESTADO_RESULTADOS, seletores, SELETOR_GENERICO, paginacao, carregando
+            )
+            if assinatura != assinatura_anterior:
+                return 'alterada'
+            if ocupada or time.perf_counter() - inicio < estavel:
+                return False
+            pendentes, ms_sem_atividade, estado = driver.execute_script(SCRIPT_ESTADO_REDE)
+            if estado in self.estados_prontos and pendentes == 0 and ms_sem_atividade >= estavel * 1000:
+                return 'estavel'
+            return False
+
+        resultado = self.aguardar('resultados', pronta)
+        if resultado == 'alterada':
+            self.aguardar_rede_ociosa()
+        elif resultado == 'estavel':
+            print("  ℹ️ Lista de resultados igual à anterior, sem carregamento pendente")
+        return resultado
+
+    def relatorio(self):
+        """
+        Resume o tempo gasto esperando comparado às pausas fixas antigas
+
+        Returns:
+            dict: Tempo por passo, total esperado, total legado e tempo economizado
+        """
+        por_passo = {}
+        for registro in self.registros:
+            passo = por_passo.setdefault(registro['passo'], {'vezes': 0, 'segundos': 0.0, 'legado': 0.0, 'timeouts': 0})
+            passo['vezes'] += 1
+            passo['segundos'] += registro['segundos']
+            passo['legado'] += registro['legado']
+            passo['timeouts'] += 0 if registro['ok'] else 1
+
+        total = sum(r['segundos'] for r in self.registros)
+        legado = sum(r['legado'] for r in self.registros)
+        return {
+            'modo': self.modo,
+            'passos': por_passo,
+            'total_segundos': total,
+            'legado_segundos': legado,
+            'economizado_segundos': legado - total,
+        }
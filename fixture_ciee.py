@@ -0,0 +1,611 @@
+"""Páginas sintéticas que imitam o DOM do portal CIEE, para medições locais sem acessar o site real"""
+
+import html
+import json
+import mimetypes
+import os
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+
+TIPOS = ['Estágio', 'Aprendiz', 'PCD']
+AREAS = ['INFORMÁTICA', 'ADMINISTRAÇÃO', 'LOGISTICA', 'MARKETING', 'SAÚDE']
+CIDADES = ['São Paulo - SP', 'Brasília - DF', 'Rio de Janeiro - RJ']
+HORARIOS = ['09:00 às 15:00', '13:00 às 19:00', '08:00 às 14:00']
+SALARIOS = ['R$ 900,00 / Mês', 'R$ 1.200,00 / Mês', 'R$ 1.500,00 / Mês']
+
+# Opções de cada combo de filtro: (id do input, id da lista, [(id da opção, texto)])
+COMBOS = [
+    ('TipoVaga', 'ComboTipoVaga', [
+        ('estagio', 'ESTÁGIO'), ('aprendiz', 'APRENDIZ'), ('pcd', 'PCD'),
+        ('pp', 'PROCESSOS PÚBLICOS'), ('se', 'SOLUÇÕES ESPECIAIS'),
+    ]),
+    ('NivelEnsino', 'ComboNivelEnsino', [
+        ('TODOS', 'TODOS'), ('EF', 'ENSINO FUNDAMENTAL'), ('EM', 'ENSINO MÉDIO'),
+        ('TE', 'TÉCNICO'), ('SU', 'SUPERIOR'),
+    ]),
+    ('AreaProfissional', 'ComboAreaProfissional', [
+        ('1', 'ADMINISTRAÇÃO'), ('17', 'INDUSTRIA'), ('18', 'INFORMÁTICA'), ('20', 'LETRAS'),
+        ('22', 'MARKETING'), ('24', 'MEIO AMBIENTE'), ('32', 'SAÚDE'), ('45', 'GEOMÁTICA'),
+        ('73', 'ENGENHARIA'), ('10081', 'ASTRONOMIA'), ('11241', 'GASTRONOMIA'),
+    ]),
+    ('CidadeVaga', 'ComboCidade', [
+        ('5300108', 'BRASÍLIA - DF'), ('3108602', 'BRASÍLIA DE MINAS - MG'),
+        ('3550308', 'SÃO PAULO - SP'), ('3304557', 'RIO DE JANEIRO - RJ'),
+    ]),
+]
+
+# Comportamento dos combos e do botão Aplicar, com atrasos que simulam renderização e rede
+SCRIPT_PORTAL = """
+const ATRASO_COMBO = %(atraso_combo)d;
+const ATRASO_BUSCA = %(atraso_busca)d;
+const CARDS = %(cards)s;
+const DESTAQUES = %(destaques)d;
+const LOTE_ROLAGEM = %(lote_rolagem)d;
+const ATRASO_ROLAGEM = %(atraso_rolagem)d;
+let exibidos = 0;
+let buscou = false;
+let carregandoMais = false;
+
+function renderizar(quantidade) {
+    exibidos = Math.min(quantidade, CARDS.length);
+    document.getElementById('resultados').innerHTML = CARDS.slice(0, exibidos).join('');
+}
+
+// Com LOTE_ROLAGEM, os resultados chegam em lotes quando a lista é rolada até perto do fim
+window.addEventListener('scroll', function () {
+    const perto = window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 200;
+    if (!buscou || !LOTE_ROLAGEM || carregandoMais || exibidos >= CARDS.length || !perto) { return; }
+    carregandoMais = true;
+    setTimeout(function () {
+        const lote = CARDS.slice(exibidos, exibidos + LOTE_ROLAGEM);
+        document.getElementById('resultados').insertAdjacentHTML('beforeend', lote.join(''));
+        exibidos += lote.length;
+        carregandoMais = false;
+    }, ATRASO_ROLAGEM);
+});
+
+document.querySelectorAll('.combo-filtro').forEach(function (combo) {
+    const input = combo.querySelector('input');
+    const lista = combo.querySelector('ul');
+    input.addEventListener('click', function () {
+        setTimeout(function () { lista.style.display = 'block'; }, ATRASO_COMBO);
+    });
+    input.addEventListener('input', function () {
+        const termo = input.value.toUpperCase();
+        setTimeout(function () {
+            lista.querySelectorAll('li').forEach(function (li) {
+                li.style.display = li.textContent.indexOf(termo) >= 0 ? '' : 'none';
+            });
+        }, ATRASO_COMBO);
+    });
+    lista.querySelectorAll('li').forEach(function (li) {
+        li.addEventListener('click', function () {
+            input.value = li.textContent;
+            lista.style.display = 'none';
+        });
+    });
+});
+
+document.querySelector('div.btn-search.btn-purple').addEventListener('click', function () {
+    document.getElementById('resultados').innerHTML = '<p class="carregando">Carregando...</p>';
+    setTimeout(function () {
+        buscou = true;
+        renderizar(LOTE_ROLAGEM || CARDS.length);
+    }, ATRASO_BUSCA);
+});
+
+renderizar(DESTAQUES);
+"""
+
+
+def gerar_card_vaga(indice, codigo_inicial=5860000):
+    """
+    Gera o HTML de um card de vaga no formato do portal
+
+    Args:
+        indice (int): Posição do card (determina os valores dos campos)
+        codigo_inicial (int): Código da primeira vaga
+
+    Returns:
+        str: HTML do card
+    """
+    codigo = codigo_inicial + indice
+    campos = {
+        'codigo-vaga': str(codigo),
+        'tipo-vaga': TIPOS[indice % len(TIPOS)],
+        'titulo-vaga': f"Empresa {indice} - Comércio varejista",
+        'area-vaga': AREAS[indice % len(AREAS)],
+        'local-vaga': CIDADES[indice % len(CIDADES)],
+        'horario-vaga': HORARIOS[indice % len(HORARIOS)],
+        'salario-vaga': SALARIOS[indice % len(SALARIOS)],
+    }
+    conteudo = ''.join(
+        f'<span class="{classe}">{html.escape(valor)}</span>' for classe, valor in campos.items()
+    )
+    return (
+        f'<a class="vaga-item" href="/portal/estudantes/ofertas/vaga?codigoVaga={codigo}">'
+        f'{conteudo}</a>'
+    )
+
+
+def gerar_vaga_json(indice, codigo_inicial=5860000):
+    """
+    Gera a vaga no formato JSON equivalente ao card de gerar_card_vaga
+
+    Args:
+        indice (int): Posição da vaga
+        codigo_inicial (int): Código da primeira vaga
+
+    Returns:
+        dict: Campos da vaga
+    """
+    codigo = codigo_inicial + indice
+    return {
+        'codigoVaga': codigo,
+        'tipoVaga': TIPOS[indice % len(TIPOS)],
+        'titulo': f"Empresa {indice} - Comércio varejista",
+        'areaProfissional': AREAS[indice % len(AREAS)],
+        'cidade': CIDADES[indice % len(CIDADES)],
+        'horario': HORARIOS[indice % len(HORARIOS)],
+        'bolsaAuxilio': SALARIOS[indice % len(SALARIOS)],
+        'url': f"/portal/estudantes/ofertas/vaga?codigoVaga={codigo}",
+    }
+
+
+def gerar_pagina_detalhe(codigo, via_js=False):
+    """
+    Gera a página de detalhe de uma vaga (destino do link do card)
+
+    Args:
+        codigo (int): Código da vaga
+        via_js (bool): Se True, os campos só aparecem depois que um script os renderiza
+            (a página exige navegador)
+
+    Returns:
+        str: HTML da página
+    """
+    indice = int(codigo) % 1000
+    campos = {
+        'empresa-vaga': f"Empresa {indice} Ltda",
+        'descricao-completa': f"Vaga {codigo} em comércio varejista, atendimento e rotinas administrativas",
+        'atividades-vaga': "Apoio ao atendimento; controle de estoque; organização de documentos",
+        'requisitos-vaga': f"Cursando {AREAS[indice % len(AREAS)].title()} a partir do 2º semestre",
+        'beneficios-vaga': "Vale-transporte; seguro de vida; recesso remunerado",
+        'endereco-vaga': f"Rua {indice}, {indice * 10} - Centro - {CIDADES[indice % len(CIDADES)]}",
+    }
+    conteudo = ''.join(f'<div class="{classe}">{html.escape(valor)}</div>' for classe, valor in campos.items())
+    if via_js:
+        conteudo = (
+            '<div id="app"></div>'
+            f'<script>document.getElementById("app").innerHTML = {json.dumps(conteudo, ensure_ascii=False)};</script>'
+        )
+    return (
+        '<!DOCTYPE html>\n<html lang="pt-BR"><head><meta charset="utf-8">'
+        f'<title>Vaga {codigo}</title></head><body>\n{conteudo}\n</body></html>\n'
+    )
+
+
+def gerar_paginacao(pagina, total_paginas):
+    """
+    Gera a navegação entre páginas de resultados
+
+    Args:
+        pagina (int): Página atual
+        total_paginas (int): Total de páginas
+
+    Returns:
+        str: HTML da paginação (vazio se houver uma página só)
+    """
+    if total_paginas <= 1:
+        return ''
+    links = ''.join(
+        f'<li class="{"ativa" if n == pagina else ""}"><a data-pagina="{n}" href="?pagina={n}">{n}</a></li>'
+        for n in range(1, total_paginas + 1)
+    )
+    return f'<ul class="paginacao">{links}</ul>'
+
+
+def gerar_pagina_vagas(quantidade=50, inicio=0, pagina=1, total_paginas=1):
+    """
+    Gera uma página HTML completa com a lista de cards de vagas
+
+    Args:
+        quantidade (int): Número de cards na página
+        inicio (int): Índice do primeiro card
+        pagina (int): Número desta página
+        total_paginas (int): Total de páginas (para a paginação)
+
+    Returns:
+        str: HTML da página
+    """
+    cards = '\n'.join(gerar_card_vaga(i) for i in range(inicio, inicio + quantidade))
+    return (
+        '<!DOCTYPE html>\n<html lang="pt-BR"><head><meta charset="utf-8">'
+        '<title>CIEE - Vagas (fixture)</title></head><body>\n'
+        f'<div class="lista-vagas">\n{cards}\n</div>\n'
+        f'{gerar_paginacao(pagina, total_paginas)}\n'
+        '</body></html>\n'
+    )
+
+
+def salvar_pagina_vagas(caminho, quantidade=50):
+    """
+    Grava a página sintética em disco
+
+    Args:
+        caminho (str): Arquivo de destino
+        quantidade (int): Número de cards na página
+
+    Returns:
+        str: Caminho do arquivo gravado
+    """
+    with open(caminho, 'w', encoding='utf-8') as f:
+        f.write(gerar_pagina_vagas(quantidade))
+    return caminho
+
+
+def gerar_combo(id_input, id_lista, opcoes):
+    """
+    Gera o HTML de um combo de filtro (input + lista de opções oculta)
+
+    Args:
+        id_input (str): ID do input do filtro
+        id_lista (str): ID da lista de opções
+        opcoes (list): Pares (id da opção, texto)
+
+    Returns:
+        str: HTML do combo
+    """
+    itens = ''.join(f'<li id="{id_opcao}">{html.escape(texto)}</li>' for id_opcao, texto in opcoes)
+    return (
+        f'<div class="combo-filtro"><input id="{id_input}" type="text" autocomplete="off">'
+        f'<ul id="{id_lista}" style="display:none">{itens}</ul></div>'
+    )
+
+
+def gerar_recursos_pesados(imagens):
+    """
+    Gera as tags de recursos pesados típicos do portal: imagens, fonte, CSS, vídeo e rastreador
+
+    O rastreador é servido localmente em um caminho que contém o domínio real, para
+    casar com os padrões de recursos.PADROES_RASTREADORES.
+
+    Args:
+        imagens (int): Número de imagens (0 não gera nenhum recurso)
+
+    Returns:
+        str: HTML das tags
+    """
+    if not imagens:
+        return ''
+    tags = [
+        '<link rel="stylesheet" href="/estaticos/estilo.css">',
+        '<style>@font-face { font-family: Portal; src: url("/estaticos/fonte.woff2"); } '
+        'body { font-family: Portal, sans-serif; }</style>',
+        '<script async src="/rastreadores/www.google-analytics.com/analytics.js"></script>',
+        '<video src="/estaticos/video.mp4" autoplay muted preload="auto"></video>',
+    ]
+    tags += [f'<img src="/estaticos/imagem_{i}.png" alt="">' for i in range(imagens)]
+    return '\n'.join(tags)
+
+
+def rotas_recursos(imagens, tamanho_kb=100, latencia=0.05):
+    """
+    Rotas dos recursos gerados por gerar_recursos_pesados
+
+    Args:
+        imagens (int): Número de imagens
+        tamanho_kb (int): Tamanho de cada imagem/vídeo/fonte, em KB
+        latencia (float): Atraso de cada resposta, em segundos (simula CDN/terceiros)
+
+    Returns:
+        dict: Rotas para ServidorFixture
+    """
+    def recurso(tipo, tamanho):
+        corpo = b'\0' * tamanho
+
+        def responder(parametros):
+            time.sleep(latencia)
+            return 200, tipo, corpo
+        return responder
+
+    binario = tamanho_kb * 1024
+    rotas = {f'/estaticos/imagem_{i}.png': recurso('image/png', binario) for i in range(imagens)}
+    rotas.update({
+        '/estaticos/estilo.css': recurso('text/css', 2048),
+        '/estaticos/fonte.woff2': recurso('font/woff2', binario),
+        '/estaticos/video.mp4': recurso('video/mp4', binario * 5),
+        '/rastreadores/www.google-analytics.com/analytics.js': recurso('application/javascript', 50 * 1024),
+    })
+    return rotas
+
+
+def gerar_pagina_portal(quantidade=50, destaques=5, atraso_combo=150, atraso_busca=600, total_paginas=1,
+                        recursos=0, lote_rolagem=0, atraso_rolagem=300):
+    """
+    Gera uma página com os filtros e o botão Aplicar do portal
+
+    A página começa mostrando só os destaques; após clicar em Aplicar, e depois
+    de atraso_busca ms, a lista completa é renderizada.
+
+    Args:
+        quantidade (int): Número de cards exibidos após aplicar os filtros
+        destaques (int): Número de cards exibidos antes de aplicar
+        atraso_combo (int): Atraso (ms) para abrir/filtrar a lista de um combo
+        atraso_busca (int): Atraso (ms) da "requisição" de busca
+        total_paginas (int): Total de páginas exibido na paginação
+        recursos (int): Imagens pesadas na página (> 0 também inclui fonte, CSS, vídeo e
+            rastreador; ver gerar_recursos_pesados)
+        lote_rolagem (int): Se > 0, só este número de cards aparece após aplicar; os
+            demais chegam em lotes iguais quando a lista é rolada até o fim
+        atraso_rolagem (int): Atraso (ms) de cada lote carregado no scroll
+
+    Returns:
+        str: HTML da página
+    """
+    combos = '\n'.join(gerar_combo(*combo) for combo in COMBOS)
+    script = SCRIPT_PORTAL % {
+        'atraso_combo': atraso_combo,
+        'atraso_busca': atraso_busca,
+        'cards': json.dumps([gerar_card_vaga(i) for i in range(quantidade)], ensure_ascii=False),
+        'destaques': min(destaques, quantidade),
+        'lote_rolagem': lote_rolagem,
+        'atraso_rolagem': atraso_rolagem,
+    }
+    return (
+        '<!DOCTYPE html>\n<html lang="pt-BR"><head><meta charset="utf-8">'
+        '<title>CIEE - Portal (fixture)</title></head><body>\n'
+        f'{gerar_recursos_pesados(recursos)}\n'
+        f'<div class="filtros-busca">\n{combos}\n'
+        '<div class="btn-search btn-purple">Aplicar</div>\n</div>\n'
+        '<div class="lista-vagas" id="resultados"></div>\n'
+        f'{gerar_paginacao(1, total_paginas)}\n'
+        f'<script>{script}</script>\n'
+        '</body></html>\n'
+    )
+
+
+def salvar_pagina_portal(caminho, quantidade=50, **kwargs):
+    """
+    Grava a página com filtros em disco
+
+    Args:
+        caminho (str): Arquivo de destino
+        quantidade (int): Número de cards após aplicar os filtros
+        **kwargs: Repassados para gerar_pagina_portal
+
+    Returns:
+        str: Caminho do arquivo gravado
+    """
+    with open(caminho, 'w', encoding='utf-8') as f:
+        f.write(gerar_pagina_portal(quantidade, **kwargs))
+    return caminho
+
+
+class ServidorFixture:
+    """
+    Servidor HTTP local que responde com páginas sintéticas ou respostas gravadas
+
+    Cada rota é um caminho ('/busca') associado a uma tupla (status, content-type, corpo)
+    ou a uma função que recebe os parâmetros da query (dict) e retorna essa tupla.
+
+    Uso:
+        with ServidorFixture(rotas_padrao()) as servidor:
+            backend = BackendHTTP(url_busca=servidor.url('/busca'))
+    """
+
+    def __init__(self, rotas, host='127.0.0.1', porta=0):
+        """
+        Args:
+            rotas (dict): Caminho -> resposta ou função(parametros) -> resposta
+            host (str): Interface de escuta
+            porta (int): Porta (0 escolhe uma livre)
+        """
+        self.rotas = rotas
+        self.requisicoes = 0
+        self.bytes_enviados = 0
+        servidor = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                servidor.requisicoes += 1
+                partes = urlsplit(self.path)
+                rota = servidor.rotas.get(partes.path)
+                if rota is None:
+                    resposta = (404, 'text/plain; charset=utf-8', 'não encontrado')
+                elif callable(rota):
+                    parametros = {k: v[0] for k, v in parse_qs(partes.query).items()}
+                    resposta = rota(parametros)
+                else:
+                    resposta = rota
+
+                status, tipo, corpo = resposta
+                if isinstance(corpo, str):
+                    corpo = corpo.encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', tipo)
+                self.send_header('Content-Length', str(len(corpo)))
+                self.end_headers()
+                self.wfile.write(corpo)
+                servidor.bytes_enviados += len(corpo)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, porta), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    def url(self, caminho='/'):
+        """
+        Retorna a URL absoluta de um caminho do servidor
+
+        Args:
+            caminho (str): Ex: '/busca'
+
+        Returns:
+            str: Ex: 'http://127.0.0.1:54321/busca'
+        """
+        host, porta = self.httpd.server_address[:2]
+        return f"http://{host}:{porta}{caminho}"
+
+    def iniciar(self):
+        """Inicia o servidor em uma thread em segundo plano"""
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def parar(self):
+        """Para o servidor"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.iniciar()
+
+    def __exit__(self, *exc):
+        self.parar()
+
+
+def rotas_padrao(quantidade=50, por_pagina=None, sobreposicao=0, latencia_detalhe=0.0, detalhes_js=0,
+                 latencia_busca=0.0, **kwargs_portal):
+    """
+    Rotas do site sintético: portal com filtros, busca em HTML e busca em JSON
+
+    Com por_pagina, os resultados são divididos em páginas (parâmetro 'pagina'
+    da query). O portal sem 'pagina' mostra os filtros e a primeira página; com
+    'pagina', mostra direto a página pedida.
+
+    Args:
+        quantidade (int): Número total de vagas
+        por_pagina (int): Vagas por página (padrão: todas numa página só)
+        sobreposicao (int): Cards repetidos do fim da página anterior (testa a deduplicação)
+        latencia_detalhe (float): Atraso de cada página de detalhe, em segundos
+        detalhes_js (int): Se N > 0, uma a cada N páginas de detalhe exige JavaScript
+        latencia_busca (float): Atraso de cada página de resultados (HTML e JSON), em segundos
+        **kwargs_portal: Repassados para gerar_pagina_portal
+
+    Returns:
+        dict: Rotas para ServidorFixture
+    """
+    por_pagina = por_pagina or max(1, quantidade)
+    total_paginas = max(1, -(-quantidade // por_pagina))
+
+    def intervalo(parametros):
+        pagina = min(max(1, int(parametros.get('pagina', 1))), total_paginas)
+        inicio = max(0, (pagina - 1) * por_pagina - (sobreposicao if pagina > 1 else 0))
+        fim = min(quantidade, pagina * por_pagina)
+        return pagina, inicio, fim
+
+    def busca_html(parametros):
+        time.sleep(latencia_busca)
+        pagina, inicio, fim = intervalo(parametros)
+        return 200, 'text/html; charset=utf-8', gerar_pagina_vagas(fim - inicio, inicio, pagina, total_paginas)
+
+    def busca_json(parametros):
+        time.sleep(latencia_busca)
+        pagina, inicio, fim = intervalo(parametros)
+        corpo = {'pagina': pagina, 'totalPaginas': total_paginas,
+                 'vagas': [gerar_vaga_json(i) for i in range(inicio, fim)]}
+        return 200, 'application/json; charset=utf-8', json.dumps(corpo, ensure_ascii=False)
+
+    portal = gerar_pagina_portal(min(quantidade, por_pagina), total_paginas=total_paginas, **kwargs_portal)
+
+    def pagina_portal(parametros):
+        if 'pagina' in parametros:
+            return busca_html(parametros)
+        return 200, 'text/html; charset=utf-8', portal
+
+    def pagina_detalhe(parametros):
+        codigo = parametros.get('codigoVaga')
+        if not codigo or not codigo.isdigit():
+            return 404, 'text/plain; charset=utf-8', 'vaga não encontrada'
+        time.sleep(latencia_detalhe)
+        via_js = bool(detalhes_js) and int(codigo) % detalhes_js == 0
+        return 200, 'text/html; charset=utf-8', gerar_pagina_detalhe(codigo, via_js)
+
+    rotas = {
+        '/portal': pagina_portal,
+        '/busca': busca_html,
+        '/api/busca': busca_json,
+        '/portal/estudantes/ofertas/vaga': pagina_detalhe,
+    }
+    if kwargs_portal.get('recursos'):
+        rotas.update(rotas_recursos(kwargs_portal['recursos']))
+    return rotas
+
+
+def simular_sobrecarga(rotas, capacidade=8, latencia_excesso=0.05, taxa_falhas=0.0, semente=0):
+    """
+    Envolve as rotas num servidor de capacidade limitada, que degrada sob carga
+
+    Até capacidade requisições simultâneas, responde normalmente; acima disso cada
+    requisição espera latencia_excesso por requisição excedente (fila), e acima do
+    dobro da capacidade responde 503 na hora. Falhas 500 aleatórias simulam erros
+    do portal independentes da carga.
+
+    Args:
+        rotas (dict): Rotas de rotas_padrao (ou outras)
+        capacidade (int): Requisições simultâneas atendidas sem degradar
+        latencia_excesso (float): Atraso extra por requisição acima da capacidade, em segundos
+        taxa_falhas (float): Probabilidade de uma resposta 500
+        semente (int): Semente do sorteio das falhas
+
+    Returns:
+        dict: Rotas com a sobrecarga simulada (em_andamento compartilhado entre elas)
+    """
+    lock = threading.Lock()
+    sorteio = random.Random(semente)
+    estado = {'em_andamento': 0}
+
+    def envolver(rota):
+        def rota_sobrecarregada(parametros):
+            with lock:
+                estado['em_andamento'] += 1
+                atual = estado['em_andamento']
+                falha = sorteio.random() < taxa_falhas
+            try:
+                if atual > 2 * capacidade:
+                    return 503, 'text/plain; charset=utf-8', 'servidor sobrecarregado'
+                if falha:
+                    return 500, 'text/plain; charset=utf-8', 'erro interno'
+                if atual > capacidade:
+                    time.sleep(latencia_excesso * (atual - capacidade))
+                return rota(parametros) if callable(rota) else rota
+            finally:
+                with lock:
+                    estado['em_andamento'] -= 1
+        return rota_sobrecarregada
+
+    return {caminho: envolver(rota) for caminho, rota in rotas.items()}
+
+
+def rotas_gravadas(pasta):
+    """
+    Rotas que servem respostas gravadas em disco (um arquivo por caminho)
+
+    O arquivo 'busca.html' é servido em '/busca', 'api/busca.json' em '/api/busca', etc.
+
+    Args:
+        pasta (str): Pasta com as respostas gravadas
+
+    Returns:
+        dict: Rotas para ServidorFixture
+    """
+    rotas = {}
+    for raiz, _, arquivos in os.walk(pasta):
+        for arquivo in arquivos:
+            caminho = os.path.join(raiz, arquivo)
+            relativo = os.path.relpath(caminho, pasta).replace(os.sep, '/')
+            tipo = mimetypes.guess_type(arquivo)[0] or 'application/octet-stream'
+            with open(caminho, 'rb') as f:
+                corpo = f.read()
+            rotas['/' + os.path.splitext(relativo)[0]] = (200, f"{tipo}; charset=utf-8", corpo)
+    return rotas
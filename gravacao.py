@@ -0,0 +1,347 @@
+"""
+Gravação das respostas brutas da busca e reprocessamento offline (sem navegador)
+
+Cada página de resultados (HTML do navegador ou resposta do backend HTTP) e cada
+payload JSON de fetch/XHR capturado é guardado comprimido num arquivo endereçado
+por conteúdo: páginas idênticas em dias diferentes ocupam um objeto só. O
+reprocessamento roda a extração de parser_html (lxml, se instalado) sobre os
+objetos gravados, em vários processos, para testar mudanças nos seletores sem
+abrir o Chrome nem acessar o portal.
+
+Uso:
+    python main.py --gravar gravacoes_ciee          # grava enquanto coleta
+    python gravacao.py info gravacoes_ciee
+    python gravacao.py reprocessar gravacoes_ciee --desde 2026-09-01 --processos 8 --saida vagas.jsonl
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from armazenamento import escopo_filtros
+from paginacao import chave_vaga
+from parser_html import extrair_pagina_html, extrair_pagina_json, lxml
+
+
+# Nível do gzip dos objetos (6: bom equilíbrio entre tamanho e tempo de gravação)
+NIVEL_COMPRESSAO = 6
+
+# Lotes por processo no reprocessamento (lotes menores equilibram melhor a carga)
+LOTES_POR_PROCESSO = 4
+
+# Maior payload fetch/XHR guardado pela captura no navegador (caracteres)
+LIMITE_PAYLOAD_XHR = 2_000_000
+
+# Guarda as respostas JSON de fetch/XHR da página em window.__cieeXHR
+SCRIPT_CAPTURA_XHR = """
+if (!window.__cieeXHR) {
+    window.__cieeXHR = [];
+    const guardar = function (url, tipo, corpo) {
+        if (tipo && tipo.indexOf('json') >= 0 && corpo && corpo.length <= %d) {
+            window.__cieeXHR.push({url: String(url), corpo: corpo});
+        }
+    };
+    if (window.fetch) {
+        const fetchOriginal = window.fetch;
+        window.fetch = function () {
+            return fetchOriginal.apply(this, arguments).then(function (resposta) {
+                const tipo = resposta.headers.get('Content-Type');
+                if (tipo && tipo.indexOf('json') >= 0) {
+                    resposta.clone().text().then(function (corpo) { guardar(resposta.url, tipo, corpo); });
+                }
+                return resposta;
+            });
+        };
+    }
+    const sendOriginal = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        this.addEventListener('load', function () {
+            if (this.responseType === '' || this.responseType === 'text') {
+                guardar(this.responseURL, this.getResponseHeader('Content-Type'), this.responseText);
+            }
+        });
+        return sendOriginal.apply(this, arguments);
+    };
+}
+""" % LIMITE_PAYLOAD_XHR
+
+# Devolve e esvazia os payloads capturados
+SCRIPT_COLETAR_XHR = """
+const capturados = window.__cieeXHR || [];
+window.__cieeXHR = [];
+return capturados;
+"""
+
+
+class ArquivoGravacoes:
+    """
+    Arquivo de respostas brutas endereçado por conteúdo
+
+    Estrutura da pasta:
+        objetos/ab/abcdef...gz   conteúdo comprimido, nome = sha256 do conteúdo original
+        indice.jsonl             um registro por página gravada (data, filtros, página, tipo, URL, hash)
+
+    Os objetos são escritos de forma atômica antes do registro, e o índice só recebe
+    linhas completas, então um crash no meio da gravação não corrompe o arquivo.
+    Seguro para várias threads (abas e requisições paralelas).
+    """
+
+    def __init__(self, pasta='gravacoes_ciee'):
+        """
+        Args:
+            pasta (str): Pasta do arquivo (criada se não existir)
+        """
+        self.pasta = pasta
+        self.caminho_indice = os.path.join(pasta, 'indice.jsonl')
+        self.gravadas = 0
+        self.objetos_novos = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.join(pasta, 'objetos'), exist_ok=True)
+
+    def caminho_objeto(self, hash_conteudo):
+        """
+        Returns:
+            str: Arquivo do objeto com o hash informado
+        """
+        return os.path.join(self.pasta, 'objetos', hash_conteudo[:2], f"{hash_conteudo}.gz")
+
+    def gravar(self, conteudo, filtros, pagina, tipo='html', url=None, capturado_em=None):
+        """
+        Grava uma resposta bruta
+
+        Args:
+            conteudo (str | bytes): Corpo da resposta (HTML ou JSON)
+            filtros (dict): Combinação de filtros da busca
+            pagina (int): Número da página de resultados
+            tipo (str): 'html', 'json' (resposta da busca) ou 'xhr' (payload capturado na página)
+            url (str): URL da resposta, usada para resolver links relativos no reprocessamento
+            capturado_em (str): Data ISO da captura (padrão: agora)
+
+        Returns:
+            str: Hash sha256 do conteúdo
+        """
+        if isinstance(conteudo, str):
+            conteudo = conteudo.encode('utf-8')
+        hash_conteudo = hashlib.sha256(conteudo).hexdigest()
+        caminho = self.caminho_objeto(hash_conteudo)
+        novo = not os.path.exists(caminho)
+        if novo:
+            # Compressão fora do lock; duas threads gravando o mesmo objeto escrevem o mesmo conteúdo
+            os.makedirs(os.path.dirname(caminho), exist_ok=True)
+            temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporario, 'wb') as f:
+                f.write(gzip.compress(conteudo, NIVEL_COMPRESSAO, mtime=0))
+            os.replace(temporario, caminho)
+
+        registro = {
+            'capturado_em': capturado_em or datetime.now().isoformat(timespec='seconds'),
+            'escopo': escopo_filtros(filtros),
+            'pagina': pagina,
+            'tipo': tipo,
+            'url': url,
+            'hash': hash_conteudo,
+            'bytes': len(conteudo),
+        }
+        linha = json.dumps(registro, ensure_ascii=False) + '\n'
+        with self._lock:
+            with open(self.caminho_indice, 'a', encoding='utf-8') as f:
+                f.write(linha)
+            self.gravadas += 1
+            self.objetos_novos += novo
+        return hash_conteudo
+
+    def ler(self, hash_conteudo):
+        """
+        Returns:
+            bytes: Conteúdo original do objeto
+        """
+        with open(self.caminho_objeto(hash_conteudo), 'rb') as f:
+            return gzip.decompress(f.read())
+
+    def registros(self, desde=None, ate=None, tipos=None):
+        """
+        Gera os registros do índice, na ordem de gravação
+
+        Args:
+            desde (str): Data ISO mínima da captura (ex: '2026-09-01')
+            ate (str): Data ISO máxima da captura, inclusive (ex: '2026-09-30')
+            tipos (iterable): Só estes tipos ('html', 'json', 'xhr')
+
+        Yields:
+            dict: Registro (capturado_em, escopo, pagina, tipo, url, hash, bytes)
+        """
+        tipos = set(tipos) if tipos else None
+        try:
+            f = open(self.caminho_indice, encoding='utf-8')
+        except FileNotFoundError:
+            return
+        with f:
+            for linha in f:
+                if not linha.endswith('\n'):
+                    break
+                registro = json.loads(linha)
+                data = registro['capturado_em']
+                if desde and data < desde:
+                    continue
+                if ate and data[:len(ate)] > ate:
+                    continue
+                if tipos is not None and registro['tipo'] not in tipos:
+                    continue
+                yield registro
+
+    def estatisticas(self):
+        """
+        Returns:
+            dict: Registros, capturas distintas (dias), objetos, bytes originais e comprimidos
+        """
+        registros = list(self.registros())
+        objetos = {registro['hash']: registro['bytes'] for registro in registros}
+        comprimidos = sum(os.path.getsize(self.caminho_objeto(h)) for h in objetos
+                          if os.path.exists(self.caminho_objeto(h)))
+        return {
+            'registros': len(registros),
+            'dias': len({registro['capturado_em'][:10] for registro in registros}),
+            'combinacoes': len({registro['escopo'] for registro in registros}),
+            'objetos': len(objetos),
+            'bytes_registrados': sum(registro['bytes'] for registro in registros),
+            'bytes_objetos': sum(objetos.values()),
+            'bytes_comprimidos': comprimidos,
+        }
+
+
+def extrair_conteudo(conteudo, tipo, url=''):
+    """
+    Roda a extração sobre uma resposta gravada
+
+    Args:
+        conteudo (bytes): Corpo da resposta
+        tipo (str): 'html', 'json' ou 'xhr'
+        url (str): URL da resposta
+
+    Returns:
+        tuple: (lista de vagas, total de páginas)
+    """
+    texto = conteudo.decode('utf-8', errors='replace')
+    if tipo == 'html':
+        return extrair_pagina_html(texto, url or '')
+    try:
+        return extrair_pagina_json(json.loads(texto), url or '')
+    except (ValueError, TypeError, AttributeError):
+        # Payload XHR que não é uma lista de vagas (ex: opções dos combos)
+        return [], 1
+
+
+def _reprocessar_lote(pasta, tarefas):
+    """Extrai as vagas de um lote de (hash, tipo, url) num processo do pool"""
+    arquivo = ArquivoGravacoes(pasta)
+    return [extrair_conteudo(arquivo.ler(hash_conteudo), tipo, url) for hash_conteudo, tipo, url in tarefas]
+
+
+def reprocessar(pasta, processos=None, desde=None, ate=None, tipos=None):
+    """
+    Reextrai as vagas de todas as respostas gravadas, sem navegador
+
+    Cada objeto é processado uma vez só, mesmo que tenha sido gravado em vários
+    dias. Com processos > 1 os objetos são divididos em lotes entre os processos.
+
+    Args:
+        pasta (str): Pasta do ArquivoGravacoes
+        processos (int): Processos do pool (padrão: os.cpu_count(); 1: no processo atual)
+        desde (str): Data ISO mínima da captura
+        ate (str): Data ISO máxima da captura
+        tipos (iterable): Tipos de resposta reprocessados (padrão: todos)
+
+    Returns:
+        dict: 'vagas' (únicas, da captura mais recente), 'registros', 'objetos',
+            'por_pagina' (registro -> quantidade de vagas), 'vazias' (registros de
+            páginas HTML/JSON sem nenhuma vaga) e 'segundos'
+    """
+    inicio = time.perf_counter()
+    registros = list(ArquivoGravacoes(pasta).registros(desde, ate, tipos))
+    tarefas = list(dict.fromkeys((r['hash'], r['tipo'], r['url'] or '') for r in registros))
+    processos = max(1, processos or os.cpu_count() or 1)
+
+    if processos == 1 or len(tarefas) < 2:
+        resultados = _reprocessar_lote(pasta, tarefas)
+    else:
+        tamanho = max(1, math.ceil(len(tarefas) / (processos * LOTES_POR_PROCESSO)))
+        lotes = [tarefas[i:i + tamanho] for i in range(0, len(tarefas), tamanho)]
+        with ProcessPoolExecutor(max_workers=min(processos, len(lotes))) as executor:
+            resultados = [resultado for lote in executor.map(_reprocessar_lote, [pasta] * len(lotes), lotes)
+                          for resultado in lote]
+    extraidas = dict(zip(tarefas, resultados))
+
+    vagas = {}
+    por_pagina = []
+    vazias = []
+    for registro in sorted(registros, key=lambda r: r['capturado_em']):
+        vagas_pagina, _ = extraidas[(registro['hash'], registro['tipo'], registro['url'] or '')]
+        por_pagina.append((registro, len(vagas_pagina)))
+        if not vagas_pagina and registro['tipo'] != 'xhr':
+            vazias.append(registro)
+        for vaga in vagas_pagina:
+            vagas[chave_vaga(vaga)] = vaga
+
+    return {
+        'vagas': list(vagas.values()),
+        'registros': len(registros),
+        'objetos': len(tarefas),
+        'por_pagina': por_pagina,
+        'vazias': vazias,
+        'segundos': time.perf_counter() - inicio,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    subparsers = parser.add_subparsers(dest='comando', required=True)
+
+    info = subparsers.add_parser('info', help='resume o conteúdo do arquivo')
+    info.add_argument('pasta')
+
+    repro = subparsers.add_parser('reprocessar', help='reextrai as vagas das respostas gravadas')
+    repro.add_argument('pasta')
+    repro.add_argument('--processos', type=int, default=None, help='padrão: número de CPUs')
+    repro.add_argument('--desde', help='data ISO mínima da captura (ex: 2026-09-01)')
+    repro.add_argument('--ate', help='data ISO máxima da captura, inclusive')
+    repro.add_argument('--tipos', nargs='+', choices=['html', 'json', 'xhr'])
+    repro.add_argument('--saida', help='grava as vagas únicas (.jsonl, .csv, .json ou .parquet)')
+    args = parser.parse_args(argv)
+
+    if args.comando == 'info':
+        dados = ArquivoGravacoes(args.pasta).estatisticas()
+        print(f"📦 {args.pasta}: {dados['registros']} respostas de {dados['combinacoes']} combinações "
+              f"em {dados['dias']} dias")
+        print(f"   {dados['objetos']} objetos distintos, {dados['bytes_objetos'] / 1e6:.1f} MB "
+              f"→ {dados['bytes_comprimidos'] / 1e6:.1f} MB comprimidos "
+              f"({dados['bytes_registrados'] / 1e6:.1f} MB sem deduplicação)")
+        return
+
+    resultado = reprocessar(args.pasta, processos=args.processos, desde=args.desde, ate=args.ate,
+                            tipos=args.tipos)
+    print(f"🔁 {resultado['registros']} respostas ({resultado['objetos']} objetos) reprocessadas em "
+          f"{resultado['segundos']:.2f}s com {'lxml' if lxml is not None else 'html.parser'}")
+    print(f"✅ {len(resultado['vagas'])} vagas únicas")
+    if resultado['vazias']:
+        print(f"⚠️ {len(resultado['vazias'])} páginas sem nenhuma vaga (seletores desatualizados?):")
+        for registro in resultado['vazias'][:10]:
+            print(f"   {registro['capturado_em']} página {registro['pagina']} {registro['escopo']}")
+
+    if args.saida:
+        from saidas import criar_saida, formato_do_arquivo
+
+        with criar_saida(formato_do_arquivo(args.saida, 'jsonl'), args.saida) as saida:
+            for vaga in resultado['vagas']:
+                saida.escrever(vaga)
+        print(f"💾 Vagas salvas em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+"""Execução em lote de várias combinações de filtros em um pool de processos, cada um com seu backend"""
+
+import itertools
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from backends import criar_backend
+from paginacao import mesclar_paginas
+from saidas import criar_saida, formato_do_arquivo
+
+
+# Vezes que um worker pode morrer (ex: crash do Chrome) durante a mesma combinação antes
+# de ela ser dada como falha; as que não tinham começado são reenviadas sem custo
+QUEDAS_POR_COMBINACAO = 2
+
+# Backend do processo worker (um navegador/sessão por processo)
+_backend = None
+_config_backend = None
+# Memória compartilhada: 1 na posição de cada combinação que um worker começou
+_iniciadas = None
+
+
+def expandir_combinacoes(especificacao):
+    """
+    Expande uma especificação de filtros em uma lista de combinações
+
+    Aceita uma lista de dicts de filtros (usada como está) ou um dict cartesiano
+    em que cada filtro tem uma lista de valores.
+
+    Args:
+        especificacao: Ex: {'tipo_vaga': ['ESTÁGIO'], 'cidade': ['BRASÍLIA - DF', 'SÃO PAULO - SP']}
+
+    Returns:
+        list: Lista de dicts de filtros, um por combinação
+    """
+    if isinstance(especificacao, dict):
+        chaves = list(especificacao)
+        valores = [v if isinstance(v, (list, tuple)) else [v] for v in especificacao.values()]
+        return [dict(zip(chaves, combinacao)) for combinacao in itertools.product(*valores)]
+    return [dict(filtros) for filtros in especificacao]
+
+
+def _abrir_backend():
+    global _backend
+    nome, kwargs = _config_backend
+    _backend = criar_backend(nome, **kwargs)
+    _backend.abrir()
+
+
+def _fechar_backend():
+    global _backend
+    if _backend is not None:
+        try:
+            _backend.fechar()
+        except Exception:
+            pass
+        _backend = None
+
+
+def _inicializar_worker(nome_backend, kwargs_backend, iniciadas=None):
+    """Inicializador do processo: guarda a configuração do backend (aberto sob demanda)"""
+    global _config_backend, _iniciadas
+    import atexit
+
+    _config_backend = (nome_backend, kwargs_backend)
+    _iniciadas = iniciadas
+    atexit.register(_fechar_backend)
+
+
+def _executar_combinacao(indice, filtros, opcoes_busca):
+    """
+    Executa uma combinação no backend do processo
+
+    Um erro é devolvido no resultado (não propaga) e o backend é recriado
+    para a próxima combinação, isolando a falha.
+
+    Returns:
+        dict: Índice, filtros, vagas, erro, segundos e PID do worker
+    """
+    inicio = time.perf_counter()
+    if _iniciadas is not None:
+        _iniciadas[indice] = 1
+    resultado = {'indice': indice, 'filtros': filtros, 'vagas': [], 'erro': None, 'pid': os.getpid()}
+    try:
+        if _backend is None:
+            _abrir_backend()
+        resultado['vagas'] = _backend.buscar(filtros, **opcoes_busca)
+    except Exception as e:
+        resultado['erro'] = f"{type(e).__name__}: {e}"
+        _fechar_backend()
+    resultado['segundos'] = time.perf_counter() - inicio
+    return resultado
+
+
+def mesclar_resultados(resultados):
+    """
+    Junta as vagas de todas as combinações, na ordem das combinações, sem repetir códigos
+
+    Args:
+        resultados (list): Resultados de _executar_combinacao
+
+    Returns:
+        list: Vagas deduplicadas
+    """
+    return mesclar_paginas({resultado['indice']: resultado['vagas'] for resultado in resultados})
+
+
+def executar_lote(especificacao, workers=None, backend='selenium', kwargs_backend=None, arquivo_saida=None,
+                  **opcoes_busca):
+    """
+    Distribui as combinações de filtros entre N processos, cada um com seu próprio backend
+
+    Args:
+        especificacao: Lista de filtros ou dict cartesiano (ver expandir_combinacoes)
+        workers (int): Número de processos (padrão: número de CPUs)
+        backend (str): 'selenium' ou 'http'
+        kwargs_backend (dict): Repassados ao construtor do backend em cada processo
+        arquivo_saida (str): Se informado, grava as vagas mescladas neste arquivo
+            (formato pela extensão: .jsonl, .csv, .json ou .parquet)
+        **opcoes_busca: Repassados a backend.buscar (ex: todas_paginas=True)
+
+    Returns:
+        dict: 'combinacoes' (resultado de cada uma), 'vagas' (mescladas), 'falhas' e 'segundos'
+    """
+    combinacoes = expandir_combinacoes(especificacao)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(combinacoes) or 1))
+    kwargs_backend = kwargs_backend or {}
+
+    print("\n" + "=" * 50)
+    print(f"LOTE: {len(combinacoes)} combinações em {workers} workers ({backend})")
+    print("=" * 50)
+
+    inicio = time.perf_counter()
+    resultados = []
+
+    def registrar(resultado):
+        status = f"❌ {resultado['erro']}" if resultado['erro'] else f"✅ {len(resultado['vagas'])} vagas"
+        print(f"  [{resultado['indice'] + 1}/{len(combinacoes)}] {resultado['filtros']} {status}")
+        resultados.append(resultado)
+
+    # Um worker que morre quebra o pool inteiro (BrokenProcessPool em todos os futuros
+    # pendentes): o pool é recriado e só as combinações não terminadas são reenviadas.
+    # As que estavam em andamento na queda rodam antes, uma por vez (quarentena), para
+    # que a próxima queda seja atribuída à combinação certa
+    pendentes = dict(enumerate(combinacoes))
+    iniciadas = multiprocessing.Array('b', len(combinacoes), lock=False)
+    quarentena = []
+    quedas = {}
+    while pendentes:
+        rodada = quarentena or list(pendentes)
+        for indice in rodada:
+            iniciadas[indice] = 0
+        quebrou = False
+        with ProcessPoolExecutor(max_workers=1 if quarentena else min(workers, len(rodada)),
+                                 initializer=_inicializar_worker,
+                                 initargs=(backend, kwargs_backend, iniciadas)) as executor:
+            futuros = [(indice, executor.submit(_executar_combinacao, indice, pendentes[indice], opcoes_busca))
+                       for indice in rodada]
+            for indice, futuro in futuros:
+                try:
+                    resultado = futuro.result()
+                except BrokenProcessPool:
+                    quebrou = True
+                    continue
+                except Exception as e:
+                    resultado = {'indice': indice, 'filtros': pendentes[indice], 'vagas': [],
+                                 'erro': f"{type(e).__name__}: {e}", 'pid': None, 'segundos': 0.0}
+                del pendentes[indice]
+                registrar(resultado)
+        quarentena = [indice for indice in quarentena if indice in pendentes]
+        if not quebrou:
+            continue
+
+        suspeitas = [indice for indice in rodada if indice in pendentes and iniciadas[indice]]
+        if len(suspeitas) != 1:
+            # Várias em andamento (ou nenhuma registrada): não dá para saber qual derrubou o worker
+            quarentena = suspeitas or [indice for indice in rodada if indice in pendentes]
+            print(f"  💥 Um worker morreu; {len(quarentena)} combinações em andamento serão refeitas uma por vez")
+            continue
+        indice = suspeitas[0]
+        quedas[indice] = quedas.get(indice, 0) + 1
+        if quedas[indice] >= QUEDAS_POR_COMBINACAO:
+            quarentena = [i for i in quarentena if i != indice]
+            registrar({'indice': indice, 'filtros': pendentes.pop(indice), 'vagas': [], 'pid': None,
+                       'erro': f"o worker morreu {quedas[indice]} vezes durante a combinação", 'segundos': 0.0})
+        if pendentes:
+            print(f"  💥 Um worker morreu em {combinacoes[indice]}; pool recriado para as "
+                  f"{len(pendentes)} combinações restantes")
+
+    vagas = mesclar_resultados(resultados)
+    segundos = time.perf_counter() - inicio
+    falhas = [r for r in resultados if r['erro']]
+
+    print(f"\n✅ {len(vagas)} vagas únicas de {len(combinacoes) - len(falhas)}/{len(combinacoes)} "
+          f"combinações em {segundos:.1f}s")
+
+    if arquivo_saida:
+        with criar_saida(formato_do_arquivo(arquivo_saida), arquivo_saida) as saida:
+            for vaga in vagas:
+                saida.escrever(vaga)
+        print(f"💾 Resultados salvos em: {arquivo_saida}")
+
+    return {
+        'combinacoes': sorted(resultados, key=lambda r: r['indice']),
+        'vagas': vagas,
+        'falhas': falhas,
+        'workers': workers,
+        'segundos': segundos,
+    }
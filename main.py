@@ -4,25 +4,111 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.keys import Keys
-import time
-import json
-from datetime import datetime
-
-
-class CIEEScraper:
+from collections import Counter
+from urllib.parse import parse_qs, urlsplit
+
+import argparse
+
+from backends import BackendVagas
+from catalogo import TTL_PADRAO, normalizar, obter_catalogo
+from coleta import executar_coleta
+from esperas import GerenciadorEsperas
+from gravacao import SCRIPT_CAPTURA_XHR, SCRIPT_COLETAR_XHR
+from metricas import cronometrado, metricas
+from passos import ExecutorPassos
+from saidas import criar_saida
+from seletores import (
+    SCRIPT_ENCONTRAR_CARDS, SCRIPT_EXTRAIR_CARDS, SCRIPT_PRIMEIRO_ELEMENTO, SELETOR_GENERICO,
+    CacheSeletores, candidatos,
+)
+from paginacao import RelatorioPaginacao, iterar_vagas_paginas
+from recursos import aplicar_politica, configurar_opcoes, medir_transferencia, validar_politica
+from portal import (
+    URL_VAGAS, CAMPOS_FILTROS,
+    SELETORES_CARDS, SELETORES_CAMPOS, SELETORES_CARREGANDO, SELETORES_PAGINACAO, SELETORES_SECAO_FILTROS,
+    PARAMETRO_PAGINA,
+    url_pagina, vaga_valida,
+)
+
+
+# Maior número de página na paginação dos resultados (arguments[0] = seletores)
+SCRIPT_TOTAL_PAGINAS = """
+let total = 1;
+document.querySelectorAll(arguments[0]).forEach(function (elem) {
+    [elem.getAttribute('data-pagina'), elem.textContent].forEach(function (valor) {
+        if (valor && /^\\s*\\d+\\s*$/.test(valor)) { total = Math.max(total, parseInt(valor, 10)); }
+    });
+});
+return total;
+"""
+
+
+class CIEEScraper(BackendVagas):
     """Scraper para buscar vagas no portal CIEE"""
 
-    def __init__(self, headless=True):
+    nome = 'selenium'
+
+    def __init__(self, headless=True, url_base=None, modo_espera='evento', timeouts_espera=None,
+                 politica_recursos='completa', bloquear_extras=(), catalogo=None,
+                 caminho_catalogo='catalogo_filtros.json', ttl_catalogo=TTL_PADRAO,
+                 caminho_seletores='seletores_ciee.json', controle=None, gravador=None, colheita=False,
+                 quieto_colheita=0.5, politicas_passos=None):
         """
         Inicializa o scraper
 
         Args:
             headless (bool): Se True, executa o navegador em modo headless
+            url_base (str): URL da página de vagas (padrão: portal do CIEE)
+            modo_espera (str): 'evento' espera por condições da página; 'sleep' usa as pausas fixas
+            timeouts_espera (dict): Timeout por passo (ver esperas.TIMEOUTS_PADRAO)
+            politica_recursos (str): 'completa' carrega tudo; 'leve' bloqueia imagens, mídia,
+                fontes e rastreadores e usa carregamento 'eager'; 'minima' também bloqueia o CSS
+            bloquear_extras (iterable): Padrões de URL bloqueados além dos da política
+            catalogo (CatalogoFiltros): Catálogo das opções dos filtros (padrão: carregado de
+                caminho_catalogo, ou coletado do portal na primeira busca)
+            caminho_catalogo (str): Cache em disco do catálogo (None: coleta a cada sessão)
+            ttl_catalogo (float): Validade do cache do catálogo, em segundos
+            caminho_seletores (str): Seletores que funcionaram em cada grupo, tentados
+                primeiro nas próximas execuções (None: só nesta sessão)
+            controle (ControleAdaptativo): Se informado, define quantas abas abrir por lote
+                (concorrência adaptativa) e limita a taxa de abertura das páginas
+            gravador (ArquivoGravacoes): Se informado, o HTML de cada página de resultados
+                e os payloads JSON de fetch/XHR são gravados para reprocessamento offline
+            colheita (bool): Se True, os cards de cada página são colhidos rolando a lista
+                até a quantidade estabilizar (resultados progressivos ou carregados no scroll),
+                em vez de um retrato único
+            quieto_colheita (float): Segundos sem cards novos no fim da lista para encerrar a colheita
+            politicas_passos (dict): Orçamento, tentativas e recuperações por passo dos filtros
+                (ver passos.POLITICAS_PADRAO), ex: {'selecionar': PoliticaPasso(orcamento=4)}
         """
         self.driver = None
         self.headless = headless
-        self.url_base = "https://www.ciee.org.br/portal/estudantes/ofertas/estagios"
-
+        self.modo_espera = modo_espera
+        self.timeouts_espera = timeouts_espera
+        self.politica_recursos = validar_politica(politica_recursos)
+        self.bloquear_extras = list(bloquear_extras)
+        self.catalogo = catalogo
+        self.caminho_catalogo = caminho_catalogo
+        self.ttl_catalogo = ttl_catalogo
+        self.url_base = url_base or URL_VAGAS
+        self._pagina_usada = False
+        self.filtros_aplicados = {}
+        self.relatorio_paginacao = None
+        self.comandos_webdriver = Counter()
+        self.seletores = CacheSeletores(caminho_seletores)
+        self.controle = controle
+        self.gravador = gravador
+        self.colheita = colheita
+        self.quieto_colheita = quieto_colheita
+        self.passos = ExecutorPassos({
+            'reabrir': self._recuperar_reabrir,
+            'recarregar': self._recuperar_recarregar,
+            'reciclar': self._recuperar_reciclar,
+        }, politicas=politicas_passos)
+        # Filtros já selecionados na busca atual (refeitos pelas recuperações que recarregam a página)
+        self._filtros_selecionados = []
+
+    @cronometrado()
     def inicializar_driver(self):
         """Configura e inicializa o WebDriver"""
         options = webdriver.ChromeOptions()
@@ -34,9 +120,61 @@ class CIEEScraper:
         options.add_argument('--start-maximized')
         options.add_argument('--disable-gpu')
         options.add_argument('--no-sandbox')
+        configurar_opcoes(options, self.politica_recursos)
 
         self.driver = webdriver.Chrome(options=options)
         self.wait = WebDriverWait(self.driver, 10)
+        self.esperas = GerenciadorEsperas(self.driver, timeouts=self.timeouts_espera, modo=self.modo_espera,
+                                          carregamento=options.page_load_strategy)
+        aplicar_politica(self.driver, self.politica_recursos, self.bloquear_extras)
+        if self.gravador is not None:
+            self.driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': SCRIPT_CAPTURA_XHR})
+        self._instalar_contador_comandos()
+
+    def _instalar_contador_comandos(self):
+        """Envolve driver.execute para contar cada comando WebDriver (round-trip HTTP) enviado"""
+        execute_original = self.driver.execute
+
+        def execute_contado(driver_command, params=None):
+            self.comandos_webdriver[driver_command] += 1
+            metricas.incrementar('comandos_webdriver', comando=driver_command)
+            return execute_original(driver_command, params)
+
+        self.driver.execute = execute_contado
+
+    def _registrar_falha(self, contador, fase, erro=None):
+        """
+        Conta uma falha tratada (que só seria impressa) e emite o evento estruturado
+
+        Args:
+            contador (str): 'timeouts' ou 'erros'
+            fase (str): Fase onde a falha ocorreu
+            erro (Exception): Exceção capturada, se houver
+        """
+        metricas.incrementar(contador, fase=fase)
+        metricas.evento(contador.rstrip('s'), fase=fase, erro=str(erro) if erro else None)
+
+    def total_comandos_webdriver(self):
+        """
+        Retorna o total de comandos WebDriver enviados desde o último reset
+
+        Returns:
+            int: Quantidade de round-trips ao driver
+        """
+        return sum(self.comandos_webdriver.values())
+
+    def zerar_contador_comandos(self):
+        """Zera o contador de comandos WebDriver"""
+        self.comandos_webdriver.clear()
+
+    def bytes_transferidos(self):
+        """
+        Mede os bytes baixados pela página atual (ver recursos.medir_transferencia)
+
+        Returns:
+            dict: 'bytes', 'recursos' e 'por_tipo'
+        """
+        return medir_transferencia(self.driver)
 
     def _scroll_to_element(self, element):
         """
@@ -46,12 +184,11 @@ class CIEEScraper:
             element: WebElement para rolar até
         """
         try:
-            # Rola até o elemento com ele centralizado na tela
+            # Rola até o elemento com ele centralizado na tela; sem animação, não há o que esperar
             self.driver.execute_script(
-                "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center', inline: 'center'});",
+                "arguments[0].scrollIntoView({behavior: 'instant', block: 'center', inline: 'center'});",
                 element
             )
-            time.sleep(0.8)  # Aguarda a animação de scroll
         except Exception as e:
             print(f"  ⚠️ Erro ao rolar até elemento: {e}")
 
@@ -60,57 +197,111 @@ class CIEEScraper:
         try:
             print("\n🔄 Rolando até a seção de filtros...")
 
-            # Tenta encontrar a seção de filtros por diferentes seletores
-            seletores_filtros = [
-                "#TipoVaga",
-                ".filtros-busca",
-                "[class*='filter']",
-                "#NivelEnsino"
-            ]
+            # Todos os seletores da seção são testados numa chamada por tentativa,
+            # começando pelo que funcionou da última vez
+            ordem = self.seletores.ordenar('secao_filtros', SELETORES_SECAO_FILTROS)
+            try:
+                encontrado = self.wait.until(lambda driver: driver.execute_script(SCRIPT_PRIMEIRO_ELEMENTO, ordem))
+            except TimeoutException:
+                encontrado = None
 
             elemento_filtro = None
-            for seletor in seletores_filtros:
-                try:
-                    elemento_filtro = self.wait.until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, seletor))
-                    )
-                    if elemento_filtro:
-                        break
-                except:
-                    continue
+            if encontrado:
+                seletor, elemento_filtro = encontrado
+                self.seletores.registrar('secao_filtros', seletor)
 
             if elemento_filtro:
                 self._scroll_to_element(elemento_filtro)
                 print("  ✅ Rolou até os filtros!")
             else:
                 # Se não encontrar, rola uma quantidade fixa
-                self.driver.execute_script("window.scrollBy(0, 300);")
-                time.sleep(1)
+                self.driver.execute_script("window.scrollBy({top: 300, behavior: 'instant'});")
 
         except Exception as e:
             print(f"  ⚠️ Erro ao rolar até filtros: {e}")
 
+    def abrir(self):
+        """Inicializa o navegador e carrega a página de vagas"""
+        self.inicializar_driver()
+        self.acessar_site()
+
+    def iterar(self, filtros, todas_paginas=False, concorrencia=4, parar_quando=None, pular_paginas=(),
+               ao_extrair_pagina=None):
+        """
+        Aplica os filtros e gera as vagas (recarrega a página a partir da segunda busca)
+
+        Args:
+            filtros (dict): Dicionário com os filtros desejados
+            todas_paginas (bool): Se True, coleta todas as páginas de resultados
+            concorrencia (int): Máximo de abas carregando páginas ao mesmo tempo
+            parar_quando (callable): Critério de parada da coleta incremental
+            pular_paginas (set): Páginas já coletadas (retomada de checkpoint)
+            ao_extrair_pagina (callable): Recebe (número, vagas) de cada página extraída
+
+        Yields:
+            dict: Dados de cada vaga
+        """
+        if self._pagina_usada:
+            self.acessar_site()
+        self._pagina_usada = True
+        self.aplicar_filtros(filtros)
+        yield from self.iterar_vagas(todas_paginas=todas_paginas, concorrencia=concorrencia,
+                                     parar_quando=parar_quando, pular_paginas=pular_paginas,
+                                     ao_extrair_pagina=ao_extrair_pagina)
+
+    def resetar_filtros(self):
+        """Recarrega a página de vagas para limpar os filtros, sem reiniciar o navegador"""
+        self.acessar_site()
+        self._pagina_usada = False
+        self.filtros_aplicados = {}
+
+    def saudavel(self):
+        """
+        Verifica se o navegador ainda responde
+
+        Returns:
+            bool: True se o driver executa comandos normalmente
+        """
+        try:
+            return self.driver is not None and self.driver.execute_script("return document.readyState") is not None
+        except Exception:
+            return False
+
+    @cronometrado()
     def acessar_site(self):
         """Acessa o site do CIEE"""
         print(f"Acessando {self.url_base}...")
         self.driver.get(self.url_base)
-        time.sleep(5)
+        self.esperas.aguardar_pagina_carregada()
         print("✅ Página carregada!")
 
     def aplicar_filtros(self, filtros):
         """
         Aplica filtros na busca de vagas
 
+        Cada seleção e o clique em Aplicar são passos com orçamento de tempo, novas
+        tentativas e verificação (ver passos.py).
+
         Args:
             filtros (dict): Dicionário com os filtros desejados
+
+        Raises:
+            FalhaPasso: Se um filtro não pôde ser selecionado ou aplicado; a busca não
+                segue com a página sem filtro ou filtrada pela metade
         """
         print("\n" + "=" * 50)
         print("APLICANDO FILTROS")
         print("=" * 50)
+        self.filtros_aplicados = dict(filtros)
+        self._filtros_selecionados = []
 
         # Primeiro, rola até a seção de filtros
         self._scroll_to_filters_section()
 
+        # IDs das opções: do cache em disco ou coletados uma vez da página
+        if self.catalogo is None:
+            self.catalogo = obter_catalogo(self.driver, self.caminho_catalogo, self.ttl_catalogo)
+
         # Filtro 1: Tipo de vaga
         if 'tipo_vaga' in filtros:
             self._selecionar_tipo_vaga(filtros['tipo_vaga'])
@@ -128,371 +319,567 @@ class CIEEScraper:
             self._selecionar_cidade(filtros['cidade'])
 
         print("\n✅ Todos os filtros aplicados!")
-        time.sleep(2)
+        self.esperas.aguardar_rede_ociosa(passo='pos_filtros')
 
         # IMPORTANTE: Clicar no botão "Aplicar" após definir todos os filtros
-        self._clicar_botao_aplicar()
+        # Lista alterada ou estável = efeito; None sem timeout = modo 'sleep' ou espera indisponível
+        self._executar_passo('aplicar_botao', self._clicar_botao_aplicar,
+                             verificar=lambda lista: lista or self.esperas.ultimo_timeout is None)
+        print("  ✅ Filtros aplicados com sucesso!")
 
-    def _selecionar_tipo_vaga(self, tipo_vaga):
+    def _executar_passo(self, passo, acao, verificar=None):
         """
-        Seleciona o tipo de vaga clicando na opção da lista
+        Executa um passo dos filtros com o orçamento de tempo valendo para todas as esperas dele
 
         Args:
-            tipo_vaga (str): 'ESTÁGIO', 'APRENDIZ', 'PCD', etc
-        """
-        try:
-            print(f"\n🔹 Selecionando tipo de vaga: {tipo_vaga}")
+            passo (str): Nome do passo (ver passos.POLITICAS_PADRAO)
+            acao (callable): Executa o passo
+            verificar (callable): Recebe o retorno da ação; valor falso = passo sem efeito
 
-            # Aguarda e localiza o elemento
-            tipo_vaga_input = self.wait.until(
-                EC.presence_of_element_located((By.ID, "TipoVaga"))
-            )
-
-            # Rola até o elemento
-            self._scroll_to_element(tipo_vaga_input)
+        Returns:
+            O retorno da ação
+        """
+        def com_prazo():
+            self.esperas.prazo = self.passos.prazo
+            try:
+                return acao()
+            finally:
+                self.esperas.prazo = None
 
-            # Aguarda ficar clicável
-            tipo_vaga_input = self.wait.until(
-                EC.element_to_be_clickable((By.ID, "TipoVaga"))
-            )
-            tipo_vaga_input.click()
-            time.sleep(1)
-
-            # Mapa de tipos para IDs do HTML
-            mapa_tipos = {
-                'ESTÁGIO': 'estagio',
-                'APRENDIZ': 'aprendiz',
-                'PCD': 'pcd',
-                'PROCESSOS PÚBLICOS': 'pp',
-                'SOLUÇÕES ESPECIAIS': 'se'
-            }
-
-            # Pega o ID correto
-            id_opcao = mapa_tipos.get(tipo_vaga.upper())
-
-            if not id_opcao:
-                print(f"❌ Tipo '{tipo_vaga}' não reconhecido!")
-                print(f"Opções válidas: {list(mapa_tipos.keys())}")
-                return
+        return self.passos.executar(passo, com_prazo, verificar)
 
-            # Clica na opção da lista
-            opcao = self.wait.until(
-                EC.element_to_be_clickable((By.ID, id_opcao))
-            )
-            opcao.click()
-            time.sleep(1)
+    def _wait_passo(self):
+        """WebDriverWait limitado ao que resta do orçamento do passo em andamento"""
+        return WebDriverWait(self.driver, self.passos.restante() or 10)
 
-            print(f"  ✅ '{tipo_vaga}' selecionado!")
+    @cronometrado()
+    def _selecionar_tipo_vaga(self, tipo_vaga):
+        """
+        Seleciona o tipo de vaga
 
-        except TimeoutException:
-            print(f"  ❌ Timeout ao selecionar tipo de vaga")
-        except Exception as e:
-            print(f"  ❌ Erro: {e}")
+        Args:
+            tipo_vaga (str): 'ESTÁGIO', 'APRENDIZ', 'PCD', etc
+        """
+        self._selecionar_filtro('tipo_vaga', tipo_vaga)
 
+    @cronometrado()
     def _selecionar_nivel_ensino(self, nivel_ensino):
         """
-        Seleciona o nível de ensino clicando na opção da lista
+        Seleciona o nível de ensino
 
         Args:
             nivel_ensino (str): 'Superior', 'Técnico', 'Médio', 'Fundamental', 'Todos'
         """
-        try:
-            print(f"\n🔹 Selecionando nível de ensino: {nivel_ensino}")
+        self._selecionar_filtro('nivel_ensino', nivel_ensino)
 
-            # Aguarda e localiza o elemento
-            nivel_input = self.wait.until(
-                EC.presence_of_element_located((By.ID, "NivelEnsino"))
-            )
+    @cronometrado()
+    def _selecionar_area_profissional(self, area_profissional):
+        """
+        Seleciona a área profissional
 
-            # Rola até o elemento
-            self._scroll_to_element(nivel_input)
+        Args:
+            area_profissional (str): Ex: 'Informática', 'Administração'
+        """
+        self._selecionar_filtro('area_profissional', area_profissional)
 
-            # Aguarda ficar clicável e clica
-            nivel_input = self.wait.until(
-                EC.element_to_be_clickable((By.ID, "NivelEnsino"))
-            )
-            nivel_input.click()
-            time.sleep(1.5)
-
-            # Mapa de níveis para IDs do HTML
-            mapa_niveis = {
-                'TODOS': 'TODOS',
-                'ENSINO FUNDAMENTAL': 'EF',
-                'FUNDAMENTAL': 'EF',
-                'ENSINO MÉDIO': 'EM',
-                'MÉDIO': 'EM',
-                'TÉCNICO': 'TE',
-                'SUPERIOR': 'SU'
-            }
-
-            # Pega o ID correto
-            id_opcao = mapa_niveis.get(nivel_ensino.upper())
-
-            if not id_opcao:
-                print(f"❌ Nível '{nivel_ensino}' não reconhecido!")
-                print(f"Opções válidas: {list(mapa_niveis.keys())}")
-                return
+    @cronometrado()
+    def _selecionar_cidade(self, cidade):
+        """
+        Seleciona a cidade
 
-            # Clica na opção da lista
-            opcao = self.wait.until(
-                EC.element_to_be_clickable((By.ID, id_opcao))
-            )
-            opcao.click()
-            time.sleep(1)
+        Args:
+            cidade (str): Ex: 'BRASÍLIA - DF', 'São Paulo'
+        """
+        self._selecionar_filtro('cidade', cidade)
 
-            print(f"  ✅ '{nivel_ensino}' selecionado!")
+    def _selecionar_filtro(self, filtro, valor):
+        """
+        Seleciona a opção como um passo: verifica que o campo mostra a opção e, se não
+        mostrar, reabre o combo ou recarrega a página e tenta de novo
 
-        except TimeoutException:
-            print(f"  ❌ Timeout ao selecionar nível de ensino")
-        except Exception as e:
-            print(f"  ❌ Erro: {e}")
+        Args:
+            filtro (str): 'tipo_vaga', 'nivel_ensino', 'area_profissional' ou 'cidade'
+            valor (str): Nome da opção
+        """
+        print(f"\n🔹 Selecionando {filtro.replace('_', ' ')}: {valor}")
+        _, texto = self._executar_passo(f"selecionar_{filtro}", lambda: self._selecionar_opcao(filtro, valor),
+                                        verificar=lambda selecao: self._campo_mostra(*selecao))
+        self._filtros_selecionados.append((filtro, valor))
+        print(f"  ✅ '{texto}' selecionado!")
 
-    def _selecionar_area_profissional(self, area_profissional):
+    def _campo_mostra(self, campo, texto):
         """
-        Seleciona a área profissional clicando na opção da lista
+        Verifica se o campo do filtro mostra a opção escolhida
 
         Args:
-            area_profissional (str): Ex: 'Informática', 'Administração'
+            campo (str): ID do input do filtro
+            texto (str): Texto da opção clicada
+
+        Returns:
+            bool: True se o valor do campo corresponde ao texto (sem acentos/maiúsculas)
         """
-        try:
-            print(f"\n🔹 Selecionando área profissional: {area_profissional}")
+        valor = normalizar(self.driver.find_element(By.ID, campo).get_attribute('value') or '')
+        esperado = normalizar(texto)
+        return bool(valor) and (valor == esperado or esperado in valor or valor in esperado)
 
-            # Aguarda e localiza o elemento
-            area_input = self.wait.until(
-                EC.presence_of_element_located((By.ID, "AreaProfissional"))
-            )
+    def _selecionar_opcao(self, filtro, valor):
+        """
+        Seleciona a opção de um filtro clicando direto no ID resolvido pelo catálogo
 
-            # Rola até o elemento antes de clicar
-            self._scroll_to_element(area_input)
+        Só quando a opção não está no DOM (lista carregada sob demanda) o texto dela
+        é digitado no campo, para a lista renderizá-la. Erros e timeouts propagam para
+        o executor de passos, que decide se tenta de novo.
 
-            # Aguarda ficar clicável e clica
-            area_input = self.wait.until(
-                EC.element_to_be_clickable((By.ID, "AreaProfissional"))
-            )
-            area_input.click()
-            time.sleep(1.5)
-
-            # Mapa de áreas profissionais com IDs corretos
-            mapa_areas = {
-                'INFORMÁTICA': '18',
-                'TECNOLOGIA DA INFORMAÇÃO': '18',
-                'TI': '18',
-                'ADMINISTRAÇÃO': '1',
-                'ENGENHARIA': '73',
-                'GASTRONOMIA': '11241',
-                'LETRAS': '20',
-                'INDUSTRIA': '17',
-                'INSTITUIÇÕES FINANCEIRAS': '11241',
-                'MARKETING': '22',
-                'MEIO AMBIENTE': '24',
-                'GEOCIÊNCIAS': '73',
-                'GEOMÁTICA': '45',
-                'ASTRONOMIA': '10081',
-                'SAÚDE': '32',
-            }
-
-            # Pega o ID correto
-            id_opcao = mapa_areas.get(area_profissional.upper())
-
-            if not id_opcao:
-                print(f"⚠️ Área '{area_profissional}' não mapeada, tentando busca por texto...")
-                try:
-                    xpath_opcao = f"//ul[@id='ComboAreaProfissional']//li[contains(text(), '{area_profissional}')]"
-                    opcao = self.wait.until(
-                        EC.element_to_be_clickable((By.XPATH, xpath_opcao))
-                    )
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'nearest'});", opcao)
-                    time.sleep(0.3)
-                    opcao.click()
-                except:
-                    print(f"❌ Não foi possível encontrar '{area_profissional}'")
-                    return
-            else:
-                time.sleep(0.5)
+        Args:
+            filtro (str): 'tipo_vaga', 'nivel_ensino', 'area_profissional' ou 'cidade'
+            valor (str): Nome da opção (acentos, maiúsculas e pontuação não importam)
 
-                try:
-                    opcao = self.wait.until(
-                        EC.presence_of_element_located((By.ID, id_opcao))
-                    )
-                    # Scroll até a opção dentro da lista
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'nearest'});", opcao)
-                    time.sleep(0.3)
-
-                    # Tenta clicar normalmente primeiro
-                    try:
-                        opcao.click()
-                    except:
-                        # Se falhar, usa JavaScript
-                        self.driver.execute_script("arguments[0].click();", opcao)
-                except:
-                    print(f"❌ Não foi possível clicar na opção")
-                    return
+        Returns:
+            tuple: (ID do campo, texto da opção clicada), para a verificação
 
-            time.sleep(1)
-            print(f"  ✅ '{area_profissional}' selecionada!")
+        Raises:
+            ValueError: Se o catálogo não reconhece o valor (não adianta tentar de novo)
+        """
+        campo = CAMPOS_FILTROS[filtro][0]
+        id_opcao = self.catalogo.resolver(filtro, valor)
+        if not id_opcao:
+            sugestoes = self.catalogo.sugestoes(filtro, valor)
+            metricas.evento('opcao_desconhecida', filtro=filtro, valor=valor)
+            raise ValueError(f"'{valor}' não reconhecido (opções parecidas: {sugestoes})")
+
+        # Aguarda o campo, rola até ele e abre a lista
+        wait = self._wait_passo()
+        campo_input = wait.until(
+            EC.presence_of_element_located((By.ID, campo))
+        )
+        self._scroll_to_element(campo_input)
+        campo_input = wait.until(
+            EC.element_to_be_clickable((By.ID, campo))
+        )
+        campo_input.click()
+
+        if self.driver.find_elements(By.ID, id_opcao):
+            self.esperas.aguardar_lista_dropdown(By.ID, id_opcao)
+        else:
+            texto = self.catalogo.texto(filtro, id_opcao) or valor
+            metricas.incrementar('fallbacks', tipo='digitacao')
+            campo_input.clear()
+            campo_input.send_keys(texto)
+            self.esperas.aguardar_opcoes_filtradas(By.ID, id_opcao)
+        valor_anterior = campo_input.get_attribute('value')
+
+        opcao = wait.until(
+            EC.presence_of_element_located((By.ID, id_opcao))
+        )
+        # Scroll até a opção dentro da lista
+        self.driver.execute_script("arguments[0].scrollIntoView({block: 'nearest'});", opcao)
+        self.esperas.aguardar_opcao_clicavel(By.ID, id_opcao)
+        texto_opcao = ((opcao.get_attribute('textContent') or '').strip()
+                       or self.catalogo.texto(filtro, id_opcao) or valor)
+
+        # Tenta clicar normalmente primeiro
+        try:
+            opcao.click()
+        except Exception:
+            # Se falhar, usa JavaScript
+            metricas.incrementar('fallbacks', tipo='clique_js')
+            self.driver.execute_script("arguments[0].click();", opcao)
 
-        except TimeoutException:
-            print(f"  ❌ Timeout ao selecionar área profissional")
-        except Exception as e:
-            print(f"  ❌ Erro: {e}")
+        self.esperas.aguardar_selecao(campo_input, valor_anterior)
+        return campo, texto_opcao
 
-    def _selecionar_cidade(self, cidade):
+    @cronometrado()
+    def _clicar_botao_aplicar(self):
         """
-        Seleciona a cidade clicando na opção da lista
+        Clica no botão 'Aplicar' para efetivar os filtros
 
-        Args:
-            cidade (str): Ex: 'BRASÍLIA - DF', 'SÃO PAULO - SP'
+        Returns:
+            str: 'alterada' ou 'estavel' (ver GerenciadorEsperas.aguardar_resultados_alterados),
+                ou None se a lista continuou carregando
         """
+        print(f"\n🔹 Clicando no botão 'Aplicar'...")
+
+        # Localiza o botão
+        wait = self._wait_passo()
+        botao_aplicar = wait.until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "div.btn-search.btn-purple"))
+        )
+
+        # Rola até o botão
+        self._scroll_to_element(botao_aplicar)
+
+        # Aguarda ficar clicável e clica
+        botao_aplicar = wait.until(
+            EC.element_to_be_clickable((By.CSS_SELECTOR, "div.btn-search.btn-purple"))
+        )
+        # Mesmos seletores aprendidos de _encontrar_cards (o layout pode usar um alternativo)
+        seletores_cards = self.seletores.ordenar('cards', SELETORES_CARDS + [SELETOR_GENERICO])
+        assinatura_anterior = self.esperas.assinatura_resultados(seletores_cards, SELETORES_PAGINACAO)
+        botao_aplicar.click()
+
+        # Aguarda a lista de resultados recarregar com os filtros (ou se mostrar estável, sem spinner)
+        return self.esperas.aguardar_resultados_alterados(assinatura_anterior, seletores_cards,
+                                                          SELETORES_PAGINACAO, SELETORES_CARREGANDO)
+
+    def _recuperar_reabrir(self):
+        """Fecha o combo que ficou aberto (Esc e blur) para a próxima tentativa reabri-lo do zero"""
         try:
-            print(f"\n🔹 Selecionando cidade: {cidade}")
+            self.driver.switch_to.active_element.send_keys(Keys.ESCAPE)
+        except Exception:
+            pass
+        self.driver.execute_script("if (document.activeElement) { document.activeElement.blur(); }")
+
+    def _recuperar_recarregar(self):
+        """Recarrega a página de vagas e refaz os filtros já selecionados nesta busca"""
+        self.acessar_site()
+        self._refazer_filtros()
+
+    def _recuperar_reciclar(self):
+        """Troca o navegador por um novo e refaz os filtros já selecionados nesta busca"""
+        registros = self.esperas.registros
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        metricas.incrementar('navegadores_reciclados')
+        self.inicializar_driver()
+        self.esperas.registros = registros
+        self.acessar_site()
+        self._refazer_filtros()
+
+    def _refazer_filtros(self):
+        """
+        Seleciona de novo os filtros que a recarga da página apagou
 
-            # Aguarda e localiza o elemento
-            cidade_input = self.wait.until(
-                EC.presence_of_element_located((By.ID, "CidadeVaga"))
-            )
+        Raises:
+            RuntimeError: Se um deles não ficou selecionado
+        """
+        self._scroll_to_filters_section()
+        for filtro, valor in self._filtros_selecionados:
+            if not self._campo_mostra(*self._selecionar_opcao(filtro, valor)):
+                raise RuntimeError(f"'{valor}' não ficou selecionado em {filtro}")
 
-            # Rola até o elemento
-            self._scroll_to_element(cidade_input)
+    @cronometrado()
+    def buscar_vagas(self, modo_extracao='lote', todas_paginas=False, concorrencia=4, parar_quando=None):
+        """
+        Busca e extrai informações das vagas
 
-            # Aguarda ficar clicável e clica
-            cidade_input = self.wait.until(
-                EC.element_to_be_clickable((By.ID, "CidadeVaga"))
-            )
-            cidade_input.click()
-            time.sleep(1)
-
-            # Digita parte do nome para filtrar as opções
-            cidade_input.clear()
-            termo_busca = cidade.split()[0].upper()
-            cidade_input.send_keys(termo_busca)
-            time.sleep(2)
-
-            # Mapa de cidades conhecidas com IDs
-            mapa_cidades = {
-                'BRASÍLIA - DF': '5300108',
-                'BRASÍLIA DE MINAS - MG': '3108602',
-                'SÃO PAULO - SP': '3550308',
-                'RIO DE JANEIRO - RJ': '3304557',
-            }
-
-            cidade_normalizada = cidade.upper().strip()
-            id_cidade = mapa_cidades.get(cidade_normalizada)
-
-            if id_cidade:
-                try:
-                    opcao = self.wait.until(
-                        EC.element_to_be_clickable((By.ID, id_cidade))
-                    )
-                    opcao.click()
-                except:
-                    xpath_opcao = f"//ul[@id='ComboCidade']//li[contains(text(), '{cidade_normalizada}')]"
-                    opcao = self.wait.until(
-                        EC.element_to_be_clickable((By.XPATH, xpath_opcao))
-                    )
-                    opcao.click()
-            else:
-                xpath_opcao = f"//ul[@id='ComboCidade']//li[contains(text(), '{cidade_normalizada}')]"
-                opcao = self.wait.until(
-                    EC.element_to_be_clickable((By.XPATH, xpath_opcao))
-                )
-                opcao.click()
+        Args:
+            modo_extracao (str): 'lote' extrai todos os cards em uma única chamada
+                execute_script; 'individual' usa _extrair_dados_vaga card a card
+            todas_paginas (bool): Se True, coleta também as demais páginas de resultados,
+                abrindo várias abas em paralelo
+            concorrencia (int): Máximo de abas carregando páginas ao mesmo tempo
+            parar_quando (callable): Recebe as vagas de uma página; se retornar True, as
+                páginas seguintes não são coletadas (ex: ArmazemVagas.pagina_conhecida)
 
-            time.sleep(1)
-            print(f"  ✅ '{cidade}' selecionada!")
+        Returns:
+            list: Lista de dicionários com os dados das vagas
+        """
+        return list(self.iterar_vagas(modo_extracao, todas_paginas, concorrencia, parar_quando))
 
-        except TimeoutException:
-            print(f"  ❌ Timeout ao selecionar cidade")
-        except Exception as e:
-            print(f"  ❌ Erro: {e}")
+    @cronometrado()
+    def iterar_vagas(self, modo_extracao='lote', todas_paginas=False, concorrencia=4, parar_quando=None,
+                     pular_paginas=(), ao_extrair_pagina=None):
+        """
+        Gera as vagas conforme cada página é extraída, sem acumular a lista inteira
+
+        Os argumentos são os mesmos de buscar_vagas. Um erro interrompe a geração
+        (as vagas já entregues continuam válidas).
+
+        Args:
+            pular_paginas (set): Páginas já coletadas numa execução anterior (não são
+                abertas; a primeira é sempre carregada pelos filtros, mas não é entregue)
+            ao_extrair_pagina (callable): Recebe (número, vagas) antes das vagas de cada página
+
+        Yields:
+            dict: Dados de cada vaga
+        """
+        # O relatório da busca anterior não vale para esta (mesmo que ela falhe antes da paginação)
+        self.relatorio_paginacao = None
+        print("\n" + "=" * 50)
+        print("BUSCANDO VAGAS")
+        print("=" * 50)
 
-    def _clicar_botao_aplicar(self):
-        """Clica no botão 'Aplicar' para efetivar os filtros"""
         try:
-            print(f"\n🔹 Clicando no botão 'Aplicar'...")
+            relatorio = RelatorioPaginacao()
+            self.esperas.aguardar_rede_ociosa(passo='busca')
+            self._gravar_pagina_atual(1)
+            vagas = self._extrair_vagas_pagina_atual(modo_extracao)
+
+            if not todas_paginas:
+                if 1 not in pular_paginas:
+                    if ao_extrair_pagina is not None:
+                        ao_extrair_pagina(1, vagas)
+                    yield from vagas
+                return
 
-            # Localiza o botão
-            botao_aplicar = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "div.btn-search.btn-purple"))
+            total_paginas = self._total_paginas()
+            print(f"\n📚 {total_paginas} páginas de resultados")
+            erros = {}
+            relatorio.paginas_puladas = sum(1 for numero in pular_paginas if numero <= total_paginas)
+            if relatorio.paginas_puladas:
+                print(f"  ⏭️ {relatorio.paginas_puladas} páginas já coletadas na execução anterior")
+            self.relatorio_paginacao = relatorio
+            yield from iterar_vagas_paginas(
+                self._iterar_paginas(vagas, total_paginas, modo_extracao, concorrencia, parar_quando, erros,
+                                     pular_paginas),
+                relatorio, ao_extrair_pagina,
             )
+            relatorio.encerrar(erros, total_paginas)
+            relatorio.imprimir()
+
+        except TimeoutException:
+            print("❌ Nenhuma vaga encontrada (timeout)")
+            self._registrar_falha('timeouts', 'buscar_vagas')
+        except Exception as e:
+            print(f"❌ Erro ao buscar vagas: {e}")
+            self._registrar_falha('erros', 'buscar_vagas', e)
+
+    def _iterar_paginas(self, primeira, total_paginas, modo_extracao, concorrencia, parar_quando, erros,
+                        pular_paginas=()):
+        """Gera (número, vagas) da primeira página já extraída e das seguintes, exceto as de pular_paginas"""
+        if 1 not in pular_paginas:
+            yield 1, primeira
+            if parar_quando is not None and parar_quando(primeira):
+                print("  ⏹️ Página 1 só tem vagas conhecidas, parando a coleta")
+                return
+        restantes = [numero for numero in range(2, total_paginas + 1) if numero not in pular_paginas]
+        yield from self._iterar_paginas_em_abas(
+            restantes, modo_extracao, concorrencia, parar_quando, erros
+        )
 
-            # Rola até o botão
-            self._scroll_to_element(botao_aplicar)
+    def _encontrar_cards(self):
+        """
+        Localiza os cards de vaga na página atual
 
-            # Aguarda ficar clicável e clica
-            botao_aplicar = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "div.btn-search.btn-purple"))
-            )
-            botao_aplicar.click()
+        Os seletores candidatos e o fallback genérico (<a> com 'vaga' na classe ou
+        'codigoVaga' no link) rodam numa única chamada execute_script. Com colheita, a
+        lista é rolada e os cards são acumulados até a quantidade estabilizar.
 
-            # Aguarda a página recarregar com os filtros
-            time.sleep(4)
+        Returns:
+            list: WebElements dos cards
+        """
+        ordem = self.seletores.ordenar('cards', SELETORES_CARDS + [SELETOR_GENERICO])
+        encontrado = None
+        if self.colheita:
+            encontrado = self.esperas.aguardar_colheita(ordem, SELETOR_GENERICO, self.quieto_colheita)
+            if encontrado is not None:
+                print(f"🌾 {len(encontrado['cards'])} cards colhidos em {encontrado['rolagens']} rolagens")
+        if encontrado is None:
+            encontrado = self.driver.execute_script(SCRIPT_ENCONTRAR_CARDS, ordem, SELETOR_GENERICO)
+        seletor, cards_vagas = encontrado['seletor'], encontrado['cards']
+
+        if seletor is None:
+            print("❌ Nenhuma vaga encontrada com os seletores testados")
+        else:
+            if seletor == SELETOR_GENERICO:
+                metricas.incrementar('fallbacks', tipo='seletor_generico')
+            print(f"✅ Usando seletor: {seletor}")
+            self.seletores.registrar('cards', seletor)
+
+        return cards_vagas
+
+    def _extrair_vagas_pagina_atual(self, modo_extracao='lote'):
+        """
+        Extrai as vagas válidas da página de resultados carregada na aba atual
 
-            print(f"  ✅ Filtros aplicados com sucesso!")
+        Args:
+            modo_extracao (str): 'lote' ou 'individual'
 
-        except TimeoutException:
-            print(f"  ❌ Timeout ao clicar no botão Aplicar")
-        except Exception as e:
-            print(f"  ❌ Erro ao aplicar filtros: {e}")
+        Returns:
+            list: Lista de dicionários com os dados das vagas
+        """
+        cards_vagas = self._encontrar_cards()
+        print(f"✅ {len(cards_vagas)} vagas encontradas!\n")
+
+        if modo_extracao == 'lote':
+            print(f"📄 Extraindo {len(cards_vagas)} vagas em lote...")
+            dados_vagas = self._extrair_dados_vagas_lote(cards_vagas)
+        else:
+            dados_vagas = []
+            for index, card in enumerate(cards_vagas, 1):
+                print(f"📄 Extraindo vaga {index}/{len(cards_vagas)}...")
+                dados_vagas.append(self._extrair_dados_vaga(card))
 
-    def buscar_vagas(self):
-        """Busca e extrai informações das vagas"""
-        print("\n" + "=" * 50)
-        print("BUSCANDO VAGAS")
-        print("=" * 50)
         vagas = []
+        for index, vaga in enumerate(dados_vagas, 1):
+            if vaga_valida(vaga):
+                vagas.append(vaga)
+            else:
+                print(f"  ⚠️ Vaga {index} sem dados válidos, ignorando...")
+        return vagas
+
+    def _gravar_pagina_atual(self, numero):
+        """
+        Grava o HTML da aba atual e os payloads fetch/XHR capturados nela (se houver gravador)
 
+        Uma falha na gravação é só avisada: a coleta continua.
+
+        Args:
+            numero (int): Número da página de resultados
+        """
+        if self.gravador is None:
+            return
         try:
-            time.sleep(3)
-
-            seletores = [
-                "a.vaga-item",
-                ".vaga-row",
-                ".card-vaga",
-                "[class*='vaga']",
-                "div[class*='item-vaga']",
-                "a[href*='codigoVaga']"
-            ]
-
-            cards_vagas = None
-            for seletor in seletores:
-                try:
-                    cards_vagas = self.driver.find_elements(By.CSS_SELECTOR, seletor)
-                    if cards_vagas and len(cards_vagas) > 0:
-                        print(f"✅ Usando seletor: {seletor}")
-                        break
-                except:
-                    continue
+            url = self.driver.current_url
+            self.gravador.gravar(self.driver.page_source, self.filtros_aplicados, numero, 'html', url)
+            for payload in self.driver.execute_script(SCRIPT_COLETAR_XHR) or []:
+                self.gravador.gravar(payload['corpo'], self.filtros_aplicados, numero, 'xhr', payload['url'])
+        except Exception as e:
+            print(f"  ⚠️ Não foi possível gravar a página {numero}: {e}")
 
-            if not cards_vagas or len(cards_vagas) == 0:
-                print("❌ Nenhuma vaga encontrada com os seletores testados")
-                print("🔍 Tentando seletor genérico...")
+    def _total_paginas(self):
+        """
+        Lê o total de páginas da paginação dos resultados
 
-                cards_vagas = self.driver.find_elements(By.TAG_NAME, "a")
-                cards_vagas = [c for c in cards_vagas if
-                               'vaga' in c.get_attribute('class').lower() or 'codigoVaga' in c.get_attribute('href')]
+        Returns:
+            int: Total de páginas (1 se não houver paginação)
+        """
+        try:
+            return int(self.driver.execute_script(SCRIPT_TOTAL_PAGINAS, SELETORES_PAGINACAO))
+        except Exception as e:
+            print(f"  ⚠️ Não foi possível ler a paginação: {e}")
+            return 1
 
-            print(f"✅ {len(cards_vagas)} vagas encontradas!\n")
+    def _iterar_paginas_em_abas(self, numeros, modo_extracao='lote', concorrencia=4, parar_quando=None,
+                                erros=None):
+        """
+        Carrega as páginas em várias abas ao mesmo tempo e gera as vagas de cada uma
 
-            for index, card in enumerate(cards_vagas, 1):
-                print(f"📄 Extraindo vaga {index}/{len(cards_vagas)}...")
-                vaga = self._extrair_dados_vaga(card)
+        As abas de um lote são abertas juntas com window.open (o navegador carrega
+        todas em paralelo) e depois visitadas uma a uma para a extração. As páginas
+        do lote são entregues em ordem depois que todas as abas foram fechadas.
 
-                if (vaga['codigo'] and vaga['codigo'] != 'N/A') or (vaga['link'] and vaga['link'] != 'N/A'):
-                    vagas.append(vaga)
-                else:
-                    print(f"  ⚠️ Vaga {index} sem dados válidos, ignorando...")
+        Args:
+            numeros (iterable): Números das páginas
+            modo_extracao (str): 'lote' ou 'individual'
+            concorrencia (int): Abas abertas por lote
+            parar_quando (callable): Se retornar True para uma página, as páginas
+                posteriores a ela não são entregues nem abertas
+            erros (dict): Se informado, recebe página -> mensagem de erro
+
+        Yields:
+            tuple: (número da página, lista de vagas)
+        """
+        numeros = list(numeros)
+        erros = {} if erros is None else erros
+        janela_principal = self.driver.current_window_handle
+        controle = self.controle
+
+        posicao = 0
+        while posicao < len(numeros):
+            # Com o controle, o tamanho do lote segue a concorrência adaptativa
+            tamanho = controle.limite_atual if controle is not None else max(1, concorrencia)
+            lote = numeros[posicao:posicao + tamanho]
+            posicao += len(lote)
+            paginas = {}
+            inicios = []
+            abas_antes = set(self.driver.window_handles)
+            for numero in lote:
+                if controle is not None:
+                    inicios.append(controle.adquirir())
+                url = url_pagina(self.url_base, self.filtros_aplicados, numero, self.catalogo)
+                self.driver.execute_script("window.open(arguments[0], '_blank');", url)
+            abas_novas = [aba for aba in self.driver.window_handles if aba not in abas_antes]
+
+            for aba in abas_novas:
+                numero = None
+                self.driver.switch_to.window(aba)
+                try:
+                    try:
+                        if not self.esperas.aguardar_pagina_carregada():
+                            raise TimeoutException("página não carregou no tempo limite")
+                    except Exception as e:
+                        if inicios:
+                            controle.liberar(inicios.pop(0), e)
+                        raise
+                    if inicios:
+                        controle.liberar(inicios.pop(0))
+                    consulta = parse_qs(urlsplit(self.driver.current_url).query)
+                    numero = int(consulta[PARAMETRO_PAGINA][0])
+                    print(f"\n📄 Página {numero}")
+                    self._gravar_pagina_atual(numero)
+                    paginas[numero] = self._extrair_vagas_pagina_atual(modo_extracao)
+                except Exception as e:
+                    erros[numero if numero is not None else aba] = str(e)
+                    print(f"  ❌ Erro na página {numero}: {e}")
+                finally:
+                    self.driver.close()
+
+            # Abas que nem chegaram a abrir contam como falha
+            for inicio in inicios:
+                controle.liberar(inicio, TimeoutError("aba não aberta"))
+            self.driver.switch_to.window(janela_principal)
+
+            for numero in sorted(paginas):
+                yield numero, paginas[numero]
+                if parar_quando is not None and parar_quando(paginas[numero]):
+                    print(f"  ⏹️ Página {numero} só tem vagas conhecidas, parando a coleta")
+                    return
 
-        except TimeoutException:
-            print("❌ Nenhuma vaga encontrada (timeout)")
+    @cronometrado()
+    def _extrair_dados_vagas_lote(self, elementos):
+        """
+        Extrai os dados de todos os cards em um único round-trip ao navegador
+
+        Args:
+            elementos (list): WebElements dos cards de vaga
+
+        Returns:
+            list: Lista de dicionários no mesmo formato de _extrair_dados_vaga
+        """
+        if not elementos:
+            return []
+
+        try:
+            return self._executar_extracao(list(elementos))
         except Exception as e:
-            print(f"❌ Erro ao buscar vagas: {e}")
+            print(f"  ⚠️ Erro na extração em lote, extraindo card a card: {e}")
+            metricas.incrementar('fallbacks', tipo='extracao_individual')
+            return [self._extrair_dados_vaga(elemento) for elemento in elementos]
 
-        return vagas
+    def _executar_extracao(self, elementos):
+        """
+        Roda SCRIPT_EXTRAIR_CARDS com os seletores de cada campo na ordem aprendida
 
+        Args:
+            elementos (list): WebElements dos cards de vaga
+
+        Returns:
+            list: Lista de dicionários com os dados das vagas
+        """
+        ordem = {campo: self.seletores.ordenar(f"campo:{campo}", candidatos(seletor))
+                 for campo, seletor in SELETORES_CAMPOS.items()}
+        resultado = self.driver.execute_script(SCRIPT_EXTRAIR_CARDS, elementos, ordem)
+        for campo, seletor in resultado['vencedores'].items():
+            self.seletores.registrar(f"campo:{campo}", seletor)
+        return resultado['vagas']
+
+    @cronometrado()
     def _extrair_dados_vaga(self, elemento):
         """
         Extrai dados de uma vaga específica
 
+        Usa uma única chamada execute_script para o card; se ela falhar, busca
+        campo a campo com find_element.
+
+        Args:
+            elemento: WebElement contendo informações da vaga
+
+        Returns:
+            dict: Dicionário com dados da vaga
+        """
+        try:
+            return self._executar_extracao([elemento])[0]
+        except Exception:
+            metricas.incrementar('fallbacks', tipo='extracao_campo_a_campo')
+            return self._extrair_dados_vaga_campo_a_campo(elemento)
+
+    def _extrair_dados_vaga_campo_a_campo(self, elemento):
+        """
+        Extrai dados de uma vaga com um find_element por campo
+
         Args:
             elemento: WebElement contendo informações da vaga
 
@@ -521,67 +908,70 @@ class CIEEScraper:
                 vaga['link'] = 'N/A'
 
             try:
-                codigo_elem = elemento.find_element(By.CSS_SELECTOR, ".codigo-vaga, .cod-vaga")
+                codigo_elem = elemento.find_element(By.CSS_SELECTOR, SELETORES_CAMPOS['codigo'])
                 vaga['codigo'] = codigo_elem.text.strip()
             except:
                 vaga['codigo'] = 'N/A'
 
             try:
-                tipo_elem = elemento.find_element(By.CSS_SELECTOR, ".tipo-vaga, .badge")
+                tipo_elem = elemento.find_element(By.CSS_SELECTOR, SELETORES_CAMPOS['tipo'])
                 vaga['tipo'] = tipo_elem.text.strip()
             except:
                 vaga['tipo'] = 'N/A'
 
             try:
-                desc_elem = elemento.find_element(By.CSS_SELECTOR, ".titulo-vaga, .descricao, h3")
+                desc_elem = elemento.find_element(By.CSS_SELECTOR, SELETORES_CAMPOS['descricao'])
                 vaga['descricao'] = desc_elem.text.strip()
             except:
                 vaga['descricao'] = 'N/A'
 
             try:
-                area_elem = elemento.find_element(By.CSS_SELECTOR, ".area-vaga, .info-area")
+                area_elem = elemento.find_element(By.CSS_SELECTOR, SELETORES_CAMPOS['area'])
                 vaga['area'] = area_elem.text.strip()
             except:
                 vaga['area'] = 'N/A'
 
             try:
-                local_elem = elemento.find_element(By.CSS_SELECTOR, ".local-vaga, .info-local, .localizacao")
+                local_elem = elemento.find_element(By.CSS_SELECTOR, SELETORES_CAMPOS['localizacao'])
                 vaga['localizacao'] = local_elem.text.strip()
             except:
                 vaga['localizacao'] = 'N/A'
 
             try:
-                horario_elem = elemento.find_element(By.CSS_SELECTOR, ".horario-vaga, .info-horario")
+                horario_elem = elemento.find_element(By.CSS_SELECTOR, SELETORES_CAMPOS['horario'])
                 vaga['horario'] = horario_elem.text.strip()
             except:
                 vaga['horario'] = 'N/A'
 
             try:
-                salario_elem = elemento.find_element(By.CSS_SELECTOR, ".salario-vaga, .info-salario, .bolsa-auxilio")
+                salario_elem = elemento.find_element(By.CSS_SELECTOR, SELETORES_CAMPOS['salario'])
                 vaga['salario'] = salario_elem.text.strip()
             except:
                 vaga['salario'] = 'N/A'
 
         except Exception as e:
             print(f"  ⚠️ Erro ao extrair vaga: {e}")
+            self._registrar_falha('erros', 'extrair_dados_vaga', e)
 
         return vaga
 
-    def salvar_resultados(self, vagas, formato='json'):
+    def salvar_resultados(self, vagas, formato='jsonl', arquivo=None):
         """
         Salva os resultados em arquivo
 
         Args:
-            vagas (list): Lista de vagas encontradas
-            formato (str): 'json' ou 'csv'
-        """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            vagas (iterable): Vagas encontradas (lista ou gerador de iterar_vagas)
+            formato (str): 'jsonl', 'csv', 'json' (compacto) ou 'parquet'
+            arquivo (str): Caminho do arquivo (padrão: vagas_ciee_YYYYMMDD_HHMMSS.<ext>)
 
-        if formato == 'json':
-            arquivo = f"vagas_ciee_{timestamp}.json"
-            with open(arquivo, 'w', encoding='utf-8') as f:
-                json.dump(vagas, f, ensure_ascii=False, indent=4)
-            print(f"\n💾 Resultados salvos em: {arquivo}")
+        Returns:
+            str: Caminho do arquivo salvo
+        """
+        with criar_saida(formato, arquivo) as saida:
+            for vaga in vagas:
+                saida.escrever(vaga)
+        print(f"\n💾 {saida.quantidade} vagas salvas em: {saida.arquivo}")
+        return saida.arquivo
 
     def fechar(self):
         """Fecha o navegador"""
@@ -592,8 +982,15 @@ class CIEEScraper:
 
 def main():
     """Função principal"""
-
-    # CONFIGURE SEUS FILTROS AQUI
+    parser = argparse.ArgumentParser(description="Busca vagas no portal do CIEE")
+    parser.add_argument('--resume', action='store_true',
+                        help='retoma a coleta interrompida a partir do checkpoint, sem repetir páginas')
+    parser.add_argument('--checkpoint', default='checkpoint_ciee.json', help='arquivo do checkpoint')
+    parser.add_argument('--gravar', metavar='PASTA', default=None,
+                        help='grava o HTML bruto de cada página para reprocessar com gravacao.py')
+    args = parser.parse_args()
+
+    # CONFIGURE SEUS FILTROS AQUI (ou use a linha de comando: python cli.py buscar --help)
     filtros = {
         'tipo_vaga': 'ESTÁGIO',
         'nivel_ensino': 'Superior',
@@ -601,32 +998,28 @@ def main():
         'cidade': 'BRASÍLIA - DF'
     }
 
-    scraper = CIEEScraper(headless=False)
-
-    try:
-        scraper.inicializar_driver()
-        scraper.acessar_site()
-        scraper.aplicar_filtros(filtros)
-        vagas = scraper.buscar_vagas()
-
-        print("\n" + "=" * 50)
-        print(f"TOTAL: {len(vagas)} vagas encontradas!")
-        print("=" * 50)
-
-        if vagas:
-            scraper.salvar_resultados(vagas, formato='json')
-
-            print("\n📋 Primeiras vagas:")
-            for i, vaga in enumerate(vagas[:3], 1):
-                print(f"\n  {i}. {vaga['tipo']} - {vaga['descricao']}")
-                print(f"     📍 {vaga['localizacao']}")
-                print(f"     💰 {vaga['salario']}")
-
-    except Exception as e:
-        print(f"\n❌ Erro durante execução: {e}")
-
-    finally:
-        scraper.fechar()
+    executar_coleta(
+        filtros,
+        # 'jsonl' (uma vaga por linha, sobrevive a falhas no meio da coleta), 'csv', 'json' ou 'parquet'
+        formato_saida='jsonl',
+        # 'todas' as páginas; 'incremental' para na primeira página sem vagas novas; 'pagina' só a primeira
+        modo='todas',
+        # Busca a página de detalhe de cada vaga (requisitos, benefícios, endereço...) em paralelo
+        enriquecer_detalhes=False,
+        # Rola a lista de resultados colhendo os cards até a quantidade estabilizar
+        # (necessário se o portal carregar as vagas sob demanda no scroll)
+        colheita=False,
+        headless=False,
+        # 'leve' não baixa imagens, mídia, fontes nem rastreadores
+        politica_recursos='leve',
+        retomar=args.resume,
+        caminho_checkpoint=args.checkpoint,
+        pasta_gravacoes=args.gravar,
+        # Snapshot Prometheus das fases e contadores; eventos JSON (uma linha por evento) em log_json.
+        # CIEE_METRICAS=0 no ambiente desliga a instrumentação inteira
+        arquivo_metricas='metricas_ciee.prom',
+        log_json=None,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,304 @@
+"""Métricas do scraper: tempo por fase, contadores, logs JSON estruturados e snapshot no formato Prometheus"""
+
+import functools
+import inspect
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+
+# CIEE_METRICAS=0 desliga tudo já na importação: os decoradores devolvem a função original
+ATIVO_NA_IMPORTACAO = os.environ.get('CIEE_METRICAS', '1').lower() not in ('0', 'false', 'nao', 'não')
+
+# Prefixo dos nomes no snapshot Prometheus
+PREFIXO = 'ciee'
+
+# Logger dos eventos estruturados (sem handler até configurar_logs: não polui a saída)
+logger = logging.getLogger('ciee.metricas')
+logger.addHandler(logging.NullHandler())
+logger.propagate = False
+
+
+def _chave(nome, rotulos):
+    return nome, tuple(sorted(rotulos.items()))
+
+
+def _escapar(valor):
+    return str(valor).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _rotulos_prometheus(rotulos):
+    if not rotulos:
+        return ''
+    return '{' + ','.join(f'{nome}="{_escapar(valor)}"' for nome, valor in rotulos) + '}'
+
+
+class Metricas:
+    """
+    Registro de contadores, medidores e cronômetros, seguro para várias threads
+
+    Cada cronômetro guarda quantidade, soma e máximo (em segundos) por fase; os
+    contadores aceitam rótulos (ex: comando WebDriver, passo da espera).
+
+    Uso:
+        with metricas.cronometrar('acessar_site'):
+            ...
+        metricas.incrementar('fallbacks', tipo='clique_js')
+        print(metricas.texto_prometheus())
+    """
+
+    def __init__(self, ativo=True):
+        """
+        Args:
+            ativo (bool): Se False, todas as operações retornam sem registrar nada
+        """
+        self.ativo = ativo
+        self.contadores = {}
+        self.cronometros = {}
+        self.medidores = {}
+        self._lock = threading.Lock()
+
+    def incrementar(self, nome, valor=1, **rotulos):
+        """
+        Soma um valor a um contador
+
+        Args:
+            nome (str): Ex: 'comandos_webdriver', 'timeouts', 'fallbacks'
+            valor (int): Quanto somar
+            **rotulos: Rótulos do contador (ex: passo='busca')
+        """
+        if not self.ativo:
+            return
+        chave = _chave(nome, rotulos)
+        with self._lock:
+            self.contadores[chave] = self.contadores.get(chave, 0) + valor
+
+    def definir(self, nome, valor, **rotulos):
+        """
+        Guarda o valor atual de um medidor (gauge)
+
+        Args:
+            nome (str): Ex: 'controle_limite'
+            valor (float): Valor atual
+            **rotulos: Rótulos do medidor
+        """
+        if not self.ativo:
+            return
+        chave = _chave(nome, rotulos)
+        with self._lock:
+            self.medidores[chave] = valor
+
+    def observar(self, nome, segundos, **rotulos):
+        """
+        Registra uma duração
+
+        Args:
+            nome (str): Nome da fase
+            segundos (float): Duração medida
+            **rotulos: Rótulos da fase
+        """
+        if not self.ativo:
+            return
+        chave = _chave(nome, rotulos)
+        with self._lock:
+            atual = self.cronometros.get(chave)
+            if atual is None:
+                self.cronometros[chave] = [1, segundos, segundos]
+            else:
+                atual[0] += 1
+                atual[1] += segundos
+                if segundos > atual[2]:
+                    atual[2] = segundos
+
+    def cronometrar(self, nome, **rotulos):
+        """
+        Context manager que mede o bloco; uma exceção conta em 'erros' e vira evento
+
+        Args:
+            nome (str): Nome da fase
+            **rotulos: Rótulos da fase
+
+        Returns:
+            Context manager (nulo quando as métricas estão desligadas)
+        """
+        if not self.ativo:
+            return nullcontext()
+        return self._cronometrar(nome, rotulos)
+
+    @contextmanager
+    def _cronometrar(self, nome, rotulos):
+        inicio = time.perf_counter()
+        try:
+            yield
+        except BaseException as e:
+            if not isinstance(e, GeneratorExit):
+                self.incrementar('erros', fase=nome)
+                self.evento('erro', fase=nome, erro=f"{type(e).__name__}: {e}", **rotulos)
+            raise
+        finally:
+            segundos = time.perf_counter() - inicio
+            self.observar(nome, segundos, **rotulos)
+            self.evento('fase', fase=nome, segundos=round(segundos, 6), **rotulos)
+
+    def evento(self, tipo, **campos):
+        """
+        Emite uma linha JSON no logger 'ciee.metricas'
+
+        Args:
+            tipo (str): Ex: 'fase', 'erro', 'timeout', 'fallback'
+            **campos: Campos do evento
+        """
+        if not self.ativo or not logger.isEnabledFor(logging.INFO):
+            return
+        registro = {'ts': round(time.time(), 3), 'evento': tipo}
+        registro.update(campos)
+        logger.info(json.dumps(registro, ensure_ascii=False, default=str))
+
+    def snapshot(self):
+        """
+        Returns:
+            dict: {'contadores': [...], 'cronometros': [...], 'medidores': [...]} com nome, rótulos e valores
+        """
+        with self._lock:
+            contadores = [{'nome': nome, 'rotulos': dict(rotulos), 'valor': valor}
+                          for (nome, rotulos), valor in sorted(self.contadores.items())]
+            cronometros = [{'nome': nome, 'rotulos': dict(rotulos), 'vezes': vezes,
+                            'segundos': round(soma, 6), 'maximo': round(maximo, 6)}
+                           for (nome, rotulos), (vezes, soma, maximo) in sorted(self.cronometros.items())]
+            medidores = [{'nome': nome, 'rotulos': dict(rotulos), 'valor': valor}
+                         for (nome, rotulos), valor in sorted(self.medidores.items())]
+        return {'contadores': contadores, 'cronometros': cronometros, 'medidores': medidores}
+
+    def texto_prometheus(self):
+        """
+        Snapshot no formato de exposição de texto do Prometheus
+
+        Contadores viram `ciee_<nome>_total` e medidores `ciee_<nome>`; cada fase vira
+        o summary `ciee_fase_segundos` (count/sum) e o gauge `ciee_fase_segundos_max`.
+
+        Returns:
+            str: Texto pronto para um arquivo do node_exporter (textfile) ou um endpoint /metrics
+        """
+        with self._lock:
+            contadores = sorted(self.contadores.items())
+            cronometros = sorted(self.cronometros.items())
+            medidores = sorted(self.medidores.items())
+
+        linhas = []
+        tipos_emitidos = set()
+        for (nome, rotulos), valor in contadores:
+            metrica = f"{PREFIXO}_{nome}_total"
+            if metrica not in tipos_emitidos:
+                tipos_emitidos.add(metrica)
+                linhas.append(f"# TYPE {metrica} counter")
+            linhas.append(f"{metrica}{_rotulos_prometheus(rotulos)} {valor}")
+
+        for (nome, rotulos), valor in medidores:
+            metrica = f"{PREFIXO}_{nome}"
+            if metrica not in tipos_emitidos:
+                tipos_emitidos.add(metrica)
+                linhas.append(f"# TYPE {metrica} gauge")
+            linhas.append(f"{metrica}{_rotulos_prometheus(rotulos)} {valor:g}")
+
+        if cronometros:
+            metrica = f"{PREFIXO}_fase_segundos"
+            linhas.append(f"# TYPE {metrica} summary")
+            for (nome, rotulos), (vezes, soma, _) in cronometros:
+                rotulos_fase = _rotulos_prometheus((('fase', nome),) + rotulos)
+                linhas.append(f"{metrica}_count{rotulos_fase} {vezes}")
+                linhas.append(f"{metrica}_sum{rotulos_fase} {soma:.6f}")
+            linhas.append(f"# TYPE {metrica}_max gauge")
+            for (nome, rotulos), (_, _, maximo) in cronometros:
+                linhas.append(f"{metrica}_max{_rotulos_prometheus((('fase', nome),) + rotulos)} {maximo:.6f}")
+        return '\n'.join(linhas) + '\n'
+
+    def salvar_prometheus(self, caminho):
+        """
+        Grava o snapshot Prometheus (escrita atômica, para o coletor nunca ler um arquivo pela metade)
+
+        Args:
+            caminho (str): Ex: '/var/lib/node_exporter/ciee.prom'
+        """
+        temporario = f"{caminho}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            f.write(self.texto_prometheus())
+        os.replace(temporario, caminho)
+
+    def zerar(self):
+        """Apaga todos os contadores, cronômetros e medidores"""
+        with self._lock:
+            self.contadores.clear()
+            self.cronometros.clear()
+            self.medidores.clear()
+
+
+# Registro global usado pelo scraper, backends e daemon
+metricas = Metricas(ativo=ATIVO_NA_IMPORTACAO)
+
+
+def ativar():
+    """Liga o registro global (não tem efeito nos decoradores se CIEE_METRICAS=0 na importação)"""
+    metricas.ativo = True
+
+
+def desativar():
+    """Desliga o registro global: cronômetros e contadores passam a retornar sem registrar nada"""
+    metricas.ativo = False
+
+
+def cronometrado(nome=None):
+    """
+    Decorador que mede cada chamada da função no registro global
+
+    Em funções geradoras, mede do primeiro next() até o fim da iteração.
+
+    Args:
+        nome (str): Nome da fase (padrão: nome da função sem '_' inicial)
+
+    Returns:
+        callable: Decorador
+    """
+    def decorador(func):
+        if not ATIVO_NA_IMPORTACAO:
+            return func
+        fase = nome or func.__name__.lstrip('_')
+
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def gerador(*args, **kwargs):
+                if not metricas.ativo:
+                    return (yield from func(*args, **kwargs))
+                with metricas.cronometrar(fase):
+                    return (yield from func(*args, **kwargs))
+            return gerador
+
+        @functools.wraps(func)
+        def envolvida(*args, **kwargs):
+            if not metricas.ativo:
+                return func(*args, **kwargs)
+            with metricas.cronometrar(fase):
+                return func(*args, **kwargs)
+        return envolvida
+
+    return decorador
+
+
+def configurar_logs(arquivo=None, nivel=logging.INFO):
+    """
+    Liga a emissão dos eventos JSON (uma linha por evento)
+
+    Args:
+        arquivo (str): Arquivo de destino (None: stderr)
+        nivel (int): Nível do logger; acima de INFO os eventos não são montados
+
+    Returns:
+        logging.Handler: Handler instalado (para remover depois, se preciso)
+    """
+    handler = logging.FileHandler(arquivo, encoding='utf-8') if arquivo else logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(nivel)
+    return handler
@@ -0,0 +1,427 @@
+"""Modelo tipado da vaga: salário, horário e localização interpretados uma vez, e coleção colunar compacta"""
+
+import math
+import re
+import sys
+from array import array
+from collections import Counter
+from dataclasses import dataclass
+from datetime import time
+from enum import Enum
+from functools import lru_cache
+
+from catalogo import normalizar
+from portal import CAMPOS_VAGA, MAPA_TIPOS
+
+
+# Unidades federativas aceitas como sufixo da localização ('São Paulo - SP')
+UFS = {
+    'AC', 'AL', 'AP', 'AM', 'BA', 'CE', 'DF', 'ES', 'GO', 'MA', 'MT', 'MS', 'MG', 'PA',
+    'PB', 'PR', 'PE', 'PI', 'RJ', 'RN', 'RS', 'RO', 'RR', 'SC', 'SP', 'SE', 'TO',
+}
+
+# Palavra do período do salário (normalizada) -> período
+PERIODOS_SALARIO = {
+    'MES': 'mes', 'MENSAL': 'mes', 'MENSAIS': 'mes',
+    'HORA': 'hora', 'H': 'hora',
+    'DIA': 'dia', 'DIARIA': 'dia',
+    'SEMANA': 'semana', 'SEMANAL': 'semana',
+    'ANO': 'ano', 'ANUAL': 'ano',
+}
+
+# Dias trabalhados por semana quando o horário não diz (jornada de segunda a sexta)
+DIAS_SEMANA_PADRAO = 5
+
+_RE_VALOR = re.compile(r"(\d{1,3}(?:\.\d{3})+|\d+)(?:,(\d{1,2}))?")
+_RE_HORARIO = re.compile(r"(\d{1,2})\s*(?:[:h]\s*(\d{2}))?\s*h?\s*(?:ÀS|AS|A|ATE|ATÉ|-|–)\s*(\d{1,2})\s*(?:[:h]\s*(\d{2}))?",
+                         re.IGNORECASE)
+_RE_HORAS_SEMANAIS = re.compile(r"(\d{1,2}(?:[.,]\d+)?)\s*H(?:ORAS)?\s*(?:SEMANAIS|/\s*SEMANA|POR SEMANA)", re.IGNORECASE)
+_RE_LOCAL = re.compile(r"^(.*?)\s*[-/,–]\s*([A-Za-z]{2})\s*$")
+_DIAS = ['SEGUNDA', 'TERCA', 'QUARTA', 'QUINTA', 'SEXTA', 'SABADO', 'DOMINGO']
+
+
+class TipoVaga(Enum):
+    """Tipo da vaga, com os mesmos IDs do filtro do portal (MAPA_TIPOS)"""
+
+    ESTAGIO = 'estagio'
+    APRENDIZ = 'aprendiz'
+    PCD = 'pcd'
+    PROCESSOS_PUBLICOS = 'pp'
+    SOLUCOES_ESPECIAIS = 'se'
+    OUTRO = 'outro'
+
+
+_TIPOS_NORMALIZADOS = {normalizar(nome): TipoVaga(id_tipo) for nome, id_tipo in MAPA_TIPOS.items()}
+
+
+def _texto_valido(texto):
+    return bool(texto) and texto != 'N/A'
+
+
+@lru_cache(maxsize=4096)
+def analisar_tipo(texto):
+    """
+    Args:
+        texto (str): Ex: 'Estágio'
+
+    Returns:
+        TipoVaga: Tipo reconhecido (OUTRO quando não reconhecido)
+    """
+    if not _texto_valido(texto):
+        return TipoVaga.OUTRO
+    return _TIPOS_NORMALIZADOS.get(normalizar(texto), TipoVaga.OUTRO)
+
+
+@lru_cache(maxsize=4096)
+def analisar_salario(texto):
+    """
+    Extrai valor e período do salário
+
+    Args:
+        texto (str): Ex: 'R$ 1.200,50 / Mês'
+
+    Returns:
+        tuple: (1200.5, 'mes'); (None, None) quando não há valor (ex: 'A combinar')
+    """
+    if not _texto_valido(texto):
+        return None, None
+    m = _RE_VALOR.search(texto)
+    if not m:
+        return None, None
+    valor = float(m.group(1).replace('.', '') + '.' + (m.group(2) or '0'))
+    periodo = None
+    for palavra in normalizar(texto[m.end():]).split():
+        if palavra in PERIODOS_SALARIO:
+            periodo = PERIODOS_SALARIO[palavra]
+            break
+    return valor, periodo
+
+
+def _dias_por_semana(normalizado):
+    """Dias de jornada a partir de 'SEGUNDA A SABADO' etc. (padrão: DIAS_SEMANA_PADRAO)"""
+    m = re.search(r"(" + '|'.join(_DIAS) + r")\S*\s+A\s+(" + '|'.join(_DIAS) + r")", normalizado)
+    if not m:
+        return DIAS_SEMANA_PADRAO
+    return _DIAS.index(m.group(2)) - _DIAS.index(m.group(1)) + 1
+
+
+@lru_cache(maxsize=4096)
+def analisar_horario(texto):
+    """
+    Extrai início, fim e horas semanais do horário
+
+    As horas semanais vêm do texto quando ele as informa ('30h semanais'); senão,
+    são as horas do dia (com virada de meia-noite) vezes os dias da semana citados
+    ('segunda a sábado') ou DIAS_SEMANA_PADRAO.
+
+    Args:
+        texto (str): Ex: '09:00 às 15:00'
+
+    Returns:
+        tuple: (time(9, 0), time(15, 0), 30.0); None nos valores não encontrados
+    """
+    if not _texto_valido(texto):
+        return None, None, None
+    inicio = fim = horas_semanais = None
+
+    m = _RE_HORARIO.search(texto)
+    if m and int(m.group(1)) < 24 and int(m.group(3)) < 24:
+        inicio = time(int(m.group(1)), int(m.group(2) or 0))
+        fim = time(int(m.group(3)), int(m.group(4) or 0))
+
+    explicito = _RE_HORAS_SEMANAIS.search(texto)
+    if explicito:
+        horas_semanais = float(explicito.group(1).replace(',', '.'))
+    elif inicio is not None:
+        minutos = (fim.hour * 60 + fim.minute) - (inicio.hour * 60 + inicio.minute)
+        if minutos <= 0:
+            minutos += 24 * 60
+        horas_semanais = minutos / 60 * _dias_por_semana(normalizar(texto))
+    return inicio, fim, horas_semanais
+
+
+@lru_cache(maxsize=4096)
+def analisar_localizacao(texto):
+    """
+    Separa cidade e UF
+
+    Args:
+        texto (str): Ex: 'São Paulo - SP', 'BRASÍLIA/DF'
+
+    Returns:
+        tuple: ('São Paulo', 'SP'); (texto, None) quando não há UF reconhecível
+    """
+    if not _texto_valido(texto):
+        return None, None
+    m = _RE_LOCAL.match(texto.strip())
+    if m and m.group(2).upper() in UFS:
+        return sys.intern(m.group(1).strip()), sys.intern(m.group(2).upper())
+    return sys.intern(texto.strip()), None
+
+
+@dataclass(slots=True)
+class Vaga:
+    """
+    Vaga com os textos originais do card e os valores já interpretados
+
+    Os campos de CAMPOS_VAGA guardam o texto exato extraído (ida e volta sem perdas
+    com como_dict/de_dict); tipo, área e cidade são strings internadas, compartilhadas
+    entre todas as vagas. Campos extras (ex: detalhes) ficam em `extras`.
+
+    Também aceita leitura como dict (vaga['codigo'], vaga.get('link')), então funciona
+    com chave_vaga, vaga_valida e as saídas.
+    """
+
+    codigo: str = None
+    tipo: str = None
+    descricao: str = None
+    area: str = None
+    localizacao: str = None
+    horario: str = None
+    salario: str = None
+    link: str = None
+    categoria: TipoVaga = TipoVaga.OUTRO
+    salario_valor: float = None
+    salario_periodo: str = None
+    inicio: time = None
+    fim: time = None
+    horas_semanais: float = None
+    cidade: str = None
+    uf: str = None
+    extras: dict = None
+
+    @classmethod
+    def de_dict(cls, dados):
+        """
+        Cria a vaga a partir do dict extraído, interpretando salário, horário e localização
+
+        Args:
+            dados (dict): Dict no formato de _extrair_dados_vaga (campos extras vão para `extras`)
+
+        Returns:
+            Vaga: Vaga tipada
+        """
+        tipo = dados.get('tipo')
+        area = dados.get('area')
+        localizacao = dados.get('localizacao')
+        horario = dados.get('horario')
+        salario = dados.get('salario')
+        salario_valor, salario_periodo = analisar_salario(salario)
+        inicio, fim, horas_semanais = analisar_horario(horario)
+        cidade, uf = analisar_localizacao(localizacao)
+        extras = {campo: valor for campo, valor in dados.items() if campo not in CAMPOS_VAGA}
+        return cls(
+            codigo=dados.get('codigo'),
+            tipo=sys.intern(tipo) if isinstance(tipo, str) else tipo,
+            descricao=dados.get('descricao'),
+            area=sys.intern(area) if isinstance(area, str) else area,
+            localizacao=sys.intern(localizacao) if isinstance(localizacao, str) else localizacao,
+            horario=horario,
+            salario=salario,
+            link=dados.get('link'),
+            categoria=analisar_tipo(tipo),
+            salario_valor=salario_valor,
+            salario_periodo=salario_periodo,
+            inicio=inicio,
+            fim=fim,
+            horas_semanais=horas_semanais,
+            cidade=cidade,
+            uf=uf,
+            extras=extras or None,
+        )
+
+    def como_dict(self):
+        """
+        Returns:
+            dict: O dict original (mesmo formato do JSON de saída)
+        """
+        dados = {campo: getattr(self, campo) for campo in CAMPOS_VAGA if getattr(self, campo) is not None}
+        if self.extras:
+            dados.update(self.extras)
+        return dados
+
+    def __getitem__(self, campo):
+        if campo in CAMPOS_VAGA:
+            valor = getattr(self, campo)
+            if valor is not None:
+                return valor
+        elif self.extras and campo in self.extras:
+            return self.extras[campo]
+        raise KeyError(campo)
+
+    def get(self, campo, padrao=None):
+        try:
+            return self[campo]
+        except KeyError:
+            return padrao
+
+    def __contains__(self, campo):
+        return self.get(campo) is not None
+
+
+class _Categorias:
+    """Coluna codificada por dicionário: cada valor distinto guardado uma vez, linhas como índices"""
+
+    __slots__ = ('valores', 'indices', 'codigos')
+
+    def __init__(self):
+        self.valores = []
+        self.indices = {}
+        self.codigos = array('I')
+
+    def adicionar(self, valor):
+        codigo = self.indices.get(valor)
+        if codigo is None:
+            codigo = self.indices[valor] = len(self.valores)
+            self.valores.append(valor)
+        self.codigos.append(codigo)
+
+    def __getitem__(self, linha):
+        return self.valores[self.codigos[linha]]
+
+
+class ColecaoVagas:
+    """
+    Muitas vagas em colunas: os campos repetitivos (tipo, área, localização, horário,
+    salário) são codificados por dicionário e interpretados uma vez por valor distinto
+
+    Uso:
+        colecao = ColecaoVagas.de_dicts(backend.iterar(filtros, todas_paginas=True))
+        colecao.coluna('salario_valor')  # [900.0, 1200.0, ...]
+        colecao.contagem('uf')           # Counter({'SP': 1200, 'DF': 300})
+        colecao.como_dicts()             # lista no formato do JSON de saída
+    """
+
+    # Campos de texto livre (uma string por linha)
+    CAMPOS_TEXTO = ('codigo', 'descricao', 'link')
+    # Campos com poucos valores distintos (codificados por dicionário)
+    CAMPOS_CATEGORICOS = ('tipo', 'area', 'localizacao', 'horario', 'salario')
+    # Coluna derivada -> (campo de origem, função que interpreta o texto, posição no resultado)
+    DERIVADOS = {
+        'categoria': ('tipo', lambda texto: (analisar_tipo(texto),), 0),
+        'salario_valor': ('salario', analisar_salario, 0),
+        'salario_periodo': ('salario', analisar_salario, 1),
+        'inicio': ('horario', analisar_horario, 0),
+        'fim': ('horario', analisar_horario, 1),
+        'horas_semanais': ('horario', analisar_horario, 2),
+        'cidade': ('localizacao', analisar_localizacao, 0),
+        'uf': ('localizacao', analisar_localizacao, 1),
+    }
+
+    def __init__(self):
+        self.textos = {campo: [] for campo in self.CAMPOS_TEXTO}
+        self.categorias = {campo: _Categorias() for campo in self.CAMPOS_CATEGORICOS}
+        self.ausentes = {}
+        self.extras = {}
+        self._tamanho = 0
+
+    @classmethod
+    def de_dicts(cls, vagas):
+        """
+        Args:
+            vagas (iterable): Dicts de vaga ou Vaga (ex: gerador de backend.iterar)
+
+        Returns:
+            ColecaoVagas: Coleção com todas as vagas
+        """
+        colecao = cls()
+        for vaga in vagas:
+            colecao.adicionar(vaga)
+        return colecao
+
+    def adicionar(self, vaga):
+        """
+        Acrescenta uma vaga
+
+        Args:
+            vaga: Dict no formato de _extrair_dados_vaga ou Vaga
+        """
+        if isinstance(vaga, Vaga):
+            vaga = vaga.como_dict()
+        linha = self._tamanho
+        for campo in CAMPOS_VAGA:
+            if campo not in vaga:
+                # Só para a ida e volta sem perdas: o campo não existia no dict original
+                self.ausentes.setdefault(linha, set()).add(campo)
+        for campo in self.CAMPOS_TEXTO:
+            self.textos[campo].append(vaga.get(campo))
+        for campo in self.CAMPOS_CATEGORICOS:
+            self.categorias[campo].adicionar(vaga.get(campo))
+        extras = {campo: valor for campo, valor in vaga.items() if campo not in CAMPOS_VAGA}
+        if extras:
+            self.extras[linha] = extras
+        self._tamanho += 1
+
+    def __len__(self):
+        return self._tamanho
+
+    def _dict(self, linha):
+        ausentes = self.ausentes.get(linha, ())
+        dados = {}
+        for campo in CAMPOS_VAGA:
+            if campo in ausentes:
+                continue
+            if campo in self.textos:
+                dados[campo] = self.textos[campo][linha]
+            else:
+                dados[campo] = self.categorias[campo][linha]
+        if linha in self.extras:
+            dados.update(self.extras[linha])
+        return dados
+
+    def __getitem__(self, linha):
+        if linha < 0:
+            linha += self._tamanho
+        if not 0 <= linha < self._tamanho:
+            raise IndexError(linha)
+        return Vaga.de_dict(self._dict(linha))
+
+    def __iter__(self):
+        for linha in range(self._tamanho):
+            yield Vaga.de_dict(self._dict(linha))
+
+    def como_dicts(self):
+        """
+        Returns:
+            list: Dicts idênticos aos que foram adicionados (formato do JSON de saída)
+        """
+        return [self._dict(linha) for linha in range(self._tamanho)]
+
+    def coluna(self, nome):
+        """
+        Valores de uma coluna, original ou derivada
+
+        As colunas derivadas são calculadas uma vez por valor distinto do campo de origem.
+
+        Args:
+            nome (str): Campo de CAMPOS_VAGA ou chave de DERIVADOS (ex: 'salario_valor', 'uf')
+
+        Returns:
+            list: Um valor por vaga
+        """
+        if nome in self.textos:
+            return list(self.textos[nome])
+        if nome in self.categorias:
+            categorias = self.categorias[nome]
+            return [categorias.valores[codigo] for codigo in categorias.codigos]
+        if nome not in self.DERIVADOS:
+            raise KeyError(nome)
+        origem, analisar, posicao = self.DERIVADOS[nome]
+        categorias = self.categorias[origem]
+        tabela = [analisar(valor)[posicao] if isinstance(valor, str) else None for valor in categorias.valores]
+        return [tabela[codigo] for codigo in categorias.codigos]
+
+    def contagem(self, nome):
+        """
+        Returns:
+            Counter: Quantidade de vagas por valor da coluna
+        """
+        return Counter(self.coluna(nome))
+
+    def media(self, nome):
+        """
+        Returns:
+            float: Média dos valores numéricos da coluna (None se não houver nenhum)
+        """
+        valores = [valor for valor in self.coluna(nome) if valor is not None and not math.isnan(valor)]
+        return sum(valores) / len(valores) if valores else None
@@ -0,0 +1,363 @@
+"""Orquestrador assíncrono de várias buscas: navegação, processamento e gravação em estágios sobrepostos"""
+
+import asyncio
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backends import criar_backend
+from checkpoint import CheckpointColeta
+from lote import expandir_combinacoes
+from metricas import metricas
+from paginacao import chave_vaga
+from saidas import criar_saida, formato_do_arquivo
+
+
+# Marca de fim enviada pelas filas entre os estágios
+_FIM = object()
+
+
+def _proximo_lote(vagas, tamanho):
+    return list(itertools.islice(vagas, tamanho))
+
+
+def _fechar_backend(backend):
+    try:
+        backend.fechar()
+    except Exception:
+        pass
+
+
+class EstagioPipeline:
+    """
+    Tempo de um estágio trabalhando, esperando entrada (fila anterior vazia) e
+    bloqueado na saída (fila seguinte cheia)
+    """
+
+    def __init__(self, nome, trabalhadores):
+        """
+        Args:
+            nome (str): 'navegacao', 'processamento' ou 'gravacao'
+            trabalhadores (int): Tarefas do estágio rodando ao mesmo tempo
+        """
+        self.nome = nome
+        self.trabalhadores = trabalhadores
+        self.lotes = 0
+        self.ocupado = 0.0
+        self.esperando_entrada = 0.0
+        self.bloqueado_saida = 0.0
+
+    async def executar(self, executor, funcao, *args):
+        """Roda funcao(*args) no executor e soma o tempo como ocupado"""
+        inicio = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, funcao, *args)
+        finally:
+            segundos = time.perf_counter() - inicio
+            self.ocupado += segundos
+            metricas.observar('pipeline', segundos, estagio=self.nome)
+
+    async def receber(self, fila):
+        """Lê o próximo item da fila de entrada, somando o tempo de espera"""
+        inicio = time.perf_counter()
+        item = await fila.get()
+        self.esperando_entrada += time.perf_counter() - inicio
+        return item
+
+    async def enviar(self, fila, item):
+        """Põe um lote na fila de saída; com a fila cheia, espera (backpressure)"""
+        inicio = time.perf_counter()
+        await fila.put(item)
+        self.bloqueado_saida += time.perf_counter() - inicio
+        self.lotes += 1
+
+    def relatorio(self, duracao):
+        """
+        Args:
+            duracao (float): Tempo total da execução, em segundos
+
+        Returns:
+            dict: Tempos do estágio e utilização (ocupado / (duração x trabalhadores))
+        """
+        return {
+            'trabalhadores': self.trabalhadores,
+            'lotes': self.lotes,
+            'ocupado_segundos': self.ocupado,
+            'esperando_entrada_segundos': self.esperando_entrada,
+            'bloqueado_saida_segundos': self.bloqueado_saida,
+            'utilizacao': self.ocupado / max(duracao * self.trabalhadores, 1e-9),
+        }
+
+
+class PipelineBuscas:
+    """
+    Executa várias buscas em três estágios ligados por filas limitadas
+
+    - navegacao: cada worker tem seu backend e uma thread própria (o WebDriver não
+      é thread-safe); enquanto os lotes da busca N seguem pelas filas, o worker já
+      aplica os filtros da busca N+1
+    - processamento: função opcional sobre cada lote (ex: enriquecer com detalhes),
+      em um pool de threads
+    - gravacao: remove vagas repetidas entre as buscas e grava na saída
+
+    Com uma fila cheia o estágio anterior espera, então a memória fica limitada a
+    tamanho_fila lotes por fila.
+
+    Uso:
+        pipeline = PipelineBuscas('selenium', workers=2, processar=enriquecedor.enriquecer)
+        with criar_saida('jsonl', 'vagas.jsonl') as saida:
+            relatorio = pipeline.executar_sync(combinacoes, saida)
+    """
+
+    def __init__(self, backend='selenium', kwargs_backend=None, workers=1, processar=None,
+                 threads_processamento=2, tamanho_lote=100, tamanho_fila=4, **opcoes_busca):
+        """
+        Args:
+            backend (str): 'selenium' ou 'http'
+            kwargs_backend (dict): Repassados ao construtor do backend de cada worker
+            workers (int): Backends (navegadores) buscando ao mesmo tempo
+            processar (callable): Recebe e retorna uma lista de vagas (None: sem processamento)
+            threads_processamento (int): Lotes processados ao mesmo tempo
+            tamanho_lote (int): Vagas por lote entre os estágios
+            tamanho_fila (int): Lotes máximos em cada fila
+            **opcoes_busca: Repassados a backend.iterar (ex: todas_paginas=True)
+        """
+        self.backend = backend
+        self.kwargs_backend = kwargs_backend or {}
+        self.workers = max(1, workers)
+        self.processar = processar
+        self.threads_processamento = max(1, threads_processamento)
+        self.tamanho_lote = max(1, tamanho_lote)
+        self.tamanho_fila = max(1, tamanho_fila)
+        self.opcoes_busca = opcoes_busca
+
+    async def _navegar(self, consultas, fila_saida, estagio, resultados, checkpoint=None):
+        """Worker de navegação: consome as buscas pendentes com um backend próprio"""
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='navegacao') as executor:
+            backend = None
+            try:
+                while not consultas.empty():
+                    indice, filtros = consultas.get_nowait()
+                    inicio = time.perf_counter()
+                    resultado = {'indice': indice, 'filtros': filtros, 'vagas': 0, 'erro': None}
+                    vagas = None
+                    try:
+                        if backend is None:
+                            backend = await estagio.executar(executor, self._abrir_backend)
+                        opcoes = dict(self.opcoes_busca)
+                        if checkpoint is not None:
+                            opcoes.update(checkpoint.opcoes_busca(filtros))
+                        vagas = backend.iterar(filtros, **opcoes)
+                        while True:
+                            lote = await estagio.executar(executor, _proximo_lote, vagas, self.tamanho_lote)
+                            if not lote:
+                                break
+                            resultado['vagas'] += len(lote)
+                            await estagio.enviar(fila_saida, lote)
+                        if checkpoint is not None:
+                            # Erros da busca podem ser engolidos pelo backend: só conta o que foi gravado
+                            if self.opcoes_busca.get('todas_paginas'):
+                                relatorio = backend.relatorio_paginacao
+                                completa = bool(relatorio and relatorio.completa)
+                            else:
+                                completa = checkpoint.pagina_coletada(filtros, 1)
+                            checkpoint.encerrar_combinacao(filtros, completa)
+                    except Exception as e:
+                        # Backend recriado para a próxima busca, isolando a falha
+                        resultado['erro'] = f"{type(e).__name__}: {e}"
+                        if backend is not None:
+                            await asyncio.get_running_loop().run_in_executor(executor, _fechar_backend, backend)
+                            backend = None
+                    finally:
+                        if vagas is not None:
+                            await asyncio.get_running_loop().run_in_executor(executor, vagas.close)
+                    resultado['segundos'] = time.perf_counter() - inicio
+                    status = f"❌ {resultado['erro']}" if resultado['erro'] else f"✅ {resultado['vagas']} vagas"
+                    print(f"  [{indice + 1}] {filtros} {status}")
+                    resultados.append(resultado)
+            finally:
+                if backend is not None:
+                    await asyncio.get_running_loop().run_in_executor(executor, _fechar_backend, backend)
+
+    def _abrir_backend(self):
+        backend = criar_backend(self.backend, **self.kwargs_backend)
+        backend.abrir()
+        return backend
+
+    async def _processar(self, fila_entrada, fila_saida, estagio, executor):
+        """Worker de processamento: aplica self.processar a cada lote"""
+        while True:
+            lote = await estagio.receber(fila_entrada)
+            if lote is _FIM:
+                return
+            if self.processar is not None:
+                lote = await estagio.executar(executor, self.processar, lote)
+            await estagio.enviar(fila_saida, lote)
+
+    async def _gravar(self, fila_entrada, estagio, saida, vagas, checkpoint=None):
+        """Worker de gravação: deduplica entre as buscas e grava (ou acumula em vagas)"""
+        vistas = set()
+
+        def gravar(lote):
+            for vaga in lote:
+                chave = chave_vaga(vaga)
+                if chave in vistas or (checkpoint is not None and chave in checkpoint.gravadas):
+                    if checkpoint is not None:
+                        checkpoint.registrar_gravada(vaga)
+                    continue
+                vistas.add(chave)
+                if saida is not None:
+                    saida.escrever(vaga)
+                else:
+                    vagas.append(vaga)
+                if checkpoint is not None:
+                    checkpoint.registrar_gravada(vaga)
+
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='gravacao') as executor:
+            while True:
+                lote = await estagio.receber(fila_entrada)
+                if lote is _FIM:
+                    return len(vistas)
+                await estagio.executar(executor, gravar, lote)
+                estagio.lotes += 1
+
+    async def executar(self, especificacao, saida=None, checkpoint=None):
+        """
+        Executa todas as buscas da especificação
+
+        Args:
+            especificacao: Lista de filtros ou dict cartesiano (ver lote.expandir_combinacoes)
+            saida (SaidaVagas): Destino das vagas (None: devolvidas em 'vagas')
+            checkpoint (CheckpointColeta): Se informado, pula as combinações e páginas já
+                concluídas e registra o progresso a cada página gravada (saida deve ser o
+                JSONL checkpoint.arquivo_saida)
+
+        Returns:
+            dict: 'combinacoes', 'quantidade', 'vagas', 'falhas', 'estagios', 'gargalo' e 'segundos'
+        """
+        combinacoes = expandir_combinacoes(especificacao)
+        workers = min(self.workers, len(combinacoes) or 1)
+        consultas = asyncio.Queue()
+        for indice, filtros in enumerate(combinacoes):
+            if checkpoint is not None and checkpoint.concluida(filtros):
+                print(f"  [{indice + 1}] {filtros} ⏭️ concluída no checkpoint")
+                continue
+            consultas.put_nowait((indice, filtros))
+        fila_processamento = asyncio.Queue(maxsize=self.tamanho_fila)
+        fila_gravacao = asyncio.Queue(maxsize=self.tamanho_fila)
+
+        estagios = {
+            'navegacao': EstagioPipeline('navegacao', workers),
+            'processamento': EstagioPipeline('processamento', self.threads_processamento),
+            'gravacao': EstagioPipeline('gravacao', 1),
+        }
+        resultados = []
+        vagas = []
+
+        print("\n" + "=" * 50)
+        print(f"PIPELINE: {len(combinacoes)} buscas, {workers} navegadores ({self.backend})")
+        print("=" * 50)
+
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.threads_processamento,
+                                thread_name_prefix='processamento') as executor:
+            navegadores = [asyncio.create_task(self._navegar(consultas, fila_processamento,
+                                                             estagios['navegacao'], resultados, checkpoint))
+                           for _ in range(workers)]
+            processadores = [asyncio.create_task(self._processar(fila_processamento, fila_gravacao,
+                                                                 estagios['processamento'], executor))
+                             for _ in range(self.threads_processamento)]
+            gravador = asyncio.create_task(self._gravar(fila_gravacao, estagios['gravacao'], saida, vagas,
+                                                        checkpoint))
+            tarefas = navegadores + processadores + [gravador]
+            try:
+                await asyncio.gather(*navegadores)
+                for _ in processadores:
+                    await fila_processamento.put(_FIM)
+                await asyncio.gather(*processadores)
+                await fila_gravacao.put(_FIM)
+                quantidade = await gravador
+            finally:
+                for tarefa in tarefas:
+                    tarefa.cancel()
+        segundos = time.perf_counter() - inicio
+
+        relatorio_estagios = {nome: estagio.relatorio(segundos) for nome, estagio in estagios.items()}
+        falhas = [r for r in resultados if r['erro']]
+        print(f"\n✅ {quantidade} vagas únicas de {len(combinacoes) - len(falhas)}/{len(combinacoes)} "
+              f"buscas em {segundos:.1f}s")
+        return {
+            'combinacoes': sorted(resultados, key=lambda r: r['indice']),
+            'quantidade': quantidade,
+            'vagas': vagas if saida is None else None,
+            'falhas': falhas,
+            'estagios': relatorio_estagios,
+            'gargalo': max(relatorio_estagios, key=lambda nome: relatorio_estagios[nome]['utilizacao']),
+            'segundos': segundos,
+        }
+
+    def executar_sync(self, especificacao, saida=None, checkpoint=None):
+        """Executa o pipeline num loop asyncio próprio (ver executar)"""
+        return asyncio.run(self.executar(especificacao, saida, checkpoint))
+
+
+def imprimir_estagios(relatorio):
+    """
+    Mostra a utilização de cada estágio e o gargalo
+
+    Args:
+        relatorio (dict): Retorno de PipelineBuscas.executar
+    """
+    print(f"\n{'estágio':<15}{'trab.':>6}{'lotes':>7}{'ocupado (s)':>13}{'esp. entrada':>14}"
+          f"{'bloq. saída':>13}{'utilização':>12}")
+    for nome, e in relatorio['estagios'].items():
+        print(f"{nome:<15}{e['trabalhadores']:>6}{e['lotes']:>7}{e['ocupado_segundos']:>13.2f}"
+              f"{e['esperando_entrada_segundos']:>14.2f}{e['bloqueado_saida_segundos']:>13.2f}"
+              f"{e['utilizacao']:>12.0%}")
+    print(f"🐢 Gargalo: {relatorio['gargalo']}")
+
+
+def executar_pipeline(especificacao, workers=1, backend='selenium', kwargs_backend=None, arquivo_saida=None,
+                      processar=None, caminho_checkpoint=None, retomar=False, **kwargs):
+    """
+    Atalho para PipelineBuscas com gravação em arquivo
+
+    Args:
+        especificacao: Lista de filtros ou dict cartesiano (ver lote.expandir_combinacoes)
+        workers (int): Backends buscando ao mesmo tempo
+        backend (str): 'selenium' ou 'http'
+        kwargs_backend (dict): Repassados ao construtor do backend
+        arquivo_saida (str): Arquivo de destino, formato pela extensão (None: vagas no retorno)
+        processar (callable): Função aplicada a cada lote de vagas
+        caminho_checkpoint (str): Grava o progresso neste arquivo a cada página (requer
+            arquivo_saida .jsonl); removido quando todas as combinações terminam
+        retomar (bool): Continua a execução interrompida do checkpoint, no mesmo arquivo de saída
+        **kwargs: Demais opções de PipelineBuscas (tamanho_fila, todas_paginas...)
+
+    Returns:
+        dict: Ver PipelineBuscas.executar
+    """
+    pipeline = PipelineBuscas(backend, kwargs_backend, workers=workers, processar=processar, **kwargs)
+    checkpoint = None
+    if caminho_checkpoint:
+        if not arquivo_saida or formato_do_arquivo(arquivo_saida) != 'jsonl':
+            raise ValueError("O checkpoint requer arquivo_saida .jsonl")
+        checkpoint = CheckpointColeta(caminho_checkpoint)
+        if not (retomar and checkpoint.retomar()):
+            checkpoint.iniciar(arquivo_saida)
+        arquivo_saida = checkpoint.arquivo_saida
+
+    if not arquivo_saida:
+        relatorio = pipeline.executar_sync(especificacao)
+    else:
+        with criar_saida(formato_do_arquivo(arquivo_saida), arquivo_saida) as saida:
+            relatorio = pipeline.executar_sync(especificacao, saida, checkpoint)
+        print(f"💾 Resultados salvos em: {arquivo_saida}")
+    imprimir_estagios(relatorio)
+
+    if checkpoint is not None:
+        if all(checkpoint.concluida(filtros) for filtros in expandir_combinacoes(especificacao)):
+            checkpoint.remover()
+        else:
+            print(f"♻️ Execução incompleta; retome com retomar=True (checkpoint: {caminho_checkpoint})")
+    return relatorio
@@ -0,0 +1,189 @@
+"""Coleta de todas as páginas de resultados, com busca concorrente e mesclagem ordenada"""
+
+import itertools
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+def chave_vaga(vaga):
+    """
+    Retorna a chave de deduplicação da vaga (código, ou link quando não há código)
+
+    Args:
+        vaga (dict): Dados da vaga
+
+    Returns:
+        str: Chave única da vaga
+    """
+    if vaga.get('codigo') and vaga['codigo'] != 'N/A':
+        return vaga['codigo']
+    return vaga.get('link')
+
+
+def mesclar_paginas(paginas):
+    """
+    Junta as vagas de várias páginas na ordem das páginas, sem repetir códigos
+
+    Args:
+        paginas (dict): Número da página -> lista de vagas
+
+    Returns:
+        list: Vagas na ordem de página/posição, deduplicadas
+    """
+    vistas = set()
+    vagas = []
+    for numero in sorted(paginas):
+        for vaga in paginas[numero]:
+            chave = chave_vaga(vaga)
+            if chave in vistas:
+                continue
+            vistas.add(chave)
+            vagas.append(vaga)
+    return vagas
+
+
+def iterar_paginas(buscar_pagina, numeros, concorrencia=4, parar_quando=None, erros=None):
+    """
+    Busca as páginas em paralelo e gera cada uma assim que ela e as anteriores chegam
+
+    Mantém no máximo 2 x concorrencia páginas em andamento (memória constante
+    mesmo com milhares de páginas) e entrega na ordem dos números. Pensado para
+    resultados ordenados dos mais novos para os mais antigos: assim que uma
+    página satisfaz parar_quando, as seguintes não são buscadas.
+
+    Args:
+        buscar_pagina (callable): Recebe o número da página e retorna a lista de vagas
+        numeros (iterable): Números das páginas, em ordem
+        concorrencia (int): Máximo de páginas buscadas ao mesmo tempo
+        parar_quando (callable): Recebe as vagas de uma página e retorna True para parar
+        erros (dict): Se informado, recebe página -> mensagem de erro
+
+    Yields:
+        tuple: (número da página, lista de vagas)
+    """
+    concorrencia = max(1, concorrencia)
+    restantes = iter(numeros)
+    pendentes = deque()
+    with ThreadPoolExecutor(max_workers=concorrencia) as executor:
+        def submeter(quantidade):
+            for numero in itertools.islice(restantes, quantidade):
+                pendentes.append((numero, executor.submit(buscar_pagina, numero)))
+
+        submeter(2 * concorrencia)
+        try:
+            while pendentes:
+                numero, futuro = pendentes.popleft()
+                submeter(1)
+                try:
+                    vagas = futuro.result()
+                except Exception as e:
+                    if erros is not None:
+                        erros[numero] = str(e)
+                    print(f"  ❌ Erro na página {numero}: {e}")
+                    continue
+                yield numero, vagas
+                if parar_quando is not None and parar_quando(vagas):
+                    print(f"  ⏹️ Página {numero} só tem vagas conhecidas, parando a coleta")
+                    return
+        finally:
+            for _, futuro in pendentes:
+                futuro.cancel()
+
+
+def iterar_vagas_paginas(paginas, relatorio=None, ao_extrair_pagina=None):
+    """
+    Gera as vagas de uma sequência de páginas, sem repetir códigos
+
+    Versão em streaming de mesclar_paginas: só as chaves já vistas ficam em memória.
+
+    Args:
+        paginas (iterable): Pares (número da página, lista de vagas), em ordem
+        relatorio (RelatorioPaginacao): Se informado, contabiliza páginas e vagas
+        ao_extrair_pagina (callable): Chamado com (número, vagas) antes de entregar as vagas
+            de cada página (ex: CheckpointColeta.pagina_extraida)
+
+    Yields:
+        dict: Vagas na ordem de página/posição, deduplicadas
+    """
+    vistas = set()
+    for numero, vagas in paginas:
+        if relatorio is not None:
+            relatorio.registrar_pagina(vagas)
+        if ao_extrair_pagina is not None:
+            ao_extrair_pagina(numero, vagas)
+        for vaga in vagas:
+            chave = chave_vaga(vaga)
+            if chave in vistas:
+                continue
+            vistas.add(chave)
+            if relatorio is not None:
+                relatorio.vagas += 1
+            yield vaga
+
+
+class RelatorioPaginacao:
+    """Mede a vazão de uma coleta paginada"""
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.fim = None
+        self.total_paginas = 0
+        self.paginas_coletadas = 0
+        # Páginas coletadas numa execução anterior (retomada de checkpoint)
+        self.paginas_puladas = 0
+        self.vagas_brutas = 0
+        self.vagas = 0
+        self.erros = {}
+
+    def registrar_pagina(self, vagas):
+        """Contabiliza uma página coletada (usado na coleta em streaming)"""
+        self.paginas_coletadas += 1
+        self.vagas_brutas += len(vagas)
+
+    def encerrar(self, erros=None, total_paginas=None):
+        """
+        Encerra a medição de uma coleta contabilizada com registrar_pagina
+
+        Args:
+            erros (dict): Página -> mensagem de erro
+            total_paginas (int): Total de páginas informado pelo site
+        """
+        self.fim = time.perf_counter()
+        self.total_paginas = total_paginas or self.paginas_coletadas
+        self.erros = dict(erros or {})
+        return self
+
+    @property
+    def completa(self):
+        """True se todas as páginas foram coletadas sem erro (coleta não interrompida)"""
+        return (self.fim is not None and not self.erros
+                and self.paginas_coletadas + self.paginas_puladas >= self.total_paginas)
+
+    @property
+    def segundos(self):
+        return (self.fim or time.perf_counter()) - self.inicio
+
+    @property
+    def paginas_por_segundo(self):
+        return self.paginas_coletadas / self.segundos if self.segundos > 0 else 0.0
+
+    def como_dict(self):
+        return {
+            'total_paginas': self.total_paginas,
+            'paginas_coletadas': self.paginas_coletadas,
+            'paginas_puladas': self.paginas_puladas,
+            'vagas_brutas': self.vagas_brutas,
+            'vagas': self.vagas,
+            'erros': self.erros,
+            'completa': self.completa,
+            'segundos': self.segundos,
+            'paginas_por_segundo': self.paginas_por_segundo,
+        }
+
+    def imprimir(self):
+        print(f"\n📚 {self.paginas_coletadas}/{self.total_paginas} páginas, "
+              f"{self.vagas} vagas únicas ({self.vagas_brutas - self.vagas} repetidas) "
+              f"em {self.segundos:.2f}s - {self.paginas_por_segundo:.2f} páginas/s")
+        if self.erros:
+            print(f"  ⚠️ Páginas com erro: {sorted(self.erros)}")
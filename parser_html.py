@@ -0,0 +1,394 @@
+"""Extração dos cards de vaga a partir do HTML (ou JSON) do portal, sem navegador"""
+
+import re
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from portal import (
+    CAMPOS_VAGA, SELETORES_CARDS, SELETORES_CAMPOS, SELETORES_DETALHE, SELETORES_PAGINACAO, vaga_valida,
+)
+
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
+
+
+# Tags sem tag de fechamento
+TAGS_VAZIAS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+# Seletor simples: tag, classes e atributos ([attr], [attr=v], [attr*=v])
+_RE_SELETOR = re.compile(r"^([\w-]+|\*)?((?:\.[\w-]+)*)((?:\[[^\]]+\])*)$")
+_RE_ATRIBUTO = re.compile(r"\[([\w-]+)(?:([*^$]?=)['\"]?([^'\"\]]*)['\"]?)?\]")
+
+# Chaves aceitas para o total de páginas quando a busca responde em JSON
+CHAVES_TOTAL_PAGINAS = ['totalPaginas', 'total_paginas', 'totalPages', 'paginas']
+
+# Chaves aceitas para cada campo quando a busca responde em JSON
+CHAVES_JSON = {
+    'codigo': ['codigo', 'codigoVaga', 'id'],
+    'tipo': ['tipo', 'tipoVaga'],
+    'descricao': ['descricao', 'titulo', 'empresa'],
+    'area': ['area', 'areaProfissional'],
+    'localizacao': ['localizacao', 'local', 'cidade'],
+    'horario': ['horario'],
+    'salario': ['salario', 'bolsa', 'bolsaAuxilio'],
+    'link': ['link', 'url'],
+}
+
+
+def _compilar_simples(parte):
+    m = _RE_SELETOR.match(parte)
+    if not m or not parte:
+        raise ValueError(f"Seletor não suportado: {parte!r}")
+    tag = m.group(1) if m.group(1) not in (None, '*') else None
+    classes = [c for c in m.group(2).split('.') if c]
+    atributos = _RE_ATRIBUTO.findall(m.group(3))
+    return tag, classes, atributos
+
+
+def compilar_seletor(seletor):
+    """
+    Converte uma lista de seletores CSS simples em cadeias comparáveis
+
+    Suporta apenas o subconjunto usado pelo portal: tag, classes, atributos
+    (presença, '=', '*=', '^=', '$=') e o combinador de descendente (espaço),
+    separados por vírgula.
+
+    Args:
+        seletor (str): Ex: "a.vaga-item, .paginacao a[data-pagina]"
+
+    Returns:
+        list: Cadeias de tuplas (tag, classes, condições de atributo), da mais externa à mais interna
+    """
+    return [[_compilar_simples(parte) for parte in alternativa.split()] for alternativa in seletor.split(',')]
+
+
+def _casa_simples(tag, atributos, simples):
+    """Indica se um elemento (tag + atributos) casa com um seletor simples"""
+    tag_seletor, classes, condicoes = simples
+    if tag_seletor and tag != tag_seletor:
+        return False
+
+    classes_elem = (atributos.get('class') or '').split()
+    if any(c not in classes_elem for c in classes):
+        return False
+
+    for nome, operador, valor in condicoes:
+        atual = atributos.get(nome)
+        if atual is None:
+            return False
+        if operador == '=' and atual != valor:
+            return False
+        if operador == '*=' and valor not in atual:
+            return False
+        if operador == '^=' and not atual.startswith(valor):
+            return False
+        if operador == '$=' and not atual.endswith(valor):
+            return False
+    return True
+
+
+def _casa(no, cadeia, limite=None):
+    """Indica se o nó casa com a cadeia de descendentes, sem subir além de limite"""
+    if not _casa_simples(no.tag, no.atributos, cadeia[-1]):
+        return False
+
+    restantes = len(cadeia) - 2
+    ancestral = no.pai
+    while restantes >= 0 and ancestral is not None and ancestral is not limite:
+        if _casa_simples(ancestral.tag, ancestral.atributos, cadeia[restantes]):
+            restantes -= 1
+        ancestral = ancestral.pai
+    return restantes < 0
+
+
+def _para_xpath(cadeias):
+    """Traduz seletores compilados para uma união XPath (usada com lxml)"""
+    caminhos = []
+    for cadeia in cadeias:
+        passos = []
+        for tag, classes, condicoes in cadeia:
+            predicados = [f"contains(concat(' ', normalize-space(@class), ' '), ' {c} ')" for c in classes]
+            for nome, operador, valor in condicoes:
+                if not operador:
+                    predicados.append(f"@{nome}")
+                elif operador == '=':
+                    predicados.append(f"@{nome}='{valor}'")
+                elif operador == '*=':
+                    predicados.append(f"contains(@{nome}, '{valor}')")
+                elif operador == '^=':
+                    predicados.append(f"starts-with(@{nome}, '{valor}')")
+                else:
+                    predicados.append(f"substring(@{nome}, string-length(@{nome}) - {len(valor) - 1})='{valor}'")
+            passos.append(f"descendant::{tag or '*'}" + ''.join(f"[{p}]" for p in predicados))
+        caminhos.append('/'.join(passos))
+    return ' | '.join(caminhos)
+
+
+class No:
+    """Elemento de uma árvore HTML mínima (usada quando o lxml não está instalado)"""
+
+    __slots__ = ('tag', 'atributos', 'filhos', 'pai')
+
+    def __init__(self, tag, atributos, pai=None):
+        self.tag = tag
+        self.atributos = atributos
+        self.filhos = []
+        self.pai = pai
+
+    def iterar(self):
+        """Percorre os elementos descendentes em ordem de documento"""
+        for filho in self.filhos:
+            if isinstance(filho, No):
+                yield filho
+                yield from filho.iterar()
+
+    def selecionar(self, cadeias):
+        """Retorna os descendentes que casam com algum dos seletores, em ordem de documento"""
+        return [no for no in self.iterar() if any(_casa(no, c, self) for c in cadeias)]
+
+    def texto(self):
+        """Concatena o texto de todos os descendentes"""
+        partes = []
+        for filho in self.filhos:
+            partes.append(filho.texto() if isinstance(filho, No) else filho)
+        return ''.join(partes)
+
+    def get(self, nome):
+        return self.atributos.get(nome)
+
+
+class _ConstrutorArvore(HTMLParser):
+    """Monta uma árvore de No a partir do HTML, tolerando tags não fechadas"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.raiz = No('#documento', {})
+        self.atual = self.raiz
+
+    def handle_starttag(self, tag, attrs):
+        no = No(tag, {nome: (valor or '') for nome, valor in attrs}, self.atual)
+        self.atual.filhos.append(no)
+        if tag not in TAGS_VAZIAS:
+            self.atual = no
+
+    def handle_startendtag(self, tag, attrs):
+        self.atual.filhos.append(No(tag, {nome: (valor or '') for nome, valor in attrs}, self.atual))
+
+    def handle_endtag(self, tag):
+        no = self.atual
+        while no is not self.raiz and no.tag != tag:
+            no = no.pai
+        if no is not self.raiz:
+            self.atual = no.pai
+
+    def handle_data(self, data):
+        self.atual.filhos.append(data)
+
+
+def carregar_documento(html):
+    """
+    Faz o parse do HTML com lxml (se instalado) ou com html.parser
+
+    Args:
+        html (str): Conteúdo da página
+
+    Returns:
+        Raiz do documento (lxml.html.HtmlElement ou No)
+    """
+    if lxml is not None:
+        return lxml.html.fromstring(html)
+
+    construtor = _ConstrutorArvore()
+    construtor.feed(html)
+    construtor.close()
+    return construtor.raiz
+
+
+def _selecionar(raiz, seletor):
+    cadeias = compilar_seletor(seletor)
+    if isinstance(raiz, No):
+        return raiz.selecionar(cadeias)
+    return raiz.xpath(_para_xpath(cadeias))
+
+
+def _primeiro(raiz, seletor):
+    """Primeiro elemento do primeiro candidato da lista 'a, b, c' que encontrar algo (ordem de preferência)"""
+    for candidato in seletor.split(','):
+        encontrados = _selecionar(raiz, candidato)
+        if encontrados:
+            return encontrados[0]
+    return None
+
+
+def _texto(elemento):
+    texto = elemento.texto() if isinstance(elemento, No) else elemento.text_content()
+    return ' '.join(texto.split())
+
+
+def encontrar_cards(raiz, seletores=None):
+    """
+    Encontra os cards de vaga usando o primeiro seletor que retornar resultados
+
+    Args:
+        raiz: Documento retornado por carregar_documento
+        seletores (list): Seletores CSS candidatos (padrão: SELETORES_CARDS)
+
+    Returns:
+        list: Elementos dos cards
+    """
+    for seletor in seletores or SELETORES_CARDS:
+        cards = _selecionar(raiz, seletor)
+        if cards:
+            return cards
+    return []
+
+
+def extrair_dados_card(card, url_base=''):
+    """
+    Extrai os dados de um card, com as mesmas regras de CIEEScraper._extrair_dados_vaga
+
+    Args:
+        card: Elemento do card
+        url_base (str): URL da página, para resolver links relativos
+
+    Returns:
+        dict: Dicionário com dados da vaga ('N/A' para campos ausentes)
+    """
+    vaga = {}
+    for campo, seletor in SELETORES_CAMPOS.items():
+        encontrado = _primeiro(card, seletor)
+        vaga[campo] = _texto(encontrado) if encontrado is not None else 'N/A'
+
+    href = card.get('href')
+    vaga['link'] = urljoin(url_base, href) if href else 'N/A'
+    return vaga
+
+
+def extrair_vagas_html(html, url_base=''):
+    """
+    Extrai todas as vagas válidas de uma página de resultados
+
+    Args:
+        html (str): Conteúdo da página
+        url_base (str): URL da página, para resolver links relativos
+
+    Returns:
+        list: Lista de dicionários com os dados das vagas
+    """
+    return extrair_pagina_html(html, url_base)[0]
+
+
+def extrair_pagina_html(html, url_base=''):
+    """
+    Extrai as vagas válidas e o total de páginas de uma página de resultados
+
+    Args:
+        html (str): Conteúdo da página
+        url_base (str): URL da página, para resolver links relativos
+
+    Returns:
+        tuple: (lista de vagas, total de páginas)
+    """
+    raiz = carregar_documento(html)
+    vagas = [extrair_dados_card(card, url_base) for card in encontrar_cards(raiz)]
+    return [vaga for vaga in vagas if vaga_valida(vaga)], extrair_total_paginas(raiz)
+
+
+def extrair_detalhes_html(html):
+    """
+    Extrai os campos da página de detalhe de uma vaga
+
+    Args:
+        html (str): HTML da página de detalhe
+
+    Returns:
+        dict: Só os campos encontrados (vazio quando a página depende de JavaScript)
+    """
+    raiz = carregar_documento(html)
+    detalhes = {}
+    for campo, seletor in SELETORES_DETALHE.items():
+        encontrados = _selecionar(raiz, seletor)
+        texto = _texto(encontrados[0]) if encontrados else ''
+        if texto:
+            detalhes[campo] = texto
+    return detalhes
+
+
+def extrair_vagas_json(dados, url_base=''):
+    """
+    Converte a resposta JSON da busca para o formato de vaga do scraper
+
+    Aceita uma lista de vagas ou um objeto com a lista em 'vagas', 'itens' ou 'data'.
+
+    Args:
+        dados: JSON já decodificado
+        url_base (str): URL da página, para resolver links relativos
+
+    Returns:
+        list: Lista de dicionários com os dados das vagas
+    """
+    if isinstance(dados, dict):
+        dados = next((dados[chave] for chave in ('vagas', 'itens', 'data') if chave in dados), [])
+
+    vagas = []
+    for item in dados:
+        vaga = {}
+        for campo in CAMPOS_VAGA:
+            valor = next((item[chave] for chave in CHAVES_JSON[campo] if item.get(chave) not in (None, '')), None)
+            vaga[campo] = str(valor).strip() if valor is not None else 'N/A'
+        if vaga['link'] != 'N/A':
+            vaga['link'] = urljoin(url_base, vaga['link'])
+        if vaga_valida(vaga):
+            vagas.append(vaga)
+    return vagas
+
+
+def extrair_total_paginas(raiz):
+    """
+    Lê o total de páginas da paginação (maior número entre os links/itens)
+
+    Args:
+        raiz: Documento retornado por carregar_documento
+
+    Returns:
+        int: Total de páginas (1 se não houver paginação)
+    """
+    total = 1
+    for elemento in _selecionar(raiz, SELETORES_PAGINACAO):
+        for valor in (elemento.get('data-pagina'), _texto(elemento)):
+            if valor and valor.strip().isdigit():
+                total = max(total, int(valor))
+    return total
+
+
+def extrair_pagina_json(dados, url_base=''):
+    """
+    Extrai as vagas válidas e o total de páginas de uma resposta JSON
+
+    Args:
+        dados: JSON já decodificado
+        url_base (str): URL da página, para resolver links relativos
+
+    Returns:
+        tuple: (lista de vagas, total de páginas)
+    """
+    return extrair_vagas_json(dados, url_base), extrair_total_paginas_json(dados)
+
+
+def extrair_total_paginas_json(dados):
+    """
+    Lê o total de páginas de uma resposta JSON da busca
+
+    Args:
+        dados: JSON já decodificado
+
+    Returns:
+        int: Total de páginas (1 se não informado)
+    """
+    if isinstance(dados, dict):
+        for chave in CHAVES_TOTAL_PAGINAS:
+            if str(dados.get(chave, '')).isdigit():
+                return max(1, int(dados[chave]))
+    return 1
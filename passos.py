@@ -0,0 +1,183 @@
+"""
+Execução de passos da navegação com orçamento de tempo, novas tentativas e recuperação direcionada
+
+Cada passo (ex: selecionar a cidade, clicar em Aplicar) tem um orçamento curto para
+todas as esperas dele, um número limitado de tentativas com backoff exponencial e
+uma verificação de que o efeito aconteceu (o campo mostra a opção escolhida). Entre
+as tentativas roda a recuperação da vez (ex: fechar e reabrir o combo, recarregar a
+página e refazer os filtros anteriores, reciclar o navegador), em vez de repetir a
+coleta inteira. Falhas, tentativas extras e recuperações são contadas por passo.
+"""
+
+import random
+import time
+from collections import Counter
+from dataclasses import dataclass
+
+from metricas import metricas
+
+
+@dataclass(frozen=True)
+class PoliticaPasso:
+    """
+    Orçamento e novas tentativas de um passo
+
+    Attributes:
+        orcamento (float): Segundos para todas as esperas de uma tentativa
+        tentativas (int): Tentativas no total (1 = sem novas tentativas)
+        backoff (float): Pausa antes da segunda tentativa; dobra a cada tentativa (com jitter)
+        backoff_maximo (float): Limite da pausa
+        recuperacoes (tuple): Recuperação antes de cada nova tentativa, em ordem de custo;
+            a última se repete se houver mais tentativas que recuperações
+    """
+
+    orcamento: float = 8.0
+    tentativas: int = 3
+    backoff: float = 0.25
+    backoff_maximo: float = 2.0
+    recuperacoes: tuple = ('reabrir', 'recarregar')
+
+
+# Política por passo; nomes sem entrada usam a do prefixo ('selecionar_cidade' -> 'selecionar')
+POLITICAS_PADRAO = {
+    'selecionar': PoliticaPasso(orcamento=6.0, tentativas=3, recuperacoes=('reabrir', 'recarregar')),
+    'aplicar': PoliticaPasso(orcamento=20.0, tentativas=3, recuperacoes=('recarregar', 'reciclar')),
+}
+
+
+class FalhaPasso(Exception):
+    """O passo não teve efeito depois de todas as tentativas"""
+
+    def __init__(self, passo, tentativas, erro):
+        self.passo = passo
+        self.tentativas = tentativas
+        self.erro = erro
+        super().__init__(f"Passo '{passo}' falhou após {tentativas} tentativa(s): {erro}")
+
+
+class ExecutorPassos:
+    """
+    Executa passos com orçamento de tempo, verificação, backoff e recuperação
+
+    Uso:
+        passos = ExecutorPassos({'reabrir': fechar_combo, 'recarregar': recarregar})
+        passos.executar('selecionar_cidade', lambda: selecionar('cidade', 'BRASÍLIA - DF'),
+                        verificar=lambda resultado: campo_mostra('BRASÍLIA - DF'))
+        passos.relatorio()
+    """
+
+    def __init__(self, recuperacoes=None, politicas=None, definitivos=(ValueError,), relogio=time.perf_counter,
+                 dormir=time.sleep):
+        """
+        Args:
+            recuperacoes (dict): Nome da recuperação -> função sem argumentos
+            politicas (dict): Sobrescreve POLITICAS_PADRAO por passo ou prefixo
+            definitivos (tuple): Exceções que não adianta repetir (ex: opção desconhecida)
+            relogio (callable): Relógio em segundos (substituível em simulações)
+            dormir (callable): Pausa do backoff
+        """
+        self.recuperacoes = dict(recuperacoes or {})
+        self.politicas = dict(POLITICAS_PADRAO, **(politicas or {}))
+        self.definitivos = definitivos
+        self.relogio = relogio
+        self.dormir = dormir
+        # Instante limite da tentativa em andamento (None fora de um passo)
+        self.prazo = None
+        self.estatisticas = {}
+
+    def politica(self, passo):
+        """
+        Returns:
+            PoliticaPasso: Política do passo, do prefixo dele ou a padrão
+        """
+        return self.politicas.get(passo) or self.politicas.get(passo.split('_')[0]) or PoliticaPasso()
+
+    def restante(self, minimo=0.05):
+        """
+        Returns:
+            float: Segundos até o fim do orçamento da tentativa atual (None fora de um passo)
+        """
+        if self.prazo is None:
+            return None
+        return max(minimo, self.prazo - self.relogio())
+
+    def _estatisticas(self, passo):
+        return self.estatisticas.setdefault(passo, {
+            'execucoes': 0, 'falhas': 0, 'tentativas_extras': 0, 'recuperacoes': Counter(), 'segundos': 0.0,
+        })
+
+    def _recuperar(self, passo, nome):
+        """Roda a recuperação; uma falha nela só é contada (a próxima tentativa decide)"""
+        recuperacao = self.recuperacoes.get(nome)
+        if recuperacao is None:
+            return
+        print(f"  🔧 Recuperando '{passo}': {nome}")
+        self._estatisticas(passo)['recuperacoes'][nome] += 1
+        metricas.incrementar('recuperacoes_passo', passo=passo, acao=nome)
+        try:
+            recuperacao()
+        except Exception as e:
+            print(f"  ⚠️ Recuperação '{nome}' falhou: {e}")
+            metricas.incrementar('erros', fase=f"recuperar_{nome}")
+
+    def executar(self, passo, acao, verificar=None):
+        """
+        Executa o passo até ele ter efeito ou as tentativas acabarem
+
+        Args:
+            passo (str): Nome do passo (chave das políticas e dos contadores)
+            acao (callable): Executa o passo; usa restante() como limite das esperas
+            verificar (callable): Recebe o retorno da ação; valor falso = passo sem efeito
+
+        Returns:
+            O retorno da ação
+
+        Raises:
+            FalhaPasso: Se nenhuma tentativa teve efeito (ou o erro é definitivo)
+        """
+        politica = self.politica(passo)
+        dados = self._estatisticas(passo)
+        dados['execucoes'] += 1
+        inicio = self.relogio()
+        erro = None
+
+        for tentativa in range(1, politica.tentativas + 1):
+            if tentativa > 1:
+                dados['tentativas_extras'] += 1
+                metricas.incrementar('tentativas_passo', passo=passo)
+                recuperacoes = politica.recuperacoes
+                if recuperacoes:
+                    self._recuperar(passo, recuperacoes[min(tentativa - 2, len(recuperacoes) - 1)])
+                pausa = min(politica.backoff_maximo, politica.backoff * 2 ** (tentativa - 2))
+                self.dormir(pausa * random.uniform(0.5, 1.0))
+
+            self.prazo = self.relogio() + politica.orcamento
+            try:
+                resultado = acao()
+                if verificar is None or verificar(resultado):
+                    dados['segundos'] += self.relogio() - inicio
+                    metricas.observar('passo', self.relogio() - inicio, passo=passo)
+                    return resultado
+                erro = 'sem efeito (verificação falhou)'
+            except self.definitivos as e:
+                erro = e
+                break
+            except Exception as e:
+                erro = f"{type(e).__name__}: {e}".strip().rstrip(':')
+            finally:
+                self.prazo = None
+            print(f"  ⚠️ '{passo}' tentativa {tentativa}/{politica.tentativas}: {erro}")
+            metricas.evento('passo_sem_efeito', passo=passo, tentativa=tentativa, erro=str(erro))
+
+        dados['falhas'] += 1
+        dados['segundos'] += self.relogio() - inicio
+        metricas.incrementar('falhas_passo', passo=passo)
+        raise FalhaPasso(passo, tentativa, erro)
+
+    def relatorio(self):
+        """
+        Returns:
+            dict: Passo -> execuções, falhas, tentativas extras, recuperações e segundos
+        """
+        return {passo: dict(dados, recuperacoes=dict(dados['recuperacoes']))
+                for passo, dados in self.estatisticas.items()}
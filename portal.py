@@ -0,0 +1,169 @@
+"""Constantes do portal CIEE compartilhadas pelos backends: URLs, IDs dos filtros e seletores dos cards"""
+
+from urllib.parse import urlencode
+
+
+URL_VAGAS = "https://www.ciee.org.br/portal/estudantes/ofertas/estagios"
+
+# Mapa de tipos para IDs do HTML
+MAPA_TIPOS = {
+    'ESTÁGIO': 'estagio',
+    'APRENDIZ': 'aprendiz',
+    'PCD': 'pcd',
+    'PROCESSOS PÚBLICOS': 'pp',
+    'SOLUÇÕES ESPECIAIS': 'se'
+}
+
+# Mapa de níveis para IDs do HTML
+MAPA_NIVEIS = {
+    'TODOS': 'TODOS',
+    'ENSINO FUNDAMENTAL': 'EF',
+    'FUNDAMENTAL': 'EF',
+    'ENSINO MÉDIO': 'EM',
+    'MÉDIO': 'EM',
+    'TÉCNICO': 'TE',
+    'SUPERIOR': 'SU'
+}
+
+# Mapa de áreas profissionais com IDs conferidos (as demais vêm do catálogo coletado do portal)
+MAPA_AREAS = {
+    'INFORMÁTICA': '18',
+    'TECNOLOGIA DA INFORMAÇÃO': '18',
+    'TI': '18',
+    'ADMINISTRAÇÃO': '1',
+    'ENGENHARIA': '73',
+    'LETRAS': '20',
+    'INDUSTRIA': '17',
+    'MARKETING': '22',
+    'MEIO AMBIENTE': '24',
+    'GEOMÁTICA': '45',
+    'ASTRONOMIA': '10081',
+    'SAÚDE': '32',
+}
+
+# Mapa de cidades conhecidas com IDs
+MAPA_CIDADES = {
+    'BRASÍLIA - DF': '5300108',
+    'BRASÍLIA DE MINAS - MG': '3108602',
+    'SÃO PAULO - SP': '3550308',
+    'RIO DE JANEIRO - RJ': '3304557',
+}
+
+# Filtro -> (ID do campo no formulário, mapa de valores para IDs)
+CAMPOS_FILTROS = {
+    'tipo_vaga': ('TipoVaga', MAPA_TIPOS),
+    'nivel_ensino': ('NivelEnsino', MAPA_NIVEIS),
+    'area_profissional': ('AreaProfissional', MAPA_AREAS),
+    'cidade': ('CidadeVaga', MAPA_CIDADES),
+}
+
+# Filtro -> ID da lista de opções do combo (ver catalogo.py)
+LISTAS_FILTROS = {
+    'tipo_vaga': 'ComboTipoVaga',
+    'nivel_ensino': 'ComboNivelEnsino',
+    'area_profissional': 'ComboAreaProfissional',
+    'cidade': 'ComboCidade',
+}
+
+# Seletores CSS dos cards de vaga, do mais específico ao mais genérico
+SELETORES_CARDS = [
+    "a.vaga-item",
+    ".vaga-row",
+    ".card-vaga",
+    "[class*='vaga']",
+    "div[class*='item-vaga']",
+    "a[href*='codigoVaga']"
+]
+
+# Elementos que marcam a seção de filtros (para rolar até ela)
+SELETORES_SECAO_FILTROS = ["#TipoVaga", ".filtros-busca", "[class*='filter']", "#NivelEnsino"]
+
+# Seletores CSS de cada campo dentro do card, em ordem de preferência
+SELETORES_CAMPOS = {
+    'codigo': ".codigo-vaga, .cod-vaga",
+    'tipo': ".tipo-vaga, .badge",
+    'descricao': ".titulo-vaga, .descricao, h3",
+    'area': ".area-vaga, .info-area",
+    'localizacao': ".local-vaga, .info-local, .localizacao",
+    'horario': ".horario-vaga, .info-horario",
+    'salario': ".salario-vaga, .info-salario, .bolsa-auxilio",
+}
+
+# Seletores CSS dos campos da página de detalhe da vaga (link do card)
+SELETORES_DETALHE = {
+    'empresa': ".empresa-vaga, .vaga-empresa, [data-campo='empresa']",
+    'descricao_completa': ".descricao-completa, .vaga-descricao, [data-campo='descricao']",
+    'atividades': ".atividades-vaga, .vaga-atividades, [data-campo='atividades']",
+    'requisitos': ".requisitos-vaga, .vaga-requisitos, [data-campo='requisitos']",
+    'beneficios': ".beneficios-vaga, .vaga-beneficios, [data-campo='beneficios']",
+    'endereco': ".endereco-vaga, .vaga-endereco, [data-campo='endereco']",
+}
+
+CAMPOS_DETALHE = list(SELETORES_DETALHE)
+
+# Links/itens da paginação dos resultados (número no texto ou em data-pagina)
+SELETORES_PAGINACAO = "[data-pagina], .pagination a, .paginacao a, .pagination li, .paginacao li"
+
+# Indicadores de carregamento da lista de resultados (spinner, texto "Carregando...")
+SELETORES_CARREGANDO = ".carregando, .loading, .spinner, [aria-busy='true']"
+
+# Parâmetro de query com o número da página de resultados
+PARAMETRO_PAGINA = 'pagina'
+
+CAMPOS_VAGA = ['codigo', 'tipo', 'descricao', 'area', 'localizacao', 'horario', 'salario', 'link']
+
+
+def ids_filtros(filtros, catalogo=None):
+    """
+    Converte os filtros legíveis nos IDs usados pelo formulário do portal
+
+    Valores que não são encontrados são enviados como texto.
+
+    Args:
+        filtros (dict): Ex: {'tipo_vaga': 'ESTÁGIO', 'cidade': 'BRASÍLIA - DF'}
+        catalogo (CatalogoFiltros): Catálogo de opções (padrão: só os mapas acima)
+
+    Returns:
+        dict: Ex: {'TipoVaga': 'estagio', 'CidadeVaga': '5300108'}
+    """
+    parametros = {}
+    for filtro, valor in filtros.items():
+        if filtro not in CAMPOS_FILTROS or not valor:
+            continue
+        campo, mapa = CAMPOS_FILTROS[filtro]
+        if catalogo is not None:
+            parametros[campo] = catalogo.resolver(filtro, valor) or valor
+        else:
+            parametros[campo] = mapa.get(valor.upper().strip(), valor)
+    return parametros
+
+
+def url_pagina(url_base, filtros, pagina, catalogo=None):
+    """
+    Monta a URL de uma página de resultados com os filtros na query
+
+    Args:
+        url_base (str): URL da página de vagas
+        filtros (dict): Filtros legíveis
+        pagina (int): Número da página
+        catalogo (CatalogoFiltros): Catálogo de opções (ver ids_filtros)
+
+    Returns:
+        str: URL com os IDs dos filtros e o número da página
+    """
+    parametros = dict(ids_filtros(filtros, catalogo), **{PARAMETRO_PAGINA: str(pagina)})
+    separador = '&' if '?' in url_base else '?'
+    return f"{url_base}{separador}{urlencode(parametros)}"
+
+
+def vaga_valida(vaga):
+    """
+    Indica se a vaga tem código ou link (as demais são descartadas)
+
+    Args:
+        vaga (dict): Dados extraídos do card
+
+    Returns:
+        bool: True se a vaga deve ser mantida
+    """
+    return (vaga['codigo'] and vaga['codigo'] != 'N/A') or (vaga['link'] and vaga['link'] != 'N/A')
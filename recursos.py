@@ -0,0 +1,119 @@
+"""Política de recursos do navegador: bloqueio de imagens, mídia, fontes e rastreadores via CDP"""
+
+# Padrões no formato de Network.setBlockedURLs ('*' casa qualquer trecho da URL)
+PADROES_IMAGENS = ['*.png*', '*.jpg*', '*.jpeg*', '*.gif*', '*.webp*', '*.avif*', '*.svg*', '*.ico*', '*.bmp*']
+PADROES_MIDIA = ['*.mp4*', '*.webm*', '*.ogg*', '*.ogv*', '*.mp3*', '*.wav*', '*.m3u8*', '*.mov*']
+PADROES_FONTES = ['*.woff*', '*.ttf*', '*.otf*', '*.eot*']
+PADROES_ESTILOS = ['*.css*']
+PADROES_RASTREADORES = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*doubleclick.net*', '*googlesyndication.com*',
+    '*googleadservices.com*', '*facebook.net*', '*connect.facebook.com*', '*hotjar.com*', '*clarity.ms*',
+    '*hubspot.com*', '*hs-scripts.com*', '*newrelic.com*', '*nr-data.net*', '*youtube.com/embed*',
+]
+
+# 'completa' carrega tudo (comportamento original); 'leve' mantém o CSS, necessário para
+# visibilidade/clique dos combos; 'minima' também bloqueia o CSS
+POLITICAS = {
+    'completa': [],
+    'leve': PADROES_IMAGENS + PADROES_MIDIA + PADROES_FONTES + PADROES_RASTREADORES,
+    'minima': PADROES_IMAGENS + PADROES_MIDIA + PADROES_FONTES + PADROES_RASTREADORES + PADROES_ESTILOS,
+}
+
+# Recursos do Chrome que não servem para a coleta
+ARGUMENTOS_ENXUTOS = [
+    '--disable-extensions',
+    '--disable-background-networking',
+    '--disable-component-update',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-translate',
+    '--disable-notifications',
+    '--metrics-recording-only',
+    '--mute-audio',
+    '--no-first-run',
+    '--blink-settings=imagesEnabled=false',
+]
+
+# Bytes transferidos pela página atual, pela Resource Timing API
+SCRIPT_TRANSFERENCIA = """
+const entradas = performance.getEntriesByType('navigation').concat(performance.getEntriesByType('resource'));
+const porTipo = {};
+let total = 0;
+entradas.forEach(function (entrada) {
+    const bytes = entrada.transferSize || entrada.encodedBodySize || 0;
+    const tipo = entrada.initiatorType || 'outro';
+    porTipo[tipo] = (porTipo[tipo] || 0) + bytes;
+    total += bytes;
+});
+return {bytes: total, recursos: entradas.length, por_tipo: porTipo};
+"""
+
+
+def validar_politica(politica):
+    """
+    Confere o nome da política
+
+    Args:
+        politica (str): 'completa', 'leve' ou 'minima'
+
+    Returns:
+        str: O próprio nome
+    """
+    if politica not in POLITICAS:
+        raise ValueError(f"Política de recursos desconhecida: {politica!r} (use {', '.join(POLITICAS)})")
+    return politica
+
+
+def configurar_opcoes(options, politica='leve'):
+    """
+    Ajusta as opções do Chrome para a política: carregamento 'eager' e recursos enxutos
+
+    Com 'eager', driver.get retorna no DOMContentLoaded, sem esperar imagens e
+    outros recursos terminarem de baixar.
+
+    Args:
+        options (webdriver.ChromeOptions): Opções ainda não usadas
+        politica (str): 'completa', 'leve' ou 'minima'
+    """
+    if validar_politica(politica) == 'completa':
+        return
+    options.page_load_strategy = 'eager'
+    for argumento in ARGUMENTOS_ENXUTOS:
+        options.add_argument(argumento)
+
+
+def aplicar_politica(driver, politica='leve', padroes_extras=()):
+    """
+    Bloqueia as URLs da política no navegador via CDP (Network.setBlockedURLs)
+
+    Vale para todas as navegações seguintes da aba. Requer um driver baseado no
+    Chromium (execute_cdp_cmd).
+
+    Args:
+        driver: WebDriver do Chrome
+        politica (str): 'completa', 'leve' ou 'minima'
+        padroes_extras (iterable): Padrões adicionais (ex: domínios de anúncios específicos)
+
+    Returns:
+        list: Padrões bloqueados
+    """
+    padroes = POLITICAS[validar_politica(politica)] + list(padroes_extras)
+    if padroes:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': padroes})
+    return padroes
+
+
+def medir_transferencia(driver):
+    """
+    Mede os bytes transferidos pela página carregada na aba atual
+
+    Recursos bloqueados não são baixados e não entram na soma.
+
+    Args:
+        driver: WebDriver
+
+    Returns:
+        dict: 'bytes', 'recursos' e 'por_tipo' (bytes por initiatorType)
+    """
+    return driver.execute_script(SCRIPT_TRANSFERENCIA)
@@ -0,0 +1,240 @@
+"""Saídas em streaming das vagas: JSONL, CSV, JSON compacto e Parquet (em lotes)"""
+
+import csv
+import json
+from datetime import datetime
+
+from modelo import Vaga
+from portal import CAMPOS_VAGA
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+EXTENSOES = {'jsonl': 'jsonl', 'csv': 'csv', 'json': 'json', 'parquet': 'parquet'}
+
+
+def nome_arquivo_saida(formato, prefixo='vagas_ciee'):
+    """
+    Gera o nome do arquivo de saída com data e hora
+
+    Args:
+        formato (str): 'jsonl', 'csv', 'json' ou 'parquet'
+        prefixo (str): Início do nome do arquivo
+
+    Returns:
+        str: Ex: 'vagas_ciee_20250101_120000.jsonl'
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    return f"{prefixo}_{timestamp}.{EXTENSOES[formato]}"
+
+
+def formato_do_arquivo(arquivo, padrao='json'):
+    """
+    Deduz o formato pela extensão do arquivo
+
+    Args:
+        arquivo (str): Ex: 'vagas.parquet'
+        padrao (str): Formato usado quando a extensão não é reconhecida
+
+    Returns:
+        str: 'jsonl', 'csv', 'json' ou 'parquet'
+    """
+    extensao = arquivo.rsplit('.', 1)[-1].lower() if '.' in arquivo else ''
+    return extensao if extensao in EXTENSOES else padrao
+
+
+class SaidaVagas:
+    """
+    Destino que recebe as vagas uma a uma, conforme são extraídas
+
+    Uso:
+        with SaidaJSONL('vagas.jsonl') as saida:
+            for vaga in scraper.iterar_vagas():
+                saida.escrever(vaga)
+    """
+
+    formato = None
+
+    def __init__(self, arquivo, campos=None):
+        """
+        Args:
+            arquivo (str): Caminho do arquivo de saída
+            campos (list): Colunas dos formatos tabulares (padrão: CAMPOS_VAGA; campos extras
+                da vaga são ignorados). Os formatos JSON gravam a vaga inteira.
+        """
+        self.arquivo = arquivo
+        self.campos = list(campos or CAMPOS_VAGA)
+        self.quantidade = 0
+
+    def escrever(self, vaga):
+        """Grava uma vaga (dict ou Vaga)"""
+        if isinstance(vaga, Vaga):
+            vaga = vaga.como_dict()
+        self._escrever(vaga)
+        self.quantidade += 1
+
+    def _escrever(self, vaga):
+        raise NotImplementedError
+
+    def fechar(self):
+        """Finaliza o arquivo"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+class SaidaJSONL(SaidaVagas):
+    """Uma vaga por linha, com flush a cada linha: o que já foi extraído sobrevive a um crash"""
+
+    formato = 'jsonl'
+
+    def __init__(self, arquivo, campos=None):
+        super().__init__(arquivo, campos)
+        self.f = open(arquivo, 'a', encoding='utf-8')
+
+    def _escrever(self, vaga):
+        self.f.write(json.dumps(vaga, ensure_ascii=False, separators=(',', ':')) + '\n')
+        self.f.flush()
+
+    def fechar(self):
+        self.f.close()
+
+
+class SaidaCSV(SaidaVagas):
+    """CSV com as colunas de campos (padrão: CAMPOS_VAGA), com flush a cada linha"""
+
+    formato = 'csv'
+
+    def __init__(self, arquivo, campos=None):
+        super().__init__(arquivo, campos)
+        self.f = open(arquivo, 'w', encoding='utf-8', newline='')
+        self.writer = csv.DictWriter(self.f, fieldnames=self.campos, extrasaction='ignore')
+        self.writer.writeheader()
+        self.f.flush()
+
+    def _escrever(self, vaga):
+        self.writer.writerow(vaga)
+        self.f.flush()
+
+    def fechar(self):
+        self.f.close()
+
+
+class SaidaJSONCompacto(SaidaVagas):
+    """
+    Lista JSON sem indentação, escrita item a item
+
+    O ']' final só é gravado em fechar(); para resultados que precisam
+    sobreviver a um crash, prefira JSONL.
+    """
+
+    formato = 'json'
+
+    def __init__(self, arquivo, campos=None):
+        super().__init__(arquivo, campos)
+        self.f = open(arquivo, 'w', encoding='utf-8')
+        self.f.write('[')
+
+    def _escrever(self, vaga):
+        if self.quantidade:
+            self.f.write(',')
+        self.f.write(json.dumps(vaga, ensure_ascii=False, separators=(',', ':')))
+
+    def fechar(self):
+        self.f.write(']\n')
+        self.f.close()
+
+
+class SaidaParquet(SaidaVagas):
+    """Arquivo Parquet colunar, gravado em row groups de tamanho_lote vagas (requer pyarrow)"""
+
+    formato = 'parquet'
+
+    def __init__(self, arquivo, tamanho_lote=1000, campos=None):
+        """
+        Args:
+            arquivo (str): Caminho do arquivo de saída
+            tamanho_lote (int): Vagas acumuladas antes de gravar um row group
+            campos (list): Colunas (padrão: CAMPOS_VAGA)
+        """
+        if pa is None:
+            raise ImportError("A saída Parquet requer o pyarrow: uv pip install pyarrow")
+        super().__init__(arquivo, campos)
+        self.tamanho_lote = tamanho_lote
+        self.esquema = pa.schema([(campo, pa.string()) for campo in self.campos])
+        self.writer = pq.ParquetWriter(arquivo, self.esquema)
+        self.buffer = {campo: [] for campo in self.campos}
+        self.no_buffer = 0
+
+    def _escrever(self, vaga):
+        for campo in self.campos:
+            valor = vaga.get(campo)
+            self.buffer[campo].append(None if valor is None else str(valor))
+        self.no_buffer += 1
+        if self.no_buffer >= self.tamanho_lote:
+            self.descarregar()
+
+    def descarregar(self):
+        """Grava as vagas acumuladas como um row group"""
+        if not self.no_buffer:
+            return
+        self.writer.write_table(pa.table(self.buffer, schema=self.esquema))
+        self.buffer = {campo: [] for campo in self.campos}
+        self.no_buffer = 0
+
+    def fechar(self):
+        self.descarregar()
+        self.writer.close()
+
+
+SAIDAS = {
+    'jsonl': SaidaJSONL,
+    'csv': SaidaCSV,
+    'json': SaidaJSONCompacto,
+    'parquet': SaidaParquet,
+}
+
+
+def criar_saida(formato='jsonl', arquivo=None, **kwargs):
+    """
+    Cria uma saída pelo nome do formato
+
+    Args:
+        formato (str): 'jsonl', 'csv', 'json' ou 'parquet'
+        arquivo (str): Caminho do arquivo (padrão: vagas_ciee_YYYYMMDD_HHMMSS.<ext>)
+        **kwargs: Repassados ao construtor da saída
+
+    Returns:
+        SaidaVagas: Saída aberta
+    """
+    if formato not in SAIDAS:
+        raise ValueError(f"Formato desconhecido: {formato!r} (use {', '.join(SAIDAS)})")
+    return SAIDAS[formato](arquivo or nome_arquivo_saida(formato), **kwargs)
+
+
+def gravar_em(vagas, *saidas):
+    """
+    Repassa as vagas de um iterável, gravando cada uma nas saídas
+
+    Permite encadear a extração com outros consumidores sem montar a lista
+    inteira em memória.
+
+    Args:
+        vagas (iterable): Vagas (geralmente um gerador)
+        *saidas (SaidaVagas): Destinos
+
+    Yields:
+        dict: A mesma vaga, depois de gravada
+    """
+    for vaga in vagas:
+        for saida in saidas:
+            saida.escrever(vaga)
+        yield vaga
@@ -0,0 +1,222 @@
+"""Seletores aprendidos: cada grupo tenta primeiro o seletor que funcionou da última vez, tudo numa única chamada"""
+
+import json
+import os
+import threading
+
+from metricas import metricas
+
+
+# Candidato especial: <a> com 'vaga' na classe ou 'codigoVaga' no href (último recurso dos cards)
+SELETOR_GENERICO = 'a:generico'
+
+# Função JS compartilhada pelos scripts de cards: elementos de um candidato, com o
+# candidato especial SELETOR_GENERICO filtrando os <a> (seletor inválido -> [])
+JS_CARDS_DO_CANDIDATO = """
+function cardsDoCandidato(seletor, generico) {
+    if (seletor === generico) {
+        return Array.from(document.getElementsByTagName('a')).filter(function (a) {
+            return (a.getAttribute('class') || '').toLowerCase().indexOf('vaga') >= 0
+                || (a.getAttribute('href') || '').indexOf('codigoVaga') >= 0;
+        });
+    }
+    try { return Array.from(document.querySelectorAll(seletor)); } catch (e) { return []; }
+}
+"""
+
+# Primeiro candidato com resultados e os elementos encontrados
+# (arguments[0] = seletores em ordem de preferência, arguments[1] = SELETOR_GENERICO)
+SCRIPT_ENCONTRAR_CARDS = JS_CARDS_DO_CANDIDATO + """
+for (const seletor of arguments[0]) {
+    const cards = cardsDoCandidato(seletor, arguments[1]);
+    if (cards.length) { return {seletor: seletor, cards: cards}; }
+}
+return {seletor: null, cards: []};
+"""
+
+# Colheita dos cards rolando a página (execute_async_script): um MutationObserver
+# acumula os cards conforme aparecem, a página desce em passos instantâneos e a
+# colheita termina no fim da página, depois de quieto ms sem cards novos nem rolagem
+# (arguments: seletores em ordem de preferência, SELETOR_GENERICO, quieto ms, limite ms)
+SCRIPT_COLHER_CARDS = JS_CARDS_DO_CANDIDATO + """
+const candidatos = arguments[0], generico = arguments[1], quieto = arguments[2], limite = arguments[3];
+const concluir = arguments[arguments.length - 1];
+function buscar(seletor) { return cardsDoCandidato(seletor, generico); }
+let seletor = null;
+const cards = [];
+const vistos = new Set();
+function colher() {
+    if (seletor === null) {
+        seletor = candidatos.find(function (candidato) { return buscar(candidato).length; }) || null;
+        if (seletor === null) { return; }
+    }
+    // Cards removidos depois (listas virtualizadas) continuam guardados
+    for (const card of buscar(seletor)) {
+        if (!vistos.has(card)) { vistos.add(card); cards.push(card); }
+    }
+}
+const inicio = Date.now();
+let ultimaMudanca = inicio;
+let rolagens = 0;
+const observador = new MutationObserver(function (mutacoes) {
+    if (mutacoes.some(function (m) { return m.addedNodes.length; })) {
+        ultimaMudanca = Date.now();
+        colher();
+    }
+});
+observador.observe(document.body, {childList: true, subtree: true});
+colher();
+function passo() {
+    const antes = window.scrollY;
+    window.scrollBy({top: Math.max(200, window.innerHeight * 0.9), behavior: 'instant'});
+    if (window.scrollY !== antes) { rolagens++; ultimaMudanca = Date.now(); }
+    colher();
+    const agora = Date.now();
+    const fim = window.innerHeight + window.scrollY >= document.documentElement.scrollHeight - 2;
+    const estavel = fim && agora - ultimaMudanca >= quieto;
+    if (estavel || agora - inicio >= limite) {
+        observador.disconnect();
+        concluir({seletor: seletor, cards: cards, rolagens: rolagens, completa: estavel});
+        return;
+    }
+    // Um quadro entre os passos, para os carregadores por scroll/IntersectionObserver reagirem
+    setTimeout(passo, 16);
+}
+passo();
+"""
+
+# Primeiro elemento encontrado entre os candidatos: [seletor, elemento] ou null
+SCRIPT_PRIMEIRO_ELEMENTO = """
+for (const seletor of arguments[0]) {
+    let elem = null;
+    try { elem = document.querySelector(seletor); } catch (e) { continue; }
+    if (elem) { return [seletor, elem]; }
+}
+return null;
+"""
+
+# Campos de cada card com os candidatos em ordem de preferência e o seletor que
+# resolveu cada campo em mais cards (arguments[0] = cards, arguments[1] = {campo: [seletores]})
+SCRIPT_EXTRAIR_CARDS = """
+const cards = arguments[0];
+const candidatos = arguments[1];
+const usos = {};
+const vagas = cards.map(function (card) {
+    const vaga = {};
+    for (const campo in candidatos) {
+        vaga[campo] = 'N/A';
+        for (const seletor of candidatos[campo]) {
+            const elem = card.querySelector(seletor);
+            if (elem) {
+                vaga[campo] = (elem.innerText || elem.textContent || '').trim();
+                usos[campo] = usos[campo] || {};
+                usos[campo][seletor] = (usos[campo][seletor] || 0) + 1;
+                break;
+            }
+        }
+    }
+    const href = card.getAttribute('href') ? (card.href || card.getAttribute('href')) : null;
+    vaga['link'] = href ? href : 'N/A';
+    return vaga;
+});
+const vencedores = {};
+for (const campo in usos) {
+    vencedores[campo] = Object.keys(usos[campo]).reduce(function (a, b) {
+        return usos[campo][a] >= usos[campo][b] ? a : b;
+    });
+}
+return {vagas: vagas, vencedores: vencedores};
+"""
+
+
+def candidatos(seletor):
+    """
+    Separa uma lista de seletores CSS ('a, b, c') nos candidatos individuais
+
+    Args:
+        seletor (str): Seletores separados por vírgula (ex: valores de SELETORES_CAMPOS)
+
+    Returns:
+        list: Ex: ['a', 'b', 'c']
+    """
+    return [parte.strip() for parte in seletor.split(',') if parte.strip()]
+
+
+class CacheSeletores:
+    """
+    Seletor vencedor de cada grupo ('cards', 'secao_filtros', 'campo:codigo'...), persistido em JSON
+
+    O vencedor vai na frente da lista de candidatos; os demais só são tentados
+    quando ele deixa de encontrar algo, e o novo vencedor substitui o antigo.
+
+    Uso:
+        cache = CacheSeletores('seletores_ciee.json')
+        ordem = cache.ordenar('cards', SELETORES_CARDS + [SELETOR_GENERICO])
+        ...
+        cache.registrar('cards', seletor_que_funcionou)
+    """
+
+    def __init__(self, caminho='seletores_ciee.json'):
+        """
+        Args:
+            caminho (str): Arquivo JSON dos vencedores (None: só em memória)
+        """
+        self.caminho = caminho
+        self.vencedores = {}
+        self.estatisticas = {'acertos': 0, 'trocas': 0}
+        self._lock = threading.Lock()
+        if caminho:
+            try:
+                with open(caminho, encoding='utf-8') as f:
+                    self.vencedores = dict(json.load(f))
+            except (OSError, ValueError, TypeError):
+                self.vencedores = {}
+
+    def ordenar(self, grupo, lista):
+        """
+        Coloca o vencedor conhecido do grupo na frente dos candidatos
+
+        Args:
+            grupo (str): Nome do grupo
+            lista (list): Candidatos na ordem padrão
+
+        Returns:
+            list: Candidatos com o vencedor primeiro (a ordem dos demais é mantida)
+        """
+        vencedor = self.vencedores.get(grupo)
+        if vencedor not in lista:
+            return list(lista)
+        return [vencedor] + [seletor for seletor in lista if seletor != vencedor]
+
+    def registrar(self, grupo, seletor):
+        """
+        Anota o seletor que encontrou o grupo; grava o arquivo só quando o vencedor muda
+
+        Args:
+            grupo (str): Nome do grupo
+            seletor (str): Seletor que funcionou
+        """
+        with self._lock:
+            if self.vencedores.get(grupo) == seletor:
+                self.estatisticas['acertos'] += 1
+                metricas.incrementar('seletores', grupo=grupo, resultado='acerto')
+                return
+            anterior = self.vencedores.get(grupo)
+            self.vencedores[grupo] = seletor
+            self.estatisticas['trocas'] += 1
+        metricas.incrementar('seletores', grupo=grupo, resultado='troca')
+        if anterior is not None:
+            print(f"  🔁 Seletor de '{grupo}' mudou: {anterior} -> {seletor}")
+        self.salvar()
+
+    def salvar(self):
+        """Grava os vencedores em JSON (escrita atômica)"""
+        if not self.caminho:
+            return
+        with self._lock:
+            dados = dict(self.vencedores)
+        # Nome único: processos do lote, threads do pipeline e trabalhadores gravam o mesmo arquivo
+        temporario = f"{self.caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(dados, f, ensure_ascii=False, indent=2)
+        os.replace(temporario, self.caminho)